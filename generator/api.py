@@ -1,35 +1,351 @@
-import json
-from fastapi import FastAPI, Query
-from typing import Annotated, Dict, List
+import os
+import uuid
+import asyncio
+import pandas as pd
+from glob import glob
+from contextlib import asynccontextmanager
+from fastapi import FastAPI, Header, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
+from typing import Annotated, Dict, Iterator, List, Tuple, Union
 
 import cons
-from main import main
-from utilities.JsonEncoder import JsonEncoder as JsonEncoder
+from main import main, gen_results
+from utilities.input_error_handling import input_error_handling
+from utilities.normalise_input_dates import normalise_input_dates
+from utilities.negotiate_media_type import negotiate_media_type
+from utilities.stream_trans_data import stream_trans_data
+from utilities.select_trans_data import select_trans_data
+from utilities.TransDataWriter import TransDataWriter
+from utilities.RefDataRegistry import ref_data_registry
+from utilities.WorkerPool import WorkerPool
+from utilities.ResultCache import ResultCache
+from utilities.gen_version_hash import gen_version_hash
+from jobs import router as jobs_router, job_store, job_pool
 
 tags_metadata = [
     {
         "name": "Random Telecom Payments Data Generator",
         "description": "Generate random telecom payments data based on user-defined parameters.",
     },
+    {
+        "name": "Random Telecom Payments Data Generator Jobs",
+        "description": "Queue jobs generating large random telecom payments datasets, poll their progress and download their Parquet or CSV output files.",
+    },
 ]
 
+def iter_trans_data(input_params_dict: dict) -> Iterator[pd.DataFrame]:
+    """
+    Lazily generates the transaction data of each iteration or shard, ordered by transaction date and then transaction hash within each chunk.
+    
+    Parameters
+    ----------
+    input_params_dict : dict
+        The input parameters of the programme.
+    
+    Returns
+    -------
+    Iterator[pandas.DataFrame]
+        The rendered transaction data of each iteration or shard, as soon as it is generated.
+    """
+    for result in gen_results(input_params_dict=input_params_dict):
+        yield result['trans_data'].sort_values(by=['transaction_date', 'transaction_hash'], kind='stable').reset_index(drop=True)
+
+def gen_json_content(trans_data: pd.DataFrame) -> bytes:
+    """
+    Serialises the transaction data as a json array.
+    
+    Parameters
+    ----------
+    trans_data : pandas.DataFrame
+        The rendered transaction data.
+    
+    Returns
+    -------
+    bytes
+        The json array of the transaction data records.
+    """
+    # an empty page, such as a page past the last row, is an empty json array
+    if trans_data.shape[0] == 0:
+        return b'[]'
+    # render the date columns as YYYY-MM-DD strings, matching the newline delimited json and arrow responses, then serialise the records to json, which is returned as is rather than encoded again
+    date_strs = {date_col:trans_data[date_col].to_numpy(dtype='datetime64[D]').astype(str) for date_col in trans_data.columns.intersection(cons.trans_date_cols)}
+    return trans_data.assign(**date_strs).to_json(orient='records', double_precision=15).encode()
+
+def gen_trans_data(input_params_dict: dict) -> pd.DataFrame:
+    """
+    Generates the random telecom payments transaction data, within a worker process.
+    
+    Parameters
+    ----------
+    input_params_dict : dict
+        The input parameters of the programme.
+    
+    Returns
+    -------
+    pandas.DataFrame
+        The rendered transaction data.
+    """
+    return main(input_params_dict=input_params_dict)['trans_data']
+
+def gen_json_response_content(input_params_dict: dict, columns: Union[List[str], None] = None, offset: int = 0, limit: Union[int, None] = None) -> Tuple[bytes, int]:
+    """
+    Generates the random telecom payments data and serialises a page of the transaction data as a json array, within a worker process.
+    
+    Parameters
+    ----------
+    input_params_dict : dict
+        The input parameters of the programme.
+    columns : List[str]
+        The columns to serialise, default is None for all columns.
+    offset : int
+        The number of rows to skip, default is 0.
+    limit : int
+        The maximum number of rows to serialise, default is None for all rows after the offset.
+    
+    Returns
+    -------
+    Tuple[bytes, int]
+        The json array of the page of transaction data records, and the total number of transaction data rows.
+    """
+    trans_data = gen_trans_data(input_params_dict=input_params_dict)
+    trans_data_page = next(select_trans_data(trans_data_chunks=[trans_data], columns=columns, offset=offset, limit=limit))
+    return gen_json_content(trans_data=trans_data_page), trans_data.shape[0]
+
+def iter_trans_data_bytes(input_params_dict: dict, response_format: str, columns: Union[List[str], None] = None, offset: int = 0, limit: Union[int, None] = None) -> Iterator[bytes]:
+    """
+    Lazily generates and serialises a page of the transaction data of each iteration or shard, within a worker process.
+    
+    Parameters
+    ----------
+    input_params_dict : dict
+        The input parameters of the programme.
+    response_format : str
+        The serialisation format, either "ndjson" or "arrow".
+    columns : List[str]
+        The columns to serialise, default is None for all columns.
+    offset : int
+        The number of rows to skip, default is 0.
+    limit : int
+        The maximum number of rows to serialise, default is None for all rows after the offset.
+    
+    Returns
+    -------
+    Iterator[bytes]
+        The serialised bytes of the transaction data, as soon as each iteration or shard is generated, no further iterations are generated once the page is complete.
+    """
+    trans_data_pages = select_trans_data(trans_data_chunks=iter_trans_data(input_params_dict=input_params_dict), columns=columns, offset=offset, limit=limit)
+    yield from stream_trans_data(trans_data_chunks=trans_data_pages, response_format=response_format, columns=columns)
+
+# the pool of worker processes generating the api responses, so that generation does not block the event loop
+worker_pool = WorkerPool(max_workers=cons.api_max_workers, max_queued=cons.api_max_queued)
+# the result cache of seeded requests, versioned by the generator code and reference data
+version_fpaths = [fpath for subdir in ['app', 'objects', 'utilities'] for fpath in glob(os.path.join(cons.subdir_generator, subdir, '*.py'))]
+version_fpaths += [os.path.join(cons.subdir_generator, 'cons.py'), os.path.join(cons.subdir_generator, 'main.py')]
+version_fpaths += [fpath for fpath in glob(os.path.join(cons.subdir_data, 'ref', '*')) if fpath != cons.fpath_ref_data_bundle]
+result_cache = ResultCache(fdir=cons.fdir_api_cache, version_hash=gen_version_hash(fpaths=version_fpaths))
+# the pending generations of uncached seeded requests, shared by concurrent requests of the same dataset
+cache_fills = {}
+
+def check_worker_pool():
+    """
+    Rejects the request if every worker is busy and the queue of waiting requests is full.
+    """
+    if worker_pool.is_full():
+        raise HTTPException(status_code=503, detail=f'All {worker_pool.max_workers} workers are busy and {worker_pool.max_queued} requests are queued, retry later.', headers={'Retry-After': '1'})
+
+async def fill_cache(cache_key: str, input_params_dict: dict) -> pd.DataFrame:
+    """
+    Generates the transaction data of an uncached seeded request in a worker process, and caches it.
+    
+    Parameters
+    ----------
+    cache_key : str
+        The cache key of the request.
+    input_params_dict : dict
+        The input parameters of the programme.
+    
+    Returns
+    -------
+    pandas.DataFrame
+        The rendered transaction data.
+    """
+    trans_data = await worker_pool.run(gen_trans_data, input_params_dict)
+    await asyncio.to_thread(result_cache.put, cache_key, trans_data)
+    return trans_data
+
+async def get_cached_trans_data(input_params_dict: dict) -> Tuple[pd.DataFrame, bool, bool]:
+    """
+    Gets the transaction data of a seeded request from the result cache, generating and caching it if it is not cached.
+    
+    Parameters
+    ----------
+    input_params_dict : dict
+        The input parameters of the programme.
+    
+    Returns
+    -------
+    Tuple[pandas.DataFrame, bool, bool]
+        The rendered transaction data, whether it was a cache hit, and whether it was generated with the input parameters of this request rather than of a concurrent request of the same dataset.
+    """
+    cache_key = result_cache.gen_key(input_params_dict=input_params_dict)
+    trans_data = await asyncio.to_thread(result_cache.get, cache_key)
+    if trans_data is not None:
+        return trans_data, True, False
+    # generate the dataset once for any concurrent requests of it
+    cache_filled = cache_key not in cache_fills
+    if cache_filled:
+        check_worker_pool()
+        cache_fills[cache_key] = asyncio.ensure_future(fill_cache(cache_key=cache_key, input_params_dict=input_params_dict))
+        cache_fills[cache_key].add_done_callback(lambda cache_fill: cache_fills.pop(cache_key, None))
+    trans_data = await asyncio.shield(cache_fills[cache_key])
+    return trans_data, False, cache_filled
+
+def gen_page_headers(n_rows: int, offset: int, n_page_rows: int) -> Dict[str, str]:
+    """
+    Generates the pagination headers of a page of the transaction data.
+    
+    Parameters
+    ----------
+    n_rows : int
+        The total number of transaction data rows.
+    offset : int
+        The offset of the page.
+    n_page_rows : int
+        The number of rows in the page.
+    
+    Returns
+    -------
+    Dict[str, str]
+        The total number of rows, and the offset of the next page if there are further rows.
+    """
+    page_headers = {'X-Total-Count': str(n_rows)}
+    if offset + n_page_rows < n_rows:
+        page_headers['X-Next-Offset'] = str(offset + n_page_rows)
+    return page_headers
+
+async def gen_api_response(input_params_dict: dict, accept: Union[str, None], columns: Union[str, None] = None, offset: int = 0, limit: Union[int, None] = None, response_format: Union[str, None] = None) -> Response:
+    """
+    Generates the api response of the random telecom payments data in a worker process, in the response format negotiated from the Accept header.
+    Any output files are written to a directory unique to the request, so that concurrent requests do not overwrite each other's output, and seeded requests are served from the result cache.
+    Only the requested columns and page of rows are serialised, so pages of a cached seeded dataset are served without serialising the whole dataset.
+    
+    Parameters
+    ----------
+    input_params_dict : dict
+        The input parameters of the programme.
+    accept : str
+        The Accept header of the request.
+    columns : str
+        The comma separated columns to return, default is None for all columns.
+    offset : int
+        The number of rows to skip, default is 0.
+    limit : int
+        The maximum number of rows to return, default is None for all rows after the offset.
+    response_format : str
+        The response format, either "json", "ndjson" or "arrow", overriding the Accept header, default is None.
+    
+    Returns
+    -------
+    response : fastapi.responses.Response
+        Either a json array of the transaction data, or a newline delimited json or arrow ipc stream of the transaction data streamed chunk by chunk as each iteration or shard is generated.
+    """
+    if response_format is None:
+        response_format = negotiate_media_type(accept=accept)
+    # parse and check the requested columns
+    if columns is not None:
+        columns = [column.strip() for column in columns.split(',') if column.strip() != '']
+        invalid_columns = [column for column in columns if column not in TransDataWriter.gen_trans_schema().names]
+        if (len(columns) == 0) or (len(invalid_columns) > 0) or (len(set(columns)) < len(columns)):
+            raise HTTPException(status_code=422, detail=f'Invalid columns {invalid_columns}; must be distinct columns of {TransDataWriter.gen_trans_schema().names}.')
+    # isolate the output files of the request, and check the input parameters before queueing the request
+    # the response itself is streamed to the client, so the transaction data is never streamed to date partitions on disk
+    input_params_dict = {**input_params_dict, 'stream_output': 0, 'output_fdir': os.path.join(cons.fdir_api_outputs, uuid.uuid4().hex)}
+    try:
+        # equivalent dates generate and cache the same dataset
+        input_params_dict = normalise_input_dates(input_params_dict=input_params_dict)
+        input_error_handling(input_params_dict)
+    except (ValueError, TypeError) as exception:
+        raise HTTPException(status_code=422, detail=str(exception))
+    if input_params_dict['use_random_seed'] == 1:
+        # seeded requests always generate the same dataset, so are served from the result cache
+        trans_data, cache_hit, cache_filled = await get_cached_trans_data(input_params_dict=input_params_dict)
+        trans_data_page = next(select_trans_data(trans_data_chunks=[trans_data], columns=columns, offset=offset, limit=limit))
+        headers = {'X-Cache': 'hit' if cache_hit else 'miss', **gen_page_headers(n_rows=trans_data.shape[0], offset=offset, n_page_rows=trans_data_page.shape[0])}
+        # only the request whose input parameters generated the dataset has written output files to its directory
+        if cache_filled and (input_params_dict['write_output'] == 1):
+            headers['X-Output-Dir'] = input_params_dict['output_fdir']
+        if response_format == 'json':
+            content = await asyncio.to_thread(gen_json_content, trans_data_page)
+            return Response(content=content, media_type=cons.api_media_types['json'], headers=headers)
+        trans_data_stream = stream_trans_data(trans_data_chunks=[trans_data_page], response_format=response_format, columns=columns)
+        return StreamingResponse(content=trans_data_stream, media_type=cons.api_media_types[response_format], headers=headers)
+    check_worker_pool()
+    if response_format == 'json':
+        content, n_rows = await worker_pool.run(gen_json_response_content, input_params_dict, columns, offset, limit)
+        n_page_rows = max(0, min(n_rows - offset, n_rows if limit is None else limit))
+        headers = gen_page_headers(n_rows=n_rows, offset=offset, n_page_rows=n_page_rows)
+        if input_params_dict['write_output'] == 1:
+            headers['X-Output-Dir'] = input_params_dict['output_fdir']
+        return Response(content=content, media_type=cons.api_media_types['json'], headers=headers)
+    # stream the transaction data as it is generated, streamed responses are not written to disk
+    trans_data_stream = worker_pool.stream(iter_trans_data_bytes, input_params_dict, response_format, columns, offset, limit)
+    return StreamingResponse(content=trans_data_stream, media_type=cons.api_media_types[response_format])
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """
+    Preloads the reference data before the worker processes are started, so that they inherit it, fails any jobs interrupted by a previous shutdown, and shuts down the worker processes when the api stops.
+    
+    Parameters
+    ----------
+    app : fastapi.FastAPI
+        The api application.
+    """
+    ref_data_registry.load_bundle(fpath_bundle=cons.fpath_ref_data_bundle)
+    ref_data_registry.preload()
+    job_store.fail_unfinished(error='Interrupted by a restart of the api.')
+    yield
+    worker_pool.shutdown()
+    job_pool.shutdown()
+
 app = FastAPI(
     title="Random Telecom Payments Data Generator API",
     description="An API to generate random telecom payments data based on user-defined parameters.",
     version="0.0.0",
     openapi_tags=tags_metadata,
+    lifespan=lifespan,
 )
+app.include_router(jobs_router)
+
+@app.get("/api/cache", tags=["Random Telecom Payments Data Generator"])
+async def get_api_cache():
+    """
+    Reports the metrics of the result cache of seeded requests.
+    
+    Returns
+    -------
+    response : dict
+        The memory hit, disk hit, miss and eviction counts, hit rate, and the number of entries and bytes of the in memory and on disk tiers.
+    """
+    return result_cache.metrics()
 
 @app.get("/api", tags=["Random Telecom Payments Data Generator"])
 async def get_api(
     n_users: Annotated[int, Query(title="Number of Users", description="The number of users")] = cons.default_n_users,
     use_random_seed : Annotated[int, Query(title="Use Random Seed", description="The random seed to use", ge=0, le=1)] = cons.default_use_random_seed,
     n_itr : Annotated[int, Query(title="Number of Iterations", description="The number of iterations", ge=1)] = cons.default_n_itr,
+    n_shards : Annotated[int, Query(title="Number of Shards", description="The number of shards to split a single dataset across", ge=1)] = cons.default_n_shards,
     n_applications : Annotated[int, Query(title="Number of Applications", description="The number of applications", ge=1)] = cons.default_n_applications,
     registration_start_date : Annotated[str, Query(title="Registration Start Date", description="The registration start date in YYYY-MM-DD format")] = cons.default_registration_start_date,
     registration_end_date : Annotated[str, Query(title="Registration End Date", description="The registration end date in YYYY-MM-DD format")] = cons.default_registration_end_date,
     transaction_start_date : Annotated[str, Query(title="Transaction Start Date", description="The transaction start date in YYYY-MM-DD format")] = cons.default_transaction_start_date,
     transaction_end_date : Annotated[str, Query(title="Transaction End Date", description="The transaction end date in YYYY-MM-DD format")] = cons.default_transaction_end_date,
+    columns : Annotated[Union[str, None], Query(title="Columns", description="The comma separated transaction data columns to return, e.g. userid,transaction_date,transaction_amount")] = None,
+    offset : Annotated[int, Query(title="Offset", description="The number of transaction data rows to skip", ge=0)] = 0,
+    limit : Annotated[Union[int, None], Query(title="Limit", description="The maximum number of transaction data rows to return", ge=1)] = None,
+    response_format : Annotated[Union[str, None], Query(alias="format", title="Format", description="The response format, either json, ndjson or arrow, overriding the Accept header", pattern="^(json|ndjson|arrow)$")] = None,
+    write_output : Annotated[int, Query(title="Write Output", description="Whether to also write the output files to disk for json responses", ge=0, le=1)] = cons.api_default_write_output,
+    accept : Annotated[Union[str, None], Header(title="Accept", description="The response media type; application/json, application/x-ndjson or application/vnd.apache.arrow.stream")] = None,
     ):
     """
     Generate random telecom payments data based on user-defined parameters.
@@ -42,6 +358,8 @@ async def get_api(
         The random seed to use (0 or 1).
     n_itr : int
         The number of iterations.
+    n_shards : int
+        The number of shards to split a single dataset across.
     n_applications : int
         The number of applications.
     registration_start_date : str
@@ -52,33 +370,50 @@ async def get_api(
         The transaction start date in YYYY-MM-DD format.
     transaction_end_date : str
         The transaction end date in YYYY-MM-DD format.
+    columns : str
+        The comma separated transaction data columns to return, default is all columns.
+    offset : int
+        The number of transaction data rows to skip, default is 0.
+    limit : int
+        The maximum number of transaction data rows to return, default is all rows after the offset.
+    format : str
+        The response format, either json, ndjson or arrow, overriding the Accept header.
+    write_output : int
+        Whether to also write the output files to disk for json responses (0 or 1), default is 0.
+    accept : str
+        The Accept header of the request, negotiating a json, newline delimited json or arrow ipc stream response.
     
     Returns
     -------
-    response : str
-        A JSON string containing the generated telecom payments data.
+    response : fastapi.responses.Response
+        The generated telecom payments data, either as a JSON array or streamed as newline delimited JSON or arrow ipc record batches.
     """
     # generate parameters dictionary
     input_params_dict={
+        **cons.default_input_params_dict,
         "n_users": n_users,
         "use_random_seed": use_random_seed,
         "n_itr": n_itr,
+        "n_shards": n_shards,
         "n_applications": n_applications,
         "registration_start_date": registration_start_date,
         "registration_end_date": registration_end_date,
         "transaction_start_date": transaction_start_date,
-        "transaction_end_date": transaction_end_date
+        "transaction_end_date": transaction_end_date,
+        "write_output": write_output
     }
-    # run random telecom payments generator
-    output_data_dict = main(input_params_dict=input_params_dict)
-    # convert transaction data to dictionary and then to json response
-    trans_data_dict = output_data_dict['trans_data'].to_dict(orient='records')
-    response = json.dumps(trans_data_dict, cls=JsonEncoder)
+    # generate the response in the negotiated response format
+    response = await gen_api_response(input_params_dict=input_params_dict, accept=accept, columns=columns, offset=offset, limit=limit, response_format=response_format)
     return response
 
 @app.post("/api", tags=["Random Telecom Payments Data Generator"])
 async def post_api(
-    body: Dict[str, object] = {}
+    body: Dict[str, object] = {},
+    columns : Annotated[Union[str, None], Query(title="Columns", description="The comma separated transaction data columns to return, e.g. userid,transaction_date,transaction_amount")] = None,
+    offset : Annotated[int, Query(title="Offset", description="The number of transaction data rows to skip", ge=0)] = 0,
+    limit : Annotated[Union[int, None], Query(title="Limit", description="The maximum number of transaction data rows to return", ge=1)] = None,
+    response_format : Annotated[Union[str, None], Query(alias="format", title="Format", description="The response format, either json, ndjson or arrow, overriding the Accept header", pattern="^(json|ndjson|arrow)$")] = None,
+    accept : Annotated[Union[str, None], Header(title="Accept", description="The response media type; application/json, application/x-ndjson or application/vnd.apache.arrow.stream")] = None,
     ):
     """
     Generate random telecom payments data based on user-defined parameters.
@@ -94,6 +429,8 @@ async def post_api(
                 The random seed to use (0 or 1).
             - n_itr : int
                 The number of iterations.
+            - n_shards : int
+                The number of shards to split a single dataset across.
             - n_applications : int
                 The number of applications.
             - registration_start_date : str
@@ -104,17 +441,26 @@ async def post_api(
                 The transaction start date in YYYY-MM-DD format.
             - transaction_end_date : str
                 The transaction end date in YYYY-MM-DD format.
+            - write_output : int
+                Whether to also write the output files to disk for json responses (0 or 1), default is 0.
+    columns : str
+        The comma separated transaction data columns to return, default is all columns.
+    offset : int
+        The number of transaction data rows to skip, default is 0.
+    limit : int
+        The maximum number of transaction data rows to return, default is all rows after the offset.
+    format : str
+        The response format, either json, ndjson or arrow, overriding the Accept header.
+    accept : str
+        The Accept header of the request, negotiating a json, newline delimited json or arrow ipc stream response.
     
     Returns
     -------
-    response : str
-        A JSON string containing the generated telecom payments data.
+    response : fastapi.responses.Response
+        The generated telecom payments data, either as a JSON array or streamed as newline delimited JSON or arrow ipc record batches.
     """
     # generate parameters dictionary
-    input_params_dict={**cons.default_input_params_dict, **body}
-    # run random telecom payments generator
-    output_data_dict = main(input_params_dict=input_params_dict)
-    # convert transaction data to dictionary and then to json response
-    trans_data_dict = output_data_dict['trans_data'].to_dict(orient='records')
-    response = json.dumps(trans_data_dict, cls=JsonEncoder)
+    input_params_dict={**cons.default_input_params_dict, 'write_output': cons.api_default_write_output, **body}
+    # generate the response in the negotiated response format
+    response = await gen_api_response(input_params_dict=input_params_dict, accept=accept, columns=columns, offset=offset, limit=limit, response_format=response_format)
     return response
\ No newline at end of file
@@ -1,7 +1,9 @@
 from datetime import datetime
 from beartype import beartype
+from typing import Union
 
 import cons
+from utilities.RandomContext import RandomContext
 
 class ProgrammeParams():
     """
@@ -31,6 +33,8 @@ class ProgrammeParams():
     ----------
     random_seed : int, optional
         Seed for random number generation for reproducibility.
+    random_context : RandomContext
+        The random context handing out the random number generator streams of each programme stage, seeded from the random seed.
     n_users : int
         Number of users to generate. Defaults to 100.
     n_applications : int
@@ -51,7 +55,7 @@ class ProgrammeParams():
     def __init__(
         self,
         n_users:int=100,
-        random_seed:int=None,
+        random_seed:Union[int, None]=None,
         n_applications:int=20000,
         registration_start_date:str=cons.default_registration_start_date,
         registration_end_date:str=cons.default_registration_end_date,
@@ -60,6 +64,7 @@ class ProgrammeParams():
         ):
         # take programme parameters from class parameters
         self.random_seed = random_seed
+        self.random_context = RandomContext(random_seed=random_seed)
         self.n_users = n_users
         self.n_applications = n_applications
         self.registration_start_date = registration_start_date
@@ -1,8 +1,6 @@
 import numpy as np
 import pandas as pd
-from typing import Dict
-import random
-from beartype import beartype
+from typing import Dict, Union
 
 from app.ProgrammeParams import ProgrammeParams
 from app.gen_user_data import gen_user_data
@@ -15,17 +13,20 @@ from objects.Transaction import Transaction
 from objects.User import User
 from utilities.gen_random_entity_counts import gen_random_entity_counts
 import cons
+from utilities.lean_beartype import lean_beartype
 
-@beartype
+@lean_beartype
 def gen_random_telecom_data(
     n_users:int=1,
-    random_seed:int=None,
+    random_seed:Union[int, None]=None,
     n_applications:int=20000,
     registration_start_date:str=cons.default_registration_start_date,
     registration_end_date:str=cons.default_registration_end_date,
     transaction_start_date:str=cons.default_transaction_start_date,
     transaction_end_date:str=cons.default_transaction_end_date,
-    ) -> Dict[str, pd.DataFrame]:
+    shard:Union[int, None]=None,
+    share_idhashes:bool=True,
+    ) -> Dict[str, object]:
     """
     Generates random telecommunications data.
     
@@ -45,11 +46,16 @@ def gen_random_telecom_data(
         The user transaction start date, default is cons.default_transaction_start_date.
     transaction_end_date : str
         The user transaction end date, default is cons.default_transaction_end_date.
+    shard : int
+        The shard number of the run, e.g. the iteration number when running multiple iterations in parallel, default is None for an unsharded run.
+        Each shard generates its idhashes from its own disjoint counter range with idhash keys shared by all shards, so idhashes are unique across shards.
+    share_idhashes : bool
+        Whether to remap the transactions onto shared ip, card and device idhashes, default is True. Sharded runs set this to False and generate the shared networks across all shards afterwards, see app.gen_shared_networks.
     
     Returns
     -------
-    Dict[str, pandas.DataFrame]
-        A random telecommunication payments dataset.
+    Dict[str, object]
+        A random telecommunication payments dataset of user level data, transaction level data and the per user entity pools.
     """
     
     # initalise programme parameters
@@ -63,9 +69,17 @@ def gen_random_telecom_data(
         transaction_end_date=transaction_end_date
         )
     
-    # set random seed
-    random.seed(programmeparams.random_seed)
-    np.random.seed(seed=programmeparams.random_seed)
+    # take the random context of the run, each stage below draws from its own independent stream
+    random_context = programmeparams.random_context if shard is None else programmeparams.random_context.shard(shard=shard)
+    
+    # set the idhash counter offset and permutation keys, shards permute disjoint counter ranges with the keys of the unsharded random context
+    idhash_entities = ['user', 'device', 'card', 'ip', 'transaction']
+    if shard is None:
+        idhash_offset = 0
+        idhash_keys = dict.fromkeys(idhash_entities)
+    else:
+        idhash_offset = shard * cons.data_model_shard_idhash_stride
+        idhash_keys = dict(zip(idhash_entities, programmeparams.random_context.stream(stage='idhash_keys').integers(low=0, high=2**64, size=len(idhash_entities), dtype=np.uint64).tolist()))
     
     # generate random users
     user_obj = User(
@@ -76,24 +90,29 @@ def gen_random_telecom_data(
         fpath_last_names=cons.fpath_llama_last_names,
         fpath_countries_europe=cons.fpath_countries_europe,
         fpath_email_domain=cons.fpath_email_domain,
-        fpath_bedrock_email_domain=cons.fpath_llama_email_domains
+        fpath_bedrock_email_domain=cons.fpath_llama_email_domains,
+        rng=random_context.stream(stage='user'),
+        idhash_offset=idhash_offset,
+        idhash_key=idhash_keys['user'],
         )
     
     # generate random entity counts for each user
     random_entity_counts = gen_random_entity_counts(
         user_obj=user_obj,
+        rng=random_context.stream(stage='entity_counts'),
         transaction_timescale=programmeparams.transaction_timescale
         )
     
     # generate random entity values
-    device_obj = Device(n_device_hashes=random_entity_counts['n_devices'].sum())
-    card_obj = Card(n_card_hashes=random_entity_counts['n_cards'].sum())
-    ip_obj = Ip(n_ip_hashes=random_entity_counts['n_ips'].sum())
-    transaction_obj = Transaction(n_transaction_hashes=random_entity_counts['n_transactions'].sum(), start_date=programmeparams.transaction_start_date, end_date=programmeparams.transaction_end_date)
-    application_obj = Application(n_application_hashes=programmeparams.n_applications)
+    device_obj = Device(n_device_hashes=random_entity_counts['n_devices'].sum(), rng=random_context.stream(stage='device'), idhash_offset=idhash_offset, idhash_key=idhash_keys['device'])
+    card_obj = Card(n_card_hashes=random_entity_counts['n_cards'].sum(), rng=random_context.stream(stage='card'), idhash_offset=idhash_offset, idhash_key=idhash_keys['card'])
+    ip_obj = Ip(n_ip_hashes=random_entity_counts['n_ips'].sum(), rng=random_context.stream(stage='ip'), idhash_offset=idhash_offset, idhash_key=idhash_keys['ip'])
+    transaction_obj = Transaction(n_transaction_hashes=random_entity_counts['n_transactions'].sum(), start_date=programmeparams.transaction_start_date, end_date=programmeparams.transaction_end_date, rng=random_context.stream(stage='transaction'), idhash_offset=idhash_offset, idhash_key=idhash_keys['transaction'])
+    # the applications are drawn from the unsharded random context, so every shard shares the same application catalogue
+    application_obj = Application(n_application_hashes=programmeparams.n_applications, rng=programmeparams.random_context.stream(stage='application'))
     
     # generate user level data
-    user_data = gen_user_data(
+    user_data, user_entity_pools = gen_user_data(
         random_entity_counts=random_entity_counts,
         user_obj=user_obj,
         device_obj=device_obj,
@@ -101,22 +120,26 @@ def gen_random_telecom_data(
         ip_obj=ip_obj,
         transaction_obj=transaction_obj,
         application_obj=application_obj,
+        rng=random_context.stream(stage='user_data'),
     )
     
     # generate transaction level data
     trans_data = gen_trans_data(
         user_data=user_data,
+        user_entity_pools=user_entity_pools,
         user_obj=user_obj,
         device_obj=device_obj,
         card_obj=card_obj,
         ip_obj=ip_obj,
         transaction_obj=transaction_obj,
         application_obj=application_obj,
-        fpath_countrycrimeindex=cons.fpath_countrycrimeindex
+        rng=random_context.stream(stage='trans_data'),
+        fpath_countrycrimeindex=cons.fpath_countrycrimeindex,
+        share_idhashes=share_idhashes,
     )
     
     # map np.nans to None for JSON serialisation
     user_data = user_data.where(pd.notnull(user_data), None)
     trans_data = trans_data.where(pd.notnull(trans_data), None)
     
-    return {"user_data":user_data, "trans_data":trans_data}
+    return {"user_data":user_data, "trans_data":trans_data, "user_entity_pools":user_entity_pools}
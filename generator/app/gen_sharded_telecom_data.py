@@ -0,0 +1,104 @@
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, Union
+
+from app.gen_random_telecom_data import gen_random_telecom_data
+from app.gen_shared_networks import gen_shared_networks
+from utilities.RandomContext import RandomContext
+from utilities.imultiprocess import imultiprocess
+from utilities.EntityPool import EntityPool
+from utilities.gen_random_hash import gen_random_hash
+import cons
+from utilities.lean_beartype import lean_beartype
+
+@lean_beartype
+def gen_sharded_telecom_data(
+    n_users:int=1,
+    n_shards:int=1,
+    random_seed:Union[int, None]=None,
+    n_applications:int=20000,
+    registration_start_date:str=cons.default_registration_start_date,
+    registration_end_date:str=cons.default_registration_end_date,
+    transaction_start_date:str=cons.default_transaction_start_date,
+    transaction_end_date:str=cons.default_transaction_end_date,
+    ncpu:Union[int, None]=None,
+    progress_callback:Union[Callable[[int, int, int], None], None]=None,
+    ) -> Dict[str, object]:
+    """
+    Generates a single random telecommunications dataset by splitting the users into shards generated in parallel across a process pool.
+
+    Each shard generates its idhashes from its own disjoint counter range with shared idhash keys, so the combined dataset has no duplicate idhashes, and all shards share the same application catalogue.
+    The shared ip, card and device networks are then generated in a single pass over the combined transaction level data, see app.gen_shared_networks.
+
+    Parameters
+    ----------
+    n_users : int
+        The total number of users to generate random telecom payments data for, default is 1.
+    n_shards : int
+        The number of shards to split the users into, default is 1.
+    random_seed : int
+        A set random seed for reproducible results, default is None.
+    n_applications : int
+        The number of applications to generate, default is 20000.
+    registration_start_date : str
+        The user registration start date, default is cons.default_registration_start_date.
+    registration_end_date : str
+        The user registration end date, default is cons.default_registration_end_date.
+    transaction_start_date : str
+        The user transaction start date, default is cons.default_transaction_start_date.
+    transaction_end_date : str
+        The user transaction end date, default is cons.default_transaction_end_date.
+    ncpu : int
+        The number of cpus to generate the shards across, default is None for all cpus.
+    progress_callback : Callable[[int, int, int], None]
+        A function called with the shard index, number of users and number of transactions of each shard as it completes, in shard order, default is None.
+
+    Returns
+    -------
+    Dict[str, object]
+        A random telecommunication payments dataset of user level data, transaction level data and the per user entity pools.
+
+    Examples
+    --------
+    ```
+    gen_sharded_telecom_data(n_users=1000, n_shards=4, random_seed=42)
+    ```
+    """
+    # resolve the random seed once, so every shard derives its random streams and idhash keys from the same entropy
+    random_context = RandomContext(random_seed=random_seed)
+    random_seed = random_context.seed_sequence.entropy
+    # split the users into near equal shards
+    shards_n_users = [n_users // n_shards + int(shard < n_users % n_shards) for shard in range(n_shards)]
+    # generate the unshared shards via multiprocess call
+    args = [
+        (
+            shard_n_users,
+            random_seed,
+            n_applications,
+            registration_start_date,
+            registration_end_date,
+            transaction_start_date,
+            transaction_end_date,
+            shard,
+            False
+        ) for shard, shard_n_users in enumerate(shards_n_users)
+        ]
+    results = []
+    for shard, result in enumerate(imultiprocess(func = gen_random_telecom_data, args = args, ncpu = ncpu, ordered = True)):
+        results.append(result)
+        if progress_callback is not None:
+            progress_callback(shard, result['user_data'].shape[0], result['trans_data'].shape[0])
+    # concatenate the shards, the entity pools of the shards are stacked in the same user order as the user data
+    user_data = pd.concat(objs = [result['user_data'] for result in results], axis = 0, ignore_index = True)
+    trans_data = pd.concat(objs = [result['trans_data'] for result in results], axis = 0, ignore_index = True)
+    user_entity_pools = {
+        idhash_col:EntityPool(values=np.concatenate([result['user_entity_pools'][idhash_col].values for result in results]), counts=np.concatenate([result['user_entity_pools'][idhash_col].counts for result in results]))
+        for idhash_col in results[0]['user_entity_pools'].keys()
+        }
+    # generate the shared networks across all shards
+    trans_data = gen_shared_networks(trans_data=trans_data, rng=random_context.stream(stage='shared_networks'))
+    # create a single hash value for the sharded dataset
+    itr_hash = gen_random_hash(size=1, rng=random_context.stream(stage='itr_hash'))[0]
+    user_data['itr_hash'] = itr_hash
+    trans_data['itr_hash'] = itr_hash
+    return {"user_data":user_data, "trans_data":trans_data, "user_entity_pools":user_entity_pools}
@@ -0,0 +1,69 @@
+import pandas as pd
+import numpy as np
+
+from utilities.gen_shared_idhashes import gen_shared_idhashes
+from utilities.remap_idhashes import remap_idhashes
+from utilities.align_idhash_country_codes import align_idhash_country_codes
+from utilities.gen_country_codes_map import gen_country_codes_map
+from utilities.join_idhash_attrs import join_idhash_attrs
+from utilities.gen_trans_rejection_rates import gen_trans_rejection_rates
+from utilities.gen_trans_status import gen_trans_status
+import cons
+from utilities.lean_beartype import lean_beartype
+
+@lean_beartype
+def gen_shared_networks(
+    trans_data:pd.DataFrame,
+    rng:np.random.Generator,
+    fpath_countries_europe:str=cons.fpath_countries_europe,
+    fpath_countrycrimeindex:str=cons.fpath_countrycrimeindex,
+    fpath_email_domain:str=cons.fpath_email_domain,
+    ):
+    """
+    Generates the shared ip, card and device networks between users over the combined transaction level data of all shards of a sharded run.
+
+    The shards leave their entity hashes unshared, so the shared idhashes are drawn once over the unique hashes of every shard and users in different shards can share an entity.
+    The transactions are then remapped onto their shared idhashes, each shared idhash is given consistent entity types and majority country codes, and the transaction status is regenerated from the shared data.
+
+    Parameters
+    ----------
+    trans_data : pandas.DataFrame
+        The combined random transaction level data of all shards, generated without shared idhashes.
+    rng : numpy.random.Generator
+        The random number generator to draw from.
+    fpath_countries_europe : str
+        The full file path to the european countries reference data, default is cons.fpath_countries_europe.
+    fpath_countrycrimeindex : str
+        The full file path to the country crime index reference data, default is cons.fpath_countrycrimeindex.
+    fpath_email_domain : str
+        The full file path to the email domain reference data, default is cons.fpath_email_domain.
+
+    Returns
+    -------
+    pandas.DataFrame
+        The random transaction level data with shared ip, card and device networks.
+    """
+
+    # draw the shared idhashes over the unique idhashes of all shards and remap the transactions onto them
+    for entity, idhash_col, type_cols in [('ip', 'ip_hash', []), ('card', 'card_hash', ['card_type']), ('device', 'device_hash', ['device_type'])]:
+        idhashes = np.asarray(trans_data[idhash_col].dropna().unique(), dtype=np.uint64)
+        shared_idhash_positions = gen_shared_idhashes(idhashes=idhashes, prop_shared_idhashes=cons.data_model_shared_entities_dict[entity], rng=rng)
+        trans_data[idhash_col] = remap_idhashes(idhashes=trans_data[idhash_col], source_codes=idhashes, target_codes=idhashes[shared_idhash_positions])
+        # give every transaction of a shared idhash the entity types of the idhash's first transaction
+        if type_cols != []:
+            trans_data[type_cols] = trans_data.groupby(by=idhash_col, sort=False)[type_cols].transform('first')
+
+    # re-align the ip and card country codes to the majority country code of each shared idhash, via their iso numeric country codes
+    country_codes_map = gen_country_codes_map(fpath_countries_europe=fpath_countries_europe)
+    country_codes_numeric, country_codes_alpha = np.array(list(country_codes_map.keys())), np.array(list(country_codes_map.values()), dtype=object)
+    for country_code_type in ['card', 'ip']:
+        trans_data = join_idhash_attrs(data=trans_data, idhash_col=f'{country_code_type}_country_code', idhashes=country_codes_alpha, idhash_attrs={f'{country_code_type}_country_code_alpha':country_codes_numeric})
+        trans_data[f'{country_code_type}_country_code_alpha'] = align_idhash_country_codes(data = trans_data, idhash_col = f'{country_code_type}_hash', country_code_col = f'{country_code_type}_country_code_alpha')
+        trans_data = join_idhash_attrs(data=trans_data, idhash_col=f'{country_code_type}_country_code_alpha', idhashes=country_codes_numeric, idhash_attrs={f'{country_code_type}_country_code':country_codes_alpha})
+    trans_data = trans_data.drop(columns = ['card_country_code_alpha', 'ip_country_code_alpha'])
+
+    # regenerate transaction status and error code from the shared networks
+    rejection_rates = gen_trans_rejection_rates(trans_data=trans_data, fpath_countries_europe=fpath_countries_europe, fpath_countrycrimeindex=fpath_countrycrimeindex, fpath_email_domain=fpath_email_domain)
+    trans_data[['transaction_status', 'transaction_error_code']] = gen_trans_status(trans_data = trans_data, rejection_rates = rejection_rates, rng = rng)
+
+    return trans_data
@@ -1,8 +1,7 @@
-import random
 import pandas as pd
 import numpy as np
 from datetime import datetime
-from beartype import beartype
+from typing import Dict
 
 from objects.User import User
 from objects.Device import Device
@@ -12,21 +11,33 @@ from objects.Transaction import Transaction
 from objects.Application import Application
 from utilities.gen_country_codes_map import gen_country_codes_map
 from utilities.align_country_codes import align_country_codes
+from utilities.align_idhash_country_codes import align_idhash_country_codes
+from utilities.align_trans_dates import align_trans_dates
 from utilities.gen_trans_rejection_rates import gen_trans_rejection_rates
 from utilities.gen_trans_status import gen_trans_status
-from utilities.join_idhashes_dict import join_idhashes_dict
+from utilities.join_idhash_attrs import join_idhash_attrs
+from utilities.remap_idhashes import remap_idhashes
+from utilities.EntityPool import EntityPool
+from utilities.CategoricalSampler import CategoricalSampler
 import cons
+from utilities.lean_beartype import lean_beartype
 
-@beartype
+# the payment method sampler of transactions without a card
+non_card_trans_method_sampler = CategoricalSampler.from_dict(prop_dict=cons.data_model_non_card_trans_methods)
+
+@lean_beartype
 def gen_trans_data(
     user_data:pd.DataFrame,
+    user_entity_pools:Dict[str, EntityPool],
     user_obj:User,
     device_obj:Device,
     card_obj:Card,
     ip_obj:Ip,
     transaction_obj:Transaction,
     application_obj:Application,
+    rng:np.random.Generator,
     fpath_countrycrimeindex:str=cons.fpath_countrycrimeindex,
+    share_idhashes:bool=True,
     ):
     """
     Generates random transaction level telecom payments data.
@@ -35,6 +46,8 @@ def gen_trans_data(
     ----------
     user_data : pandas.DataFrame
         The random user level data.
+    user_entity_pools : Dict[str, EntityPool]
+        The per user entity pools of device, card, ip, transaction and application hashes keyed by idhash column name.
     user_obj : User
         The random user data model object.
     device_obj : Device
@@ -47,8 +60,12 @@ def gen_trans_data(
         The random transaction data model object.
     application_obj : Application
         The random application data model object.
+    rng : numpy.random.Generator
+        The random number generator to draw from.
     fpath_countrycrimeindex : str
         The full file path to the country crime index reference data, default is cons.fpath_countrycrimeindex.
+    share_idhashes : bool
+        Whether to remap ip, card and device hashes onto the shared idhashes of their data model objects, default is True. Sharded runs set this to False and share idhashes across all shards afterwards, see app.gen_shared_networks.
     
     Returns
     -------
@@ -56,31 +73,31 @@ def gen_trans_data(
         The random transaction level telecom payments data.
     """
     
-    # explode user data to transaction level
-    trans_data = user_data.explode('transaction_hash').dropna(subset = ['transaction_hash']).reset_index(drop = True)
-    # select uid entity hashes for each transaction
-    trans_data['device_hash'] = trans_data['device_hash'].apply(lambda x: np.random.choice(x, size = 1)[0] if isinstance(x, list) and x != [] else np.nan)
-    trans_data['card_hash'] = trans_data['card_hash'].apply(lambda x: np.random.choice(x, size = 1)[0] if isinstance(x, list) and x != [] else np.nan)
-    trans_data['ip_hash'] = trans_data['ip_hash'].apply(lambda x: np.random.choice(x, size = 1)[0] if isinstance(x, list) and x != [] else np.nan)
-    trans_data['application_hash'] = trans_data['application_hash'].apply(lambda x: np.random.choice(x, size = 1)[0] if isinstance(x, list) and x != [] else np.nan)
+    # expand user data to transaction level using the user position of each transaction hash
+    trans_user_idx = user_entity_pools['transaction_hash'].owners
+    trans_data = user_data.iloc[trans_user_idx].reset_index(drop = True)
+    trans_data['transaction_hash'] = user_entity_pools['transaction_hash'].values
+    # select uid entity hashes for each transaction from the per user entity pools
+    for idhash_col in ['device_hash', 'card_hash', 'ip_hash', 'application_hash']:
+        trans_data[idhash_col] = user_entity_pools[idhash_col].select(owners = trans_user_idx, rng = rng)
     # add null values card hashes
-    trans_null_mask = np.random.uniform(size=trans_data.shape[0]) <= cons.data_model_null_rates['card']
+    trans_null_mask = rng.uniform(size=trans_data.shape[0]) <= cons.data_model_null_rates['card']
     trans_data.loc[trans_null_mask, 'card_hash'] = np.nan
     # add shared hashed entities between users
-    trans_data['ip_hash'] = trans_data['ip_hash'].apply(lambda x: ip_obj.ip_shared_idhash_map_dict[x] if x in ip_obj.ip_shared_idhash_map_dict.keys() else x)
-    trans_data['card_hash'] = trans_data['card_hash'].apply(lambda x: card_obj.card_shared_idhash_map_dict[x] if x in card_obj.card_shared_idhash_map_dict.keys() else x)
-    trans_data['device_hash'] = trans_data['device_hash'].apply(lambda x: device_obj.device_shared_idhash_map_dict[x] if x in device_obj.device_shared_idhash_map_dict.keys() else x)
-    # add card and device entity types
-    trans_data = join_idhashes_dict(data=trans_data, idhashes_dict=device_obj.device_hashes_type_dict, idhash_key_name='device_hash', idhash_val_name='device_type')
-    trans_data = join_idhashes_dict(data=trans_data, idhashes_dict=card_obj.card_hashes_type_dict, idhash_key_name='card_hash', idhash_val_name='card_type')
-    # add card and ip country codes
-    trans_data = join_idhashes_dict(data=trans_data, idhashes_dict=card_obj.card_hashes_country_code_dict, idhash_key_name='card_hash', idhash_val_name='card_country_code_alpha')
-    trans_data = join_idhashes_dict(data=trans_data, idhashes_dict=ip_obj.ip_hashes_country_code_dict, idhash_key_name='ip_hash', idhash_val_name='ip_country_code_alpha')
-    # add transaction data
-    trans_data = join_idhashes_dict(data=trans_data, idhashes_dict=transaction_obj.transaction_hashes_amounts_dict, idhash_key_name='transaction_hash', idhash_val_name='transaction_amount')
-    trans_data = join_idhashes_dict(data=trans_data, idhashes_dict=transaction_obj.transaction_hashes_dates_dict, idhash_key_name='transaction_hash', idhash_val_name='transaction_date')
+    if share_idhashes:
+        trans_data['ip_hash'] = remap_idhashes(idhashes=trans_data['ip_hash'], source_codes=ip_obj.ip_hashes, target_codes=ip_obj.ip_shared_idhashes)
+        trans_data['card_hash'] = remap_idhashes(idhashes=trans_data['card_hash'], source_codes=card_obj.card_hashes, target_codes=card_obj.card_shared_idhashes)
+        trans_data['device_hash'] = remap_idhashes(idhashes=trans_data['device_hash'], source_codes=device_obj.device_hashes, target_codes=device_obj.device_shared_idhashes)
+    # add device entity types
+    trans_data = join_idhash_attrs(data=trans_data, idhash_col='device_hash', idhashes=device_obj.device_hashes, idhash_attrs={'device_type':device_obj.device_hashes_type})
+    # add card entity types and country codes
+    trans_data = join_idhash_attrs(data=trans_data, idhash_col='card_hash', idhashes=card_obj.card_hashes, idhash_attrs={'card_type':card_obj.card_hashes_type, 'card_country_code_alpha':card_obj.card_hashes_country_code})
+    # add ip country codes
+    trans_data = join_idhash_attrs(data=trans_data, idhash_col='ip_hash', idhashes=ip_obj.ip_hashes, idhash_attrs={'ip_country_code_alpha':ip_obj.ip_hashes_country_code})
+    # add transaction data, widening the datetime64[D] dates to the nanosecond resolution of pandas datetime columns
+    trans_data = join_idhash_attrs(data=trans_data, idhash_col='transaction_hash', idhashes=transaction_obj.transaction_hashes, idhash_attrs={'transaction_amount':transaction_obj.transaction_hashes_amounts, 'transaction_date':transaction_obj.transaction_hashes_dates.astype('datetime64[ns]')})
     # add application data
-    trans_data = join_idhashes_dict(data=trans_data, idhashes_dict=application_obj.application_hashes_payment_channel_dict, idhash_key_name='application_hash', idhash_val_name='card_payment_channel')
+    trans_data = join_idhash_attrs(data=trans_data, idhash_col='application_hash', idhashes=application_obj.application_hashes, idhash_attrs={'card_payment_channel':application_obj.application_hashes_payment_channel})
     
     # TODO: wrap this logic up into a separate function
     # align payment channel with missing card hashes and 0 transaction amounts
@@ -92,29 +109,25 @@ def gen_trans_data(
     trans_data['transaction_payment_method'] = 'Card'
     zero_transaction_amount_filter = (trans_data['transaction_amount'] == 0.0)
     missing_card_hash_filter = (trans_data['card_hash'].isnull())
-    trans_data.loc[missing_card_hash_filter, 'transaction_payment_method'] = pd.Series(np.random.choice(a = list(cons.data_model_non_card_trans_methods.keys()), size = missing_card_hash_filter.sum(), p = list(cons.data_model_non_card_trans_methods.values()), replace=True), index=trans_data[missing_card_hash_filter].index)
+    trans_data.loc[missing_card_hash_filter, 'transaction_payment_method'] = pd.Series(non_card_trans_method_sampler.sample(rng=rng, size=missing_card_hash_filter.sum()), index=trans_data[missing_card_hash_filter].index)
     trans_data.loc[zero_transaction_amount_filter, 'transaction_payment_method'] = np.nan
     # align country codes for user, ip and card
     country_code_columns = ['registration_country_code_alpha', 'ip_country_code_alpha', 'card_country_code_alpha']
-    trans_data[country_code_columns] = trans_data[country_code_columns].apply(lambda series: align_country_codes(series), axis = 1)
-    agg_aligned_ips = trans_data.groupby(by = ['ip_hash', 'ip_country_code_alpha'], as_index = False).size().sort_values(by = ['ip_hash', 'ip_country_code_alpha'], ascending = [True, False]).drop_duplicates(subset = ['ip_hash'], keep = 'first').drop(columns = ['size'])
-    agg_aligned_cards = trans_data.groupby(by = ['card_hash', 'card_country_code_alpha'], as_index = False).size().sort_values(by = ['card_hash', 'card_country_code_alpha'], ascending = [True, False]).drop_duplicates(subset = ['card_hash'], keep = 'first').drop(columns = ['size'])
-    trans_data = pd.merge(left = trans_data.drop(columns = ['ip_country_code_alpha']), right = agg_aligned_ips, on = 'ip_hash', how = 'left')
-    trans_data = pd.merge(left = trans_data.drop(columns = ['card_country_code_alpha']), right = agg_aligned_cards, on = 'card_hash', how = 'left')
+    trans_data[country_code_columns] = align_country_codes(data = trans_data[country_code_columns], rng = rng)
+    trans_data['ip_country_code_alpha'] = align_idhash_country_codes(data = trans_data, idhash_col = 'ip_hash', country_code_col = 'ip_country_code_alpha')
+    trans_data['card_country_code_alpha'] = align_idhash_country_codes(data = trans_data, idhash_col = 'card_hash', country_code_col = 'card_country_code_alpha')
     # align registration and transaction dates
-    date_columns = ['registration_date', 'transaction_date']
     if datetime.strptime(user_obj.end_date, "%Y-%m-%d") > datetime.strptime(transaction_obj.start_date, "%Y-%m-%d"):
-        dates_series = pd.date_range(start=datetime.strptime(transaction_obj.start_date, "%Y-%m-%d"), end=datetime.strptime(transaction_obj.end_date, "%Y-%m-%d") - pd.Timedelta(days=1), freq="d")
-        trans_data[date_columns] = trans_data[date_columns].apply(lambda s: [s['registration_date'], np.random.choice(a=dates_series[dates_series >= max(s['registration_date'], s['transaction_date'])], size=1)[0]], result_type = 'expand', axis = 1).copy()
+        trans_data['transaction_date'] = align_trans_dates(registration_dates=trans_data['registration_date'].to_numpy(), transaction_dates=trans_data['transaction_date'].to_numpy(), end_date=transaction_obj.end_date, rng=rng)
     # map iso numeric country codes to iso alpha country codes
     country_codes_map = gen_country_codes_map(fpath_countries_europe=user_obj.fpath_countries_europe)
-    trans_data = join_idhashes_dict(data=trans_data, idhashes_dict=country_codes_map, idhash_key_name='registration_country_code_alpha', idhash_val_name='registration_country_code')
-    trans_data = join_idhashes_dict(data=trans_data, idhashes_dict=country_codes_map, idhash_key_name='card_country_code_alpha', idhash_val_name='card_country_code')
-    trans_data = join_idhashes_dict(data=trans_data, idhashes_dict=country_codes_map, idhash_key_name='ip_country_code_alpha', idhash_val_name='ip_country_code')
+    country_codes_numeric, country_codes_alpha = np.array(list(country_codes_map.keys())), np.array(list(country_codes_map.values()), dtype=object)
+    for country_code_type in ['registration', 'card', 'ip']:
+        trans_data = join_idhash_attrs(data=trans_data, idhash_col=f'{country_code_type}_country_code_alpha', idhashes=country_codes_numeric, idhash_attrs={f'{country_code_type}_country_code':country_codes_alpha})
     
     # generate transaction status and error code
-    rejection_rates_dict = gen_trans_rejection_rates(trans_data=trans_data, fpath_countries_europe=user_obj.fpath_countries_europe, fpath_countrycrimeindex=fpath_countrycrimeindex, fpath_email_domain =user_obj.fpath_email_domain )
-    trans_data[['transaction_status', 'transaction_error_code']] = trans_data.apply(lambda series: gen_trans_status(series = series, rejection_rates_dict = rejection_rates_dict), result_type = 'expand', axis = 1)
+    rejection_rates = gen_trans_rejection_rates(trans_data=trans_data, fpath_countries_europe=user_obj.fpath_countries_europe, fpath_countrycrimeindex=fpath_countrycrimeindex, fpath_email_domain =user_obj.fpath_email_domain )
+    trans_data[['transaction_status', 'transaction_error_code']] = gen_trans_status(trans_data = trans_data, rejection_rates = rejection_rates, rng = rng)
     
     # order columns and sort rows by transaction date
     col_order = cons.user_cols + cons. device_cols + cons.card_cols + cons.ip_cols + cons.app_cols + cons.trans_cols + cons.itr_cols
@@ -1,6 +1,6 @@
 import pandas as pd
 import numpy as np
-from beartype import beartype
+from typing import Dict, Tuple
 
 from objects.User import User
 from objects.Device import Device
@@ -8,11 +8,13 @@ from objects.Card import Card
 from objects.Ip import Ip
 from objects.Transaction import Transaction
 from objects.Application import Application
-from utilities.gen_obj_idhash_series import gen_obj_idhash_series
-from utilities.join_idhashes_dict import join_idhashes_dict
+from utilities.EntityPool import EntityPool
+from utilities.join_idhash_attrs import join_idhash_attrs
 from utilities.gen_random_hash import gen_random_hash
+from utilities.gen_userids import gen_userids
+from utilities.lean_beartype import lean_beartype
 
-@beartype
+@lean_beartype
 def gen_user_data(
     random_entity_counts:pd.DataFrame,
     user_obj:User,
@@ -20,8 +22,9 @@ def gen_user_data(
     card_obj:Card,
     ip_obj:Ip,
     transaction_obj:Transaction,
-    application_obj:Application
-    ) -> pd.DataFrame:
+    application_obj:Application,
+    rng:np.random.Generator,
+    ) -> Tuple[pd.DataFrame, Dict[str, EntityPool]]:
     """
     Generates random user level telecom payments data
 
@@ -41,36 +44,39 @@ def gen_user_data(
         The random transaction data model object
     application_obj : Application
         The random application data model object
+    rng : numpy.random.Generator
+        The random number generator to draw from
 
     Returns
     -------
-    pandas.DataFrame
-        The random user level telecom payments data
+    Tuple[pandas.DataFrame, Dict[str, EntityPool]]
+        The random user level telecom payments data, and the per user entity pools of device, card, ip, transaction and application hashes keyed by idhash column name
     """
     # take a deep copy of the data
     user_data = random_entity_counts.copy()
-    # add user data
-    user_data = join_idhashes_dict(data=user_data, idhashes_dict=user_obj.user_ids_first_name_dict, idhash_key_name='uid', idhash_val_name='first_name')
-    user_data = join_idhashes_dict(data=user_data, idhashes_dict=user_obj.user_ids_last_name_dict, idhash_key_name='uid', idhash_val_name='last_name')
-    user_data = join_idhashes_dict(data=user_data, idhashes_dict=user_obj.user_ids_dates_dict, idhash_key_name='uid', idhash_val_name='registration_date')
-    user_data = join_idhashes_dict(data=user_data, idhashes_dict=user_obj.user_ids_country_code_dict, idhash_key_name='uid', idhash_val_name='registration_country_code_alpha')
-    user_data = join_idhashes_dict(data=user_data, idhashes_dict=user_obj.user_ids_email_domain_dict, idhash_key_name='uid', idhash_val_name='email_domain')
-    userid_date_country_code = user_data['registration_date'].dt.strftime('%Y%m%d') + user_data['registration_country_code_alpha'].astype(str)
-    zero_pad = (userid_date_country_code.str.len() - 11).abs().apply(lambda x: '0'*x)
-    user_data['userid'] = userid_date_country_code + zero_pad + user_data['uid'].astype(str).str[-5:]
-    # add hash data lists
-    user_data['device_hash'] = gen_obj_idhash_series(idhashes=device_obj.device_hashes, n_counts_series=user_data['n_devices'])
-    user_data['card_hash'] = gen_obj_idhash_series(idhashes=card_obj.card_hashes, n_counts_series=user_data['n_cards'])
-    user_data['ip_hash'] = gen_obj_idhash_series(idhashes=ip_obj.ip_hashes, n_counts_series=user_data['n_ips'])
-    user_data['transaction_hash'] = gen_obj_idhash_series(idhashes=transaction_obj.transaction_hashes, n_counts_series=user_data['n_transactions'])
+    # add user data, widening the datetime64[D] dates to the nanosecond resolution of pandas datetime columns
+    user_attrs = {
+        'first_name':user_obj.user_ids_first_name,
+        'last_name':user_obj.user_ids_last_name,
+        'registration_date':user_obj.user_ids_dates.astype('datetime64[ns]'),
+        'registration_country_code_alpha':user_obj.user_ids_country_code,
+        'email_domain':user_obj.user_ids_email_domain,
+        }
+    user_data = join_idhash_attrs(data=user_data, idhash_col='uid', idhashes=user_obj.user_ids, idhash_attrs=user_attrs)
+    # generate the fixed width arrow string userids from the integer registration dates, country codes and uids, kept as an arrow backed column rather than converted to object strings
+    userids = gen_userids(registration_dates=user_data['registration_date'].to_numpy(), country_codes=user_data['registration_country_code_alpha'].to_numpy(), uids=user_data['uid'].to_numpy(dtype=np.uint64))
+    user_data['userid'] = pd.Series(userids, index=user_data.index)
+    # add hash data pools, the integer idhash codes of each entity object are assigned to users in order
+    user_entity_pools = {}
+    user_entity_pools['device_hash'] = EntityPool(values=device_obj.device_hashes, counts=user_data['n_devices'].to_numpy())
+    user_entity_pools['card_hash'] = EntityPool(values=card_obj.card_hashes, counts=user_data['n_cards'].to_numpy())
+    user_entity_pools['ip_hash'] = EntityPool(values=ip_obj.ip_hashes, counts=user_data['n_ips'].to_numpy())
+    user_entity_pools['transaction_hash'] = EntityPool(values=transaction_obj.transaction_hashes, counts=user_data['n_transactions'].to_numpy())
     # generate application hashes per user
-    #user_data['application_hash'] = user_data['n_applications'].apply(lambda x: list(np.random.choice(a = list(application_obj.application_hashes_props_dict.keys()), p = list(application_obj.application_hashes_props_dict.values()), replace = True, size = x)))
-    total_application_hashes = user_data['n_applications'].sum()
-    split_indices = user_data['n_applications'].cumsum()[:-1].values
-    application_hashes = np.random.choice(a = list(application_obj.application_hashes_props_dict.keys()), p=list(application_obj.application_hashes_props_dict.values()), replace=True, size=total_application_hashes)
-    user_data['application_hash'] = pd.Series(np.split(application_hashes, split_indices)).apply(lambda x: x.tolist())
+    application_hashes = rng.choice(a = application_obj.application_hashes, p=list(application_obj.application_hashes_props_dict.values()), replace=True, size=user_data['n_applications'].sum())
+    user_entity_pools['application_hash'] = EntityPool(values=application_hashes, counts=user_data['n_applications'].to_numpy())
     # drop excess columns
     user_data = user_data.drop(columns = ['n_devices', 'n_cards', 'n_ips', 'n_applications', 'n_transactions'])
     # create a hash value for the dataset (to distinguish between different iterations)
-    user_data['itr_hash'] = gen_random_hash(size=1)[0]
-    return user_data
\ No newline at end of file
+    user_data['itr_hash'] = gen_random_hash(size=1, rng=rng)[0]
+    return user_data, user_entity_pools
\ No newline at end of file
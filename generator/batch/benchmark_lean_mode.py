@@ -0,0 +1,99 @@
+# python generator/batch/benchmark_lean_mode.py --n_users 10000
+
+import os
+import sys
+import json
+import logging
+import argparse
+import subprocess
+from time import perf_counter
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+import cons
+
+def benchmark(n_users:int, n_calls:int, n_repeats:int) -> dict:
+    """
+    Times the per call cost of internal hot helpers on tiny inputs, where the beartype checks dominate, and the end to end generation of a single iteration of random telecom data.
+    The lean mode is fixed when the generator is imported, so each mode is benchmarked in its own process.
+
+    Parameters
+    ----------
+    n_users : int
+        The number of users of the end to end generation.
+    n_calls : int
+        The number of calls to time for each hot helper.
+    n_repeats : int
+        The number of timings of each hot helper and of the end to end generation, the fastest is reported.
+
+    Returns
+    -------
+    dict
+        The per call time of each hot helper in microseconds and the end to end time in seconds.
+    """
+    import numpy as np
+    import pandas as pd
+    from utilities.CategoricalSampler import CategoricalSampler
+    from utilities.select_csr_idhashes import select_csr_idhashes
+    from utilities.join_idhash_attrs import join_idhash_attrs
+    from utilities.gen_dates import gen_dates
+    from utilities.RefDataRegistry import ref_data_registry
+    from app.gen_random_telecom_data import gen_random_telecom_data
+    rng = np.random.default_rng(seed=42)
+    # set up tiny inputs so the per call overhead of the helpers is measured
+    sampler = CategoricalSampler.from_dict(prop_dict=cons.data_model_card_types_dict)
+    values, offsets, owners = np.arange(4, dtype=np.uint64), np.array([0, 2, 4]), np.array([0, 1])
+    data, idhashes, attrs = pd.DataFrame({"uid":np.array([1, 2], dtype=np.uint64)}), np.array([2, 1], dtype=np.uint64), {"attr":np.array(["a", "b"])}
+    hot_helpers = {
+        "CategoricalSampler.sample":lambda: sampler.sample(rng=rng, size=2),
+        "select_csr_idhashes":lambda: select_csr_idhashes(values=values, offsets=offsets, owners=owners, rng=rng),
+        "join_idhash_attrs":lambda: join_idhash_attrs(data=data, idhash_col="uid", idhashes=idhashes, idhash_attrs=attrs),
+        "gen_dates":lambda: gen_dates(size=2, start_date="2020-01-01", end_date="2020-12-31", rng=rng),
+    }
+    results = {}
+    for helper_name, hot_helper in hot_helpers.items():
+        hot_helper()
+        # take the fastest of the repeated timings, which is the least affected by other load on the machine
+        helper_times = []
+        for _ in range(n_repeats):
+            t0 = perf_counter()
+            for _ in range(n_calls):
+                hot_helper()
+            helper_times.append((perf_counter() - t0) / n_calls * 1e6)
+        results[helper_name] = min(helper_times)
+    # time the end to end generation, with the reference data already loaded
+    ref_data_registry.preload()
+    end_to_end_times = []
+    for _ in range(n_repeats):
+        t0 = perf_counter()
+        gen_random_telecom_data(n_users=n_users, random_seed=1)
+        end_to_end_times.append(perf_counter() - t0)
+    results["gen_random_telecom_data"] = min(end_to_end_times)
+    return results
+
+if __name__ == "__main__":
+    # set up logging
+    lgr = logging.getLogger()
+    lgr.setLevel(logging.INFO)
+    # parse the benchmark arguments
+    parser = argparse.ArgumentParser(description="Benchmark the beartype overhead removed by lean mode.")
+    parser.add_argument("--n_users", type=int, default=1000, help="The number of users of the end to end generation, default is 1000.")
+    parser.add_argument("--n_calls", type=int, default=10000, help="The number of calls to time for each hot helper, default is 10000.")
+    parser.add_argument("--n_repeats", type=int, default=3, help="The number of timings of each hot helper and of the end to end generation, default is 3.")
+    parser.add_argument("--child", action="store_true", help="Run the benchmark in the current process and print the results as json.")
+    args = parser.parse_args()
+    if args.child:
+        print(json.dumps(benchmark(n_users=args.n_users, n_calls=args.n_calls, n_repeats=args.n_repeats)))
+    else:
+        # run the benchmark in a child process for each mode, as lean mode is fixed at import time
+        mode_results = {}
+        for mode, lean_mode in [("checked", "0"), ("lean", "1")]:
+            child_args = [sys.executable, __file__, "--child", "--n_users", str(args.n_users), "--n_calls", str(args.n_calls), "--n_repeats", str(args.n_repeats)]
+            child_env = {**os.environ, cons.lean_mode_env_var:lean_mode}
+            child_output = subprocess.run(child_args, env=child_env, capture_output=True, text=True, check=True).stdout
+            mode_results[mode] = json.loads(child_output.strip().split("\n")[-1])
+        # log the timings of both modes and the overhead removed by lean mode
+        for name in mode_results["checked"].keys():
+            checked, lean = mode_results["checked"][name], mode_results["lean"][name]
+            unit = "s" if name == "gen_random_telecom_data" else "us/call"
+            logging.info(f"{name}: checked {checked:.3f} {unit}, lean {lean:.3f} {unit}, overhead removed {checked - lean:.3f} {unit} ({1 - lean / checked:.1%})")
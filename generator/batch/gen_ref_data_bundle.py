@@ -0,0 +1,19 @@
+# python generator/batch/gen_ref_data_bundle.py
+
+import os
+import sys
+import logging
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+import cons
+from utilities.RefDataRegistry import ref_data_registry
+
+if __name__ == "__main__":
+    # set up logging
+    lgr = logging.getLogger()
+    lgr.setLevel(logging.INFO)
+    # load the reference data from the csv files and compile it into a single binary bundle, which is loaded by default at startup
+    ref_data_registry.preload()
+    n_entries = ref_data_registry.build_bundle(fpath_bundle=cons.fpath_ref_data_bundle)
+    logging.info(f"Written {n_entries} reference data entries to: {cons.fpath_ref_data_bundle}")
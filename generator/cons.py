@@ -13,7 +13,12 @@ subdir_unittest = os.path.join(subdir_data, 'unittest')
 subdir_creds = os.path.join(fpath_repo_dir, '.creds')
 # set data files
 fpath_randomtelecomtransdata = os.path.join(subdir_data,'RandomTelecomPayments.csv')
+fpath_randomtelecomtransdata_parquet = os.path.join(subdir_data,'RandomTelecomPayments.parquet')
 fpath_randomtelecomusersdata = os.path.join(subdir_data,'RandomTelecomUsers.parquet')
+fdir_randomtelecomtransdata_partitions = os.path.join(subdir_data,'RandomTelecomPaymentsPartitions')
+fdir_api_outputs = os.path.join(subdir_data, 'api')
+fdir_api_jobs = os.path.join(subdir_data, 'jobs')
+fdir_api_cache = os.path.join(subdir_data, 'cache')
 fpath_arch_randomtelecomdata = os.path.join(subdir_data, 'arch', 'RandomTelecomPayments.csv')
 fpath_temp_llama_first_names = os.path.join(subdir_data, 'temp', 'llama_first_names_{country}.csv')
 fpath_temp_llama_last_names = os.path.join(subdir_data, 'temp', 'llama_last_names_{country}.csv')
@@ -27,6 +32,8 @@ fpath_llama_first_names = os.path.join(subdir_data, 'ref', 'llama_first_names.cs
 fpath_llama_last_names = os.path.join(subdir_data, 'ref', 'llama_last_names.csv')
 fpath_llama_email_domains = os.path.join(subdir_data, 'ref', 'llama_email_domains.csv')
 fpath_smartphones = os.path.join(subdir_data, 'ref', 'smartphones.csv')
+fpath_ref_data_bundle = os.path.join(subdir_data, 'ref', 'ref_data_bundle.npz')
+fdir_ref_data = os.path.join(subdir_data, 'ref')
 fpath_unittest_user_data = os.path.join(subdir_unittest, 'user_data.parquet')
 fpath_unittest_transaction_data = os.path.join(subdir_unittest, 'transaction_data.parquet')
 fpath_aws_session_token = os.path.join(subdir_creds,'sessionToken.json')
@@ -45,12 +52,24 @@ url_last_names = 'https://gist.githubusercontent.com/elifiner/cc90fdd38744915882
 
 # set date constants
 date_date_strftime = "%Y-%m-%d"
+input_date_params = ['registration_start_date', 'registration_end_date', 'transaction_start_date', 'transaction_end_date']
 date_today = datetime.datetime.today()
 
+# set lean mode, which skips the beartype runtime checks of internal helpers when the environment variable is set to 1 before the generator is imported
+lean_mode_env_var = 'RANDOM_TELECOM_LEAN_MODE'
+lean_mode = os.environ.get(lean_mode_env_var, '0') == '1'
+
 # set programme defaults
 default_n_users = 100
 default_use_random_seed = 0
 default_n_itr = 1
+default_n_shards = 1
+default_stream_output = 0
+default_trans_output_format = 'csv'
+default_parquet_compression = 'snappy'
+default_parquet_row_group_size = 1000000
+default_write_output = 1
+default_output_fdir = subdir_data
 default_n_applications = 20000
 default_registration_start_date = (date_today - datetime.timedelta(days=731)).strftime(date_date_strftime)
 default_registration_end_date = (date_today - datetime.timedelta(days=366)).strftime(date_date_strftime)
@@ -61,6 +80,13 @@ default_input_params_dict = {
     "n_users": default_n_users,
     "use_random_seed": default_use_random_seed,
     "n_itr": default_n_itr,
+    "n_shards": default_n_shards,
+    "stream_output": default_stream_output,
+    "trans_output_format": default_trans_output_format,
+    "parquet_compression": default_parquet_compression,
+    "parquet_row_group_size": default_parquet_row_group_size,
+    "write_output": default_write_output,
+    "output_fdir": default_output_fdir,
     "n_applications": default_n_applications,
     "registration_start_date": default_registration_start_date,
     "registration_end_date": default_registration_end_date,
@@ -83,6 +109,7 @@ unittest_transaction_end_date = '2021-12-31'
 data_model_entity_user_ratios = {'card':1.3, 'device':2.5, 'transaction':5.3, 'ip':4.3}
 data_model_poisson_params = {'user':{'lambda':20, 'power':1}, 'device':{'lambda':0.2, 'power':2}, 'card':{'lambda':0.1, 'power':2}, 'ip':{'lambda':1.3, 'power':2}, 'application':{'lambda':1, 'power':2}, 'transaction':{'lambda':5, 'power':2}}
 data_model_shared_entities_dict = {'ip':0.05, 'card':0.005, 'device':0.01}
+data_model_shard_idhash_stride = 2**40
 data_model_null_rates = {'card':0.1}
 data_model_card_types_dict = {'Visa':0.5, 'Mastercard':0.5}
 data_model_payment_channels = {'PayPal':0.4, 'Adyen':0.15, 'AppStore':0.25, 'WorldPay':0.15, 'Docomo':0.05}
@@ -103,4 +130,29 @@ card_cols = ['card_hash', 'card_type', 'card_country_code']
 ip_cols = ['ip_hash', 'ip_country_code']
 app_cols = ['application_hash']
 trans_cols = ['transaction_hash', 'transaction_date', 'transaction_amount', 'transaction_payment_method', 'card_payment_channel', 'transaction_status', 'transaction_error_code']
-itr_cols = ['itr_hash']
\ No newline at end of file
+itr_cols = ['itr_hash']
+trans_date_cols = ['registration_date', 'transaction_date']
+trans_dictionary_cols = ['registration_country_code', 'device_type', 'card_type', 'card_country_code', 'ip_country_code', 'transaction_payment_method', 'card_payment_channel', 'transaction_status', 'transaction_error_code']
+# set the rendered output type of the integer idhash code columns
+idhash_col_types = {'uid':'id', 'device_hash':'hash', 'card_hash':'hash', 'ip_hash':'hash', 'application_hash':'hash', 'transaction_hash':'hash', 'itr_hash':'hash'}
+# set the media types of the api responses, and the maximum number of rows serialised in each streamed chunk
+api_media_types = {'json':'application/json', 'ndjson':'application/x-ndjson', 'arrow':'application/vnd.apache.arrow.stream'}
+api_stream_chunk_size = 100000
+# set the number of api requests generated at once by the api worker pool, and the number of further requests queued before new requests are rejected
+api_max_workers_env_var = 'RANDOM_TELECOM_API_MAX_WORKERS'
+api_max_queued_env_var = 'RANDOM_TELECOM_API_MAX_QUEUED'
+api_max_workers = int(os.environ.get(api_max_workers_env_var, '2'))
+api_max_queued = int(os.environ.get(api_max_queued_env_var, '8'))
+# set the api requests to not write their output files to disk by default, as nothing removes the output directory of each request
+api_default_write_output = 0
+# set the number of jobs generated at once by the api job pool, and the number of further jobs queued before new jobs are rejected
+api_max_job_workers_env_var = 'RANDOM_TELECOM_API_MAX_JOB_WORKERS'
+api_max_queued_jobs_env_var = 'RANDOM_TELECOM_API_MAX_QUEUED_JOBS'
+api_max_job_workers = int(os.environ.get(api_max_job_workers_env_var, '1'))
+api_max_queued_jobs = int(os.environ.get(api_max_queued_jobs_env_var, '100'))
+# set the size limits of the in memory and on disk tiers of the api result cache of seeded requests, and the input parameters which determine the generated data
+api_cache_max_memory_mb_env_var = 'RANDOM_TELECOM_API_CACHE_MAX_MEMORY_MB'
+api_cache_max_disk_mb_env_var = 'RANDOM_TELECOM_API_CACHE_MAX_DISK_MB'
+api_cache_max_memory_bytes = int(os.environ.get(api_cache_max_memory_mb_env_var, '1024')) * 1024 ** 2
+api_cache_max_disk_bytes = int(os.environ.get(api_cache_max_disk_mb_env_var, '10240')) * 1024 ** 2
+api_cache_key_params = ['n_users', 'use_random_seed', 'n_itr', 'n_shards', 'n_applications', 'registration_start_date', 'registration_end_date', 'transaction_start_date', 'transaction_end_date']
@@ -0,0 +1,157 @@
+import os
+import asyncio
+from fastapi import APIRouter, HTTPException, Query
+from fastapi.responses import FileResponse
+from typing import Annotated, Dict
+
+import cons
+from main import main
+from utilities.JobStore import JobStore
+from utilities.WorkerPool import WorkerPool
+from utilities.input_error_handling import input_error_handling
+
+# the on-disk store of the jobs, and the pool of worker processes executing them
+job_store = JobStore(fdir=cons.fdir_api_jobs)
+job_pool = WorkerPool(max_workers=cons.api_max_job_workers, max_queued=cons.api_max_queued_jobs)
+# hold references to the running job tasks, so that they are not garbage collected before they finish
+job_tasks = set()
+
+# the output artifacts of a job and their media types
+artifact_media_types = {"csv":"text/csv", "parquet":"application/vnd.apache.parquet"}
+
+def run_job(fdir: str, job_id: str):
+    """
+    Runs a job within a worker process, recording its progress as each iteration or shard completes, and its output artifacts once it finishes.
+
+    Parameters
+    ----------
+    fdir : str
+        The directory of the job store.
+    job_id : str
+        The id of the job.
+    """
+    job_store = JobStore(fdir=fdir)
+    input_params_dict = job_store.read(job_id=job_id)['input_params']
+    # track the status of each shard, or each iteration when not sharding
+    n_parts = input_params_dict['n_shards'] if input_params_dict['n_shards'] > 1 else input_params_dict['n_itr']
+    progress = {"n_users":0, "n_transactions":0, "shard_status":["pending"] * n_parts}
+    job_store.update(job_id=job_id, status='running', progress=progress)
+    def progress_callback(shard: int, n_users: int, n_transactions: int):
+        progress['n_users'] += n_users
+        progress['n_transactions'] += n_transactions
+        progress['shard_status'][shard] = "completed"
+        job_store.update(job_id=job_id, progress=progress)
+    try:
+        # run random telecom payments generator, writing the output files to the job directory
+        main(input_params_dict=input_params_dict, progress_callback=progress_callback)
+        artifacts = sorted([fname for fname in os.listdir(input_params_dict['output_fdir']) if os.path.splitext(fname)[1][1:] in artifact_media_types.keys()])
+        job_store.update(job_id=job_id, status='completed', artifacts=artifacts)
+    except Exception as exception:
+        job_store.update(job_id=job_id, status='failed', error=f'{type(exception).__name__}: {exception}')
+
+async def execute_job(job_id: str):
+    """
+    Executes a job in the job pool once a worker is free, recording the job as failed if the worker process itself fails.
+
+    Parameters
+    ----------
+    job_id : str
+        The id of the job.
+    """
+    try:
+        await job_pool.run(run_job, job_store.fdir, job_id)
+    except Exception as exception:
+        job_store.update(job_id=job_id, status='failed', error=f'{type(exception).__name__}: {exception}')
+
+router = APIRouter(prefix="/jobs", tags=["Random Telecom Payments Data Generator Jobs"])
+
+@router.post("", status_code=202)
+async def post_job(
+    body: Dict[str, object] = {}
+    ):
+    """
+    Queues a job to generate random telecom payments data based on user-defined parameters, and write it to Parquet or CSV files.
+
+    Parameters
+    ----------
+    body : Dict[str, object]
+        A dictionary containing the input parameters, with the same possible keys as the /api endpoint.
+
+    Returns
+    -------
+    response : dict
+        The id and status of the queued job.
+    """
+    # generate parameters dictionary, and check the input parameters before queueing the job
+    input_params_dict = {**cons.default_input_params_dict, **body, 'write_output': 1}
+    try:
+        input_error_handling(input_params_dict)
+    except (ValueError, TypeError) as exception:
+        raise HTTPException(status_code=422, detail=str(exception))
+    # reject the job if every worker is busy and the queue of waiting jobs is full
+    if job_pool.is_full():
+        raise HTTPException(status_code=503, detail=f'All {job_pool.max_workers} job workers are busy and {job_pool.max_queued} jobs are queued, retry later.', headers={'Retry-After': '60'})
+    # create the job with the output files written to its own directory, and execute it in the background
+    job_id = job_store.create(input_params_dict=input_params_dict)
+    job_store.update(job_id=job_id, input_params={**input_params_dict, 'output_fdir': job_store.job_fdir(job_id=job_id)})
+    job_task = asyncio.create_task(execute_job(job_id=job_id))
+    job_tasks.add(job_task)
+    job_task.add_done_callback(job_tasks.discard)
+    return {"job_id": job_id, "status": "queued"}
+
+@router.get("/{job_id}")
+async def get_job(
+    job_id: str
+    ):
+    """
+    Reports the status and progress of a job.
+
+    Parameters
+    ----------
+    job_id : str
+        The id of the job.
+
+    Returns
+    -------
+    response : dict
+        The job record, with its status, input parameters, progress of the users and transactions generated and the status of each shard, output artifacts and any error.
+    """
+    try:
+        return job_store.read(job_id=job_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f'Job {job_id} not found.')
+
+@router.get("/{job_id}/result")
+async def get_job_result(
+    job_id: str,
+    artifact: Annotated[str, Query(title="Artifact", description="The output artifact to download, either the transactions or users data", pattern="^(transactions|users)$")] = "transactions",
+    ):
+    """
+    Downloads an output artifact of a completed job.
+
+    Parameters
+    ----------
+    job_id : str
+        The id of the job.
+    artifact : str
+        The output artifact to download, either the "transactions" data in the job's transaction output format or the "users" data as parquet.
+
+    Returns
+    -------
+    response : fastapi.responses.FileResponse
+        The Parquet or CSV file of the output artifact.
+    """
+    try:
+        job = job_store.read(job_id=job_id)
+    except KeyError:
+        raise HTTPException(status_code=404, detail=f'Job {job_id} not found.')
+    if job['status'] != 'completed':
+        raise HTTPException(status_code=409, detail=f'Job {job_id} is {job["status"]}, results are only available once it is completed.')
+    # find the file of the requested output artifact within the job directory
+    if artifact == 'users':
+        fpath_artifact = os.path.join(job_store.job_fdir(job_id=job_id), os.path.basename(cons.fpath_randomtelecomusersdata))
+    else:
+        fpath_randomtelecomtransdata = cons.fpath_randomtelecomtransdata_parquet if job['input_params']['trans_output_format'] == 'parquet' else cons.fpath_randomtelecomtransdata
+        fpath_artifact = os.path.join(job_store.job_fdir(job_id=job_id), os.path.basename(fpath_randomtelecomtransdata))
+    media_type = artifact_media_types[os.path.splitext(fpath_artifact)[1][1:]]
+    return FileResponse(path=fpath_artifact, media_type=media_type, filename=os.path.basename(fpath_artifact))
@@ -3,39 +3,78 @@ import sys
 import logging
 from time import time
 import pandas as pd
+from typing import Callable, Iterable, Iterator, Union
 
 sys.path.append(os.path.join(os.getcwd(), 'generator'))
 
 import cons
 from utilities.commandline_interface import commandline_interface
 from utilities.input_error_handling import input_error_handling
-from utilities.multiprocess import multiprocess
+from utilities.imultiprocess import imultiprocess
+from utilities.PartitionedWriter import PartitionedWriter
+from utilities.TransDataWriter import TransDataWriter
+from utilities.join_entity_pools import join_entity_pools
+from utilities.render_idhashes import render_idhashes
+from utilities.RefDataRegistry import ref_data_registry
 from app.gen_random_telecom_data import gen_random_telecom_data
+from app.gen_sharded_telecom_data import gen_sharded_telecom_data
 
-def main(input_params_dict: dict):
+def gen_results(input_params_dict: dict, progress_callback: Union[Callable[[int, int, int], None], None] = None) -> Iterable[dict]:
     """
-    Main function to generate random telecom payments data.
+    Generates the random telecom payments data of each iteration or shard, with the transaction level idhashes rendered for output.
+
+    Parameters
+    ----------
+    input_params_dict : dict
+        The input parameters of the programme.
+    progress_callback : Callable[[int, int, int], None]
+        A function called with the index, number of users and number of transactions of each iteration or shard as it completes, default is None.
+
+    Returns
+    -------
+    Iterable[dict]
+        The user data, user entity pools and rendered transaction data of each result, lazily generated as each iteration completes when running multiple iterations.
     """
     # run input error handling
     logging.info(f'Input Parameters: {input_params_dict}')
     input_error_handling(input_params_dict)
-    # start timer
-    t0 = time()
-    if input_params_dict['n_itr'] > 1:
+    # load the compiled reference data bundle if available, and preload the reference data once so that forked worker processes inherit it rather than rereading it
+    if not ref_data_registry.load_bundle(fpath_bundle=cons.fpath_ref_data_bundle):
+        logging.info(f'Reference data bundle not found at {cons.fpath_ref_data_bundle}, reading reference data csv files; build the bundle with generator/batch/gen_ref_data_bundle.py')
+    ref_data_registry.preload()
+    if input_params_dict['n_shards'] > 1:
+        logging.info("Running multi-thread sharded.")
+        # generate a single random telecom dataset split into shards via multiprocess call
+        results = [
+            gen_sharded_telecom_data(
+                n_users=input_params_dict['n_users'],
+                n_shards=input_params_dict['n_shards'],
+                random_seed=None if input_params_dict['use_random_seed'] == 0 else input_params_dict['use_random_seed'],
+                n_applications=input_params_dict['n_applications'],
+                registration_start_date=input_params_dict['registration_start_date'],
+                registration_end_date=input_params_dict['registration_end_date'],
+                transaction_start_date=input_params_dict['transaction_start_date'],
+                transaction_end_date=input_params_dict['transaction_end_date'],
+                ncpu=os.cpu_count(),
+                progress_callback=progress_callback
+                )
+            ]
+    elif input_params_dict['n_itr'] > 1:
         logging.info("Running multi-thread.")
-        # generate random telecom data via multiprocess call
+        # generate random telecom data via multiprocess call, yielding each iteration in iteration order as soon as it and all earlier iterations complete
         args = [
             (
                 input_params_dict['n_users'],
-                None if input_params_dict['use_random_seed'] == 0 else itr,
+                None if input_params_dict['use_random_seed'] == 0 else input_params_dict['use_random_seed'],
                 input_params_dict['n_applications'],
                 input_params_dict['registration_start_date'],
                 input_params_dict['registration_end_date'],
                 input_params_dict['transaction_start_date'],
-                input_params_dict['transaction_end_date']
+                input_params_dict['transaction_end_date'],
+                itr
             ) for itr in range(input_params_dict['n_itr'])
             ]
-        results = multiprocess(func = gen_random_telecom_data, args = args, ncpu = os.cpu_count())
+        results = imultiprocess(func = gen_random_telecom_data, args = args, ncpu = os.cpu_count(), ordered = True)
     else:
         logging.info("Running single thread.")
         results = [
@@ -49,30 +88,109 @@ def main(input_params_dict: dict):
                 transaction_end_date=input_params_dict['transaction_end_date']
                 )
             ]
-    # concatenate random telecom datasets into a single file
-    user_data = pd.concat(objs = [result['user_data'] for result in results], axis = 0, ignore_index = True)
-    trans_data = pd.concat(objs = [result['trans_data'] for result in results], axis = 0, ignore_index = True)
-    # TODO: add addition post processing if running multi-processing due to random duplicates between iterations
-    # order results by userid and transaction date ascending
-    user_data = user_data.sort_values(by = 'uid').reset_index(drop = True)
-    trans_data = trans_data.sort_values(by = 'transaction_date').reset_index(drop = True)
+    # report the progress of each iteration as it completes, the progress of each shard is reported by the sharded generator
+    if (progress_callback is not None) and (input_params_dict['n_shards'] == 1):
+        results = report_progress(results=results, progress_callback=progress_callback)
+    # render the integer idhash codes of each result as fixed width id and hash strings for output
+    return map(render_trans_idhashes, results)
+
+def report_progress(results: Iterable[dict], progress_callback: Callable[[int, int, int], None]) -> Iterator[dict]:
+    """
+    Lazily passes through the results of each iteration, calling the progress callback as each result completes.
+
+    Parameters
+    ----------
+    results : Iterable[dict]
+        The user data, user entity pools and transaction data of each iteration.
+    progress_callback : Callable[[int, int, int], None]
+        A function called with the index, number of users and number of transactions of each iteration as it completes.
+
+    Returns
+    -------
+    Iterator[dict]
+        The results of each iteration.
+    """
+    for itr, result in enumerate(results):
+        progress_callback(itr, result['user_data'].shape[0], result['trans_data'].shape[0])
+        yield result
+
+def render_trans_idhashes(result: dict) -> dict:
+    """
+    Renders the integer idhash codes of a result's transaction data as fixed width id and hash strings for output.
+
+    Parameters
+    ----------
+    result : dict
+        The user data, user entity pools and transaction data of an iteration or shard.
+
+    Returns
+    -------
+    dict
+        The result with its transaction data idhashes rendered.
+    """
+    trans_data = result['trans_data']
+    for idhash_col in trans_data.columns.intersection(list(cons.idhash_col_types.keys())):
+        trans_data[idhash_col] = render_idhashes(idhashes=trans_data[idhash_col], idhash_type=cons.idhash_col_types[idhash_col])
+    return result
+
+def main(input_params_dict: dict, progress_callback: Union[Callable[[int, int, int], None], None] = None):
+    """
+    Main function to generate random telecom payments data.
+    """
+    # start timer
+    t0 = time()
+    # generate the random telecom data of each iteration or shard
+    results = gen_results(input_params_dict=input_params_dict, progress_callback=progress_callback)
+    # set the output file paths within the output directory, and check the output directory exists
+    output_fdir = input_params_dict['output_fdir']
+    fpath_randomtelecomusersdata = os.path.join(output_fdir, os.path.basename(cons.fpath_randomtelecomusersdata))
+    fpath_randomtelecomtransdata = os.path.join(output_fdir, os.path.basename(cons.fpath_randomtelecomtransdata_parquet if input_params_dict['trans_output_format'] == 'parquet' else cons.fpath_randomtelecomtransdata))
+    fdir_randomtelecomtransdata_partitions = os.path.join(output_fdir, os.path.basename(cons.fdir_randomtelecomtransdata_partitions))
+    if (input_params_dict['write_output'] == 1) and (not os.path.exists(output_fdir)):
+        os.makedirs(output_fdir)
+    # when streaming the output, each result's transaction data is appended to date partitions on disk rather than held in memory
+    trans_writer = PartitionedWriter(fdir=fdir_randomtelecomtransdata_partitions, partition_col='transaction_date') if input_params_dict['stream_output'] == 1 else None
+    user_data_list, trans_data_list = [], []
+    for result in results:
+        # materialise the user entity pools as idhash lists for the user level output
+        user_data_list.append(join_entity_pools(user_data=result['user_data'], user_entity_pools=result['user_entity_pools']))
+        trans_data = result['trans_data']
+        if trans_writer is not None:
+            trans_writer.write(data=trans_data)
+        else:
+            trans_data_list.append(trans_data)
+        del result, trans_data
+    # concatenate random telecom datasets and order results by userid and transaction date ascending, with ties of transaction date broken by transaction hash
+    user_data = pd.concat(objs = user_data_list, axis = 0, ignore_index = True).sort_values(by = 'uid').reset_index(drop = True)
+    for idhash_col in ['uid', 'itr_hash']:
+        user_data[idhash_col] = render_idhashes(idhashes=user_data[idhash_col], idhash_type=cons.idhash_col_types[idhash_col])
+    logging.info(f'RandomTeleComUsersData.shape: {user_data.shape}')
+    if input_params_dict['write_output'] == 1:
+        logging.info(f'Writing intermediate user level random telecoms data to: {fpath_randomtelecomusersdata}')
+        user_data.to_parquet(fpath_randomtelecomusersdata, engine='fastparquet')
+    if trans_writer is not None:
+        # write the transaction level output as either csv or columnar parquet
+        trans_data_writer = TransDataWriter(fpath=fpath_randomtelecomtransdata, output_format=input_params_dict['trans_output_format'], compression=input_params_dict['parquet_compression'], row_group_size=input_params_dict['parquet_row_group_size'])
+        logging.info(f'Writing output trans level random telecoms data to: {fpath_randomtelecomtransdata}')
+        # merge the date partitions in date order, holding one partition in memory at a time
+        for partition_data in trans_writer.iter_partitions(sort_by=['transaction_date', 'transaction_hash']):
+            trans_data_writer.write(trans_data=partition_data)
+        trans_data = None
+        trans_data_shape = trans_data_writer.close()
+    else:
+        trans_data = pd.concat(objs = trans_data_list, axis = 0, ignore_index = True).sort_values(by = ['transaction_date', 'transaction_hash'], kind = 'stable').reset_index(drop = True)
+        trans_data_shape = trans_data.shape
+        if input_params_dict['write_output'] == 1:
+            # write the transaction level output as either csv or columnar parquet
+            trans_data_writer = TransDataWriter(fpath=fpath_randomtelecomtransdata, output_format=input_params_dict['trans_output_format'], compression=input_params_dict['parquet_compression'], row_group_size=input_params_dict['parquet_row_group_size'])
+            logging.info(f'Writing output trans level random telecoms data to: {fpath_randomtelecomtransdata}')
+            trans_data_writer.write(trans_data=trans_data)
+            trans_data_shape = trans_data_writer.close()
+    logging.info(f'RandomTeleComTransData.shape: {trans_data_shape}')
     # end timer
     t1 = time()
     total_runtime_seconds = round(t1 - t0, 2)
     logging.info(f'Total Runtime: {total_runtime_seconds} seconds')
-    # print out head and shape of data
-    logging.info(f'RandomTeleComUsersData.shape: {user_data.shape}')
-    logging.info(f'RandomTeleComTransData.shape: {trans_data.shape}')
-    # check output data directories exist
-    data_fdirs = [os.path.dirname(cons.fpath_randomtelecomtransdata), os.path.dirname(cons.fpath_randomtelecomusersdata)] 
-    for data_fdir in data_fdirs:
-        if not os.path.exists(data_fdir):
-            os.mkdir(data_fdir)
-    # write data to disk
-    logging.info(f'Writing intermediate user level random telecoms data to: {cons.fpath_randomtelecomusersdata}')
-    logging.info(f'Writing output trans level random telecoms data to: {cons.fpath_randomtelecomtransdata}')
-    user_data.to_parquet(cons.fpath_randomtelecomusersdata, engine='fastparquet')
-    trans_data.to_csv(cons.fpath_randomtelecomtransdata, index = False)
     # return dataframes as dictionary
     return {"user_data": user_data, "trans_data": trans_data}
 
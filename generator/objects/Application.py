@@ -1,17 +1,19 @@
 import cons
 from utilities.gen_idhash_cnt_dict import gen_idhash_cnt_dict
 from utilities.cnt2prop_dict import cnt2prop_dict
+from utilities.CategoricalSampler import CategoricalSampler
+from utilities.lean_beartype import lean_beartype
 
 import numpy as np
-from beartype import beartype
-from typing import List, Dict
+from typing import Dict
 
 class Application:
     
-    @beartype
+    @lean_beartype
     def __init__(
         self,
         n_application_hashes:int,
+        rng:np.random.Generator,
         ):
         """
         Initialize the Application object with randomly generated data model.
@@ -20,6 +22,8 @@ class Application:
         ----------
         n_application_hashes : int
             The number of application hashes to generate.
+        rng : numpy.random.Generator
+            The random number generator to draw from.
         
         Attributes
         ----------
@@ -31,52 +35,58 @@ class Application:
             The power parameter for the Poisson distribution.
         payment_channels : Dict[str, float]
             The population proportions of available payment channels.
-        application_hashes_cnts_dict : Dict[str, int]
+        payment_channel_sampler : CategoricalSampler
+            The categorical sampler of payment channels by their population proportions.
+        application_hashes : numpy.ndarray
+            The application hash codes.
+        application_hashes_cnts_dict : Dict[int, int]
             Mapping of application hashes to their occurrence counts.
-        application_hashes_props_dict : Dict[str, float]
+        application_hashes_props_dict : Dict[int, float]
             Mapping of application hashes to their proportions.
-        application_hashes_payment_channel_dict : Dict[str, str]
-            Mapping of application hashes to randomly assigned payment channels.
+        application_hashes_payment_channel : numpy.ndarray
+            The randomly assigned payment channels, aligned to the application hashes.
         """
         self.n_application_hashes = n_application_hashes
         self.lam = cons.data_model_poisson_params["application"]["lambda"]
         self.power = cons.data_model_poisson_params["application"]["power"]
         self.payment_channels = cons.data_model_payment_channels
-        self.application_hashes_cnts_dict = gen_idhash_cnt_dict(idhash_type="hash", n=self.n_application_hashes, lam=self.lam)
-        self.application_hashes = list(self.application_hashes_cnts_dict.keys())
+        self.payment_channel_sampler = CategoricalSampler.from_dict(prop_dict=self.payment_channels)
+        self.application_hashes_cnts_dict = gen_idhash_cnt_dict(idhash_type="hash", n=self.n_application_hashes, lam=self.lam, rng=rng)
+        self.application_hashes = np.array(list(self.application_hashes_cnts_dict.keys()), dtype=np.uint64)
         self.application_hashes_props_dict = cnt2prop_dict(idhashes_cnts_dict=self.application_hashes_cnts_dict)
-        self.application_hashes_payment_channel_dict = self.gen_transaction_payment_channel(application_hashes=self.application_hashes, payment_channels=self.payment_channels)
+        self.application_hashes_payment_channel = self.gen_transaction_payment_channel(application_hashes=self.application_hashes, payment_channel_sampler=self.payment_channel_sampler, rng=rng)
     
-    @beartype
+    @lean_beartype
     def gen_transaction_payment_channel(
         self,
-        application_hashes:List[str],
-        payment_channels:Dict[str, float],
-        ) -> Dict[str, str]:
+        application_hashes:np.ndarray,
+        payment_channel_sampler:CategoricalSampler,
+        rng:np.random.Generator,
+        ) -> np.ndarray:
         """
-        Generates a dictionary of random application payment channels.
+        Generates an array of random application payment channels.
         
         Parameters
         ----------
-        application_hashes : List[str]
-            The application hashes.
-        payment_channels : Dict[str, float]
-            The population proportion of payment channels.
+        application_hashes : numpy.ndarray
+            The application hash codes.
+        payment_channel_sampler : CategoricalSampler
+            The categorical sampler of payment channels by their population proportions.
+        rng : numpy.random.Generator
+            The random number generator to draw from.
         
         Returns
         -------
-        Dict[str, str]
-            A dictionary of transaction payment channels.
+        numpy.ndarray
+            An array of transaction payment channels, aligned to the application hashes.
         """
         # randomly sample payment channels based on population proportions
-        transaction_payment_channels = list(
-            np.random.choice(
-                a=list(payment_channels.keys()),
-                p=list(payment_channels.values()),
-                replace=True,
-                size=len(application_hashes),
-            )
-        )
-        # return payment channels and application hashes
-        application_hashes_payment_channels_dict = dict(zip(application_hashes, transaction_payment_channels))
-        return application_hashes_payment_channels_dict
+        transaction_payment_channels = payment_channel_sampler.sample(rng=rng, size=len(application_hashes))
+        return transaction_payment_channels
+
+    @property
+    def application_hashes_payment_channel_dict(self) -> Dict[int, str]:
+        """
+        Mapping of application hashes to randomly assigned payment channels.
+        """
+        return dict(zip(self.application_hashes.tolist(), self.application_hashes_payment_channel))
\ No newline at end of file
@@ -1,20 +1,24 @@
 import cons
 from utilities.gen_idhash_cnt_dict import gen_idhash_cnt_dict
 from utilities.cnt2prop_dict import cnt2prop_dict
-from utilities.gen_country_codes_dict import gen_country_codes_dict
+from utilities.gen_country_codes import gen_country_codes
 from utilities.gen_shared_idhashes import gen_shared_idhashes
+from utilities.CategoricalSampler import CategoricalSampler
+from utilities.lean_beartype import lean_beartype
 
 import numpy as np
-from beartype import beartype
-from typing import List, Dict, Union
+from typing import Dict, Union
 
 class Card:
     
-    @beartype
+    @lean_beartype
     def __init__(
         self,
         n_card_hashes:Union[int,np.int64],
+        rng:np.random.Generator,
         fpath_countries_europe:str=cons.fpath_countries_europe,
+        idhash_offset:Union[int,np.int64]=0,
+        idhash_key:Union[int,None]=None,
         ):
         """
         The randomly generated card data model object.
@@ -23,8 +27,14 @@ class Card:
         ----------
         n_card_hashes : int
             The number of card hashes to generate.
+        rng : numpy.random.Generator
+            The random number generator to draw from.
         fpath_countries_europe : str
             The file path to the european countries reference file, default is cons.fpath_countries_europe.
+        idhash_offset : int
+            The start of the counter range the card hashes are permuted from, default is 0.
+        idhash_key : int
+            The key of the card hash permutation, default is None which draws a random key.
         
         Attributes
         ----------
@@ -32,64 +42,94 @@ class Card:
             The number of card hashes generated.
         card_types_dict : Dict[str, float]
             The population proportions of card types.
+        card_type_sampler : CategoricalSampler
+            The categorical sampler of card types by their population proportions.
         lam : float
             The lambda parameter of the squared poisson distribution used to generate the card hash counts.
         power : float
             The power parameter of the squared poisson distribution used to generate the card hash counts.
         prop_shared_card_hashes : float
             The population proportion of shared card hashes.
-        card_hashes_cnts_dict : Dict[str, int]
+        card_hashes : numpy.ndarray
+            The card hash codes.
+        card_hashes_cnts_dict : Dict[int, int]
             The card hash counts dictionary.
-        card_hashes_props_dict : Dict[str, float]
+        card_hashes_props_dict : Dict[int, float]
             The card hash proportions dictionary.
-        card_hashes_type_dict : Dict[str, str]
-            The card hash types dictionary.
-        card_hashes_country_code_dict : Dict[str, str]
-            The card hash country codes dictionary.
-        card_shared_idhash_map_dict : Dict[str, str]
-            The card shared idhash mapping dictionary.
+        card_hashes_type : numpy.ndarray
+            The card hash types, aligned to the card hashes.
+        card_hashes_country_code : numpy.ndarray
+            The card hash country codes, aligned to the card hashes.
+        card_shared_idhash_positions : numpy.ndarray
+            The position of each card hash's shared card hash within the card hashes, aligned to the card hashes.
         """
         self.n_card_hashes = n_card_hashes
         self.fpath_countries_europe = fpath_countries_europe
         self.card_types_dict = cons.data_model_card_types_dict
+        self.card_type_sampler = CategoricalSampler.from_dict(prop_dict=self.card_types_dict)
         self.lam = cons.data_model_poisson_params["card"]["lambda"]
         self.power = cons.data_model_poisson_params["card"]["power"]
         self.prop_shared_card_hashes = cons.data_model_shared_entities_dict["card"]
-        self.card_hashes_cnts_dict = gen_idhash_cnt_dict(idhash_type="hash", n=self.n_card_hashes, lam=self.lam, power=self.power)
-        self.card_hashes = list(self.card_hashes_cnts_dict.keys())
+        self.card_hashes_cnts_dict = gen_idhash_cnt_dict(idhash_type="hash", n=self.n_card_hashes, lam=self.lam, power=self.power, rng=rng, offset=idhash_offset, key=idhash_key)
+        self.card_hashes = np.array(list(self.card_hashes_cnts_dict.keys()), dtype=np.uint64)
         self.card_hashes_props_dict = cnt2prop_dict(idhashes_cnts_dict=self.card_hashes_cnts_dict)
-        self.card_hashes_type_dict = self.gen_card_type(card_hashes=self.card_hashes, card_types_dict=self.card_types_dict)
-        self.card_hashes_country_code_dict = gen_country_codes_dict(idhashes=self.card_hashes, fpath_countries_europe=self.fpath_countries_europe)
-        self.card_shared_idhash_map_dict = gen_shared_idhashes(idhashes=self.card_hashes, prop_shared_idhashes=self.prop_shared_card_hashes)
+        self.card_hashes_type = self.gen_card_type(card_hashes=self.card_hashes, card_type_sampler=self.card_type_sampler, rng=rng)
+        self.card_hashes_country_code = gen_country_codes(size=self.card_hashes.shape[0], rng=rng, fpath_countries_europe=self.fpath_countries_europe)
+        self.card_shared_idhash_positions = gen_shared_idhashes(idhashes=self.card_hashes, prop_shared_idhashes=self.prop_shared_card_hashes, rng=rng)
     
-    @beartype
+    @lean_beartype
     def gen_card_type(
         self,
-        card_hashes:List[str],
-        card_types_dict:Dict[str, float],
-        ) -> Dict[str, str]:
+        card_hashes:np.ndarray,
+        card_type_sampler:CategoricalSampler,
+        rng:np.random.Generator,
+        ) -> np.ndarray:
         """
-        Generates a dictionary of random card types.
+        Generates an array of random card types.
         
         Parameters
         ----------
-        card_hashes : List[str]
-            The card hashes.
-        card_types_dict : Dict[str, float]
-            The population proportions of card types.
+        card_hashes : numpy.ndarray
+            The card hash codes.
+        card_type_sampler : CategoricalSampler
+            The categorical sampler of card types by their population proportions.
+        rng : numpy.random.Generator
+            The random number generator to draw from.
         
         Returns
         -------
-        Dict[str, str]
-            A dictionary of card types.
+        numpy.ndarray
+            An array of card types, aligned to the card hashes.
         """
         # randomly choose card types based on the population proportions of card types
-        card_types = np.random.choice(
-            a=list(card_types_dict.keys()),
-            p=list(card_types_dict.values()),
-            size=len(card_hashes),
-            replace=True,
-        )
-        # return the card hashes and card types
-        card_hashes_type_dict = dict(zip(card_hashes, card_types))
-        return card_hashes_type_dict
+        card_types = card_type_sampler.sample(rng=rng, size=len(card_hashes))
+        return card_types
+
+    @property
+    def card_hashes_type_dict(self) -> Dict[int, str]:
+        """
+        The card hash types dictionary.
+        """
+        return dict(zip(self.card_hashes.tolist(), self.card_hashes_type))
+
+    @property
+    def card_hashes_country_code_dict(self) -> Dict[int, int]:
+        """
+        The card hash country codes dictionary.
+        """
+        return dict(zip(self.card_hashes.tolist(), self.card_hashes_country_code))
+
+    @property
+    def card_shared_idhashes(self) -> np.ndarray:
+        """
+        The shared card hash codes, aligned to the card hashes.
+        """
+        return self.card_hashes[self.card_shared_idhash_positions]
+
+    @property
+    def card_shared_idhash_map_dict(self) -> Dict[int, int]:
+        """
+        The card shared idhash mapping dictionary, of the card hashes which are shared.
+        """
+        shared_mask = self.card_shared_idhash_positions != np.arange(self.card_hashes.shape[0])
+        return dict(zip(self.card_hashes[shared_mask].tolist(), self.card_shared_idhashes[shared_mask].tolist()))
\ No newline at end of file
@@ -2,19 +2,22 @@ import cons
 from utilities.gen_idhash_cnt_dict import gen_idhash_cnt_dict
 from utilities.cnt2prop_dict import cnt2prop_dict
 from utilities.gen_shared_idhashes import gen_shared_idhashes
+from utilities.RefDataRegistry import ref_data_registry
+from utilities.lean_beartype import lean_beartype
 
 import numpy as np
-import pandas as pd
-from beartype import beartype
-from typing import List, Dict, Union
+from typing import Dict, Union
 
 class Device:
     
-    @beartype
+    @lean_beartype
     def __init__(
         self,
         n_device_hashes:Union[int,np.int64],
+        rng:np.random.Generator,
         fpath_smartphones:str=cons.fpath_smartphones,
+        idhash_offset:Union[int,np.int64]=0,
+        idhash_key:Union[int,None]=None,
         ):
         """
         The randomly generated device data model object.
@@ -23,8 +26,14 @@ class Device:
         ----------
         n_device_hashes : int
             The number of device hashes to generate.
+        rng : numpy.random.Generator
+            The random number generator to draw from.
         fpath_smartphones : str
             The file path to the smart phones reference file, default is cons.fpath_smartphones.
+        idhash_offset : int
+            The start of the counter range the device hashes are permuted from, default is 0.
+        idhash_key : int
+            The key of the device hash permutation, default is None which draws a random key.
         
         Attributes
         ----------
@@ -36,55 +45,76 @@ class Device:
             The power parameter of the squared poisson distribution used to generate the device hash counts.
         prop_shared_device_hashes : float
             The population proportion of shared device hashes.
-        device_hashes_cnts_dict : Dict[str, int]
+        device_hashes : numpy.ndarray
+            The device hash codes.
+        device_hashes_cnts_dict : Dict[int, int]
             The device hash counts dictionary.
-        device_hashes_props_dict : Dict[str, float]
+        device_hashes_props_dict : Dict[int, float]
             The device hash proportions dictionary.
-        device_hashes_type_dict : Dict[str, str]
-            The device hash types dictionary.
-        device_shared_idhash_map_dict : Dict[str, str]
-            The device shared idhash mapping dictionary.
+        device_hashes_type : numpy.ndarray
+            The device hash types, aligned to the device hashes.
+        device_shared_idhash_positions : numpy.ndarray
+            The position of each device hash's shared device hash within the device hashes, aligned to the device hashes.
         """
         self.n_device_hashes = n_device_hashes
         self.fpath_smartphones = fpath_smartphones
         self.lam = cons.data_model_poisson_params["device"]["lambda"]
         self.power = cons.data_model_poisson_params["device"]["power"]
         self.prop_shared_device_hashes = cons.data_model_shared_entities_dict["device"]
-        self.device_hashes_cnts_dict = gen_idhash_cnt_dict(idhash_type="hash", n=self.n_device_hashes, lam=self.lam, power=self.power)
-        self.device_hashes = list(self.device_hashes_cnts_dict.keys())
+        self.device_hashes_cnts_dict = gen_idhash_cnt_dict(idhash_type="hash", n=self.n_device_hashes, lam=self.lam, power=self.power, rng=rng, offset=idhash_offset, key=idhash_key)
+        self.device_hashes = np.array(list(self.device_hashes_cnts_dict.keys()), dtype=np.uint64)
         self.device_hashes_props_dict = cnt2prop_dict(idhashes_cnts_dict=self.device_hashes_cnts_dict)
-        self.device_hashes_type_dict = self.gen_device_types(device_hashes=self.device_hashes, fpath_smartphones=self.fpath_smartphones)
-        self.device_shared_idhash_map_dict = gen_shared_idhashes(idhashes=self.device_hashes, prop_shared_idhashes=self.prop_shared_device_hashes)
+        self.device_hashes_type = self.gen_device_types(device_hashes=self.device_hashes, fpath_smartphones=self.fpath_smartphones, rng=rng)
+        self.device_shared_idhash_positions = gen_shared_idhashes(idhashes=self.device_hashes, prop_shared_idhashes=self.prop_shared_device_hashes, rng=rng)
 
-    @beartype
+    @lean_beartype
     def gen_device_types(
         self,
-        device_hashes:List[str],
+        device_hashes:np.ndarray,
         fpath_smartphones:str,
-        ) -> Dict[str, str]:
+        rng:np.random.Generator,
+        ) -> np.ndarray:
         """
-        Generates a dictionary of random device types
+        Generates an array of random device types
         
         Parameters
         ----------
-        device_hashes : List[str]
-            The device hashes.
+        device_hashes : numpy.ndarray
+            The device hash codes.
         fpath_smartphones : str
             The file path to the smart phones reference file.
+        rng : numpy.random.Generator
+            The random number generator to draw from.
         
         Returns
         -------
-        Dict[str, str]
-            A dictionary of device hash types.
+        numpy.ndarray
+            An array of device hash types, aligned to the device hashes.
         """
-        # load in smartphone data
-        smartphone_data = pd.read_csv(fpath_smartphones, usecols=['model','rating','os'])
-        smartphone_data = smartphone_data.loc[smartphone_data['os'] == 'android', :].copy()
-        # derive a proportion popularity from the ratings(TODO: expand this to be average rating per mobile phone brand)
-        smartphone_data['rating'] = smartphone_data['rating'].fillna(value=smartphone_data['rating'].mean())
-        smartphone_data['popularity'] =  smartphone_data['rating'] / smartphone_data['rating'].sum()
+        # get the cached sampler of android smartphone models by their popularity proportions derived from the ratings (TODO: expand this to be average rating per mobile phone brand)
+        smartphone_sampler = ref_data_registry.smartphone_sampler(fpath_smartphones=fpath_smartphones)
         # randomly choose different device types
-        device_types = list(np.random.choice(a=smartphone_data['model'].to_list(), size=len(device_hashes), replace=True, p=smartphone_data['popularity'].to_list()))
-        # return device hashes and types
-        device_hashes_type_dict = dict(zip(device_hashes, device_types))
-        return device_hashes_type_dict
+        device_types = smartphone_sampler.sample(rng=rng, size=len(device_hashes))
+        return device_types
+
+    @property
+    def device_hashes_type_dict(self) -> Dict[int, str]:
+        """
+        The device hash types dictionary.
+        """
+        return dict(zip(self.device_hashes.tolist(), self.device_hashes_type))
+
+    @property
+    def device_shared_idhashes(self) -> np.ndarray:
+        """
+        The shared device hash codes, aligned to the device hashes.
+        """
+        return self.device_hashes[self.device_shared_idhash_positions]
+
+    @property
+    def device_shared_idhash_map_dict(self) -> Dict[int, int]:
+        """
+        The device shared idhash mapping dictionary, of the device hashes which are shared.
+        """
+        shared_mask = self.device_shared_idhash_positions != np.arange(self.device_hashes.shape[0])
+        return dict(zip(self.device_hashes[shared_mask].tolist(), self.device_shared_idhashes[shared_mask].tolist()))
\ No newline at end of file
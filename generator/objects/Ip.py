@@ -1,20 +1,23 @@
 import cons
 from utilities.gen_idhash_cnt_dict import gen_idhash_cnt_dict
 from utilities.cnt2prop_dict import cnt2prop_dict
-from utilities.gen_country_codes_dict import gen_country_codes_dict
+from utilities.gen_country_codes import gen_country_codes
 from utilities.gen_shared_idhashes import gen_shared_idhashes
+from utilities.lean_beartype import lean_beartype
 
 import numpy as np
-from beartype import beartype
-from typing import Union
+from typing import Dict, Union
 
 class Ip:
     
-    @beartype
+    @lean_beartype
     def __init__(
         self,
         n_ip_hashes:Union[int,np.int64],
+        rng:np.random.Generator,
         fpath_countries_europe:str=cons.fpath_countries_europe,
+        idhash_offset:Union[int,np.int64]=0,
+        idhash_key:Union[int,None]=None,
         ):
         """
         The randomly generated ip data model object.
@@ -23,8 +26,14 @@ class Ip:
         ----------
         n_ip_hashes : int
             The number of ip hashes to generate.
+        rng : numpy.random.Generator
+            The random number generator to draw from.
         fpath_countries_europe : str
             The file path to the european countries reference file, default is cons.fpath_countries_europe.
+        idhash_offset : int
+            The start of the counter range the ip hashes are permuted from, default is 0.
+        idhash_key : int
+            The key of the ip hash permutation, default is None which draws a random key.
         
         Attributes
         ----------
@@ -36,22 +45,46 @@ class Ip:
             The power parameter of the squared poisson distribution used to generate the ip hash counts.
         prop_shared_ip_hashes : float
             The population proportion of shared ip hashes.
-        ip_hashes_cnts_dict : Dict[str, int]
+        ip_hashes : numpy.ndarray
+            The ip hash codes.
+        ip_hashes_cnts_dict : Dict[int, int]
             The ip hash counts dictionary.
-        ip_hashes_props_dict : Dict[str, float]
+        ip_hashes_props_dict : Dict[int, float]
             The ip hash proportions dictionary.
-        ip_hashes_country_code_dict : Dict[str, str]
-            The ip hash country codes dictionary.
-        ip_shared_idhash_map_dict  : Dict[str, str]
-            The shared ip hash mapping dictionary.
+        ip_hashes_country_code : numpy.ndarray
+            The ip hash country codes, aligned to the ip hashes.
+        ip_shared_idhash_positions : numpy.ndarray
+            The position of each ip hash's shared ip hash within the ip hashes, aligned to the ip hashes.
         """
         self.n_ip_hashes = n_ip_hashes
         self.fpath_countries_europe = fpath_countries_europe
         self.lam = cons.data_model_poisson_params["ip"]["lambda"]
         self.power = cons.data_model_poisson_params["ip"]["power"]
         self.prop_shared_ip_hashes = cons.data_model_shared_entities_dict["ip"]
-        self.ip_hashes_cnts_dict = gen_idhash_cnt_dict(idhash_type="hash", n=self.n_ip_hashes, lam=self.lam, power=self.power)
-        self.ip_hashes = list(self.ip_hashes_cnts_dict.keys())
+        self.ip_hashes_cnts_dict = gen_idhash_cnt_dict(idhash_type="hash", n=self.n_ip_hashes, lam=self.lam, power=self.power, rng=rng, offset=idhash_offset, key=idhash_key)
+        self.ip_hashes = np.array(list(self.ip_hashes_cnts_dict.keys()), dtype=np.uint64)
         self.ip_hashes_props_dict = cnt2prop_dict(idhashes_cnts_dict=self.ip_hashes_cnts_dict)
-        self.ip_hashes_country_code_dict = gen_country_codes_dict(idhashes=self.ip_hashes, fpath_countries_europe=self.fpath_countries_europe)
-        self.ip_shared_idhash_map_dict = gen_shared_idhashes(idhashes=self.ip_hashes, prop_shared_idhashes=self.prop_shared_ip_hashes)
\ No newline at end of file
+        self.ip_hashes_country_code = gen_country_codes(size=self.ip_hashes.shape[0], rng=rng, fpath_countries_europe=self.fpath_countries_europe)
+        self.ip_shared_idhash_positions = gen_shared_idhashes(idhashes=self.ip_hashes, prop_shared_idhashes=self.prop_shared_ip_hashes, rng=rng)
+
+    @property
+    def ip_hashes_country_code_dict(self) -> Dict[int, int]:
+        """
+        The ip hash country codes dictionary.
+        """
+        return dict(zip(self.ip_hashes.tolist(), self.ip_hashes_country_code))
+
+    @property
+    def ip_shared_idhashes(self) -> np.ndarray:
+        """
+        The shared ip hash codes, aligned to the ip hashes.
+        """
+        return self.ip_hashes[self.ip_shared_idhash_positions]
+
+    @property
+    def ip_shared_idhash_map_dict(self) -> Dict[int, int]:
+        """
+        The ip shared idhash mapping dictionary, of the ip hashes which are shared.
+        """
+        shared_mask = self.ip_shared_idhash_positions != np.arange(self.ip_hashes.shape[0])
+        return dict(zip(self.ip_hashes[shared_mask].tolist(), self.ip_shared_idhashes[shared_mask].tolist()))
\ No newline at end of file
@@ -1,21 +1,25 @@
 import cons
 from utilities.gen_idhash_cnt_dict import gen_idhash_cnt_dict
 from utilities.cnt2prop_dict import cnt2prop_dict
-from utilities.gen_dates_dict import gen_dates_dict
+from utilities.gen_dates import gen_dates
 from utilities.round_trans_amount import round_trans_amount
+from utilities.CategoricalSampler import CategoricalSampler
+from utilities.lean_beartype import lean_beartype
 
 import numpy as np
-from beartype import beartype
-from typing import List, Dict, Union
+from typing import Dict, Union
 
 class Transaction:
     
-    @beartype
+    @lean_beartype
     def __init__(
         self,
         n_transaction_hashes:Union[int,np.int64],
         start_date:str,
         end_date:str,
+        rng:np.random.Generator,
+        idhash_offset:Union[int,np.int64]=0,
+        idhash_key:Union[int,None]=None,
         ):
         """
         The randomly generated transaction data model object.
@@ -28,6 +32,12 @@ class Transaction:
             The start date to generate transactions from.
         end_date : str
             The end date to generate transaction till.
+        rng : numpy.random.Generator
+            The random number generator to draw from.
+        idhash_offset : int
+            The start of the counter range the transaction hashes are permuted from, default is 0.
+        idhash_key : int
+            The key of the transaction hash permutation, default is None which draws a random key.
         
         Attributes
         ----------
@@ -43,16 +53,20 @@ class Transaction:
             The power parameter of the squared poisson distribution used to generate the transaction hash counts.
         transaction_status : Dict[str, float]
             The population proportion of transaction statuses.
-        transaction_hashes_cnts_dict : Dict[str, int]
+        transaction_status_sampler : CategoricalSampler
+            The categorical sampler of transaction statuses by their population proportions.
+        transaction_hashes : numpy.ndarray
+            The transaction hash codes.
+        transaction_hashes_cnts_dict : Dict[int, int]
             The transaction hash counts dictionary.
-        transaction_hashes_props_dict : Dict[str, float]
+        transaction_hashes_props_dict : Dict[int, float]
             The transaction hash proportions dictionary.
-        transaction_hashes_dates_dict : Dict[str, str]
-            The transaction hash dates dictionary.
-        transaction_hashes_status_dict : Dict[str, str]
-            The transaction hash status dictionary.
-        transaction_hashes_amounts_dict : Dict[str, float]
-            The transaction hash amount dictionary.
+        transaction_hashes_dates : numpy.ndarray
+            The transaction hash datetime64[D] dates, aligned to the transaction hashes.
+        transaction_hashes_status : numpy.ndarray
+            The transaction hash statuses, aligned to the transaction hashes.
+        transaction_hashes_amounts : numpy.ndarray
+            The transaction hash amounts, aligned to the transaction hashes.
         """
         self.n_transaction_hashes = n_transaction_hashes
         self.start_date = start_date
@@ -60,61 +74,59 @@ class Transaction:
         self.lam = cons.data_model_poisson_params["transaction"]["lambda"]
         self.power = cons.data_model_poisson_params["transaction"]["power"]
         self.transaction_status = cons.data_model_transaction_status
-        self.transaction_hashes_cnts_dict = gen_idhash_cnt_dict(idhash_type="hash", n=self.n_transaction_hashes, lam=self.lam, power=self.power)
-        self.transaction_hashes = list(self.transaction_hashes_cnts_dict.keys())
+        self.transaction_status_sampler = CategoricalSampler.from_dict(prop_dict=self.transaction_status)
+        self.transaction_hashes_cnts_dict = gen_idhash_cnt_dict(idhash_type="hash", n=self.n_transaction_hashes, lam=self.lam, power=self.power, rng=rng, offset=idhash_offset, key=idhash_key)
+        self.transaction_hashes = np.array(list(self.transaction_hashes_cnts_dict.keys()), dtype=np.uint64)
         self.transaction_hashes_props_dict = cnt2prop_dict(idhashes_cnts_dict=self.transaction_hashes_cnts_dict)
-        self.transaction_hashes_dates_dict = gen_dates_dict(idhashes=self.transaction_hashes,start_date=self.start_date,end_date=self.end_date,)
-        self.transaction_hashes_status_dict = self.gen_transaction_status(transaction_hashes=self.transaction_hashes, transaction_status=self.transaction_status)
-        self.transaction_hashes_amounts_dict = self.gen_transaction_amounts(transaction_hashes=self.transaction_hashes, loc=0, scale=2)
+        self.transaction_hashes_dates = gen_dates(size=self.transaction_hashes.shape[0], start_date=self.start_date, end_date=self.end_date, rng=rng)
+        self.transaction_hashes_status = self.gen_transaction_status(transaction_hashes=self.transaction_hashes, transaction_status_sampler=self.transaction_status_sampler, rng=rng)
+        self.transaction_hashes_amounts = self.gen_transaction_amounts(transaction_hashes=self.transaction_hashes, rng=rng, loc=0, scale=2)
     
-    @beartype
+    @lean_beartype
     def gen_transaction_status(
         self,
-        transaction_hashes:List[str],
-        transaction_status:Dict[str, float],
-        ):
+        transaction_hashes:np.ndarray,
+        transaction_status_sampler:CategoricalSampler,
+        rng:np.random.Generator,
+        ) -> np.ndarray:
         """
-        Generates a dictionary of random transaction statuses
+        Generates an array of random transaction statuses
         
         Parameters
         ----------
-        transaction_hashes : List[str]
-            The transaction hashes
-        transaction_status : Dict[str, float]
-            The population proportion of transaction statuses
+        transaction_hashes : numpy.ndarray
+            The transaction hash codes
+        transaction_status_sampler : CategoricalSampler
+            The categorical sampler of transaction statuses by their population proportions
+        rng : numpy.random.Generator
+            The random number generator to draw from
         
         Returns
         -------
-        Dict[str, str]
-            A dictionary of transaction statuses
+        numpy.ndarray
+            An array of transaction statuses, aligned to the transaction hashes
         """
         # randomly sample transaction status based on population proportions
-        transaction_status = list(
-            np.random.choice(
-                a=list(transaction_status.keys()),
-                p=list(transaction_status.values()),
-                replace=True,
-                size=len(transaction_hashes),
-            )
-        )
-        # return transaction hashes and statuses
-        transaction_hashes_status_dict = dict(zip(transaction_hashes, transaction_status))
-        return transaction_hashes_status_dict
+        transaction_hashes_status = transaction_status_sampler.sample(rng=rng, size=len(transaction_hashes))
+        return transaction_hashes_status
     
-    @beartype
+    @lean_beartype
     def gen_transaction_amounts(
         self,
-        transaction_hashes:List[str],
+        transaction_hashes:np.ndarray,
+        rng:np.random.Generator,
         loc:Union[int, float]=0,
         scale:Union[int, float]=2,
-        ) -> Dict[str, float]:
+        ) -> np.ndarray:
         """
-        Generates a dictionary of random transaction hash amounts.
+        Generates an array of random transaction hash amounts.
         
         Parameters
         ----------
-        transaction_hashes : List[str]
-            The transaction hashes.
+        transaction_hashes : numpy.ndarray
+            The transaction hash codes.
+        rng : numpy.random.Generator
+            The random number generator to draw from.
         loc : float
             The mean of the transaction amount distribution to generate, default is 0.
         scale : float
@@ -122,11 +134,32 @@ class Transaction:
         
         Returns
         -------
-        Dict[str, float]
-            A dictionary of transaction hash prices
+        numpy.ndarray
+            An array of transaction hash prices, aligned to the transaction hashes
         """
         # randomly sample transaction prices from an absolute normal distribution with mean 0 and standard deviation 2
-        trans_prices = np.round(np.abs(np.random.normal(loc=loc, scale=scale, size=len(transaction_hashes)))** 2,2,)
-        # return the transaction hashes and prices
-        trans_prices_dict = dict(zip(transaction_hashes, round_trans_amount(trans_prices)))
-        return trans_prices_dict
\ No newline at end of file
+        trans_prices = np.round(np.abs(rng.normal(loc=loc, scale=scale, size=len(transaction_hashes)))** 2,2,)
+        # return the rounded transaction prices
+        trans_prices = round_trans_amount(amounts=trans_prices, rng=rng)
+        return trans_prices
+
+    @property
+    def transaction_hashes_dates_dict(self) -> Dict[int, np.datetime64]:
+        """
+        The transaction hash dates dictionary.
+        """
+        return dict(zip(self.transaction_hashes.tolist(), self.transaction_hashes_dates))
+
+    @property
+    def transaction_hashes_status_dict(self) -> Dict[int, str]:
+        """
+        The transaction hash status dictionary.
+        """
+        return dict(zip(self.transaction_hashes.tolist(), self.transaction_hashes_status))
+
+    @property
+    def transaction_hashes_amounts_dict(self) -> Dict[int, float]:
+        """
+        The transaction hash amount dictionary.
+        """
+        return dict(zip(self.transaction_hashes.tolist(), self.transaction_hashes_amounts))
\ No newline at end of file
@@ -1,27 +1,32 @@
 import cons
 from utilities.gen_idhash_cnt_dict import gen_idhash_cnt_dict
 from utilities.cnt2prop_dict import cnt2prop_dict
-from utilities.gen_country_codes_dict import gen_country_codes_dict
-from utilities.gen_dates_dict import gen_dates_dict
+from utilities.gen_country_codes import gen_country_codes
+from utilities.gen_dates import gen_dates
+from utilities.select_csr_idhashes import select_csr_idhashes
+from utilities.RefDataRegistry import ref_data_registry
+from utilities.lean_beartype import lean_beartype
 
 import numpy as np
 import pandas as pd
-from beartype import beartype
-from typing import Dict
+from typing import Dict, Union
 
 class User:
     
-    @beartype
+    @lean_beartype
     def __init__(
         self,
         n_user_ids:int,
         start_date:str,
         end_date:str,
+        rng:np.random.Generator,
         fpath_first_names:str=cons.fpath_llama_first_names,
         fpath_last_names:str=cons.fpath_llama_last_names,
         fpath_countries_europe:str=cons.fpath_countries_europe,
         fpath_email_domain:str=cons.fpath_email_domain,
         fpath_bedrock_email_domain:str=cons.fpath_llama_email_domains,
+        idhash_offset:Union[int,np.int64]=0,
+        idhash_key:Union[int,None]=None,
         ):
         """
         The randomly generated user data model object
@@ -34,6 +39,8 @@ class User:
             The start date to generate users from
         end_date : str
             The end date to generate users till
+        rng : numpy.random.Generator
+            The random number generator to draw from
         fpath_first_names : str
             The full file path to the first names reference data, default is cons.fpath_llama_first_names.
         fpath_last_names : str
@@ -42,6 +49,10 @@ class User:
             The full file path to the europe countries reference data, default is cons.fpath_countries_europe.
         fpath_email_domain : str
             The full file path to the email domain reference data, default is cons.fpath_llama_email_domains .
+        idhash_offset : int
+            The start of the counter range the user ids are permuted from, default is 0.
+        idhash_key : int
+            The key of the user id permutation, default is None which draws a random key.
         
         Attributes
         ----------
@@ -55,20 +66,22 @@ class User:
             The lambda parameter of the squared poisson distribution used to generate the user ids counts
         power : float
             The power parameter of the squared poisson distribution used to generate the user ids counts
-        user_ids_cnts_dict : Dict[str, int]
+        user_ids : numpy.ndarray
+            The user id codes
+        user_ids_cnts_dict : Dict[int, int]
             The user id counts dictionary
-        user_ids_props_dict : Dict[str, float]
+        user_ids_props_dict : Dict[int, float]
             The user id proportions dictionary
-        user_ids_first_name_dict : Dict[str, str]
-            The user id first names dictionary
-        user_ids_last_name_dict : Dict[str, str]
-            The user id last names dictionary
-        user_ids_country_code_dict : Dict[str, str]
-            The user id country codes dictionary
-        user_ids_email_domain_dict : Dict[str, str]
-            The user id email domains dictionary
-        user_ids_dates_dict : Dict[str, str]
-            The user id dates dictionary
+        user_ids_first_name : numpy.ndarray
+            The user id first names, aligned to the user ids
+        user_ids_last_name : numpy.ndarray
+            The user id last names, aligned to the user ids
+        user_ids_country_code : numpy.ndarray
+            The user id country codes, aligned to the user ids
+        user_ids_email_domain : numpy.ndarray
+            The user id email domains, aligned to the user ids
+        user_ids_dates : numpy.ndarray
+            The user id datetime64[D] registration dates, aligned to the user ids
         """
         self.n_user_ids = n_user_ids
         self.start_date = start_date
@@ -80,23 +93,24 @@ class User:
         self.fpath_bedrock_email_domain = fpath_bedrock_email_domain
         self.lam = cons.data_model_poisson_params["user"]["lambda"]
         self.power = cons.data_model_poisson_params["user"]["power"]
-        self.user_ids_cnts_dict = gen_idhash_cnt_dict(idhash_type="id", n=self.n_user_ids, lam=self.lam, power=self.power)
-        self.user_ids = list(self.user_ids_cnts_dict.keys())
+        self.user_ids_cnts_dict = gen_idhash_cnt_dict(idhash_type="id", n=self.n_user_ids, lam=self.lam, power=self.power, rng=rng, offset=idhash_offset, key=idhash_key)
+        self.user_ids = np.array(list(self.user_ids_cnts_dict.keys()), dtype=np.uint64)
         self.user_ids_props_dict = cnt2prop_dict(idhashes_cnts_dict=self.user_ids_cnts_dict)
-        self.user_ids_country_code_dict = gen_country_codes_dict(idhashes=self.user_ids, fpath_countries_europe=self.fpath_countries_europe)
-        self.user_ids_first_name_dict = self.gen_user_bedrock_name_data(fpath_bedrock_data=self.fpath_first_names, sample_column_name="first_names")
-        self.user_ids_last_name_dict = self.gen_user_bedrock_name_data(fpath_bedrock_data=self.fpath_last_names, sample_column_name="last_names")
-        self.user_ids_email_domain_dict = self.gen_user_bedrock_email_domain(fpath_email_domain=self.fpath_email_domain, fpath_bedrock_email_domain=self.fpath_bedrock_email_domain)
-        self.user_ids_dates_dict = gen_dates_dict(idhashes=self.user_ids, start_date=self.start_date, end_date=self.end_date)
+        self.user_ids_country_code = gen_country_codes(size=self.user_ids.shape[0], rng=rng, fpath_countries_europe=self.fpath_countries_europe)
+        self.user_ids_first_name = self.gen_user_bedrock_name_data(fpath_bedrock_data=self.fpath_first_names, sample_column_name="first_names", rng=rng)
+        self.user_ids_last_name = self.gen_user_bedrock_name_data(fpath_bedrock_data=self.fpath_last_names, sample_column_name="last_names", rng=rng)
+        self.user_ids_email_domain = self.gen_user_bedrock_email_domain(fpath_email_domain=self.fpath_email_domain, fpath_bedrock_email_domain=self.fpath_bedrock_email_domain, rng=rng)
+        self.user_ids_dates = gen_dates(size=self.user_ids.shape[0], start_date=self.start_date, end_date=self.end_date, rng=rng)
     
-    @beartype
+    @lean_beartype
     def gen_user_bedrock_name_data(
         self,
         fpath_bedrock_data:str,
         sample_column_name:str,
-        ) -> Dict[str, str]:
+        rng:np.random.Generator,
+        ) -> np.ndarray:
         """
-        Generates a dictionary of random user bedrock data, e.g. first_names or last_names
+        Generates an array of random user bedrock data, e.g. first_names or last_names
         
         Parameters
         ----------
@@ -104,58 +118,83 @@ class User:
             The file path to the bedrock data reference file
         sample_column_name : str
             The column name to sample from in the bedrock data reference file
+        rng : numpy.random.Generator
+            The random number generator to draw from
         
         Returns
         -------
-        Dict[str, str]
-            A dictionary of user id bedrock data
-        """
-        # load in list of first names
-        bedrock_data = pd.read_csv(fpath_bedrock_data)
-        # randomly sample names first_names according to country code and counts
-        country_code_dataframe = pd.Series(self.user_ids_country_code_dict, name="country_code").to_frame().reset_index().rename(columns={"index":"user_ids"}).assign(count=1)
-        country_codes_cnt = country_code_dataframe.groupby(by="country_code").agg({"user_ids":list,"count":"sum"}).reset_index()
-        country_codes_cnt["sample"] = country_codes_cnt.apply(lambda series: bedrock_data.loc[(bedrock_data["ISO numeric"] == series["country_code"]), sample_column_name].sample(n=series["count"], replace=True, weights=None).to_list(), axis=1)
-        # create the key value pairs mapping user id to bedrock data points
-        user_ids_bedrock_pairs = country_codes_cnt.apply(lambda series: dict(zip(series["user_ids"], series["sample"])), axis=1).to_list()
-        # convert key value pairs to dict
-        user_ids_bedrock_dict = pd.concat([pd.Series(d) for d in user_ids_bedrock_pairs])[country_code_dataframe["user_ids"]].to_dict()
-        return user_ids_bedrock_dict
+        numpy.ndarray
+            An array of user id bedrock data, aligned to the user ids
+        """
+        # get the cached names, indexed by country code into contiguous arrays with per country offsets
+        country_codes, offsets, names = ref_data_registry.country_names_index(fpath_bedrock_data=fpath_bedrock_data, sample_column_name=sample_column_name)
+        # find the names position of each user's country, users of countries without names are given an empty pool at the end
+        user_country_idx = pd.Index(country_codes).get_indexer(self.user_ids_country_code)
+        user_country_idx[user_country_idx < 0] = country_codes.shape[0]
+        offsets = np.append(offsets, offsets[-1])
+        # randomly sample one name per user from the names of their country with a single vectorised index draw
+        user_ids_bedrock = select_csr_idhashes(values=names, offsets=offsets, owners=user_country_idx, rng=rng)
+        return user_ids_bedrock
     
-    @beartype
+    @lean_beartype
     def gen_user_bedrock_email_domain(
         self,
         fpath_email_domain:str,
         fpath_bedrock_email_domain:str,
-        ) -> Dict[str, str]:
+        rng:np.random.Generator,
+        ) -> np.ndarray:
         """
-        Generates a dictionary of random user id email domains
+        Generates an array of random user id email domains
         
         Parameters
         ----------
         fpath_email_domain : str
             The file path to the email domains reference file
+        rng : numpy.random.Generator
+            The random number generator to draw from
         
         Returns
         -------
-        Dict[str, str]
-            A dictionary of user id email domains
-        """
-        # load domain names data
-        email_domain_data = pd.read_csv(fpath_email_domain, index_col=0)
-        # calculate the proportion of email domains
-        email_domain_data["proportion"] = email_domain_data["proportion"].divide(email_domain_data["proportion"].sum())
-        # convert email domain proportions to a dictionary
-        email_domain_dict = email_domain_data.set_index("domain").to_dict()["proportion"]
+        numpy.ndarray
+            An array of user id email domains, aligned to the user ids
+        """
+        # get the cached sampler of email domains by their proportions
+        email_domain_sampler = ref_data_registry.email_domain_sampler(fpath_email_domain=fpath_email_domain)
         # randomly choose the email domains based on proportions
-        user_email_domain_list = list(
-            np.random.choice(
-                a=list(email_domain_dict.keys()),
-                p=list(email_domain_dict.values()),
-                replace=True,
-                size=len(self.user_ids),
-            )
-        )
-        # return the user ids email domains
-        user_ids_email_domain_dict = dict(zip(self.user_ids, user_email_domain_list))
-        return user_ids_email_domain_dict
\ No newline at end of file
+        user_ids_email_domain = email_domain_sampler.sample(rng=rng, size=len(self.user_ids))
+        return user_ids_email_domain
+
+    @property
+    def user_ids_first_name_dict(self) -> Dict[int, str]:
+        """
+        The user id first names dictionary
+        """
+        return dict(zip(self.user_ids.tolist(), self.user_ids_first_name))
+
+    @property
+    def user_ids_last_name_dict(self) -> Dict[int, str]:
+        """
+        The user id last names dictionary
+        """
+        return dict(zip(self.user_ids.tolist(), self.user_ids_last_name))
+
+    @property
+    def user_ids_country_code_dict(self) -> Dict[int, int]:
+        """
+        The user id country codes dictionary
+        """
+        return dict(zip(self.user_ids.tolist(), self.user_ids_country_code))
+
+    @property
+    def user_ids_email_domain_dict(self) -> Dict[int, str]:
+        """
+        The user id email domains dictionary
+        """
+        return dict(zip(self.user_ids.tolist(), self.user_ids_email_domain))
+
+    @property
+    def user_ids_dates_dict(self) -> Dict[int, np.datetime64]:
+        """
+        The user id dates dictionary
+        """
+        return dict(zip(self.user_ids.tolist(), self.user_ids_dates))
\ No newline at end of file
@@ -0,0 +1,140 @@
+import os
+import sys
+import json
+import asyncio
+import tempfile
+import unittest
+import pyarrow as pa
+from fastapi.testclient import TestClient
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+import api
+import cons
+from utilities.ResultCache import ResultCache
+
+# cache the seeded responses and write their output files within a temporary directory removed once the tests finish
+tmp_dir = tempfile.TemporaryDirectory()
+api.result_cache = ResultCache(fdir=tmp_dir.name, version_hash=api.result_cache.version_hash)
+cons.fdir_api_outputs = os.path.join(tmp_dir.name, "api")
+
+async def gen_joined_responses(input_params_dict, n_requests):
+    """Generates concurrent api responses of the same seeded dataset, which join a single cache fill."""
+    return await asyncio.gather(*[api.gen_api_response(input_params_dict=input_params_dict, accept=None) for _ in range(n_requests)])
+
+# request small datasets in each response format, including bodies asking for the transaction data to be streamed to disk
+input_params = {"n_users": 20, "n_applications": 20, "write_output": 0}
+with TestClient(api.app) as client:
+    json_response = client.get("/api", params={**input_params, "use_random_seed": 1})
+    ndjson_response = client.get("/api", params={**input_params, "use_random_seed": 1}, headers={"Accept": "application/x-ndjson"})
+    stream_output_responses = [client.post("/api", json={**input_params, "use_random_seed": use_random_seed, "stream_output": 1}) for use_random_seed in [0, 1]]
+    # request with the default write_output, and with invalid input parameters
+    default_response = client.get("/api", params={"n_users": 20, "n_applications": 20})
+    invalid_responses = [client.get("/api", params={"n_users": 2, "n_shards": 5}), client.post("/api", json={"n_users": "x"})]
+    # request projected columns, the first, last and empty pages and a format overriding the Accept header, for both seeded and unseeded requests
+    n_rows = int(json_response.headers["X-Total-Count"])
+    page_params = {**input_params, "use_random_seed": 1, "columns": "userid,transaction_date"}
+    first_page_response = client.get("/api", params={**page_params, "offset": 0, "limit": 10})
+    last_page_response = client.post("/api", params={"columns": "userid,transaction_date", "offset": n_rows - 5, "limit": 10}, json={**input_params, "use_random_seed": 1})
+    empty_page_responses = [client.get("/api", params={**input_params, "use_random_seed": use_random_seed, "offset": 1000000}) for use_random_seed in [0, 1]]
+    format_response = client.get("/api", params={**page_params, "limit": 10, "format": "arrow"}, headers={"Accept": "application/json"})
+    invalid_columns_response = client.get("/api", params={**page_params, "columns": "userid,not_a_column"})
+    # request seeded datasets written to disk by a cache miss followed by a cache hit, and by concurrent requests joining a single cache fill
+    write_output_responses = [client.get("/api", params={"n_users": 25, "n_applications": 20, "use_random_seed": 1, "write_output": 1}) for _ in range(2)]
+    # request the same seeded dataset with unpadded and padded dates, and with an invalid date
+    date_params = {"n_users": 20, "n_applications": 20, "use_random_seed": 1, "registration_start_date": "2020-01-01", "registration_end_date": "2020-12-31", "transaction_start_date": "2021-01-01", "transaction_end_date": "2021-12-31"}
+    date_responses = [client.get("/api", params={**date_params, "registration_start_date": "2020-1-1", "transaction_start_date": "2021-1-1"}), client.get("/api", params=date_params)]
+    invalid_date_response = client.get("/api", params={**date_params, "transaction_end_date": "2021-13-01"})
+    joined_responses = client.portal.call(gen_joined_responses, {**cons.default_input_params_dict, "n_users": 30, "n_applications": 20, "use_random_seed": 1, "write_output": 1}, 2)
+
+def tearDownModule():
+    tmp_dir.cleanup()
+
+
+class Test_api(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.json_response = json_response
+        self.ndjson_response = ndjson_response
+        self.stream_output_responses = stream_output_responses
+        self.default_response = default_response
+        self.invalid_responses = invalid_responses
+        self.n_rows = n_rows
+        self.first_page_response = first_page_response
+        self.last_page_response = last_page_response
+        self.empty_page_responses = empty_page_responses
+        self.format_response = format_response
+        self.invalid_columns_response = invalid_columns_response
+        self.write_output_responses = write_output_responses
+        self.joined_responses = joined_responses
+        self.date_responses = date_responses
+        self.invalid_date_response = invalid_date_response
+
+    def test_status_code(self):
+        self.assertEqual(self.json_response.status_code, 200)
+        self.assertEqual(self.ndjson_response.status_code, 200)
+        for stream_output_response in self.stream_output_responses:
+            self.assertEqual(stream_output_response.status_code, 200)
+
+    def test_stream_output(self):
+        for stream_output_response in self.stream_output_responses:
+            self.assertEqual(type(stream_output_response.json()), list)
+            self.assertGreater(len(stream_output_response.json()), 0)
+
+    def test_date_format(self):
+        json_records = self.json_response.json()
+        ndjson_records = [json.loads(line) for line in self.ndjson_response.text.splitlines()]
+        self.assertEqual(json_records, ndjson_records)
+        for date_col in ["registration_date", "transaction_date"]:
+            self.assertTrue(all(len(record[date_col]) == 10 for record in json_records))
+
+    def test_write_output(self):
+        self.assertEqual(self.default_response.status_code, 200)
+        self.assertNotIn("X-Output-Dir", self.default_response.headers)
+        # only the request which generated the dataset returns its output directory, which has been written
+        for responses in [self.write_output_responses, self.joined_responses]:
+            self.assertEqual([response.status_code for response in responses], [200, 200])
+            self.assertEqual([response.headers["X-Cache"] for response in responses], ["miss", "hit"] if responses is self.write_output_responses else ["miss", "miss"])
+            self.assertEqual(["X-Output-Dir" in response.headers for response in responses], [True, False])
+            self.assertTrue(os.path.isdir(responses[0].headers["X-Output-Dir"]))
+            self.assertGreater(len(os.listdir(responses[0].headers["X-Output-Dir"])), 0)
+
+    def test_invalid_input_params(self):
+        for invalid_response in self.invalid_responses:
+            self.assertEqual(invalid_response.status_code, 422)
+
+    def test_dates(self):
+        self.assertEqual([date_response.status_code for date_response in self.date_responses], [200, 200])
+        self.assertEqual([date_response.headers["X-Cache"] for date_response in self.date_responses], ["miss", "hit"])
+        self.assertEqual(self.date_responses[0].json(), self.date_responses[1].json())
+        self.assertEqual(self.invalid_date_response.status_code, 422)
+
+    def test_columns(self):
+        self.assertEqual([list(record.keys()) for record in self.first_page_response.json()], [["userid", "transaction_date"]] * 10)
+        self.assertEqual(self.invalid_columns_response.status_code, 422)
+
+    def test_pages(self):
+        self.assertEqual(self.first_page_response.json(), [{key:record[key] for key in ["userid", "transaction_date"]} for record in self.json_response.json()[:10]])
+        self.assertEqual(self.first_page_response.headers["X-Total-Count"], str(self.n_rows))
+        self.assertEqual(self.first_page_response.headers["X-Next-Offset"], "10")
+        self.assertEqual(len(self.last_page_response.json()), 5)
+        self.assertEqual(self.last_page_response.headers["X-Total-Count"], str(self.n_rows))
+        self.assertNotIn("X-Next-Offset", self.last_page_response.headers)
+
+    def test_empty_page(self):
+        for empty_page_response in self.empty_page_responses:
+            self.assertEqual(empty_page_response.status_code, 200)
+            self.assertEqual(empty_page_response.json(), [])
+            self.assertIn("X-Total-Count", empty_page_response.headers)
+            self.assertNotIn("X-Next-Offset", empty_page_response.headers)
+
+    def test_format(self):
+        self.assertEqual(self.format_response.headers["Content-Type"], "application/vnd.apache.arrow.stream")
+        format_table = pa.ipc.open_stream(self.format_response.content).read_all()
+        self.assertEqual(format_table.column_names, ["userid", "transaction_date"])
+        self.assertEqual(format_table.num_rows, 10)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,43 @@
+import os
+import sys
+import unittest
+import pandas as pd
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+import cons
+from app.gen_sharded_telecom_data import gen_sharded_telecom_data
+
+# generate a small sharded dataset with the default ncpu, as in the docstring example
+n_users = 100
+n_shards = 2
+obs_results = gen_sharded_telecom_data(n_users=n_users, n_shards=n_shards, random_seed=cons.unittest_seed)
+rep_results = gen_sharded_telecom_data(n_users=n_users, n_shards=n_shards, random_seed=cons.unittest_seed)
+
+
+class Test_gen_sharded_telecom_data(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.obs_results = obs_results
+        self.rep_results = rep_results
+
+    def test_type(self):
+        self.assertEqual(type(self.obs_results), dict)
+        self.assertEqual(list(self.obs_results.keys()), ["user_data", "trans_data", "user_entity_pools"])
+        self.assertEqual(type(self.obs_results["user_data"]), pd.DataFrame)
+        self.assertEqual(type(self.obs_results["trans_data"]), pd.DataFrame)
+
+    def test_n_users(self):
+        self.assertEqual(self.obs_results["user_data"].shape[0], n_users)
+
+    def test_unique_idhashes(self):
+        self.assertTrue(self.obs_results["user_data"]["uid"].is_unique)
+        self.assertTrue(self.obs_results["trans_data"]["transaction_hash"].is_unique)
+
+    def test_reproducible(self):
+        self.assertTrue(self.obs_results["trans_data"].equals(self.rep_results["trans_data"]))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,67 @@
+import os
+import sys
+import unittest
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+import cons
+from app.gen_shared_networks import gen_shared_networks
+
+# create relative file paths
+fpath_countries_europe = '.' + cons.fpath_countries_europe.split(cons.fpath_repo_dir)[1]
+fpath_countrycrimeindex = '.' + cons.fpath_countrycrimeindex.split(cons.fpath_repo_dir)[1]
+fpath_email_domain = '.' + cons.fpath_email_domain.split(cons.fpath_repo_dir)[1]
+fpath_unittest_transaction_data = '.' + cons.fpath_unittest_transaction_data.split(cons.fpath_repo_dir)[1]
+
+# stack two copies of the unittest transaction data as if generated by two shards with disjoint idhashes
+trans_data = pd.read_parquet(fpath_unittest_transaction_data)
+shard_trans_data = trans_data.copy()
+for idhash_col in ['device_hash', 'card_hash', 'ip_hash', 'transaction_hash']:
+    shard_trans_data[idhash_col] = shard_trans_data[idhash_col] ^ np.uint64(1)
+input_trans_data = pd.concat(objs=[trans_data, shard_trans_data], axis=0, ignore_index=True)
+
+rng = np.random.default_rng(seed=cons.unittest_seed)
+obs_trans_data = gen_shared_networks(trans_data=input_trans_data.copy(), rng=rng, fpath_countries_europe=fpath_countries_europe, fpath_countrycrimeindex=fpath_countrycrimeindex, fpath_email_domain=fpath_email_domain)
+
+
+class Test_gen_shared_networks(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.input_trans_data = input_trans_data
+        self.obs_trans_data = obs_trans_data
+
+    def test_type(self):
+        self.assertEqual(type(self.obs_trans_data), pd.DataFrame)
+
+    def test_shape(self):
+        self.assertEqual(self.obs_trans_data.shape, self.input_trans_data.shape)
+        self.assertEqual(self.obs_trans_data.columns.tolist(), self.input_trans_data.columns.tolist())
+
+    def test_dtypes(self):
+        self.assertTrue((self.obs_trans_data.dtypes == self.input_trans_data.dtypes).all())
+
+    def test_isnull(self):
+        for idhash_col in ['device_hash', 'card_hash', 'ip_hash']:
+            self.assertTrue((self.obs_trans_data[idhash_col].isnull() == self.input_trans_data[idhash_col].isnull()).all())
+
+    def test_idhashes(self):
+        for idhash_col in ['device_hash', 'card_hash', 'ip_hash']:
+            self.assertTrue(self.obs_trans_data[idhash_col].dropna().isin(self.input_trans_data[idhash_col].dropna()).all())
+        self.assertTrue((self.obs_trans_data['transaction_hash'] == self.input_trans_data['transaction_hash']).all())
+
+    def test_consistent_attrs(self):
+        for idhash_col, attr_col in [('device_hash', 'device_type'), ('card_hash', 'card_type'), ('card_hash', 'card_country_code'), ('ip_hash', 'ip_country_code')]:
+            self.assertTrue((self.obs_trans_data.groupby(idhash_col)[attr_col].nunique() <= 1).all())
+
+    def test_trans_status(self):
+        rejected_mask = self.obs_trans_data["transaction_status"] == "Rejected"
+        self.assertTrue(self.obs_trans_data["transaction_status"].isin(cons.data_model_transaction_status.keys()).all())
+        self.assertTrue(self.obs_trans_data.loc[rejected_mask, "transaction_error_code"].notnull().all())
+        self.assertTrue(self.obs_trans_data.loc[~rejected_mask, "transaction_error_code"].isnull().all())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,9 +1,9 @@
 import os
 import sys
 import unittest
-import random
 import numpy as np
 import pandas as pd
+import pyarrow as pa
 
 sys.path.append(os.path.join(os.getcwd(), "generator"))
 
@@ -18,6 +18,7 @@ from objects.Ip import Ip
 from objects.Transaction import Transaction
 from objects.User import User
 from utilities.gen_random_entity_counts import gen_random_entity_counts
+from utilities.join_entity_pools import join_entity_pools
 
 # initalise programme parameters
 programmeparams = ProgrammeParams(
@@ -29,9 +30,8 @@ programmeparams = ProgrammeParams(
     transaction_end_date=cons.unittest_transaction_end_date
     )
 
-# set random seed
-random.seed(programmeparams.random_seed)
-np.random.seed(seed=programmeparams.random_seed)
+# take the random context of the run
+random_context = programmeparams.random_context
 
 # create relative file paths
 fpath_first_names = '.' + cons.fpath_llama_first_names.split(cons.fpath_repo_dir)[1]
@@ -54,20 +54,21 @@ user_obj = User(
     fpath_countries_europe=fpath_countries_europe,
     fpath_email_domain=fpath_email_domain,
     fpath_bedrock_email_domain=fpath_bedrock_email_domain,
+    rng=random_context.stream(stage='user'),
     )
 
 # generate random entity counts for each user
-random_entity_counts = gen_random_entity_counts(user_obj)
+random_entity_counts = gen_random_entity_counts(user_obj=user_obj, rng=random_context.stream(stage='entity_counts'))
 
 # generate random entity values
-device_obj = Device(n_device_hashes=random_entity_counts['n_devices'].sum(), fpath_smartphones=fpath_smartphones)
-card_obj = Card(n_card_hashes=random_entity_counts['n_cards'].sum(), fpath_countries_europe=fpath_countries_europe)
-ip_obj = Ip(n_ip_hashes=random_entity_counts['n_ips'].sum(), fpath_countries_europe=fpath_countries_europe)
-transaction_obj = Transaction(n_transaction_hashes=random_entity_counts['n_transactions'].sum(), start_date=programmeparams.transaction_start_date, end_date=programmeparams.transaction_end_date)
-application_obj = Application(n_application_hashes=programmeparams.n_applications)
+device_obj = Device(n_device_hashes=random_entity_counts['n_devices'].sum(), rng=random_context.stream(stage='device'), fpath_smartphones=fpath_smartphones)
+card_obj = Card(n_card_hashes=random_entity_counts['n_cards'].sum(), rng=random_context.stream(stage='card'), fpath_countries_europe=fpath_countries_europe)
+ip_obj = Ip(n_ip_hashes=random_entity_counts['n_ips'].sum(), rng=random_context.stream(stage='ip'), fpath_countries_europe=fpath_countries_europe)
+transaction_obj = Transaction(n_transaction_hashes=random_entity_counts['n_transactions'].sum(), start_date=programmeparams.transaction_start_date, end_date=programmeparams.transaction_end_date, rng=random_context.stream(stage='transaction'))
+application_obj = Application(n_application_hashes=programmeparams.n_applications, rng=random_context.stream(stage='application'))
 
 # generate expected user and transaction level data
-obs_user_data = gen_user_data(
+obs_user_data, obs_user_entity_pools = gen_user_data(
     random_entity_counts=random_entity_counts,
     user_obj=user_obj,
     device_obj=device_obj,
@@ -75,17 +76,21 @@ obs_user_data = gen_user_data(
     ip_obj=ip_obj,
     transaction_obj=transaction_obj,
     application_obj=application_obj,
+    rng=random_context.stream(stage='user_data'),
 )
 obs_trans_data = gen_trans_data(
     user_data=obs_user_data,
+    user_entity_pools=obs_user_entity_pools,
     user_obj=user_obj,
     device_obj=device_obj,
     card_obj=card_obj,
     ip_obj=ip_obj,
     transaction_obj=transaction_obj,
     application_obj=application_obj,
+    rng=random_context.stream(stage='trans_data'),
     fpath_countrycrimeindex=fpath_countrycrimeindex
 )
+obs_user_data = join_entity_pools(user_data=obs_user_data, user_entity_pools=obs_user_entity_pools)
 
 # if writing observed data to unittest data directory
 if cons.unittest_gen_test_dfs:
@@ -96,6 +101,9 @@ if cons.unittest_gen_test_dfs:
 # load in expected user level data
 exp_user_data = pd.read_parquet(fpath_unittest_user_data)
 exp_trans_data = pd.read_parquet(fpath_unittest_transaction_data)
+# the userids are generated as an arrow backed string column, which is read back from parquet as object strings
+exp_user_data['userid'] = exp_user_data['userid'].astype(pd.ArrowDtype(pa.large_string()))
+exp_trans_data['userid'] = exp_trans_data['userid'].astype(pd.ArrowDtype(pa.large_string()))
 
 class Test_gen_user_trans_data(unittest.TestCase):
     """"""
@@ -127,7 +135,7 @@ class Test_gen_user_trans_data(unittest.TestCase):
         self.assertTrue((self.obs_trans_data.notnull() == self.exp_trans_data.notnull()).all().all())
 
     def test_object(self):
-        self.assertTrue((self.obs_trans_data.fillna(-999.0) == self.exp_trans_data.fillna(-999.0)).all().all())
+        pd.testing.assert_frame_equal(self.obs_trans_data, self.exp_trans_data)
 
 
 if __name__ == "__main__":
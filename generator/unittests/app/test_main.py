@@ -0,0 +1,37 @@
+import os
+import sys
+import unittest
+import pandas as pd
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+import cons
+from main import main
+
+# generate the same seeded multiple iteration dataset twice, without writing the output files
+input_params_dict = {**cons.default_input_params_dict, "n_users": 50, "n_applications": 50, "use_random_seed": 1, "n_itr": 3, "write_output": 0}
+obs_trans_data = main(input_params_dict=input_params_dict)["trans_data"]
+rep_trans_data = main(input_params_dict=input_params_dict)["trans_data"]
+exp_trans_data = obs_trans_data.sort_values(by=["transaction_date", "transaction_hash"]).reset_index(drop=True)
+
+
+class Test_main(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.obs_trans_data = obs_trans_data
+        self.rep_trans_data = rep_trans_data
+        self.exp_trans_data = exp_trans_data
+
+    def test_type(self):
+        self.assertEqual(type(self.obs_trans_data), pd.DataFrame)
+
+    def test_order(self):
+        pd.testing.assert_frame_equal(self.obs_trans_data, self.exp_trans_data)
+
+    def test_reproducible(self):
+        pd.testing.assert_frame_equal(self.obs_trans_data, self.rep_trans_data)
+
+
+if __name__ == "__main__":
+    unittest.main()
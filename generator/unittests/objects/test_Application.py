@@ -1,7 +1,6 @@
 import unittest
 import os
 import sys
-import random
 import numpy as np
 
 sys.path.append(os.path.join(os.getcwd(), "generator"))
@@ -10,36 +9,35 @@ import cons
 from objects.Application import Application
 
 exp_application_hashes_cnts_dict = {
-    "63cea7c46926aa74": 1,
-    "37725417bd51fb40": 5,
-    "b95cb80aae9fbbfe": 2,
-    "dded2b63f8242648": 3,
+    737650845259517236: 12,
+    14901230531057247662: 1,
+    12276904048539927950: 5,
+    12897852372488181176: 11,
 }
 exp_application_hashes_prices_dict = {
-    "63cea7c46926aa74": 1.51,
-    "37725417bd51fb40": 0.44,
-    "b95cb80aae9fbbfe": 7.63,
-    "dded2b63f8242648": 0.32,
+    737650845259517236: 1.51,
+    14901230531057247662: 0.44,
+    12276904048539927950: 7.63,
+    12897852372488181176: 0.32,
 }
 exp_application_hashes_props_dict = {
-    "63cea7c46926aa74": 0.09090909090909091,
-    "37725417bd51fb40": 0.45454545454545453,
-    "b95cb80aae9fbbfe": 0.18181818181818182,
-    "dded2b63f8242648": 0.2727272727272727,
+    737650845259517236: 0.41379310344827586,
+    14901230531057247662: 0.034482758620689655,
+    12276904048539927950: 0.1724137931034483,
+    12897852372488181176: 0.3793103448275862,
 }
 exp_application_hashes_payment_channel_dict = {
-    "63cea7c46926aa74": "Adyen",
-    "37725417bd51fb40": "Adyen",
-    "b95cb80aae9fbbfe": "PayPal",
-    "dded2b63f8242648": "Docomo",
+    737650845259517236: "Docomo",
+    14901230531057247662: "WorldPay",
+    12276904048539927950: "AppStore",
+    12897852372488181176: "PayPal",
 }
 exp_n_application_hashes = cons.unittest_n_entities
 exp_lam = cons.data_model_poisson_params["application"]["lambda"]
 exp_payment_channels = cons.data_model_payment_channels
 
-random.seed(cons.unittest_seed)
-np.random.seed(cons.unittest_seed)
-application_object = Application(n_application_hashes=exp_n_application_hashes)
+rng = np.random.default_rng(seed=cons.unittest_seed)
+application_object = Application(n_application_hashes=exp_n_application_hashes, rng=rng)
 
 obs_application_hashes_cnts_dict = application_object.application_hashes_cnts_dict
 obs_application_hashes_props_dict = application_object.application_hashes_props_dict
@@ -1,7 +1,6 @@
 import unittest
 import os
 import sys
-import random
 import numpy as np
 
 sys.path.append(os.path.join(os.getcwd(), "generator"))
@@ -10,28 +9,28 @@ import cons
 from objects.Card import Card
 
 exp_card_hashes_cnts_dict = {
-    "63cea7c46926aa74": 1,
-    "37725417bd51fb40": 3,
-    "b95cb80aae9fbbfe": 1,
-    "dded2b63f8242648": 1,
+    737650845259517236: 2,
+    14901230531057247662: 1,
+    12276904048539927950: 1,
+    12897852372488181176: 1,
 }
 exp_card_hashes_type_dict = {
-    "63cea7c46926aa74": "Visa",
-    "37725417bd51fb40": "Mastercard",
-    "b95cb80aae9fbbfe": "Visa",
-    "dded2b63f8242648": "Mastercard",
+    737650845259517236: "Visa",
+    14901230531057247662: "Mastercard",
+    12276904048539927950: "Mastercard",
+    12897852372488181176: "Mastercard",
 }
 exp_card_hashes_props_dict = {
-    "63cea7c46926aa74": 0.16666666666666666,
-    "37725417bd51fb40": 0.5,
-    "b95cb80aae9fbbfe": 0.16666666666666666,
-    "dded2b63f8242648": 0.16666666666666666,
+    737650845259517236: 0.4,
+    14901230531057247662: 0.2,
+    12276904048539927950: 0.2,
+    12897852372488181176: 0.2,
 }
 exp_card_hashes_country_code_dict = {
-    "63cea7c46926aa74": 276,
-    "37725417bd51fb40": 380,
-    "b95cb80aae9fbbfe": 380,
-    "dded2b63f8242648": 250,
+    737650845259517236: 616,
+    14901230531057247662: 724,
+    12276904048539927950: 380,
+    12897852372488181176: 804,
 }
 exp_card_shared_idhash_map_dic = {}
 exp_card_types_dict = cons.data_model_card_types_dict
@@ -39,11 +38,10 @@ exp_prop_shared_card_hashes = cons.data_model_shared_entities_dict["card"]
 exp_n_card_hashes = cons.unittest_n_entities
 exp_lam = cons.data_model_poisson_params["card"]["lambda"]
 
-random.seed(cons.unittest_seed)
-np.random.seed(cons.unittest_seed)
+rng = np.random.default_rng(seed=cons.unittest_seed)
 
 fpath_countries_europe = '.' + cons.fpath_countries_europe.split(cons.fpath_repo_dir)[1]
-card_object = Card(n_card_hashes=exp_n_card_hashes, fpath_countries_europe=fpath_countries_europe)
+card_object = Card(n_card_hashes=exp_n_card_hashes, rng=rng, fpath_countries_europe=fpath_countries_europe)
 
 obs_card_hashes_cnts_dict = card_object.card_hashes_cnts_dict
 obs_card_types_dict = card_object.card_types_dict
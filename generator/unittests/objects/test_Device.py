@@ -1,7 +1,6 @@
 import unittest
 import os
 import sys
-import random
 import numpy as np
 
 sys.path.append(os.path.join(os.getcwd(), "generator"))
@@ -10,22 +9,22 @@ import cons
 from objects.Device import Device
 
 exp_device_hashes_cnts_dict = {
-    "63cea7c46926aa74": 1,
-    "37725417bd51fb40": 3,
-    "b95cb80aae9fbbfe": 1,
-    "dded2b63f8242648": 1,
+    737650845259517236: 1,
+    14901230531057247662: 2,
+    12276904048539927950: 1,
+    12897852372488181176: 2,
 }
 exp_device_hashes_props_dict = {
-    "63cea7c46926aa74": 0.16666666666666666,
-    "37725417bd51fb40": 0.5,
-    "b95cb80aae9fbbfe": 0.16666666666666666,
-    "dded2b63f8242648": 0.16666666666666666,
+    737650845259517236: 0.16666666666666666,
+    14901230531057247662: 0.3333333333333333,
+    12276904048539927950: 0.16666666666666666,
+    12897852372488181176: 0.3333333333333333,
 }
 exp_device_hashes_type_dict = {
-    "63cea7c46926aa74": "Samsung Galaxy M53 5G",
-    "37725417bd51fb40": "Lyf Earth 2",
-    "b95cb80aae9fbbfe": "Nubia Red Magic 8 Pro 5G",
-    "dded2b63f8242648": "Vivo Y73T",
+    737650845259517236: "Realme GT 2 Explorer Master Edition",
+    14901230531057247662: "iQOO 9T 5G",
+    12276904048539927950: "Poco X6 Pro 5G",
+    12897852372488181176: "Samsung Galaxy M32 Prime Edition",
 }
 exp_device_shared_idhash_map_dict = {}
 exp_prop_shared_device_hashes = cons.data_model_shared_entities_dict["device"]
@@ -33,11 +32,10 @@ exp_n_device_hashes = cons.unittest_n_entities
 exp_n_device_types = cons.unittest_n_device_types
 exp_lam = cons.data_model_poisson_params["device"]["lambda"]
 
-random.seed(cons.unittest_seed)
-np.random.seed(cons.unittest_seed)
+rng = np.random.default_rng(seed=cons.unittest_seed)
 
 fpath_smartphones = '.' + cons.fpath_smartphones.split(cons.fpath_repo_dir)[1]
-device_object = Device(exp_n_device_hashes, fpath_smartphones=fpath_smartphones)
+device_object = Device(exp_n_device_hashes, rng=rng, fpath_smartphones=fpath_smartphones)
 
 obs_device_hashes_cnts_dict = device_object.device_hashes_cnts_dict
 obs_device_hashes_props_dict = device_object.device_hashes_props_dict
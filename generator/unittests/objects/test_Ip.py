@@ -1,7 +1,6 @@
 import unittest
 import os
 import sys
-import random
 import numpy as np
 
 sys.path.append(os.path.join(os.getcwd(), "generator"))
@@ -10,33 +9,32 @@ import cons
 from objects.Ip import Ip
 
 exp_ip_hashes_cnts_dict = {
-    "63cea7c46926aa74": 2,
-    "37725417bd51fb40": 5,
-    "b95cb80aae9fbbfe": 2,
-    "dded2b63f8242648": 7,
+    737650845259517236: 12,
+    14901230531057247662: 1,
+    12276904048539927950: 5,
+    12897852372488181176: 11,
 }
 exp_ip_hashes_props_dict = {
-    "63cea7c46926aa74": 0.125,
-    "37725417bd51fb40": 0.3125,
-    "b95cb80aae9fbbfe": 0.125,
-    "dded2b63f8242648": 0.4375,
+    737650845259517236: 0.41379310344827586,
+    14901230531057247662: 0.034482758620689655,
+    12276904048539927950: 0.1724137931034483,
+    12897852372488181176: 0.3793103448275862,
 }
 exp_ip_hashes_country_code_dict = {
-    "63cea7c46926aa74": 56,
-    "37725417bd51fb40": 100,
-    "b95cb80aae9fbbfe": 528,
-    "dded2b63f8242648": 191,
+    737650845259517236: 56,
+    14901230531057247662: 191,
+    12276904048539927950: 100,
+    12897852372488181176: 724,
 }
 exp_ip_shared_idhash_map_dict = {}
 exp_prop_shared_ip_hashes = cons.data_model_shared_entities_dict["ip"]
 exp_n_ip_hashes = cons.unittest_n_entities
 exp_lam = cons.data_model_poisson_params["ip"]["lambda"]
 
-random.seed(cons.unittest_seed)
-np.random.seed(cons.unittest_seed)
+rng = np.random.default_rng(seed=cons.unittest_seed)
 
 fpath_countries_europe = '.' + cons.fpath_countries_europe.split(cons.fpath_repo_dir)[1]
-ip_object = Ip(n_ip_hashes=exp_n_ip_hashes, fpath_countries_europe=fpath_countries_europe)
+ip_object = Ip(n_ip_hashes=exp_n_ip_hashes, rng=rng, fpath_countries_europe=fpath_countries_europe)
 
 obs_ip_hashes_cnts_dict = ip_object.ip_hashes_cnts_dict
 obs_ip_hashes_props_dict = ip_object.ip_hashes_props_dict
@@ -1,7 +1,6 @@
 import unittest
 import os
 import sys
-import random
 import numpy as np
 
 sys.path.append(os.path.join(os.getcwd(), "generator"))
@@ -10,28 +9,28 @@ import cons
 from objects.Transaction import Transaction
 
 exp_transaction_hashes_cnts_dict = {
-    "63cea7c46926aa74": 10,
-    "37725417bd51fb40": 30,
-    "b95cb80aae9fbbfe": 32,
-    "dded2b63f8242648": 44,
+    737650845259517236: 44,
+    14901230531057247662: 17,
+    12276904048539927950: 72,
+    12897852372488181176: 12,
 }
 exp_transaction_hashes_props_dict = {
-    "63cea7c46926aa74": 0.08620689655172414,
-    "37725417bd51fb40": 0.25862068965517243,
-    "b95cb80aae9fbbfe": 0.27586206896551724,
-    "dded2b63f8242648": 0.3793103448275862,
+    737650845259517236: 0.30344827586206896,
+    14901230531057247662: 0.11724137931034483,
+    12276904048539927950: 0.496551724137931,
+    12897852372488181176: 0.08275862068965517,
 }
 exp_transaction_hashes_status_dict = {
-    "63cea7c46926aa74": "Successful",
-    "37725417bd51fb40": "Successful",
-    "b95cb80aae9fbbfe": "Successful",
-    "dded2b63f8242648": "Successful",
+    737650845259517236: "Successful",
+    14901230531057247662: "Successful",
+    12276904048539927950: "Successful",
+    12897852372488181176: "Successful",
 }
 exp_transaction_hashes_amounts_dict = {
-    "63cea7c46926aa74": 2.99,
-    "37725417bd51fb40": 7.59,
-    "b95cb80aae9fbbfe": 0.59,
-    "dded2b63f8242648": 4.55,
+    737650845259517236: 0.55,
+    14901230531057247662: 8.59,
+    12276904048539927950: 2.49,
+    12897852372488181176: 3.55,
 }
 exp_transaction_status = cons.data_model_transaction_status
 exp_n_transaction_hashes = cons.unittest_n_entities
@@ -39,9 +38,8 @@ exp_start_date = cons.unittest_transaction_start_date
 exp_end_date = cons.unittest_transaction_end_date
 exp_lam = cons.data_model_poisson_params["transaction"]["lambda"]
 
-random.seed(cons.unittest_seed)
-np.random.seed(cons.unittest_seed)
-transaction_object = Transaction(exp_n_transaction_hashes, exp_start_date, exp_end_date)
+rng = np.random.default_rng(seed=cons.unittest_seed)
+transaction_object = Transaction(exp_n_transaction_hashes, exp_start_date, exp_end_date, rng=rng)
 
 obs_transaction_hashes_cnts_dict = transaction_object.transaction_hashes_cnts_dict
 obs_transaction_hashes_props_dict = transaction_object.transaction_hashes_props_dict
@@ -1,7 +1,6 @@
 import unittest
 import os
 import sys
-import random
 import numpy as np
 
 sys.path.append(os.path.join(os.getcwd(), "generator"))
@@ -10,54 +9,53 @@ import cons
 from objects.User import User
 
 exp_user_ids_cnts_dict = {
-    "6374692674377254": 20,
-    "1751409580926382": 29,
-    "4264861381989413": 19,
-    "6720317315593519": 26,
+    88002933036867: 20,
+    563709181934090: 24,
+    7813855231783775: 25,
+    8277169843776326: 20,
 }
 exp_user_ids_props_dict = {
-    "6374692674377254": 0.2127659574468085,
-    "1751409580926382": 0.30851063829787234,
-    "4264861381989413": 0.20212765957446807,
-    "6720317315593519": 0.2765957446808511,
+    88002933036867: 0.2247191011235955,
+    563709181934090: 0.2696629213483146,
+    7813855231783775: 0.2808988764044944,
+    8277169843776326: 0.2247191011235955,
 }
 exp_user_ids_first_name_dict = {
-    "6374692674377254": "simone",
-    "1751409580926382": "francesca",
-    "4264861381989413": "igor",
-    "6720317315593519": "beckett",
+    88002933036867: "lies",
+    563709181934090: "dylan",
+    7813855231783775: "astrid",
+    8277169843776326: "lukas",
 }
 exp_user_ids_last_name_dict = {
-    "6374692674377254": "de filippo",
-    "1751409580926382": "gagliardi",
-    "4264861381989413": "lupu",
-    "6720317315593519": "leslie",
+    88002933036867: "van der vegt",
+    563709181934090: "bradley",
+    7813855231783775: "sondergaard",
+    8277169843776326: "szymanski",
 }
 exp_user_ids_country_code_dict = {
-    "6374692674377254": 380,
-    "1751409580926382": 380,
-    "4264861381989413": 498,
-    "6720317315593519": 826,
+    88002933036867: 528,
+    563709181934090: 826,
+    7813855231783775: 208,
+    8277169843776326: 616,
 }
 exp_user_ids_email_domain_dict = {
-    "6374692674377254": "yahoo.com",
-    "1751409580926382": "yahoo.com",
-    "4264861381989413": "yahoo.com",
-    "6720317315593519": "gmail.com",
+    88002933036867: "hotmail.com",
+    563709181934090: "yahoo.fr",
+    7813855231783775: "yahoo.com",
+    8277169843776326: "freenet.de",
 }
 exp_user_ids_dates_dict = {
-    "6374692674377254": np.datetime64("2020-03-21T00:00:00.000000000"),
-    "1751409580926382": np.datetime64("2020-06-11T00:00:00.000000000"),
-    "4264861381989413": np.datetime64("2020-10-15T00:00:00.000000000"),
-    "6720317315593519": np.datetime64("2020-09-17T00:00:00.000000000"),
+    88002933036867: np.datetime64("2020-06-12T00:00:00.000000000"),
+    563709181934090: np.datetime64("2020-11-22T00:00:00.000000000"),
+    7813855231783775: np.datetime64("2020-09-05T00:00:00.000000000"),
+    8277169843776326: np.datetime64("2020-10-11T00:00:00.000000000"),
 }
 exp_start_date = cons.unittest_registration_start_date
 exp_end_date = cons.unittest_registration_end_date
 exp_n_user_ids = cons.unittest_n_entities
 exp_lam = cons.data_model_poisson_params["user"]["lambda"]
 
-random.seed(cons.unittest_seed)
-np.random.seed(cons.unittest_seed)
+rng = np.random.default_rng(seed=cons.unittest_seed)
 
 fpath_first_names = '.' + cons.fpath_llama_first_names.split(cons.fpath_repo_dir)[1]
 fpath_last_names = '.' + cons.fpath_llama_last_names.split(cons.fpath_repo_dir)[1]
@@ -73,7 +71,8 @@ user_object = User(
     fpath_last_names=fpath_last_names,
     fpath_countries_europe=fpath_countries_europe,
     fpath_email_domain=fpath_email_domain,
-    fpath_bedrock_email_domain=fpath_bedrock_email_domain
+    fpath_bedrock_email_domain=fpath_bedrock_email_domain,
+    rng=rng,
     )
 
 obs_user_ids_cnts_dict = user_object.user_ids_cnts_dict
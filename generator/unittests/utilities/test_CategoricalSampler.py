@@ -0,0 +1,55 @@
+import unittest
+import os
+import sys
+import numpy as np
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+import cons
+from utilities.CategoricalSampler import CategoricalSampler
+
+prop_dict = cons.data_model_payment_channels
+categorical_sampler = CategoricalSampler.from_dict(prop_dict=prop_dict)
+# draws should match numpy choice with the same distribution and random state
+obs_sample = categorical_sampler.sample(rng=np.random.default_rng(seed=cons.unittest_seed), size=1000)
+exp_sample = np.random.default_rng(seed=cons.unittest_seed).choice(a=list(prop_dict.keys()), p=list(prop_dict.values()), size=1000, replace=True)
+# draw into a preallocated array
+out = np.empty(shape=10, dtype=categorical_sampler.categories.dtype)
+obs_out_sample = categorical_sampler.sample(rng=np.random.default_rng(seed=cons.unittest_seed), size=10, out=out)
+
+
+class Test_CategoricalSampler(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.categorical_sampler = categorical_sampler
+        self.obs_sample = obs_sample
+        self.exp_sample = exp_sample
+
+    def test_type(self):
+        self.assertEqual(type(self.obs_sample), type(self.exp_sample))
+        self.assertEqual(self.obs_sample.dtype, self.exp_sample.dtype)
+
+    def test_cdf(self):
+        self.assertEqual(self.categorical_sampler.cdf[-1], 1.0)
+        self.assertTrue((np.diff(self.categorical_sampler.cdf) >= 0).all())
+        self.assertFalse(self.categorical_sampler.cdf.flags.writeable)
+
+    def test_object(self):
+        np.testing.assert_array_equal(self.obs_sample, self.exp_sample)
+
+    def test_out(self):
+        self.assertIs(obs_out_sample, out)
+        np.testing.assert_array_equal(obs_out_sample, self.exp_sample[:10])
+
+    def test_invalid_probs(self):
+        with self.assertRaises(ValueError):
+            CategoricalSampler(categories=["a", "b"], probs=[0.5, 0.6])
+        with self.assertRaises(ValueError):
+            CategoricalSampler(categories=["a", "b"], probs=[1.5, -0.5])
+        with self.assertRaises(ValueError):
+            CategoricalSampler(categories=["a", "b"], probs=[1.0])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,64 @@
+import unittest
+import os
+import sys
+import numpy as np
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+import cons
+from utilities.EntityPool import EntityPool
+
+rng = np.random.default_rng(seed=cons.unittest_seed)
+
+values = np.array(["2e23f63807f6170a", "b8816ed926bf9f83", "b010fdb44fa68822", "ff23757073a07357"], dtype=object)
+counts = np.array([1, 2, 0, 1])
+entity_pool = EntityPool(values=values, counts=counts)
+obs_offsets = entity_pool.offsets
+obs_counts = entity_pool.counts
+obs_owners = entity_pool.owners
+obs_lists = entity_pool.to_lists()
+obs_selected = entity_pool.select(owners=np.array([0, 1, 1, 3, 2]), rng=rng)
+exp_offsets = np.array([0, 1, 3, 3, 4])
+exp_counts = counts
+exp_owners = np.array([0, 1, 1, 3])
+exp_lists = [["2e23f63807f6170a"], ["b8816ed926bf9f83", "b010fdb44fa68822"], [], ["ff23757073a07357"]]
+
+
+class Test_EntityPool(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.entity_pool = entity_pool
+        self.obs_offsets = obs_offsets
+        self.exp_offsets = exp_offsets
+        self.obs_counts = obs_counts
+        self.exp_counts = exp_counts
+        self.obs_owners = obs_owners
+        self.exp_owners = exp_owners
+        self.obs_lists = obs_lists
+        self.exp_lists = exp_lists
+        self.obs_selected = obs_selected
+
+    def test_len(self):
+        self.assertEqual(len(self.entity_pool), len(self.exp_counts))
+
+    def test_object(self):
+        self.assertTrue((self.obs_offsets == self.exp_offsets).all())
+        self.assertTrue((self.obs_counts == self.exp_counts).all())
+        self.assertTrue((self.obs_owners == self.exp_owners).all())
+        self.assertEqual(self.obs_lists, self.exp_lists)
+
+    def test_select(self):
+        self.assertEqual(self.obs_selected[0], "2e23f63807f6170a")
+        self.assertIn(self.obs_selected[1], self.exp_lists[1])
+        self.assertIn(self.obs_selected[2], self.exp_lists[1])
+        self.assertEqual(self.obs_selected[3], "ff23757073a07357")
+        self.assertTrue(self.obs_selected[4] != self.obs_selected[4])
+
+    def test_error(self):
+        with self.assertRaises(ValueError):
+            EntityPool(values=values, counts=np.array([1, 1]))
+
+
+if __name__ == "__main__":
+    unittest.main()
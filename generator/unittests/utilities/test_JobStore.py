@@ -0,0 +1,69 @@
+import unittest
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+from utilities.JobStore import JobStore
+
+# create, update and fail jobs in a temporary job store
+tmp_dir = tempfile.TemporaryDirectory()
+job_store = JobStore(fdir=tmp_dir.name)
+input_params_dict = {"n_users":100, "n_shards":2}
+completed_job_id = job_store.create(input_params_dict=input_params_dict)
+queued_job = job_store.read(job_id=job_store.create(input_params_dict=input_params_dict))
+running_job = job_store.update(job_id=completed_job_id, status="running", progress={"n_users":50, "n_transactions":250, "shard_status":["completed", "pending"]})
+completed_job = job_store.update(job_id=completed_job_id, status="completed", artifacts=["RandomTelecomPayments.csv"])
+obs_failed_job_ids = job_store.fail_unfinished(error="interrupted")
+failed_job = job_store.read(job_id=queued_job["job_id"])
+exp_job_ids = sorted([completed_job_id, queued_job["job_id"]])
+
+def tearDownModule():
+    tmp_dir.cleanup()
+
+
+class Test_JobStore(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.job_store = job_store
+        self.input_params_dict = input_params_dict
+        self.queued_job = queued_job
+        self.running_job = running_job
+        self.completed_job = completed_job
+        self.failed_job = failed_job
+        self.obs_failed_job_ids = obs_failed_job_ids
+        self.exp_job_ids = exp_job_ids
+
+    def test_create(self):
+        self.assertEqual(self.queued_job["status"], "queued")
+        self.assertEqual(self.queued_job["input_params"], self.input_params_dict)
+        self.assertEqual(self.queued_job["progress"], {"n_users":0, "n_transactions":0, "shard_status":[]})
+        self.assertIsNone(self.queued_job["started_at"])
+        self.assertEqual(self.job_store.list_job_ids(), self.exp_job_ids)
+
+    def test_update(self):
+        self.assertEqual(self.running_job["status"], "running")
+        self.assertEqual(self.running_job["progress"]["shard_status"], ["completed", "pending"])
+        self.assertIsNotNone(self.running_job["started_at"])
+        self.assertIsNone(self.running_job["finished_at"])
+        self.assertEqual(self.completed_job["status"], "completed")
+        self.assertEqual(self.completed_job["artifacts"], ["RandomTelecomPayments.csv"])
+        self.assertEqual(self.completed_job["progress"], self.running_job["progress"])
+        self.assertIsNotNone(self.completed_job["finished_at"])
+
+    def test_fail_unfinished(self):
+        self.assertEqual(self.obs_failed_job_ids, [self.queued_job["job_id"]])
+        self.assertEqual(self.failed_job["status"], "failed")
+        self.assertEqual(self.failed_job["error"], "interrupted")
+
+    def test_invalid_job_id(self):
+        with self.assertRaises(KeyError):
+            self.job_store.read(job_id="../" + self.queued_job["job_id"])
+        with self.assertRaises(KeyError):
+            self.job_store.read(job_id="0" * 32)
+
+
+if __name__ == "__main__":
+    unittest.main()
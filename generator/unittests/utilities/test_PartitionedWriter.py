@@ -0,0 +1,67 @@
+import unittest
+import os
+import sys
+import tempfile
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+import cons
+from utilities.PartitionedWriter import PartitionedWriter
+
+rng = np.random.default_rng(seed=cons.unittest_seed)
+
+# split randomly ordered transactions into chunks spanning overlapping date ranges
+n_trans = 1000
+trans_data = pd.DataFrame({
+    "transaction_hash": [f"{idx:016x}" for idx in rng.permutation(n_trans)],
+    "transaction_date": pd.Timestamp("2021-01-01") + pd.to_timedelta(rng.integers(low=0, high=90, size=n_trans), unit="D"),
+    "transaction_amount": rng.uniform(size=n_trans).round(2),
+    "card_type": np.where(rng.uniform(size=n_trans) < 0.5, "Visa", None),
+})
+trans_data_chunks = [trans_data.iloc[chunk_idx] for chunk_idx in np.array_split(np.arange(trans_data.shape[0]), 3)]
+
+tmp_dir = tempfile.TemporaryDirectory()
+tmp_fdir = tmp_dir.name
+fdir_partitions = os.path.join(tmp_fdir, "partitions")
+partitioned_writer = PartitionedWriter(fdir=fdir_partitions, partition_col="transaction_date", partition_freq="M")
+for trans_data_chunk in trans_data_chunks:
+    partitioned_writer.write(data=trans_data_chunk)
+obs_n_parts = partitioned_writer.n_parts
+obs_partitions = sorted(os.listdir(fdir_partitions))
+obs_partition_data_list = list(partitioned_writer.iter_partitions(sort_by=["transaction_date", "transaction_hash"]))
+obs_trans_data = pd.concat(objs=obs_partition_data_list, axis=0, ignore_index=True)
+exp_trans_data = trans_data.sort_values(by=["transaction_date", "transaction_hash"]).reset_index(drop=True)
+exp_partitions = ["transaction_date=2021-01", "transaction_date=2021-02", "transaction_date=2021-03"]
+
+def tearDownModule():
+    tmp_dir.cleanup()
+
+
+class Test_PartitionedWriter(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.obs_n_parts = obs_n_parts
+        self.obs_partitions = obs_partitions
+        self.exp_partitions = exp_partitions
+        self.obs_partition_data_list = obs_partition_data_list
+        self.obs_trans_data = obs_trans_data
+        self.exp_trans_data = exp_trans_data
+
+    def test_partitions(self):
+        self.assertEqual(self.obs_n_parts, 3)
+        self.assertEqual(self.obs_partitions, self.exp_partitions)
+        self.assertFalse(os.path.exists(fdir_partitions))
+
+    def test_shape(self):
+        self.assertEqual(len(self.obs_partition_data_list), len(self.exp_partitions))
+        self.assertEqual(self.obs_trans_data.shape, self.exp_trans_data.shape)
+
+    def test_object(self):
+        pd.testing.assert_frame_equal(self.obs_trans_data, self.exp_trans_data, check_dtype=False)
+
+
+if __name__ == "__main__":
+    unittest.main()
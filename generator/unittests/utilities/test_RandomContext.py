@@ -0,0 +1,52 @@
+import unittest
+import os
+import sys
+import numpy as np
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+import cons
+from utilities.RandomContext import RandomContext
+
+random_context = RandomContext(random_seed=cons.unittest_seed)
+obs_user_draws = random_context.stream(stage="user").integers(low=0, high=2**32, size=4)
+obs_user_redraws = RandomContext(random_seed=cons.unittest_seed).stream(stage="user").integers(low=0, high=2**32, size=4)
+obs_card_draws = random_context.stream(stage="card").integers(low=0, high=2**32, size=4)
+obs_shard_user_draws = random_context.shard(shard=1).stream(stage="user").integers(low=0, high=2**32, size=4)
+obs_shard_user_redraws = random_context.shard(shard=1).stream(stage="user").integers(low=0, high=2**32, size=4)
+obs_other_shard_user_draws = random_context.shard(shard=2).stream(stage="user").integers(low=0, high=2**32, size=4)
+
+
+class Test_RandomContext(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.random_context = random_context
+        self.obs_user_draws = obs_user_draws
+        self.obs_user_redraws = obs_user_redraws
+        self.obs_card_draws = obs_card_draws
+        self.obs_shard_user_draws = obs_shard_user_draws
+        self.obs_shard_user_redraws = obs_shard_user_redraws
+        self.obs_other_shard_user_draws = obs_other_shard_user_draws
+
+    def test_type(self):
+        self.assertEqual(type(self.random_context.stream(stage="user")), np.random.Generator)
+        self.assertEqual(type(self.random_context.stream(stage="user").bit_generator), np.random.PCG64)
+        self.assertEqual(type(self.random_context.shard(shard=1)), RandomContext)
+
+    def test_random_seed(self):
+        self.assertEqual(self.random_context.random_seed, cons.unittest_seed)
+        self.assertEqual(self.random_context.shard(shard=1).random_seed, cons.unittest_seed)
+
+    def test_reproducible(self):
+        self.assertEqual(self.obs_user_draws.tolist(), self.obs_user_redraws.tolist())
+        self.assertEqual(self.obs_shard_user_draws.tolist(), self.obs_shard_user_redraws.tolist())
+
+    def test_independent(self):
+        self.assertNotEqual(self.obs_user_draws.tolist(), self.obs_card_draws.tolist())
+        self.assertNotEqual(self.obs_user_draws.tolist(), self.obs_shard_user_draws.tolist())
+        self.assertNotEqual(self.obs_shard_user_draws.tolist(), self.obs_other_shard_user_draws.tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,129 @@
+import unittest
+import os
+import sys
+import shutil
+import tempfile
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+import cons
+from utilities.RefDataRegistry import RefDataRegistry
+
+# create relative file paths
+fpath_countries_europe = '.' + cons.fpath_countries_europe.split(cons.fpath_repo_dir)[1]
+fpath_email_domain = '.' + cons.fpath_email_domain.split(cons.fpath_repo_dir)[1]
+fpath_first_names = '.' + cons.fpath_llama_first_names.split(cons.fpath_repo_dir)[1]
+
+# copy the email domains reference file to a temporary file which can be edited
+tmp_dir = tempfile.TemporaryDirectory()
+tmp_fdir = tmp_dir.name
+tmp_fpath_email_domain = os.path.join(tmp_fdir, "email-domains.csv")
+shutil.copyfile(fpath_email_domain, tmp_fpath_email_domain)
+
+ref_data_registry = RefDataRegistry()
+obs_country_code_sampler = ref_data_registry.country_population_sampler(fpath_countries_europe=fpath_countries_europe)
+obs_cached_country_code_sampler = ref_data_registry.country_population_sampler(fpath_countries_europe=fpath_countries_europe)
+obs_email_domain_sampler = ref_data_registry.email_domain_sampler(fpath_email_domain=tmp_fpath_email_domain)
+obs_n_cache_entries = len(ref_data_registry.cache)
+# compile the cached entries into a bundle and load it into a new registry
+fpath_bundle = os.path.join(tmp_fdir, "ref_data_bundle.npz")
+obs_n_bundle_entries = ref_data_registry.build_bundle(fpath_bundle=fpath_bundle)
+bundle_ref_data_registry = RefDataRegistry()
+obs_bundle_loaded = bundle_ref_data_registry.load_bundle(fpath_bundle=fpath_bundle)
+obs_missing_bundle_loaded = bundle_ref_data_registry.load_bundle(fpath_bundle=os.path.join(tmp_fdir, "missing.npz"))
+obs_bundle_country_code_sampler = bundle_ref_data_registry.country_population_sampler(fpath_countries_europe=fpath_countries_europe)
+obs_bundle_cache_names = [key[0] for key in bundle_ref_data_registry.cache.keys()]
+# edit the temporary email domains file, which should be reread and no longer read from the bundle
+email_domain_data = pd.read_csv(tmp_fpath_email_domain, index_col=0).head(2)
+email_domain_data.to_csv(tmp_fpath_email_domain)
+obs_edited_email_domain_sampler = ref_data_registry.email_domain_sampler(fpath_email_domain=tmp_fpath_email_domain)
+obs_stale_bundle_entry = bundle_ref_data_registry.read_bundle_entry(name="email_domain_sampler", fpaths=(tmp_fpath_email_domain,))
+
+european_populations = pd.read_csv(fpath_countries_europe, usecols=["ISO numeric", "population"])
+exp_country_codes = european_populations["ISO numeric"].to_numpy()
+exp_country_codes_props = european_populations["population"].to_numpy() / european_populations["population"].sum()
+exp_edited_email_domains = email_domain_data["domain"].to_numpy()
+
+# bundle two email domains files with the same file name in different directories of a temporary reference data directory
+fdir_ref_data = os.path.join(tmp_fdir, "ref")
+fpaths_same_name = [os.path.join(fdir_ref_data, subdir, "email-domains.csv") for subdir in ["a", "b"]]
+for fpath_same_name, n_domains in zip(fpaths_same_name, [2, 3]):
+    os.makedirs(os.path.dirname(fpath_same_name))
+    pd.read_csv(fpath_email_domain, index_col=0).head(n_domains).to_csv(fpath_same_name)
+same_name_ref_data_registry = RefDataRegistry(fdir_ref_data=fdir_ref_data)
+exp_same_name_domains = [same_name_ref_data_registry.email_domain_sampler(fpath_email_domain=fpath_same_name).categories for fpath_same_name in fpaths_same_name]
+fpath_same_name_bundle = os.path.join(tmp_fdir, "same_name_ref_data_bundle.npz")
+obs_n_same_name_bundle_entries = same_name_ref_data_registry.build_bundle(fpath_bundle=fpath_same_name_bundle)
+same_name_bundle_ref_data_registry = RefDataRegistry(fdir_ref_data=fdir_ref_data)
+same_name_bundle_ref_data_registry.load_bundle(fpath_bundle=fpath_same_name_bundle)
+obs_same_name_source_keys = [same_name_bundle_ref_data_registry.gen_source_key(fpath=fpath_same_name) for fpath_same_name in fpaths_same_name]
+obs_same_name_bundle_entries = [same_name_bundle_ref_data_registry.read_bundle_entry(name="email_domain_sampler", fpaths=(fpath_same_name,)) for fpath_same_name in fpaths_same_name]
+
+# index the first names by country code in a separate registry
+obs_names_country_codes, obs_names_offsets, obs_names = RefDataRegistry().country_names_index(fpath_bedrock_data=fpath_first_names, sample_column_name="first_names")
+first_names = pd.read_csv(fpath_first_names)
+exp_names_country_codes = np.sort(first_names["ISO numeric"].unique())
+exp_names = [first_names.loc[first_names["ISO numeric"] == country_code, "first_names"].to_list() for country_code in exp_names_country_codes]
+
+def tearDownModule():
+    tmp_dir.cleanup()
+
+
+class Test_RefDataRegistry(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.obs_country_code_sampler = obs_country_code_sampler
+        self.exp_country_codes = exp_country_codes
+        self.exp_country_codes_props = exp_country_codes_props
+
+    def test_object(self):
+        np.testing.assert_array_equal(self.obs_country_code_sampler.categories, self.exp_country_codes)
+        np.testing.assert_array_equal(self.obs_country_code_sampler.probs, self.exp_country_codes_props)
+        self.assertAlmostEqual(obs_email_domain_sampler.probs.sum(), 1.0)
+
+    def test_cached(self):
+        self.assertIs(obs_cached_country_code_sampler, self.obs_country_code_sampler)
+        self.assertEqual(obs_n_cache_entries, 4)
+
+    def test_read_only(self):
+        self.assertFalse(self.obs_country_code_sampler.categories.flags.writeable)
+        self.assertFalse(self.obs_country_code_sampler.probs.flags.writeable)
+        with self.assertRaises(ValueError):
+            self.obs_country_code_sampler.probs[0] = 1.0
+
+    def test_invalidation(self):
+        np.testing.assert_array_equal(obs_edited_email_domain_sampler.categories, exp_edited_email_domains)
+        self.assertAlmostEqual(obs_edited_email_domain_sampler.probs.sum(), 1.0)
+
+    def test_bundle(self):
+        self.assertEqual(obs_n_bundle_entries, 3)
+        self.assertTrue(obs_bundle_loaded)
+        self.assertFalse(obs_missing_bundle_loaded)
+        np.testing.assert_array_equal(obs_bundle_country_code_sampler.categories, self.exp_country_codes)
+        np.testing.assert_array_equal(obs_bundle_country_code_sampler.cdf, self.obs_country_code_sampler.cdf)
+        self.assertEqual(obs_bundle_cache_names, ["country_population_sampler"])
+        self.assertIsNone(obs_stale_bundle_entry)
+
+    def test_bundle_source_keys(self):
+        self.assertEqual(obs_same_name_source_keys, ["a/email-domains.csv", "b/email-domains.csv"])
+        self.assertEqual(obs_n_same_name_bundle_entries, 2)
+        for obs_same_name_bundle_entry, exp_domains in zip(obs_same_name_bundle_entries, exp_same_name_domains):
+            self.assertIsNotNone(obs_same_name_bundle_entry)
+            np.testing.assert_array_equal(obs_same_name_bundle_entry.categories, exp_domains)
+
+    def test_country_names_index(self):
+        np.testing.assert_array_equal(obs_names_country_codes, exp_names_country_codes)
+        self.assertEqual(obs_names_offsets.shape[0], exp_names_country_codes.shape[0] + 1)
+        self.assertEqual([obs_names[start:end].tolist() for start, end in zip(obs_names_offsets[:-1], obs_names_offsets[1:])], exp_names)
+        self.assertFalse(obs_names.flags.writeable)
+
+    def test_file_not_found(self):
+        with self.assertRaises(FileNotFoundError):
+            ref_data_registry.read_csv(fpath=os.path.join(tmp_fdir, "missing.csv"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,70 @@
+import unittest
+import os
+import sys
+import tempfile
+import pandas as pd
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+import cons
+from utilities.ResultCache import ResultCache
+
+# create relative file paths
+fpath_unittest_transaction_data = '.' + cons.fpath_unittest_transaction_data.split(cons.fpath_repo_dir)[1]
+
+# cache the unittest transaction data under the keys of two requests, with room in memory for only one entry
+trans_data = pd.read_parquet(fpath_unittest_transaction_data)
+trans_data_nbytes = int(trans_data.memory_usage(index=False, deep=True).sum())
+input_params_dict = {**cons.default_input_params_dict, "use_random_seed":1}
+tmp_dir = tempfile.TemporaryDirectory()
+result_cache = ResultCache(fdir=tmp_dir.name, version_hash="version", max_memory_bytes=trans_data_nbytes)
+cache_key = result_cache.gen_key(input_params_dict=input_params_dict)
+other_cache_key = result_cache.gen_key(input_params_dict={**input_params_dict, "n_users":input_params_dict["n_users"] + 1})
+obs_miss = result_cache.get(cache_key=cache_key)
+result_cache.put(cache_key=cache_key, trans_data=trans_data)
+obs_memory_hit = result_cache.get(cache_key=cache_key)
+result_cache.put(cache_key=other_cache_key, trans_data=trans_data)
+obs_disk_hit = result_cache.get(cache_key=cache_key)
+obs_metrics = result_cache.metrics()
+exp_metrics = {"memory_hits":1, "disk_hits":1, "misses":1, "memory_evictions":2, "disk_evictions":0, "hit_rate":2 / 3, "memory_entries":1, "memory_bytes":trans_data_nbytes, "disk_entries":2}
+# the cache key ignores the parameters which do not determine the generated data, and depends on the version hash
+obs_output_key = result_cache.gen_key(input_params_dict={**input_params_dict, "write_output":0, "trans_output_format":"parquet"})
+obs_version_key = ResultCache(fdir=result_cache.fdir, version_hash="other_version").gen_key(input_params_dict=input_params_dict)
+
+def tearDownModule():
+    tmp_dir.cleanup()
+
+
+class Test_ResultCache(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.trans_data = trans_data
+        self.cache_key = cache_key
+        self.other_cache_key = other_cache_key
+        self.obs_miss = obs_miss
+        self.obs_memory_hit = obs_memory_hit
+        self.obs_disk_hit = obs_disk_hit
+        self.obs_metrics = obs_metrics
+        self.exp_metrics = exp_metrics
+        self.obs_output_key = obs_output_key
+        self.obs_version_key = obs_version_key
+
+    def test_keys(self):
+        self.assertNotEqual(self.cache_key, self.other_cache_key)
+        self.assertEqual(self.obs_output_key, self.cache_key)
+        self.assertNotEqual(self.obs_version_key, self.cache_key)
+
+    def test_get(self):
+        self.assertIsNone(self.obs_miss)
+        self.assertIs(self.obs_memory_hit, self.trans_data)
+        pd.testing.assert_frame_equal(self.obs_disk_hit, self.trans_data.reset_index(drop=True))
+
+    def test_metrics(self):
+        obs_metrics = {key:value for key, value in self.obs_metrics.items() if key != "disk_bytes"}
+        self.assertEqual(obs_metrics, self.exp_metrics)
+        self.assertGreater(self.obs_metrics["disk_bytes"], 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
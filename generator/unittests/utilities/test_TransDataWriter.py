@@ -0,0 +1,108 @@
+import unittest
+import os
+import sys
+import tempfile
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+import cons
+from utilities.TransDataWriter import TransDataWriter
+from utilities.render_idhashes import render_idhashes
+
+# create relative file paths
+fpath_unittest_transaction_data = '.' + cons.fpath_unittest_transaction_data.split(cons.fpath_repo_dir)[1]
+
+# render the unittest transaction data idhashes as they are at output
+trans_data = pd.read_parquet(fpath_unittest_transaction_data)
+for idhash_col in trans_data.columns.intersection(list(cons.idhash_col_types.keys())):
+    trans_data[idhash_col] = render_idhashes(idhashes=trans_data[idhash_col], idhash_type=cons.idhash_col_types[idhash_col])
+n_rows = trans_data.shape[0]
+trans_data_chunks = [trans_data.iloc[:n_rows // 2], trans_data.iloc[n_rows // 2:]]
+
+# write the transaction data in chunks to both csv and parquet, within a temporary directory removed once the tests finish
+tmp_dir = tempfile.TemporaryDirectory()
+tmp_fdir = tmp_dir.name
+fpath_csv = os.path.join(tmp_fdir, "trans_data.csv")
+fpath_parquet = os.path.join(tmp_fdir, "trans_data.parquet")
+csv_writer = TransDataWriter(fpath=fpath_csv, output_format="csv")
+parquet_writer = TransDataWriter(fpath=fpath_parquet, output_format="parquet", compression="zstd", row_group_size=50)
+for trans_data_chunk in trans_data_chunks:
+    csv_writer.write(trans_data=trans_data_chunk)
+    parquet_writer.write(trans_data=trans_data_chunk)
+obs_csv_shape = csv_writer.close()
+obs_parquet_shape = parquet_writer.close()
+obs_csv_trans_data = pd.read_csv(fpath_csv)
+obs_parquet_file = pq.ParquetFile(fpath_parquet)
+obs_parquet_trans_data = pd.read_parquet(fpath_parquet, engine="pyarrow")
+exp_shape = trans_data.shape
+exp_n_row_groups = int(np.ceil(n_rows / 50))
+
+# write the transaction data in small chunks, which are buffered into whole row groups
+fpath_small_chunks_parquet = os.path.join(tmp_fdir, "trans_data_small_chunks.parquet")
+small_chunks_writer = TransDataWriter(fpath=fpath_small_chunks_parquet, output_format="parquet", row_group_size=50)
+for start in range(0, n_rows, 37):
+    small_chunks_writer.write(trans_data=trans_data.iloc[start:start + 37])
+small_chunks_writer.close()
+obs_small_chunks_parquet_file = pq.ParquetFile(fpath_small_chunks_parquet)
+exp_row_group_sizes = [50] * (n_rows // 50) + [n_rows % 50]
+
+def tearDownModule():
+    tmp_dir.cleanup()
+
+
+class Test_TransDataWriter(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.trans_data = trans_data
+        self.obs_csv_shape = obs_csv_shape
+        self.obs_parquet_shape = obs_parquet_shape
+        self.obs_csv_trans_data = obs_csv_trans_data
+        self.obs_parquet_file = obs_parquet_file
+        self.obs_parquet_trans_data = obs_parquet_trans_data
+        self.exp_shape = exp_shape
+        self.exp_n_row_groups = exp_n_row_groups
+        self.obs_small_chunks_parquet_file = obs_small_chunks_parquet_file
+        self.exp_row_group_sizes = exp_row_group_sizes
+
+    def test_shape(self):
+        self.assertEqual(self.obs_csv_shape, self.exp_shape)
+        self.assertEqual(self.obs_parquet_shape, self.exp_shape)
+        self.assertEqual(self.obs_csv_trans_data.shape, self.exp_shape)
+        self.assertEqual(self.obs_parquet_trans_data.shape, self.exp_shape)
+
+    def test_schema(self):
+        obs_schema = self.obs_parquet_file.schema_arrow
+        for trans_col in cons.trans_dictionary_cols:
+            self.assertTrue(pa.types.is_dictionary(obs_schema.field(trans_col).type))
+        for trans_col in cons.trans_date_cols:
+            self.assertEqual(obs_schema.field(trans_col).type, pa.date32())
+        self.assertEqual(self.obs_parquet_file.metadata.row_group(0).column(0).compression, "ZSTD")
+        self.assertEqual(self.obs_parquet_file.metadata.num_row_groups, self.exp_n_row_groups)
+
+    def test_row_groups(self):
+        for parquet_file in [self.obs_parquet_file, self.obs_small_chunks_parquet_file]:
+            obs_row_group_sizes = [parquet_file.metadata.row_group(row_group).num_rows for row_group in range(parquet_file.metadata.num_row_groups)]
+            self.assertEqual(obs_row_group_sizes, self.exp_row_group_sizes)
+        self.assertTrue(self.obs_small_chunks_parquet_file.read().to_pandas()["transaction_hash"].equals(self.trans_data["transaction_hash"]))
+
+    def test_object(self):
+        self.assertEqual(self.obs_parquet_trans_data.columns.tolist(), self.trans_data.columns.tolist())
+        for trans_col in cons.trans_dictionary_cols:
+            self.assertTrue((self.obs_parquet_trans_data[trans_col].astype(object).fillna("") == self.trans_data[trans_col].astype(object).fillna("")).all())
+        for trans_col in cons.trans_date_cols:
+            self.assertTrue((pd.to_datetime(self.obs_parquet_trans_data[trans_col]) == pd.to_datetime(self.trans_data[trans_col])).all())
+        self.assertTrue((self.obs_parquet_trans_data["transaction_hash"] == self.trans_data["transaction_hash"]).all())
+        self.assertTrue((self.obs_csv_trans_data["transaction_hash"] == self.trans_data["transaction_hash"]).all())
+
+    def test_output_format(self):
+        with self.assertRaises(ValueError):
+            TransDataWriter(fpath=fpath_csv, output_format="json")
+
+
+if __name__ == "__main__":
+    unittest.main()
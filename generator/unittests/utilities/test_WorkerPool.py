@@ -0,0 +1,98 @@
+import unittest
+import os
+import sys
+import time
+import asyncio
+from concurrent.futures import ThreadPoolExecutor
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+from utilities.WorkerPool import WorkerPool
+
+async def run_worker_pool(worker_pool:WorkerPool) -> dict:
+    # run concurrent calls and streams in the worker processes, and record the pool state while they are pending
+    calls = [asyncio.ensure_future(worker_pool.run(pow, 2, exponent)) for exponent in range(3)]
+    await asyncio.sleep(0)
+    n_pending, is_full = worker_pool.n_pending, worker_pool.is_full()
+    outputs = await asyncio.gather(*calls)
+    chunks = [chunk async for chunk in worker_pool.stream(range, 5)]
+    # stop reading a stream part way through
+    partial_stream = worker_pool.stream(range, 100)
+    partial_chunks = [await partial_stream.__anext__() for _ in range(2)]
+    await partial_stream.aclose()
+    # record the errors of the calls and streams
+    errors = []
+    for call in [worker_pool.run(int, "x"), partial_stream.__anext__()]:
+        try:
+            await call
+        except (ValueError, StopAsyncIteration) as error:
+            errors.append(type(error))
+    try:
+        [chunk async for chunk in worker_pool.stream(iter, 5)]
+    except TypeError as error:
+        errors.append(type(error))
+    return {"n_pending":n_pending, "is_full":is_full, "outputs":outputs, "chunks":chunks, "partial_chunks":partial_chunks, "errors":errors, "n_pending_after":worker_pool.n_pending}
+
+def slow_range(stop:int, delay:float):
+    # yield each chunk after a delay, so that the consumer waits on the next chunk
+    for chunk in range(stop):
+        yield chunk
+        time.sleep(delay)
+
+async def cancel_worker_pool_stream(worker_pool:WorkerPool) -> dict:
+    # read the stream with a single reading thread, so that a reading thread left waiting blocks all further reads
+    loop = asyncio.get_running_loop()
+    loop.set_default_executor(ThreadPoolExecutor(max_workers=1))
+    # cancel the stream while the reading thread waits on the next chunk, as when the client disconnects
+    cancelled_stream = worker_pool.stream(slow_range, 3, 2.0)
+    first_chunk = await cancelled_stream.__anext__()
+    next_chunk = asyncio.ensure_future(cancelled_stream.__anext__())
+    await asyncio.sleep(0.5)
+    next_chunk.cancel()
+    try:
+        await next_chunk
+    except asyncio.CancelledError:
+        pass
+    await cancelled_stream.aclose()
+    try:
+        # the reading thread returns once the stream is cancelled, and is free to run further calls
+        reader_output = await asyncio.wait_for(loop.run_in_executor(None, int, "1"), timeout=10)
+    finally:
+        # shutting down the pool also releases any reading thread still waiting on the stream
+        worker_pool.shutdown()
+    return {"first_chunk":first_chunk, "reader_output":reader_output, "n_pending_after":worker_pool.n_pending}
+
+worker_pool = WorkerPool(max_workers=1, max_queued=2)
+obs_worker_pool_dict = asyncio.run(run_worker_pool(worker_pool=worker_pool))
+worker_pool.shutdown()
+exp_worker_pool_dict = {"n_pending":3, "is_full":True, "outputs":[1, 2, 4], "chunks":[0, 1, 2, 3, 4], "partial_chunks":[0, 1], "errors":[ValueError, StopAsyncIteration, TypeError], "n_pending_after":0}
+exp_cancel_dict = {"first_chunk":0, "reader_output":1, "n_pending_after":0}
+
+
+class Test_WorkerPool(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.obs_worker_pool_dict = obs_worker_pool_dict
+        self.exp_worker_pool_dict = exp_worker_pool_dict
+        self.exp_cancel_dict = exp_cancel_dict
+
+    def test_type(self):
+        self.assertEqual(type(self.obs_worker_pool_dict), type(self.exp_worker_pool_dict))
+
+    def test_object(self):
+        self.assertEqual(self.obs_worker_pool_dict, self.exp_worker_pool_dict)
+
+    def test_cancel(self):
+        # the stream is cancelled within the test rather than at import, as slow_range can only be pickled once this module is imported
+        cancel_worker_pool = WorkerPool(max_workers=1, max_queued=0)
+        obs_cancel_dict = asyncio.run(cancel_worker_pool_stream(worker_pool=cancel_worker_pool))
+        self.assertEqual(obs_cancel_dict, self.exp_cancel_dict)
+
+    def test_invalid(self):
+        with self.assertRaises(ValueError):
+            WorkerPool(max_workers=0)
+
+
+if __name__ == "__main__":
+    unittest.main()
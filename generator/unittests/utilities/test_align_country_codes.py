@@ -3,14 +3,13 @@ import os
 import sys
 import numpy as np
 import pandas as pd
-import random
 
 sys.path.append(os.path.join(os.getcwd(), "generator"))
 
 import cons
 from utilities.align_country_codes import align_country_codes
 
-random.seed(cons.unittest_seed)
+rng = np.random.default_rng(seed=cons.unittest_seed)
 
 input_data_df = pd.DataFrame.from_records(
     [
@@ -39,9 +38,9 @@ input_data_df = pd.DataFrame.from_records(
 exp_data_df = pd.DataFrame.from_records(
     [
         {
-            "registration_country_code_alpha": 353.0,
-            "ip_country_code_alpha": 353,
-            "card_country_code_alpha": 353,
+            "registration_country_code_alpha": 353,
+            "ip_country_code_alpha": 353.0,
+            "card_country_code_alpha": 353.0,
         },
         {
             "registration_country_code_alpha": 353,
@@ -60,11 +59,8 @@ exp_data_df = pd.DataFrame.from_records(
         },
     ]
 )
-obs_data_df = input_data_df.apply(
-    lambda series: align_country_codes(
-        series, proba_comm_ip=0.05, proba_comm_card=0.01
-    ),
-    axis=1,
+obs_data_df = align_country_codes(
+    data=input_data_df, rng=rng, proba_comm_ip=0.5, proba_comm_card=0.01
 )
 
 
@@ -0,0 +1,47 @@
+import unittest
+import os
+import sys
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+from utilities.align_idhash_country_codes import align_idhash_country_codes
+
+input_data_df = pd.DataFrame.from_records(
+    [
+        {"ip_hash": "63cea7c46926aa74", "ip_country_code_alpha": 42.0},
+        {"ip_hash": "63cea7c46926aa74", "ip_country_code_alpha": 353.0},
+        {"ip_hash": "63cea7c46926aa74", "ip_country_code_alpha": 42.0},
+        {"ip_hash": "37725417bd51fb40", "ip_country_code_alpha": 42.0},
+        {"ip_hash": "37725417bd51fb40", "ip_country_code_alpha": 353.0},
+        {"ip_hash": "b95cb80aae9fbbfe", "ip_country_code_alpha": np.nan},
+        {"ip_hash": np.nan, "ip_country_code_alpha": 250.0},
+    ]
+)
+exp_aligned_country_codes = np.array([42.0, 42.0, 42.0, 353.0, 353.0, np.nan, np.nan])
+obs_aligned_country_codes = align_idhash_country_codes(data=input_data_df, idhash_col="ip_hash", country_code_col="ip_country_code_alpha")
+
+
+class Test_align_idhash_country_codes(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.obs_aligned_country_codes = obs_aligned_country_codes
+        self.exp_aligned_country_codes = exp_aligned_country_codes
+
+    def test_type(self):
+        self.assertEqual(type(self.obs_aligned_country_codes), type(self.exp_aligned_country_codes))
+
+    def test_shape(self):
+        self.assertEqual(self.obs_aligned_country_codes.shape, self.exp_aligned_country_codes.shape)
+
+    def test_isnull(self):
+        self.assertTrue((np.isnan(self.obs_aligned_country_codes) == np.isnan(self.exp_aligned_country_codes)).all())
+
+    def test_object(self):
+        self.assertTrue(np.array_equal(self.obs_aligned_country_codes, self.exp_aligned_country_codes, equal_nan=True))
+
+
+if __name__ == "__main__":
+    unittest.main()
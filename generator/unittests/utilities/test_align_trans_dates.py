@@ -0,0 +1,42 @@
+import unittest
+import os
+import sys
+import numpy as np
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+import cons
+from utilities.align_trans_dates import align_trans_dates
+
+rng = np.random.default_rng(seed=cons.unittest_seed)
+
+registration_dates = np.array(["2021-03-01", "2021-01-01", "2021-06-15", "2021-12-31"], dtype="datetime64[ns]")
+transaction_dates = np.array(["2021-01-15", "2021-02-01", "2021-06-01", "2021-12-31"], dtype="datetime64[ns]")
+end_date = "2021-12-31"
+exp_aligned_dates = np.array(["2021-03-28", "2021-10-16", "2021-10-23", "2021-12-31"], dtype="datetime64[ns]")
+obs_aligned_dates = align_trans_dates(registration_dates=registration_dates, transaction_dates=transaction_dates, end_date=end_date, rng=rng)
+
+
+class Test_align_trans_dates(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.registration_dates = registration_dates
+        self.transaction_dates = transaction_dates
+        self.obs_aligned_dates = obs_aligned_dates
+        self.exp_aligned_dates = exp_aligned_dates
+
+    def test_type(self):
+        self.assertEqual(type(self.obs_aligned_dates), type(self.exp_aligned_dates))
+        self.assertEqual(self.obs_aligned_dates.dtype, self.transaction_dates.dtype)
+
+    def test_bounds(self):
+        self.assertTrue((self.obs_aligned_dates >= np.maximum(self.registration_dates, self.transaction_dates)).all())
+        self.assertTrue((self.obs_aligned_dates <= np.datetime64(end_date)).all())
+
+    def test_object(self):
+        np.testing.assert_array_equal(self.obs_aligned_dates, self.exp_aligned_dates)
+
+
+if __name__ == "__main__":
+    unittest.main()
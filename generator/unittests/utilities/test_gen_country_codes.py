@@ -0,0 +1,35 @@
+import unittest
+import os
+import sys
+import numpy as np
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+import cons
+from utilities.gen_country_codes import gen_country_codes
+
+rng = np.random.default_rng(seed=cons.unittest_seed)
+
+exp_country_codes = np.array([100, 616, 688, 826])
+fpath_countries_europe = '.' + cons.fpath_countries_europe.split(cons.fpath_repo_dir)[1]
+obs_country_codes = gen_country_codes(size=4, rng=rng, fpath_countries_europe=fpath_countries_europe)
+
+class Test_gen_country_codes(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.obs_country_codes = obs_country_codes
+        self.exp_country_codes = exp_country_codes
+
+    def test_type(self):
+        self.assertEqual(type(self.obs_country_codes), type(self.exp_country_codes))
+
+    def test_shape(self):
+        self.assertEqual(self.obs_country_codes.shape, self.exp_country_codes.shape)
+
+    def test_object(self):
+        self.assertEqual(self.obs_country_codes.tolist(), self.exp_country_codes.tolist())
+
+
+if __name__ == "__main__":
+    unittest.main()
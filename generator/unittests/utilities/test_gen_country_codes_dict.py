@@ -8,12 +8,12 @@ sys.path.append(os.path.join(os.getcwd(), "generator"))
 import cons
 from utilities.gen_country_codes_dict import gen_country_codes_dict
 
-np.random.seed(cons.unittest_seed)
+rng = np.random.default_rng(seed=cons.unittest_seed)
 
-idhashes = ["a", "b", "c", "d"]
-exp_prop_dict = {"a": 276, "b": 756, "c": 642, "d": 826}
+idhashes = np.array([1, 2, 3, 4], dtype=np.uint64)
+exp_prop_dict = {1: 100, 2: 616, 3: 688, 4: 826}
 fpath_countries_europe = '.' + cons.fpath_countries_europe.split(cons.fpath_repo_dir)[1]
-obs_prop_dict = gen_country_codes_dict(idhashes=idhashes, fpath_countries_europe=fpath_countries_europe)
+obs_prop_dict = gen_country_codes_dict(idhashes=idhashes, rng=rng, fpath_countries_europe=fpath_countries_europe)
 
 class Test_gen_country_codes_dict(unittest.TestCase):
     """"""
@@ -0,0 +1,36 @@
+import unittest
+import os
+import sys
+import numpy as np
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+import cons
+from utilities.gen_dates import gen_dates
+
+rng = np.random.default_rng(seed=cons.unittest_seed)
+
+exp_dates = np.array(["2020-03-06", "2021-07-19", "2021-04-23", "2020-11-16"], dtype="datetime64[D]")
+obs_dates = gen_dates(size=4, start_date="2020-01-01", end_date="2021-12-31", rng=rng)
+
+
+class Test_gen_dates(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.obs_dates = obs_dates
+        self.exp_dates = exp_dates
+
+    def test_type(self):
+        self.assertEqual(type(self.obs_dates), type(self.exp_dates))
+        self.assertEqual(self.obs_dates.dtype, self.exp_dates.dtype)
+
+    def test_len(self):
+        self.assertEqual(len(self.obs_dates), len(self.exp_dates))
+
+    def test_object(self):
+        np.testing.assert_array_equal(self.obs_dates, self.exp_dates)
+
+
+if __name__ == "__main__":
+    unittest.main()
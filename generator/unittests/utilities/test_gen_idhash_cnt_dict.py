@@ -1,7 +1,6 @@
 import unittest
 import os
 import sys
-import random
 import numpy as np
 
 sys.path.append(os.path.join(os.getcwd(), "generator"))
@@ -9,23 +8,22 @@ sys.path.append(os.path.join(os.getcwd(), "generator"))
 import cons
 from utilities.gen_idhash_cnt_dict import gen_idhash_cnt_dict
 
-random.seed(cons.unittest_seed)
-np.random.seed(cons.unittest_seed)
+rng = np.random.default_rng(seed=cons.unittest_seed)
 
 exp_id_dict = {
-    "6374692674377254": 6,
-    "1751409580926382": 3,
-    "4264861381989413": 2,
-    "6720317315593519": 4,
+    88002933036867: 12,
+    563709181934090: 1,
+    7813855231783775: 5,
+    8277169843776326: 11,
 }
 exp_hash_dict = {
-    "86870b77ea207220": 12,
-    "a49698b687b10f66": 3,
-    "d742b75a2024ed20": 2,
-    "496ed6a8ee99bc2e": 2,
+    11018846451006399513: 4,
+    1518286841379655948: 2,
+    9386095408404204675: 1,
+    12712995406253477229: 5,
 }
-obs_id_dict = gen_idhash_cnt_dict(idhash_type="id", n=4, lam=1, nbytes=16)
-obs_hash_dict = gen_idhash_cnt_dict(idhash_type="hash", n=4, lam=1, nbytes=16)
+obs_id_dict = gen_idhash_cnt_dict(idhash_type="id", n=4, lam=1, rng=rng, nbytes=16)
+obs_hash_dict = gen_idhash_cnt_dict(idhash_type="hash", n=4, lam=1, rng=rng, nbytes=16)
 
 
 class Test_gen_idhash_cnt_dict(unittest.TestCase):
@@ -3,7 +3,6 @@ import os
 import sys
 import numpy as np
 import pandas as pd
-import random
 
 sys.path.append(os.path.join(os.getcwd(), "generator"))
 
@@ -16,26 +15,25 @@ exp_end_date = cons.unittest_registration_end_date
 exp_n_user_ids = cons.unittest_n_entities
 exp_lam = cons.data_model_poisson_params["user"]["lambda"]
 
-random.seed(cons.unittest_seed)
-np.random.seed(cons.unittest_seed)
+rng = np.random.default_rng(seed=cons.unittest_seed)
 
 fpath_first_names = '.' + cons.fpath_llama_first_names.split(cons.fpath_repo_dir)[1]
 fpath_last_names = '.' + cons.fpath_llama_last_names.split(cons.fpath_repo_dir)[1]
 fpath_countries_europe = '.' + cons.fpath_countries_europe.split(cons.fpath_repo_dir)[1]
 fpath_email_domain = '.' + cons.fpath_email_domain.split(cons.fpath_repo_dir)[1]
-user_object = User(n_user_ids=exp_n_user_ids, start_date=exp_start_date, end_date=exp_end_date, fpath_first_names=fpath_first_names, fpath_last_names=fpath_last_names, fpath_countries_europe=fpath_countries_europe, fpath_email_domain=fpath_email_domain)
+user_object = User(n_user_ids=exp_n_user_ids, start_date=exp_start_date, end_date=exp_end_date, fpath_first_names=fpath_first_names, fpath_last_names=fpath_last_names, fpath_countries_europe=fpath_countries_europe, fpath_email_domain=fpath_email_domain, rng=rng)
 
 exp_randomentity_counts_dict = {
-    'uid': ['6374692674377254', '6720317315593519', '4264861381989413', '1751409580926382'], 
-    'n_devices': [1, 2, 1, 1],
+    'uid': np.array([7813855231783775, 88002933036867, 8277169843776326, 563709181934090], dtype=np.uint64), 
+    'n_devices': [1, 1, 1, 2],
     'n_cards': [1, 1, 1, 1],
-    'n_ips': [3, 5, 5, 1],
-    'n_transactions': [72, 16, 13, 29],
+    'n_ips': [19, 3, 1, 5],
+    'n_transactions': [15, 31, 16, 84],
     'n_applications': [4, 2, 3, 5]
     }
 
 exp_randomentity_counts_df = pd.DataFrame.from_dict(exp_randomentity_counts_dict)
-obs_random_entity_counts_df = gen_random_entity_counts(user_object)
+obs_random_entity_counts_df = gen_random_entity_counts(user_obj=user_object, rng=rng)
 
 class Test_gen_random_entity_counts(unittest.TestCase):
     """"""
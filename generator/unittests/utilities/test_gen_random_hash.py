@@ -8,15 +8,16 @@ sys.path.append(os.path.join(os.getcwd(), "generator"))
 import cons
 from utilities.gen_random_hash import gen_random_hash
 
-np.random.seed(cons.unittest_seed)
+rng = np.random.default_rng(seed=cons.unittest_seed)
 
 exp_random_hash = [
-    "63cea7c46926aa74",
-    "37725417bd51fb40",
-    "b95cb80aae9fbbfe",
-    "dded2b63f8242648",
+    737650845259517236,
+    14901230531057247662,
+    12276904048539927950,
+    12897852372488181176,
 ]
-obs_random_hash = gen_random_hash(size=4, nbytes=16)
+obs_random_hash = gen_random_hash(size=4, rng=rng, nbytes=16).tolist()
+obs_shard_random_hashes = [gen_random_hash(size=1000, rng=rng, nbytes=16, offset=shard * 1000, key=cons.unittest_seed) for shard in range(2)]
 
 
 class Test_gen_random_hash(unittest.TestCase):
@@ -25,6 +26,7 @@ class Test_gen_random_hash(unittest.TestCase):
     def setUp(self):
         self.obs_random_hash = obs_random_hash
         self.exp_random_hash = exp_random_hash
+        self.obs_shard_random_hashes = obs_shard_random_hashes
 
     def test_type(self):
         self.assertEqual(type(self.obs_random_hash), type(self.exp_random_hash))
@@ -35,6 +37,10 @@ class Test_gen_random_hash(unittest.TestCase):
     def test_object(self):
         self.assertEqual(self.obs_random_hash, self.exp_random_hash)
 
+    def test_shards(self):
+        obs_shard_hashes = np.concatenate(self.obs_shard_random_hashes)
+        self.assertEqual(np.unique(obs_shard_hashes).shape[0], obs_shard_hashes.shape[0])
+
 
 if __name__ == "__main__":
     unittest.main()
@@ -8,15 +8,15 @@ sys.path.append(os.path.join(os.getcwd(), "generator"))
 import cons
 from utilities.gen_random_id import gen_random_id
 
-np.random.seed(cons.unittest_seed)
+rng = np.random.default_rng(seed=cons.unittest_seed)
 
 exp_random_id = [
-    "6374692674377254",
-    "1751409580926382",
-    "4264861381989413",
-    "6720317315593519",
+    88002933036867,
+    563709181934090,
+    7813855231783775,
+    8277169843776326,
 ]
-obs_random_id = gen_random_id(size=4, nbytes=16)
+obs_random_id = gen_random_id(size=4, rng=rng, nbytes=16).tolist()
 
 
 class Test_gen_random_id(unittest.TestCase):
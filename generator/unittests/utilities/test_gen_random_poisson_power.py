@@ -8,10 +8,10 @@ sys.path.append(os.path.join(os.getcwd(), "generator"))
 import cons
 from utilities.gen_random_poisson_power import gen_random_poisson_power
 
-np.random.seed(cons.unittest_seed)
+rng = np.random.default_rng(seed=cons.unittest_seed)
 
-exp_random_poisson = np.array([11, 7, 1, 1])
-obs_random_poisson = gen_random_poisson_power(lam=1, size=4, power=2)
+exp_random_poisson = np.array([11, 3, 5, 11])
+obs_random_poisson = gen_random_poisson_power(lam=1, size=4, power=2, rng=rng)
 
 
 class Test_gen_random_poisson_power(unittest.TestCase):
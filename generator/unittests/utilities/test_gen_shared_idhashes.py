@@ -1,7 +1,6 @@
 import unittest
 import os
 import sys
-import random
 import numpy as np
 
 sys.path.append(os.path.join(os.getcwd(), "generator"))
@@ -10,13 +9,17 @@ import cons
 from utilities.gen_idhash_cnt_dict import gen_idhash_cnt_dict
 from utilities.gen_shared_idhashes import gen_shared_idhashes
 
-random.seed(cons.unittest_seed)
-np.random.seed(cons.unittest_seed)
+rng = np.random.default_rng(seed=cons.unittest_seed)
 
 obs_prop_shared_idhashes=cons.data_model_shared_entities_dict["ip"]
-idhashes = list(gen_idhash_cnt_dict(idhash_type="hash", n=4, lam=1, nbytes=16).keys())
-obs_shared_idhashes = gen_shared_idhashes(idhashes=idhashes, prop_shared_idhashes=obs_prop_shared_idhashes)
-exp_shared_idhashes = {}
+idhashes = np.array(list(gen_idhash_cnt_dict(idhash_type="hash", n=4, lam=1, rng=rng, nbytes=16).keys()), dtype=np.uint64)
+obs_shared_idhashes = gen_shared_idhashes(idhashes=idhashes, prop_shared_idhashes=obs_prop_shared_idhashes, rng=rng)
+exp_shared_idhashes = np.arange(4)
+
+# share half of a larger population of idhashes, each shared idhash must map onto another shared idhash of its network
+n_idhashes = 1000
+obs_network_shared_idhashes = gen_shared_idhashes(idhashes=np.arange(n_idhashes, dtype=np.uint64), prop_shared_idhashes=0.5, rng=rng)
+obs_network_shared_mask = obs_network_shared_idhashes != np.arange(n_idhashes)
 
 class Test_gen_shared_idhashes(unittest.TestCase):
     """"""
@@ -24,18 +27,27 @@ class Test_gen_shared_idhashes(unittest.TestCase):
     def setUp(self):
         self.exp_shared_idhashes = exp_shared_idhashes
         self.obs_shared_idhashes = obs_shared_idhashes
+        self.obs_network_shared_idhashes = obs_network_shared_idhashes
+        self.obs_network_shared_mask = obs_network_shared_mask
 
     def test_type(self):
         self.assertEqual(type(self.exp_shared_idhashes), type(self.obs_shared_idhashes))
+        self.assertEqual(self.obs_shared_idhashes.dtype, np.int64)
 
     def test_len(self):
         self.assertEqual(len(self.exp_shared_idhashes), len(self.obs_shared_idhashes))
-
-    def test_keys(self):
-        self.assertEqual(list(self.exp_shared_idhashes.keys()), list(self.obs_shared_idhashes.keys()))
-
-    def test_values(self):
-        self.assertEqual(list(self.exp_shared_idhashes.values()), list(self.obs_shared_idhashes.values()))
+        self.assertEqual(len(self.obs_network_shared_idhashes), n_idhashes)
+
+    def test_object(self):
+        np.testing.assert_array_equal(self.obs_shared_idhashes, self.exp_shared_idhashes)
+
+    def test_networks(self):
+        # no more than the shared proportion of idhashes are remapped, and only onto idhashes which are themselves shared
+        self.assertLessEqual(self.obs_network_shared_mask.sum(), n_idhashes // 2)
+        self.assertGreater(self.obs_network_shared_mask.sum(), 0)
+        shared_targets = self.obs_network_shared_idhashes[self.obs_network_shared_mask]
+        self.assertTrue(np.isin(shared_targets, self.obs_network_shared_idhashes).all())
+        self.assertTrue(((shared_targets >= 0) & (shared_targets < n_idhashes)).all())
 
 if __name__ == "__main__":
     unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+import os
+import sys
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+import cons
+from utilities.gen_trans_rejection_rates import gen_trans_rejection_rates
+
+# create relative file paths
+fpath_countries_europe = '.' + cons.fpath_countries_europe.split(cons.fpath_repo_dir)[1]
+fpath_countrycrimeindex = '.' + cons.fpath_countrycrimeindex.split(cons.fpath_repo_dir)[1]
+fpath_email_domain = '.' + cons.fpath_email_domain.split(cons.fpath_repo_dir)[1]
+fpath_unittest_transaction_data = '.' + cons.fpath_unittest_transaction_data.split(cons.fpath_repo_dir)[1]
+
+trans_data = pd.read_parquet(fpath_unittest_transaction_data)
+obs_rejection_rates = gen_trans_rejection_rates(trans_data=trans_data, fpath_countries_europe=fpath_countries_europe, fpath_countrycrimeindex=fpath_countrycrimeindex, fpath_email_domain=fpath_email_domain)
+
+# derive the expected shared entity and per user count rates with separate groupby passes
+exp_rejection_rates = {}
+for entity, idhash_col in [("devices", "device_hash"), ("ips", "ip_hash"), ("cards", "card_hash")]:
+    shared_entities = trans_data.groupby(by=idhash_col)["userid"].nunique()
+    count_entities = trans_data.groupby(by="userid")[idhash_col].nunique()
+    exp_rejection_rates[f"shared_{entity}_reject_rates"] = (shared_entities / shared_entities.sum()).to_dict()
+    exp_rejection_rates[f"count_{entity}_reject_rates"] = (count_entities / count_entities.sum()).to_dict()
+exp_rates_names = ["country_code_trans_reject_rates", "domain_email_trans_reject_rates"] + [f"{rates_type}_{entity}_reject_rates" for entity in ["devices", "ips", "cards"] for rates_type in ["shared", "count"]]
+
+
+class Test_gen_trans_rejection_rates(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.obs_rejection_rates = obs_rejection_rates
+        self.exp_rejection_rates = exp_rejection_rates
+
+    def test_type(self):
+        self.assertEqual(list(self.obs_rejection_rates.keys()), exp_rates_names)
+        for keys, rates in self.obs_rejection_rates.values():
+            self.assertIsInstance(keys, pd.Index)
+            self.assertEqual(rates.dtype, np.float64)
+            self.assertEqual(keys.shape, rates.shape)
+            self.assertTrue(keys.is_unique)
+
+    def test_object(self):
+        for rates_name, exp_rates_dict in self.exp_rejection_rates.items():
+            keys, rates = self.obs_rejection_rates[rates_name]
+            obs_rates_dict = dict(zip(keys.tolist(), rates.tolist()))
+            self.assertEqual(obs_rates_dict.keys(), exp_rates_dict.keys())
+            np.testing.assert_allclose([obs_rates_dict[key] for key in exp_rates_dict.keys()], list(exp_rates_dict.values()))
+
+
+if __name__ == "__main__":
+    unittest.main()
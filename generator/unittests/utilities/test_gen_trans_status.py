@@ -0,0 +1,95 @@
+import unittest
+import os
+import sys
+import numpy as np
+import pandas as pd
+from scipy.stats import chisquare
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+import cons
+from utilities.gen_trans_rejection_rates import gen_trans_rejection_rates
+from utilities.gen_trans_status import gen_trans_status
+
+rng = np.random.default_rng(seed=cons.unittest_seed)
+
+# create relative file paths
+fpath_countries_europe = '.' + cons.fpath_countries_europe.split(cons.fpath_repo_dir)[1]
+fpath_countrycrimeindex = '.' + cons.fpath_countrycrimeindex.split(cons.fpath_repo_dir)[1]
+fpath_email_domain = '.' + cons.fpath_email_domain.split(cons.fpath_repo_dir)[1]
+fpath_unittest_transaction_data = '.' + cons.fpath_unittest_transaction_data.split(cons.fpath_repo_dir)[1]
+
+# tile the unittest transaction data to give the statistical test enough power
+n_tiles = 500
+trans_data = pd.read_parquet(fpath_unittest_transaction_data)
+rejection_rates = gen_trans_rejection_rates(trans_data=trans_data, fpath_countries_europe=fpath_countries_europe, fpath_countrycrimeindex=fpath_countrycrimeindex, fpath_email_domain=fpath_email_domain)
+tiled_trans_data = pd.concat(objs=[trans_data] * n_tiles, axis=0, ignore_index=True)
+obs_trans_status = gen_trans_status(trans_data=tiled_trans_data, rejection_rates=rejection_rates, rng=rng)
+# convert the rejection rates to dictionaries for the row-wise rule cascade
+rejection_rates_dict = {f"{rates_name}_dict":dict(zip(keys.tolist(), rates.tolist())) for rates_name, (keys, rates) in rejection_rates.items()}
+
+# derive the exact expected status and error code probabilities of the row-wise rule cascade
+def exp_trans_status_probs(series:pd.Series, rejection_scaling_factor:int=2) -> dict:
+    successful_total = cons.data_model_transaction_status["Successful"] + cons.data_model_transaction_status["Pending"]
+    if pd.isna(series["card_hash"]):
+        return {"Successful":0.98, "Pending":0.02}
+    country_codes = series[["registration_country_code","ip_country_code","card_country_code"]].dropna()
+    trigger_prob = lambda rate: 0.0 if pd.isna(rate) else min(1.0, rate * rejection_scaling_factor)
+    rules = [
+        (np.mean([trigger_prob(rejection_rates_dict["country_code_trans_reject_rates_dict"].get(code)) for code in country_codes]), cons.data_model_rejection_codes_fraud),
+        (trigger_prob(rejection_rates_dict["domain_email_trans_reject_rates_dict"].get(series["email_domain"])), cons.data_model_rejection_codes_authentication),
+        (trigger_prob(cons.data_model_inconsistent_country_codes_rejection_rate[country_codes.nunique()]), cons.data_model_rejection_codes_connection),
+        (trigger_prob(rejection_rates_dict["shared_devices_reject_rates_dict"].get(series["device_hash"])), cons.data_model_rejection_codes_fraud),
+        (trigger_prob(rejection_rates_dict["shared_ips_reject_rates_dict"].get(series["ip_hash"])), cons.data_model_rejection_codes_fraud),
+        (trigger_prob(rejection_rates_dict["shared_cards_reject_rates_dict"].get(series["card_hash"])), cons.data_model_rejection_codes_fraud),
+        (trigger_prob(rejection_rates_dict["count_devices_reject_rates_dict"].get(series["userid"])), cons.data_model_rejection_codes_user),
+        (trigger_prob(rejection_rates_dict["count_ips_reject_rates_dict"].get(series["userid"])), cons.data_model_rejection_codes_connection),
+        (trigger_prob(rejection_rates_dict["count_cards_reject_rates_dict"].get(series["userid"])), cons.data_model_rejection_codes_funds),
+    ]
+    probs = {}
+    no_prior_trigger_prob = 1.0
+    for rule_prob, rejection_codes in rules:
+        for error_code, error_code_prob in rejection_codes.items():
+            probs[error_code] = probs.get(error_code, 0.0) + no_prior_trigger_prob * rule_prob * error_code_prob
+        no_prior_trigger_prob *= (1 - rule_prob)
+    probs["Successful"] = no_prior_trigger_prob * cons.data_model_transaction_status["Successful"] / successful_total
+    probs["Pending"] = no_prior_trigger_prob * cons.data_model_transaction_status["Pending"] / successful_total
+    return probs
+
+exp_probs = pd.DataFrame.from_records(trans_data.apply(exp_trans_status_probs, axis=1).to_list()).fillna(0.0).sum(axis=0) * n_tiles
+obs_categories = obs_trans_status["transaction_error_code"].fillna(obs_trans_status["transaction_status"])
+obs_counts = obs_categories.value_counts().reindex(exp_probs.index, fill_value=0)
+chisquare_pvalue = chisquare(f_obs=obs_counts.values, f_exp=exp_probs.values).pvalue
+
+class Test_gen_trans_status(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.tiled_trans_data = tiled_trans_data
+        self.obs_trans_status = obs_trans_status
+        self.obs_categories = obs_categories
+        self.exp_probs = exp_probs
+        self.chisquare_pvalue = chisquare_pvalue
+
+    def test_type(self):
+        self.assertEqual(type(self.obs_trans_status), pd.DataFrame)
+
+    def test_shape(self):
+        self.assertEqual(self.obs_trans_status.shape, (self.tiled_trans_data.shape[0], 2))
+        self.assertTrue((self.obs_trans_status.index == self.tiled_trans_data.index).all())
+
+    def test_isnull(self):
+        rejected_mask = self.obs_trans_status["transaction_status"] == "Rejected"
+        self.assertTrue(self.obs_trans_status.loc[rejected_mask, "transaction_error_code"].notnull().all())
+        self.assertTrue(self.obs_trans_status.loc[~rejected_mask, "transaction_error_code"].isnull().all())
+        self.assertTrue((self.obs_trans_status.loc[self.tiled_trans_data["card_hash"].isnull(), "transaction_status"] != "Rejected").all())
+
+    def test_categories(self):
+        self.assertTrue(self.obs_categories.isin(self.exp_probs.index).all())
+
+    def test_distribution(self):
+        self.assertGreater(self.chisquare_pvalue, 0.001)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,39 @@
+import unittest
+import os
+import sys
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+from utilities.gen_userids import gen_userids
+
+registration_dates = np.array(["2020-01-01", "2021-12-31", "2020-02-29", "2021-07-04"], dtype="datetime64[ns]")
+country_codes = np.array([8, 826, 40, 250])
+uids = np.array([1234567, 89, 18446744073709551615, 100000], dtype=np.uint64)
+exp_userids = ["2020010180034567", "2021123182600089", "2020022940051615", "2021070425000000"]
+obs_userids = gen_userids(registration_dates=registration_dates, country_codes=country_codes, uids=uids)
+
+
+class Test_gen_userids(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.obs_userids = obs_userids
+        self.exp_userids = exp_userids
+
+    def test_type(self):
+        self.assertEqual(type(self.obs_userids), pd.arrays.ArrowExtensionArray)
+        self.assertEqual(self.obs_userids.dtype, pd.ArrowDtype(pa.large_string()))
+
+    def test_len(self):
+        self.assertEqual(len(self.obs_userids), len(self.exp_userids))
+        self.assertTrue(all(len(userid) == 16 for userid in self.obs_userids))
+
+    def test_object(self):
+        self.assertEqual(self.obs_userids.tolist(), self.exp_userids)
+
+
+if __name__ == "__main__":
+    unittest.main()
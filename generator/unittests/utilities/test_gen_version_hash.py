@@ -0,0 +1,48 @@
+import unittest
+import os
+import sys
+import tempfile
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+from utilities.gen_version_hash import gen_version_hash
+
+# write two versions of a set of files
+tmp_dir = tempfile.TemporaryDirectory()
+tmp_fdir = tmp_dir.name
+fpaths = [os.path.join(tmp_fdir, fname) for fname in ["a.py", "b.csv"]]
+for fpath in fpaths:
+    with open(fpath, "w") as version_file:
+        version_file.write(fpath)
+obs_version_hash = gen_version_hash(fpaths=fpaths)
+obs_reversed_version_hash = gen_version_hash(fpaths=fpaths[::-1])
+obs_missing_version_hash = gen_version_hash(fpaths=fpaths + [os.path.join(tmp_fdir, "missing.py")])
+with open(fpaths[1], "a") as version_file:
+    version_file.write("changed")
+obs_changed_version_hash = gen_version_hash(fpaths=fpaths)
+
+def tearDownModule():
+    tmp_dir.cleanup()
+
+
+class Test_gen_version_hash(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.obs_version_hash = obs_version_hash
+        self.obs_reversed_version_hash = obs_reversed_version_hash
+        self.obs_missing_version_hash = obs_missing_version_hash
+        self.obs_changed_version_hash = obs_changed_version_hash
+
+    def test_type(self):
+        self.assertEqual(type(self.obs_version_hash), str)
+        self.assertEqual(len(self.obs_version_hash), 64)
+
+    def test_object(self):
+        self.assertEqual(self.obs_reversed_version_hash, self.obs_version_hash)
+        self.assertEqual(self.obs_missing_version_hash, self.obs_version_hash)
+        self.assertNotEqual(self.obs_changed_version_hash, self.obs_version_hash)
+
+
+if __name__ == "__main__":
+    unittest.main()
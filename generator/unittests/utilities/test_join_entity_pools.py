@@ -0,0 +1,52 @@
+import unittest
+import os
+import sys
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+from utilities.EntityPool import EntityPool
+from utilities.join_entity_pools import join_entity_pools
+
+user_data = pd.DataFrame({"uid": np.array([6374692674377254, 1751409580926382, 4264861381989413], dtype=np.uint64)})
+user_entity_pools = {
+    "device_hash": EntityPool(values=np.array([3324771670441727754, 13295029453911465859, 12686919101174941730], dtype=np.uint64), counts=np.array([1, 1, 1])),
+    "ip_hash": EntityPool(values=np.array([18384667229693178711, 4408980229783884114], dtype=np.uint64), counts=np.array([2, 0, 0])),
+}
+obs_user_pools_data = join_entity_pools(user_data=user_data, user_entity_pools=user_entity_pools)
+exp_user_pools_data = pd.DataFrame(
+    {
+        "uid": np.array([6374692674377254, 1751409580926382, 4264861381989413], dtype=np.uint64),
+        "device_hash": [["2e23f63807f6170a"], ["b8816ed926bf9f83"], ["b010fdb44fa68822"]],
+        "ip_hash": [["ff23757073a07357", "3d2fd828c1fd1152"], [], []],
+    }
+)
+
+
+class Test_join_entity_pools(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.obs_user_pools_data = obs_user_pools_data
+        self.exp_user_pools_data = exp_user_pools_data
+
+    def test_type(self):
+        self.assertEqual(type(self.obs_user_pools_data), type(self.exp_user_pools_data))
+
+    def test_shape(self):
+        self.assertEqual(self.obs_user_pools_data.shape, self.exp_user_pools_data.shape)
+
+    def test_columns(self):
+        self.assertEqual(self.obs_user_pools_data.columns.to_list(), self.exp_user_pools_data.columns.to_list())
+
+    def test_object(self):
+        self.assertEqual(self.obs_user_pools_data.to_dict(orient="list"), self.exp_user_pools_data.to_dict(orient="list"))
+
+    def test_error(self):
+        with self.assertRaises(ValueError):
+            join_entity_pools(user_data=user_data.iloc[:2], user_entity_pools=user_entity_pools)
+
+
+if __name__ == "__main__":
+    unittest.main()
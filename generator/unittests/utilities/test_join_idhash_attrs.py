@@ -0,0 +1,48 @@
+import unittest
+import os
+import sys
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+from utilities.join_idhash_attrs import join_idhash_attrs
+
+data = pd.DataFrame({"card_hash": pd.array([3326615498294007818, None, 13295658390123716483, 42], dtype="UInt64")})
+idhashes = np.array([13295658390123716483, 3326615498294007818], dtype=np.uint64)
+idhash_attrs = {
+    "card_type": np.array(["Mastercard", "Visa"]),
+    "card_country_code_alpha": np.array([250, 276]),
+}
+obs_join_data = join_idhash_attrs(data=data.copy(), idhash_col="card_hash", idhashes=idhashes, idhash_attrs=idhash_attrs)
+exp_join_data = pd.DataFrame(
+    {
+        "card_hash": pd.array([3326615498294007818, None, 13295658390123716483, 42], dtype="UInt64"),
+        "card_type": ["Visa", np.nan, "Mastercard", np.nan],
+        "card_country_code_alpha": [276.0, np.nan, 250.0, np.nan],
+    }
+)
+
+
+class Test_join_idhash_attrs(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.obs_join_data = obs_join_data
+        self.exp_join_data = exp_join_data
+
+    def test_type(self):
+        self.assertEqual(type(self.obs_join_data), type(self.exp_join_data))
+
+    def test_shape(self):
+        self.assertEqual(self.obs_join_data.shape, self.exp_join_data.shape)
+
+    def test_columns(self):
+        self.assertEqual(self.obs_join_data.columns.to_list(), self.exp_join_data.columns.to_list())
+
+    def test_object(self):
+        pd.testing.assert_frame_equal(self.obs_join_data, self.exp_join_data)
+
+
+if __name__ == "__main__":
+    unittest.main()
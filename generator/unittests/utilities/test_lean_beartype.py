@@ -0,0 +1,44 @@
+import unittest
+import os
+import sys
+from beartype.roar import BeartypeCallHintParamViolation
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+import cons
+from utilities.lean_beartype import lean_beartype
+
+def add_one(value:int) -> int:
+    return value + 1
+
+# decorate the same helper in checked mode and in lean mode
+checked_add_one = lean_beartype(add_one)
+lean_mode = cons.lean_mode
+cons.lean_mode = True
+lean_add_one = lean_beartype(add_one)
+cons.lean_mode = lean_mode
+
+
+class Test_lean_beartype(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.checked_add_one = checked_add_one
+        self.lean_add_one = lean_add_one
+
+    def test_object(self):
+        self.assertEqual(self.checked_add_one(value=1), 2)
+        self.assertEqual(self.lean_add_one(value=1), 2)
+
+    def test_checked(self):
+        if not cons.lean_mode:
+            self.assertIsNot(self.checked_add_one, add_one)
+            with self.assertRaises(BeartypeCallHintParamViolation):
+                self.checked_add_one(value="1")
+
+    def test_lean(self):
+        self.assertIs(self.lean_add_one, add_one)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,32 @@
+import unittest
+import os
+import sys
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+import cons
+from utilities.negotiate_media_type import negotiate_media_type
+
+# negotiate the response format of a range of accept headers
+accepts = [None, "*/*", "application/x-ndjson", "application/json;q=0.4, application/vnd.apache.arrow.stream", "text/html", "application/x-ndjson;q=0"]
+obs_formats = [negotiate_media_type(accept=accept) for accept in accepts]
+exp_formats = ["json", "json", "ndjson", "arrow", "json", "json"]
+
+
+class Test_negotiate_media_type(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.obs_formats = obs_formats
+        self.exp_formats = exp_formats
+
+    def test_type(self):
+        self.assertTrue(all(isinstance(obs_format, str) for obs_format in self.obs_formats))
+
+    def test_formats(self):
+        self.assertEqual(self.obs_formats, self.exp_formats)
+        self.assertTrue(set(self.obs_formats).issubset(cons.api_media_types.keys()))
+
+
+if __name__ == "__main__":
+    unittest.main()
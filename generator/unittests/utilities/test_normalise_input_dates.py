@@ -0,0 +1,42 @@
+import unittest
+import os
+import sys
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+import cons
+from utilities.normalise_input_dates import normalise_input_dates
+
+# normalise unpadded, padded and invalid dates
+input_params_dict = {"n_users": 100, "registration_start_date": "2020-1-1", "registration_end_date": "2020-12-31", "transaction_start_date": "2021-01-01", "transaction_end_date": "2021-2-3"}
+obs_input_params_dict = normalise_input_dates(input_params_dict=input_params_dict)
+exp_input_params_dict = {"n_users": 100, "registration_start_date": "2020-01-01", "registration_end_date": "2020-12-31", "transaction_start_date": "2021-01-01", "transaction_end_date": "2021-02-03"}
+invalid_dates = ["2020-13-01", "01/01/2020", "not a date", 20200101]
+
+
+class Test_normalise_input_dates(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.input_params_dict = input_params_dict
+        self.obs_input_params_dict = obs_input_params_dict
+        self.exp_input_params_dict = exp_input_params_dict
+        self.invalid_dates = invalid_dates
+
+    def test_type(self):
+        self.assertEqual(type(self.obs_input_params_dict), dict)
+        self.assertEqual(list(self.obs_input_params_dict.keys()), list(self.input_params_dict.keys()))
+
+    def test_dates(self):
+        self.assertEqual(self.obs_input_params_dict, self.exp_input_params_dict)
+        self.assertEqual(normalise_input_dates(input_params_dict=self.obs_input_params_dict), self.exp_input_params_dict)
+        self.assertEqual(self.input_params_dict["registration_start_date"], "2020-1-1")
+
+    def test_invalid_dates(self):
+        for invalid_date in self.invalid_dates:
+            with self.assertRaises(ValueError):
+                normalise_input_dates(input_params_dict={**self.exp_input_params_dict, cons.input_date_params[0]: invalid_date})
+
+
+if __name__ == "__main__":
+    unittest.main()
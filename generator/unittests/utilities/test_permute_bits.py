@@ -0,0 +1,45 @@
+import unittest
+import os
+import sys
+import numpy as np
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+from utilities.permute_bits import permute_bits
+
+exp_permuted_bits = [
+    9593046636353387234,
+    14131179195320296226,
+    505580945727611722,
+    16790147722589438022,
+]
+obs_permuted_bits = permute_bits(values=np.arange(4, dtype=np.uint64), n_bits=64, key=42).tolist()
+# a permutation of a full small domain must be a bijection onto the same domain
+obs_permuted_domain = permute_bits(values=np.arange(16, dtype=np.uint64), n_bits=4, key=42)
+
+
+class Test_permute_bits(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.obs_permuted_bits = obs_permuted_bits
+        self.exp_permuted_bits = exp_permuted_bits
+        self.obs_permuted_domain = obs_permuted_domain
+
+    def test_type(self):
+        self.assertEqual(type(self.obs_permuted_bits), type(self.exp_permuted_bits))
+        self.assertEqual(self.obs_permuted_domain.dtype, np.uint64)
+
+    def test_object(self):
+        self.assertEqual(self.obs_permuted_bits, self.exp_permuted_bits)
+
+    def test_bijection(self):
+        self.assertEqual(np.sort(self.obs_permuted_domain).tolist(), list(range(16)))
+
+    def test_error(self):
+        with self.assertRaises(ValueError):
+            permute_bits(values=np.arange(4, dtype=np.uint64), n_bits=65, key=42)
+
+
+if __name__ == "__main__":
+    unittest.main()
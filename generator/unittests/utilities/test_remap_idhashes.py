@@ -0,0 +1,38 @@
+import unittest
+import os
+import sys
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+from utilities.remap_idhashes import remap_idhashes
+
+idhashes = pd.Series(pd.array([3326615498294007818, None, 13295658390123716483, 5], dtype="UInt64"))
+source_codes = np.array([3326615498294007818, 13295658390123716483, 5], dtype=np.uint64)
+target_codes = np.array([3326615498294007818, 3326615498294007818, 18446744073709551615], dtype=np.uint64)
+exp_remapped_idhashes = pd.Series(pd.array([3326615498294007818, None, 3326615498294007818, 18446744073709551615], dtype="UInt64"))
+obs_remapped_idhashes = remap_idhashes(idhashes=idhashes, source_codes=source_codes, target_codes=target_codes)
+
+
+class Test_remap_idhashes(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.idhashes = idhashes
+        self.obs_remapped_idhashes = obs_remapped_idhashes
+        self.exp_remapped_idhashes = exp_remapped_idhashes
+
+    def test_type(self):
+        self.assertEqual(type(self.obs_remapped_idhashes), type(self.exp_remapped_idhashes))
+        self.assertEqual(self.obs_remapped_idhashes.dtype, self.exp_remapped_idhashes.dtype)
+
+    def test_object(self):
+        pd.testing.assert_series_equal(self.obs_remapped_idhashes, self.exp_remapped_idhashes)
+
+    def test_unchanged(self):
+        pd.testing.assert_series_equal(remap_idhashes(idhashes=self.idhashes, source_codes=np.array([], dtype=np.uint64), target_codes=np.array([], dtype=np.uint64)), self.idhashes)
+
+
+if __name__ == "__main__":
+    unittest.main()
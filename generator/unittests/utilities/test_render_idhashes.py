@@ -0,0 +1,45 @@
+import unittest
+import os
+import sys
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+from utilities.render_idhashes import render_idhashes
+
+exp_rendered_hashes = ["00000000000000ff", np.nan, "ffffffffffffffff"]
+exp_rendered_ids = ["0000000000000042", "4416889080049899"]
+obs_rendered_hashes = render_idhashes(idhashes=pd.array([255, None, 18446744073709551615], dtype="UInt64"), idhash_type="hash", nbytes=16)
+obs_rendered_ids = render_idhashes(idhashes=np.array([42, 4416889080049899], dtype=np.uint64), idhash_type="id", nbytes=16)
+
+
+class Test_render_idhashes(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.obs_rendered_hashes = obs_rendered_hashes
+        self.exp_rendered_hashes = exp_rendered_hashes
+        self.obs_rendered_ids = obs_rendered_ids
+        self.exp_rendered_ids = exp_rendered_ids
+
+    def test_type(self):
+        self.assertEqual(type(self.obs_rendered_hashes), np.ndarray)
+        self.assertEqual(type(self.obs_rendered_ids), np.ndarray)
+
+    def test_len(self):
+        self.assertEqual(len(self.obs_rendered_hashes), len(self.exp_rendered_hashes))
+        self.assertEqual(len(self.obs_rendered_ids), len(self.exp_rendered_ids))
+
+    def test_object(self):
+        self.assertEqual(self.obs_rendered_hashes[[0, 2]].tolist(), [self.exp_rendered_hashes[0], self.exp_rendered_hashes[2]])
+        self.assertTrue(pd.isna(self.obs_rendered_hashes[1]))
+        self.assertEqual(self.obs_rendered_ids.tolist(), self.exp_rendered_ids)
+
+    def test_error(self):
+        with self.assertRaises(ValueError):
+            render_idhashes(idhashes=np.array([42], dtype=np.uint64), idhash_type="uuid")
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -3,18 +3,16 @@ import os
 import sys
 import numpy as np
 import pandas as pd
-import random
 
 sys.path.append(os.path.join(os.getcwd(), "generator"))
 
 import cons
 from utilities.round_trans_amount import round_trans_amount
 
-random.seed(cons.unittest_seed)
-np.random.seed(seed=cons.unittest_seed)
+rng = np.random.default_rng(seed=cons.unittest_seed)
 
-obs_amount = round_trans_amount(amounts=np.array([1, 2, 3]))
-exp_amount = np.array([0.99, 1, 2.59])
+obs_amount = round_trans_amount(amounts=np.array([1, 2, 3]), rng=rng)
+exp_amount = np.array([0.59, 1.5, 2.29])
 
 
 class Test_round_trans_amount(unittest.TestCase):
@@ -0,0 +1,46 @@
+import unittest
+import os
+import sys
+import numpy as np
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+import cons
+from utilities.select_csr_idhashes import select_csr_idhashes
+
+rng = np.random.default_rng(seed=cons.unittest_seed)
+
+values = np.array(["63cea7c46926aa74", "37725417bd51fb40", "b95cb80aae9fbbfe", "dded2b63f8242648"], dtype=object)
+offsets = np.array([0, 1, 3, 3, 4])
+owners = np.array([0, 1, 1, 2, 3, 1, 1])
+obs_selected_idhashes = select_csr_idhashes(values=values, offsets=offsets, owners=owners, rng=rng)
+exp_selected_idhashes = np.array(["63cea7c46926aa74", "37725417bd51fb40", "b95cb80aae9fbbfe", np.nan, "dded2b63f8242648", "b95cb80aae9fbbfe", "37725417bd51fb40"], dtype=object)
+
+
+class Test_select_csr_idhashes(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.obs_selected_idhashes = obs_selected_idhashes
+        self.exp_selected_idhashes = exp_selected_idhashes
+        self.values = values
+        self.offsets = offsets
+        self.owners = owners
+
+    def test_type(self):
+        self.assertEqual(type(self.obs_selected_idhashes), type(self.exp_selected_idhashes))
+
+    def test_shape(self):
+        self.assertEqual(self.obs_selected_idhashes.shape, self.owners.shape)
+
+    def test_pools(self):
+        for idhash, owner in zip(self.obs_selected_idhashes, self.owners):
+            pool = self.values[self.offsets[owner]:self.offsets[owner + 1]].tolist()
+            self.assertTrue(idhash in pool if pool != [] else idhash != idhash)
+
+    def test_object(self):
+        self.assertEqual(str(self.obs_selected_idhashes.tolist()), str(self.exp_selected_idhashes.tolist()))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,61 @@
+import unittest
+import os
+import sys
+import numpy as np
+import pandas as pd
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+import cons
+from utilities.select_trans_data import select_trans_data
+
+# create relative file paths
+fpath_unittest_transaction_data = '.' + cons.fpath_unittest_transaction_data.split(cons.fpath_repo_dir)[1]
+
+# select pages of the unittest transaction data split into chunks, counting the chunks read
+trans_data = pd.read_parquet(fpath_unittest_transaction_data)
+trans_data_chunks = [trans_data.iloc[chunk_idx] for chunk_idx in np.array_split(np.arange(trans_data.shape[0]), 4)]
+columns = ["userid", "transaction_date", "transaction_amount", "transaction_status"]
+offset, limit = trans_data_chunks[0].shape[0] + 3, trans_data_chunks[1].shape[0]
+n_chunks_read = []
+def iter_trans_data_chunks():
+    for trans_data_chunk in trans_data_chunks:
+        n_chunks_read.append(1)
+        yield trans_data_chunk
+obs_page = pd.concat(list(select_trans_data(trans_data_chunks=iter_trans_data_chunks(), columns=columns, offset=offset, limit=limit)))
+obs_n_chunks_read = len(n_chunks_read)
+obs_all = pd.concat(list(select_trans_data(trans_data_chunks=trans_data_chunks)))
+obs_past_end = next(select_trans_data(trans_data_chunks=[trans_data], columns=columns, offset=trans_data.shape[0] + 1))
+exp_page = trans_data[columns].iloc[offset:offset + limit]
+exp_n_chunks_read = 3
+
+
+class Test_select_trans_data(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.trans_data = trans_data
+        self.columns = columns
+        self.obs_page = obs_page
+        self.obs_n_chunks_read = obs_n_chunks_read
+        self.obs_all = obs_all
+        self.obs_past_end = obs_past_end
+        self.exp_page = exp_page
+        self.exp_n_chunks_read = exp_n_chunks_read
+
+    def test_type(self):
+        self.assertEqual(type(self.obs_page), type(self.exp_page))
+
+    def test_page(self):
+        pd.testing.assert_frame_equal(self.obs_page, self.exp_page)
+        self.assertEqual(self.obs_n_chunks_read, self.exp_n_chunks_read)
+
+    def test_all(self):
+        pd.testing.assert_frame_equal(self.obs_all, self.trans_data)
+
+    def test_past_end(self):
+        self.assertEqual(self.obs_past_end.shape, (0, len(self.columns)))
+
+
+if __name__ == "__main__":
+    unittest.main()
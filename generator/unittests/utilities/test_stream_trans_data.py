@@ -0,0 +1,80 @@
+import unittest
+import os
+import sys
+import json
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+sys.path.append(os.path.join(os.getcwd(), "generator"))
+
+import cons
+from utilities.stream_trans_data import stream_trans_data
+from utilities.render_idhashes import render_idhashes
+
+# create relative file paths
+fpath_unittest_transaction_data = '.' + cons.fpath_unittest_transaction_data.split(cons.fpath_repo_dir)[1]
+
+# render the unittest transaction data idhashes as they are at output
+trans_data = pd.read_parquet(fpath_unittest_transaction_data)
+for idhash_col in trans_data.columns.intersection(list(cons.idhash_col_types.keys())):
+    trans_data[idhash_col] = render_idhashes(idhashes=trans_data[idhash_col], idhash_type=cons.idhash_col_types[idhash_col])
+trans_data_chunks = [trans_data.iloc[chunk_idx] for chunk_idx in np.array_split(np.arange(trans_data.shape[0]), 2)]
+
+# stream the transaction data chunks as newline delimited json and as an arrow ipc stream
+obs_ndjson_bytes = list(stream_trans_data(trans_data_chunks=trans_data_chunks, response_format="ndjson", chunk_size=50))
+obs_arrow_bytes = list(stream_trans_data(trans_data_chunks=trans_data_chunks, response_format="arrow", chunk_size=50))
+obs_ndjson_records = [json.loads(line) for line in b"".join(obs_ndjson_bytes).decode().splitlines()]
+obs_arrow_trans_data = pa.ipc.open_stream(b"".join(obs_arrow_bytes)).read_all().to_pandas()
+columns = ["userid", "transaction_date", "transaction_amount", "transaction_status"]
+obs_columns_arrow_table = pa.ipc.open_stream(b"".join(stream_trans_data(trans_data_chunks=[trans_data[columns]], response_format="arrow", columns=columns))).read_all()
+obs_empty_arrow_table = pa.ipc.open_stream(b"".join(stream_trans_data(trans_data_chunks=[], response_format="arrow"))).read_all()
+exp_n_slices = sum([int(np.ceil(trans_data_chunk.shape[0] / 50)) for trans_data_chunk in trans_data_chunks])
+exp_trans_hashes = trans_data["transaction_hash"].to_list()
+exp_trans_dates = trans_data["transaction_date"].dt.strftime("%Y-%m-%d").to_list()
+
+
+class Test_stream_trans_data(unittest.TestCase):
+    """"""
+
+    def setUp(self):
+        self.trans_data = trans_data
+        self.obs_ndjson_bytes = obs_ndjson_bytes
+        self.obs_arrow_bytes = obs_arrow_bytes
+        self.obs_ndjson_records = obs_ndjson_records
+        self.obs_arrow_trans_data = obs_arrow_trans_data
+        self.obs_empty_arrow_table = obs_empty_arrow_table
+        self.obs_columns_arrow_table = obs_columns_arrow_table
+        self.columns = columns
+        self.exp_n_slices = exp_n_slices
+        self.exp_trans_hashes = exp_trans_hashes
+        self.exp_trans_dates = exp_trans_dates
+
+    def test_type(self):
+        self.assertTrue(all(isinstance(obs_bytes, bytes) for obs_bytes in self.obs_ndjson_bytes + self.obs_arrow_bytes))
+
+    def test_chunks(self):
+        self.assertEqual(len(self.obs_ndjson_bytes), self.exp_n_slices)
+        self.assertEqual(len(self.obs_arrow_bytes), self.exp_n_slices + 1)
+
+    def test_ndjson(self):
+        self.assertEqual(len(self.obs_ndjson_records), self.trans_data.shape[0])
+        self.assertEqual(list(self.obs_ndjson_records[0].keys()), self.trans_data.columns.to_list())
+        self.assertEqual([record["transaction_hash"] for record in self.obs_ndjson_records], self.exp_trans_hashes)
+        self.assertEqual([record["transaction_date"] for record in self.obs_ndjson_records], self.exp_trans_dates)
+
+    def test_arrow(self):
+        self.assertEqual(self.obs_arrow_trans_data.shape, self.trans_data.shape)
+        self.assertEqual(self.obs_arrow_trans_data["transaction_hash"].to_list(), self.exp_trans_hashes)
+        self.assertEqual(self.obs_empty_arrow_table.num_rows, 0)
+        self.assertEqual(self.obs_empty_arrow_table.num_columns, self.trans_data.shape[1])
+        self.assertEqual(self.obs_columns_arrow_table.schema.names, self.columns)
+        self.assertEqual(self.obs_columns_arrow_table.num_rows, self.trans_data.shape[0])
+
+    def test_invalid_format(self):
+        with self.assertRaises(ValueError):
+            list(stream_trans_data(trans_data_chunks=[self.trans_data], response_format="csv"))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,100 @@
+import numpy as np
+from typing import Dict, Union
+
+from utilities.lean_beartype import lean_beartype
+
+class CategoricalSampler():
+    """
+    A reusable sampler of a categorical distribution, which validates the probabilities and precomputes their cumulative distribution once, then draws batches of categories by a binary search of uniform draws.
+    The draws are identical to numpy.random.Generator.choice with the same categories and probabilities, without rebuilding and revalidating the distribution on every call.
+
+    Parameters
+    ----------
+    categories : numpy.ndarray, list
+        The categories of the distribution.
+    probs : numpy.ndarray, list
+        The probabilities of each category, which must be non-negative and sum to 1.
+
+    Attributes
+    ----------
+    categories : numpy.ndarray
+        The read only categories of the distribution.
+    probs : numpy.ndarray
+        The read only probabilities of each category.
+    cdf : numpy.ndarray
+        The read only normalised cumulative distribution of the categories.
+
+    Examples
+    --------
+    ```
+    card_type_sampler = CategoricalSampler.from_dict(prop_dict={'Visa':0.5, 'Mastercard':0.5})
+    card_types = card_type_sampler.sample(rng=np.random.default_rng(seed=42), size=10)
+    ```
+    """
+
+    @lean_beartype
+    def __init__(
+        self,
+        categories:Union[np.ndarray, list],
+        probs:Union[np.ndarray, list],
+        ):
+        self.categories = np.asarray(categories)
+        self.probs = np.asarray(probs, dtype=np.float64)
+        # check the probabilities form a valid distribution over the categories
+        if (self.categories.ndim != 1) or (self.categories.shape != self.probs.shape) or (self.categories.shape[0] == 0):
+            raise ValueError("categories and probs must be non-empty one dimensional arrays of the same length")
+        if (self.probs < 0).any() or not np.isclose(self.probs.sum(), 1.0, rtol=0, atol=np.sqrt(np.finfo(np.float64).eps)):
+            raise ValueError("probs must be non-negative and sum to 1")
+        # precompute the normalised cumulative distribution
+        self.cdf = np.cumsum(self.probs)
+        self.cdf /= self.cdf[-1]
+        for array in (self.categories, self.probs, self.cdf):
+            array.flags.writeable = False
+
+    @classmethod
+    @lean_beartype
+    def from_dict(
+        cls,
+        prop_dict:Dict[Union[str, int, float], float],
+        ) -> "CategoricalSampler":
+        """
+        Creates a categorical sampler from a dictionary of category proportions.
+
+        Parameters
+        ----------
+        prop_dict : Dict[Union[str, int, float], float]
+            A dictionary of categories and their proportions.
+
+        Returns
+        -------
+        CategoricalSampler
+            The categorical sampler of the dictionary's distribution.
+        """
+        return cls(categories=list(prop_dict.keys()), probs=list(prop_dict.values()))
+
+    @lean_beartype
+    def sample(
+        self,
+        rng:np.random.Generator,
+        size:Union[int, np.int64],
+        out:Union[np.ndarray, None]=None,
+        ) -> np.ndarray:
+        """
+        Draws a batch of categories with replacement.
+
+        Parameters
+        ----------
+        rng : numpy.random.Generator
+            The random number generator to draw from.
+        size : int
+            The number of categories to draw.
+        out : numpy.ndarray, optional
+            A preallocated array of the given size and of the categories dtype to draw the categories into, default is None.
+
+        Returns
+        -------
+        numpy.ndarray
+            The drawn categories.
+        """
+        category_idx = self.cdf.searchsorted(rng.random(size), side="right")
+        return np.take(self.categories, category_idx, out=out)
@@ -0,0 +1,97 @@
+import numpy as np
+import pandas as pd
+from typing import List, Union
+
+from utilities.select_csr_idhashes import select_csr_idhashes
+from utilities.lean_beartype import lean_beartype
+
+class EntityPool():
+    """
+    A compact per-user pool of entity idhashes, stored in compressed sparse row (CSR) layout as a flat array of idhashes with per-user offsets.
+    The idhashes of the user at position i are values[offsets[i]:offsets[i+1]].
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The flat array of idhashes for all users, ordered by user position.
+    counts : numpy.ndarray
+        The number of idhashes belonging to each user.
+
+    Attributes
+    ----------
+    values : numpy.ndarray
+        The flat array of idhashes for all users, ordered by user position.
+    offsets : numpy.ndarray
+        The offsets of each user's idhashes within the values array, of length n_users + 1.
+
+    Examples
+    --------
+    ```
+    values = np.array(['2e23f63807f6170a', 'b8816ed926bf9f83', 'b010fdb44fa68822'])
+    entity_pool = EntityPool(values=values, counts=np.array([2, 1]))
+    entity_pool.select(owners=np.array([0, 1, 0]), rng=np.random.default_rng(seed=42))
+    ```
+    """
+
+    @lean_beartype
+    def __init__(
+        self,
+        values:np.ndarray,
+        counts:np.ndarray,
+        ):
+        if values.shape[0] != counts.sum():
+            raise ValueError(f"Entity pool counts sum to {counts.sum()} but {values.shape[0]} values were given.")
+        self.values = values
+        self.offsets = np.concatenate([[0], np.cumsum(counts, dtype=np.int64)])
+
+    @property
+    def counts(self) -> np.ndarray:
+        """
+        The number of idhashes belonging to each user.
+        """
+        return np.diff(self.offsets)
+
+    @property
+    def owners(self) -> np.ndarray:
+        """
+        The user position of each idhash within the values array.
+        """
+        return np.repeat(np.arange(self.counts.shape[0]), self.counts)
+
+    def __len__(self) -> int:
+        return self.counts.shape[0]
+
+    @lean_beartype
+    def select(
+        self,
+        owners:np.ndarray,
+        rng:np.random.Generator,
+        ) -> Union[np.ndarray, pd.arrays.IntegerArray]:
+        """
+        Randomly selects one idhash from the pool of each given user position.
+
+        Parameters
+        ----------
+        owners : numpy.ndarray
+            The user position of each row to select an idhash for.
+        rng : numpy.random.Generator
+            The random number generator to draw from.
+
+        Returns
+        -------
+        numpy.ndarray or pandas.arrays.IntegerArray
+            The randomly selected idhash for each row, or null where the user has no idhashes.
+        """
+        return select_csr_idhashes(values=self.values, offsets=self.offsets, owners=owners, rng=rng)
+
+    @lean_beartype
+    def to_lists(self) -> List[List[Union[str, int, float]]]:
+        """
+        Materialises the pool as a list of idhash lists, one per user.
+
+        Returns
+        -------
+        List[List[Union[str, int, float]]]
+            The idhashes of each user as a python list.
+        """
+        return [idhashes.tolist() for idhashes in np.split(self.values, self.offsets[1:-1])]
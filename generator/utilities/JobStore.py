@@ -0,0 +1,207 @@
+import os
+import re
+import json
+import uuid
+from datetime import datetime, timezone
+from typing import Dict, List
+
+from utilities.lean_beartype import lean_beartype
+
+class JobStore():
+    """
+    An on-disk store of generation jobs, where each job has its own directory holding a job.json record of its status, input parameters and progress, alongside its output artifacts.
+    Each update of a job record is written to a temporary file and then atomically renamed over the record, so that readers in other processes never see a partially written record.
+
+    Parameters
+    ----------
+    fdir : str
+        The directory to store the jobs in.
+
+    Attributes
+    ----------
+    fdir : str
+        The directory the jobs are stored in.
+
+    Examples
+    --------
+    ```
+    job_store = JobStore(fdir='data/jobs')
+    job_id = job_store.create(input_params_dict={'n_users': 1000})
+    job_store.update(job_id=job_id, status='running')
+    job_store.read(job_id=job_id)
+    ```
+    """
+
+    # the statuses of jobs which have not yet finished
+    unfinished_statuses = ("queued", "running")
+
+    @lean_beartype
+    def __init__(
+        self,
+        fdir:str,
+        ):
+        self.fdir = fdir
+
+    @lean_beartype
+    def job_fdir(
+        self,
+        job_id:str,
+        ) -> str:
+        """
+        Gets the directory of a job, checking the job id is well formed so that it cannot address paths outside the store.
+
+        Parameters
+        ----------
+        job_id : str
+            The id of the job.
+
+        Returns
+        -------
+        str
+            The directory of the job.
+        """
+        if re.fullmatch(r"[0-9a-f]{32}", job_id) is None:
+            raise KeyError(f"Invalid job_id {job_id}")
+        return os.path.join(self.fdir, job_id)
+
+    @lean_beartype
+    def create(
+        self,
+        input_params_dict:Dict[str, object],
+        ) -> str:
+        """
+        Creates a new queued job.
+
+        Parameters
+        ----------
+        input_params_dict : Dict[str, object]
+            The input parameters of the job.
+
+        Returns
+        -------
+        str
+            The id of the new job.
+        """
+        job_id = uuid.uuid4().hex
+        os.makedirs(self.job_fdir(job_id=job_id))
+        job = {
+            "job_id":job_id,
+            "status":"queued",
+            "created_at":datetime.now(timezone.utc).isoformat(),
+            "started_at":None,
+            "finished_at":None,
+            "input_params":input_params_dict,
+            "progress":{"n_users":0, "n_transactions":0, "shard_status":[]},
+            "artifacts":[],
+            "error":None,
+        }
+        self.write(job=job)
+        return job_id
+
+    @lean_beartype
+    def read(
+        self,
+        job_id:str,
+        ) -> dict:
+        """
+        Reads the record of a job.
+
+        Parameters
+        ----------
+        job_id : str
+            The id of the job.
+
+        Returns
+        -------
+        dict
+            The record of the job, a KeyError is raised if the job does not exist.
+        """
+        fpath_job = os.path.join(self.job_fdir(job_id=job_id), "job.json")
+        if not os.path.exists(fpath_job):
+            raise KeyError(f"Job {job_id} not found")
+        with open(fpath_job, "r") as job_file:
+            return json.load(job_file)
+
+    @lean_beartype
+    def write(
+        self,
+        job:dict,
+        ):
+        """
+        Atomically writes the record of a job.
+
+        Parameters
+        ----------
+        job : dict
+            The record of the job.
+        """
+        fpath_job = os.path.join(self.job_fdir(job_id=job["job_id"]), "job.json")
+        with open(f"{fpath_job}.tmp", "w") as job_file:
+            json.dump(job, job_file, default=str)
+        os.replace(f"{fpath_job}.tmp", fpath_job)
+
+    @lean_beartype
+    def update(
+        self,
+        job_id:str,
+        **fields:object,
+        ) -> dict:
+        """
+        Updates fields of the record of a job, setting the start and finish times as the job starts running and finishes.
+
+        Parameters
+        ----------
+        job_id : str
+            The id of the job.
+        **fields : object
+            The fields of the job record to update.
+
+        Returns
+        -------
+        dict
+            The updated record of the job.
+        """
+        job = {**self.read(job_id=job_id), **fields}
+        if fields.get("status") == "running":
+            job["started_at"] = datetime.now(timezone.utc).isoformat()
+        elif fields.get("status") in ("completed", "failed"):
+            job["finished_at"] = datetime.now(timezone.utc).isoformat()
+        self.write(job=job)
+        return job
+
+    @lean_beartype
+    def list_job_ids(self) -> List[str]:
+        """
+        Lists the ids of the stored jobs.
+
+        Returns
+        -------
+        List[str]
+            The ids of the stored jobs.
+        """
+        if not os.path.exists(self.fdir):
+            return []
+        return sorted([job_id for job_id in os.listdir(self.fdir) if os.path.exists(os.path.join(self.fdir, job_id, "job.json"))])
+
+    @lean_beartype
+    def fail_unfinished(
+        self,
+        error:str,
+        ) -> List[str]:
+        """
+        Marks every queued or running job as failed, such as the jobs interrupted by a restart of the process executing them.
+
+        Parameters
+        ----------
+        error : str
+            The error message recorded against the failed jobs.
+
+        Returns
+        -------
+        List[str]
+            The ids of the failed jobs.
+        """
+        failed_job_ids = [job_id for job_id in self.list_job_ids() if self.read(job_id=job_id)["status"] in self.unfinished_statuses]
+        for job_id in failed_job_ids:
+            self.update(job_id=job_id, status="failed", error=error)
+        return failed_job_ids
@@ -0,0 +1,103 @@
+import os
+import shutil
+import pandas as pd
+from typing import Iterator, List
+
+from utilities.lean_beartype import lean_beartype
+
+class PartitionedWriter():
+    """
+    A streaming writer which appends chunks of data to date partitioned parquet part files on disk as soon as they are produced, and then reads the partitions back in date order one partition at a time to write a single globally ordered output file.
+    Only one chunk or one partition is held in memory at a time, so the total output can be much larger than the available memory.
+
+    Parameters
+    ----------
+    fdir : str
+        The directory to write the partition part files to, it is removed once the partitions have been read back.
+    partition_col : str
+        The datetime column to partition the data by.
+    partition_freq : str
+        The pandas period frequency of the partitions, default is "D" for daily partitions.
+
+    Attributes
+    ----------
+    fdir : str
+        The directory of the partition part files.
+    partition_col : str
+        The datetime column the data is partitioned by.
+    partition_freq : str
+        The pandas period frequency of the partitions.
+    n_parts : int
+        The number of chunks written so far.
+
+    Examples
+    --------
+    ```
+    partitioned_writer = PartitionedWriter(fdir='data/parts', partition_col='transaction_date')
+    partitioned_writer.write(data=trans_data)
+    for partition_data in partitioned_writer.iter_partitions(sort_by=['transaction_date']):
+        trans_data_writer.write(trans_data=partition_data)
+    ```
+    """
+
+    @lean_beartype
+    def __init__(
+        self,
+        fdir:str,
+        partition_col:str,
+        partition_freq:str="D",
+        ):
+        self.fdir = fdir
+        self.partition_col = partition_col
+        self.partition_freq = partition_freq
+        self.n_parts = 0
+        # start from an empty partitions directory
+        if os.path.exists(self.fdir):
+            shutil.rmtree(self.fdir)
+        os.makedirs(self.fdir)
+
+    @lean_beartype
+    def write(
+        self,
+        data:pd.DataFrame,
+        ):
+        """
+        Appends a chunk of data to the partitions, writing one part file to each partition the chunk has rows for.
+
+        Parameters
+        ----------
+        data : pandas.DataFrame
+            The chunk of data to append.
+        """
+        partition_keys = data[self.partition_col].dt.to_period(freq=self.partition_freq).astype(str)
+        for partition_key, partition_data in data.groupby(by=partition_keys, sort=False):
+            partition_fdir = os.path.join(self.fdir, f"{self.partition_col}={partition_key}")
+            os.makedirs(partition_fdir, exist_ok=True)
+            partition_data.to_parquet(os.path.join(partition_fdir, f"part-{self.n_parts:05d}.parquet"), engine="pyarrow", index=False)
+        self.n_parts += 1
+
+    @lean_beartype
+    def iter_partitions(
+        self,
+        sort_by:List[str],
+        ) -> Iterator[pd.DataFrame]:
+        """
+        Lazily reads the partitions back in partition order, sorting the rows within each partition, and removes the partitions directory once every partition has been read.
+
+        Parameters
+        ----------
+        sort_by : List[str]
+            The columns to sort the rows of each partition by, the partition column must come first for the output to be globally ordered.
+
+        Returns
+        -------
+        Iterator[pandas.DataFrame]
+            An iterator of the sorted partitions, in partition order.
+        """
+        # partition keys are fixed width period strings, so sorting the directory names sorts the partitions by date
+        for partition_dir in sorted(os.listdir(self.fdir)):
+            partition_fdir = os.path.join(self.fdir, partition_dir)
+            # read the parts of the partition individually, as a column which is all null in one part can have a different parquet type in another
+            partition_data = pd.concat(objs=[pd.read_parquet(os.path.join(partition_fdir, part_fname), engine="pyarrow") for part_fname in sorted(os.listdir(partition_fdir))], axis=0, ignore_index=True)
+            yield partition_data.sort_values(by=sort_by, kind="stable").reset_index(drop=True)
+        shutil.rmtree(self.fdir)
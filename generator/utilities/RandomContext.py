@@ -0,0 +1,89 @@
+import hashlib
+import numpy as np
+from typing import Tuple, Union
+
+from utilities.lean_beartype import lean_beartype
+
+class RandomContext():
+    """
+    A reproducible random number context which hands out independent numpy PCG64 Generator streams for each named stage and shard of the programme.
+    Every stream is derived from the context's numpy SeedSequence and the stage name alone, so streams do not depend on the order in which they are requested; stages can run in any order, or concurrently, with bit for bit reproducible results.
+
+    Parameters
+    ----------
+    random_seed : int, optional
+        The random seed of the context, default is None which draws fresh entropy from the operating system.
+    spawn_key : Tuple[int, ...]
+        The position of the context within the tree of contexts spawned from the random seed, default is () for the root context.
+
+    Attributes
+    ----------
+    random_seed : int, optional
+        The random seed of the context.
+    seed_sequence : numpy.random.SeedSequence
+        The seed sequence all of the context's stage streams and shard contexts are spawned from.
+
+    Examples
+    --------
+    ```
+    random_context = RandomContext(random_seed=42)
+    user_rng = random_context.stream(stage="user")
+    shard_random_context = random_context.shard(shard=1)
+    ```
+    """
+
+    # spawn key namespaces keeping stage streams and shard contexts disjoint
+    stage_namespace = 0
+    shard_namespace = 1
+
+    @lean_beartype
+    def __init__(
+        self,
+        random_seed:Union[int, None]=None,
+        spawn_key:Tuple[int, ...]=(),
+        ):
+        self.random_seed = random_seed
+        self.seed_sequence = np.random.SeedSequence(entropy=random_seed, spawn_key=spawn_key)
+
+    @lean_beartype
+    def stream(
+        self,
+        stage:str,
+        ) -> np.random.Generator:
+        """
+        Creates the random number generator stream of a named stage, each call for the same stage returns a generator in the same initial state.
+
+        Parameters
+        ----------
+        stage : str
+            The name of the programme stage, e.g. "user" or "trans_data".
+
+        Returns
+        -------
+        numpy.random.Generator
+            The PCG64 random number generator of the stage.
+        """
+        # derive a stable 32 bit key from the stage name, python's hash() is salted per process
+        stage_key = int.from_bytes(hashlib.sha256(stage.encode("utf-8")).digest()[:4], byteorder="little")
+        stage_seed_sequence = np.random.SeedSequence(entropy=self.seed_sequence.entropy, spawn_key=self.seed_sequence.spawn_key + (self.stage_namespace, stage_key))
+        return np.random.Generator(np.random.PCG64(stage_seed_sequence))
+
+    @lean_beartype
+    def shard(
+        self,
+        shard:int,
+        ) -> "RandomContext":
+        """
+        Creates the independent random context of a numbered shard, e.g. an iteration run in a separate process.
+
+        Parameters
+        ----------
+        shard : int
+            The shard number.
+
+        Returns
+        -------
+        RandomContext
+            The random context of the shard.
+        """
+        return RandomContext(random_seed=self.seed_sequence.entropy, spawn_key=self.seed_sequence.spawn_key + (self.shard_namespace, shard))
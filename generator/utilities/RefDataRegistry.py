@@ -0,0 +1,567 @@
+import os
+import hashlib
+import numpy as np
+import pandas as pd
+from typing import Callable, Dict, Tuple, Union
+
+import cons
+from utilities.CategoricalSampler import CategoricalSampler
+from utilities.lean_beartype import lean_beartype
+
+class RefDataRegistry():
+    """
+    A process wide registry of the reference data under data/ref, which reads each reference file once and caches it together with the categorical samplers and rates derived from it.
+    Cached entries are keyed by the file path and the file's modification time and size, so an edited reference file is reread. Cached numpy arrays are read only views, and cached data frames and dictionaries must not be modified by callers.
+    The registry is preloaded before worker processes are forked, so that workers inherit the loaded reference data rather than rereading it.
+    The cached entries can be compiled into a single binary numpy bundle, which stores the content hash of each source file. Entries are then loaded from the bundle rather than parsed from the csv files, as long as the source files still have the same content hash.
+    The entries and content hashes of the bundle are keyed by the paths of the source files relative to the reference data directory, so the bundle can be used wherever the repository is located.
+
+    Parameters
+    ----------
+    fdir_ref_data : str
+        The reference data directory, default is cons.fdir_ref_data.
+
+    Attributes
+    ----------
+    fdir_ref_data : str
+        The reference data directory.
+    cache : Dict[tuple, object]
+        The cached reference data, keyed by the entry name, the file signatures and any entry arguments.
+    content_hashes : Dict[Tuple[str, int, int], str]
+        The cached sha256 content hashes of the source files, keyed by file signature.
+    bundle_signature : Tuple[str, int, int], optional
+        The file signature of the loaded bundle.
+    bundle_hashes : Dict[str, str]
+        The source file content hashes of the loaded bundle, keyed by source key.
+    bundle_entries : Dict[str, Tuple[str, Dict[str, numpy.ndarray]]]
+        The encoded entries of the loaded bundle, keyed by entry id.
+
+    Examples
+    --------
+    ```
+    from utilities.RefDataRegistry import ref_data_registry
+    ref_data_registry.load_bundle(fpath_bundle=cons.fpath_ref_data_bundle)
+    country_code_sampler = ref_data_registry.country_population_sampler(fpath_countries_europe=cons.fpath_countries_europe)
+    ```
+    """
+
+    @lean_beartype
+    def __init__(
+        self,
+        fdir_ref_data:str=cons.fdir_ref_data,
+        ):
+        self.fdir_ref_data = fdir_ref_data
+        self.cache = {}
+        self.content_hashes = {}
+        self.bundle_signature = None
+        self.bundle_hashes = {}
+        self.bundle_entries = {}
+
+    @lean_beartype
+    def file_signature(
+        self,
+        fpath:str,
+        ) -> Tuple[str, int, int]:
+        """
+        Generates the signature of a reference file, which changes whenever the file is edited.
+
+        Parameters
+        ----------
+        fpath : str
+            The file path of the reference file.
+
+        Returns
+        -------
+        Tuple[str, int, int]
+            The real file path, modification time in nanoseconds and size in bytes of the reference file.
+        """
+        # check file path exists
+        if os.path.exists(fpath) == False:
+            raise FileNotFoundError(f"File not found: {fpath}")
+        fstat = os.stat(fpath)
+        return (os.path.realpath(fpath), fstat.st_mtime_ns, fstat.st_size)
+
+    @lean_beartype
+    def file_content_hash(
+        self,
+        fpath:str,
+        ) -> str:
+        """
+        Generates the sha256 content hash of a reference file, hashing each edited version of the file once.
+
+        Parameters
+        ----------
+        fpath : str
+            The file path of the reference file.
+
+        Returns
+        -------
+        str
+            The hex digest of the sha256 content hash of the reference file.
+        """
+        signature = self.file_signature(fpath)
+        if signature not in self.content_hashes:
+            with open(fpath, "rb") as fobj:
+                self.content_hashes[signature] = hashlib.sha256(fobj.read()).hexdigest()
+        return self.content_hashes[signature]
+
+    @lean_beartype
+    def get(
+        self,
+        name:str,
+        fpaths:Tuple[str, ...],
+        loader:Callable[[], object],
+        args:tuple=(),
+        ) -> object:
+        """
+        Gets a cached reference data entry, loading and caching it on the first call.
+
+        Parameters
+        ----------
+        name : str
+            The name of the entry.
+        fpaths : Tuple[str, ...]
+            The file paths of the reference files the entry is derived from.
+        loader : Callable[[], object]
+            The function loading the entry on a cache miss.
+        args : tuple
+            Any further arguments the entry depends on, default is ().
+
+        Returns
+        -------
+        object
+            The cached reference data entry.
+        """
+        key = (name, tuple(self.file_signature(fpath) for fpath in fpaths), args)
+        if key not in self.cache:
+            # load the entry from the bundle if its source files are unchanged, otherwise from the source files
+            entry = self.read_bundle_entry(name=name, fpaths=fpaths, args=args)
+            if entry is None:
+                entry = loader()
+            # hand out read only views of cached numpy arrays
+            for array in (entry if isinstance(entry, tuple) else (entry,)):
+                if isinstance(array, np.ndarray):
+                    array.flags.writeable = False
+            self.cache[key] = entry
+        return self.cache[key]
+
+    @lean_beartype
+    def read_csv(
+        self,
+        fpath:str,
+        usecols:Union[Tuple[str, ...], None]=None,
+        index_col:Union[int, None]=None,
+        ) -> pd.DataFrame:
+        """
+        Reads a reference csv file once, returning the cached data frame on later calls.
+
+        Parameters
+        ----------
+        fpath : str
+            The file path of the reference csv file.
+        usecols : Tuple[str, ...], optional
+            The columns to read, default is None for all columns.
+        index_col : int, optional
+            The column to use as the index, default is None.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The cached reference data, which must not be modified.
+        """
+        loader = lambda: pd.read_csv(filepath_or_buffer=fpath, usecols=None if usecols is None else list(usecols), index_col=index_col)
+        return self.get(name="read_csv", fpaths=(fpath,), loader=loader, args=(usecols, index_col))
+
+    @lean_beartype
+    def country_population_sampler(
+        self,
+        fpath_countries_europe:str=cons.fpath_countries_europe,
+        ) -> CategoricalSampler:
+        """
+        Gets the categorical sampler of the ISO numeric country codes of the european countries by their population proportions.
+
+        Parameters
+        ----------
+        fpath_countries_europe : str
+            The file path to the european countries reference file, default is cons.fpath_countries_europe.
+
+        Returns
+        -------
+        CategoricalSampler
+            The sampler of the ISO numeric country codes.
+        """
+        def loader():
+            european_populations_cnt_data = self.read_csv(fpath=fpath_countries_europe, usecols=("ISO numeric", "population"))
+            country_codes = european_populations_cnt_data["ISO numeric"].to_numpy(copy=True)
+            populations = european_populations_cnt_data["population"].to_numpy()
+            country_codes_props = populations / populations.sum()
+            # check population proportions sum to 1.0
+            if np.isclose(country_codes_props.sum(), 1.0) == False:
+                raise ValueError("Population proportions do not sum to 1.0")
+            return CategoricalSampler(categories=country_codes, probs=country_codes_props)
+        return self.get(name="country_population_sampler", fpaths=(fpath_countries_europe,), loader=loader)
+
+    @lean_beartype
+    def country_codes_map(
+        self,
+        fpath_countries_europe:str=cons.fpath_countries_europe,
+        ) -> Dict[int, str]:
+        """
+        Gets the dictionary of ISO numeric codes mapping to ISO alpha codes of the european countries.
+
+        Parameters
+        ----------
+        fpath_countries_europe : str
+            The file path to the european countries reference file, default is cons.fpath_countries_europe.
+
+        Returns
+        -------
+        Dict[int, str]
+            A copy of the cached dictionary of ISO numeric codes mapping to ISO alpha codes.
+        """
+        loader = lambda: self.read_csv(fpath=fpath_countries_europe, usecols=("ISO numeric", "ISO alpha 2")).set_index("ISO numeric")["ISO alpha 2"].to_dict()
+        return dict(self.get(name="country_codes_map", fpaths=(fpath_countries_europe,), loader=loader))
+
+    @lean_beartype
+    def email_domain_sampler(
+        self,
+        fpath_email_domain:str=cons.fpath_email_domain,
+        ) -> CategoricalSampler:
+        """
+        Gets the categorical sampler of the email domains by their normalised proportions.
+
+        Parameters
+        ----------
+        fpath_email_domain : str
+            The file path to the email domains reference file, default is cons.fpath_email_domain.
+
+        Returns
+        -------
+        CategoricalSampler
+            The sampler of the email domains.
+        """
+        def loader():
+            email_domain_data = self.read_csv(fpath=fpath_email_domain, index_col=0)
+            email_domains = email_domain_data["domain"].to_numpy(copy=True)
+            email_domain_props = email_domain_data["proportion"].divide(email_domain_data["proportion"].sum()).to_numpy()
+            return CategoricalSampler(categories=email_domains, probs=email_domain_props)
+        return self.get(name="email_domain_sampler", fpaths=(fpath_email_domain,), loader=loader)
+
+    @lean_beartype
+    def smartphone_sampler(
+        self,
+        fpath_smartphones:str=cons.fpath_smartphones,
+        ) -> CategoricalSampler:
+        """
+        Gets the categorical sampler of the android smartphone models by their popularity proportions derived from their ratings.
+
+        Parameters
+        ----------
+        fpath_smartphones : str
+            The file path to the smart phones reference file, default is cons.fpath_smartphones.
+
+        Returns
+        -------
+        CategoricalSampler
+            The sampler of the smartphone models.
+        """
+        def loader():
+            smartphone_data = self.read_csv(fpath=fpath_smartphones, usecols=("model", "rating", "os"))
+            smartphone_data = smartphone_data.loc[smartphone_data["os"] == "android", :]
+            # derive a proportion popularity from the ratings
+            ratings = smartphone_data["rating"].fillna(value=smartphone_data["rating"].mean())
+            smartphone_models = smartphone_data["model"].to_numpy(copy=True)
+            smartphone_props = (ratings / ratings.sum()).to_numpy()
+            return CategoricalSampler(categories=smartphone_models, probs=smartphone_props)
+        return self.get(name="smartphone_sampler", fpaths=(fpath_smartphones,), loader=loader)
+
+    @lean_beartype
+    def country_names_index(
+        self,
+        fpath_bedrock_data:str,
+        sample_column_name:str,
+        ) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Gets a bedrock names reference table, e.g. first_names or last_names, indexed by ISO numeric country code into a contiguous array of names with per country offsets.
+        The names of the country at position i of the country codes are names[offsets[i]:offsets[i+1]].
+
+        Parameters
+        ----------
+        fpath_bedrock_data : str
+            The file path to the bedrock names reference file.
+        sample_column_name : str
+            The column name of the names in the bedrock names reference file.
+
+        Returns
+        -------
+        Tuple[numpy.ndarray, numpy.ndarray, numpy.ndarray]
+            The sorted ISO numeric country codes, the offsets of each country's names of length n_countries + 1, and the names ordered by country code.
+        """
+        def loader():
+            bedrock_data = self.read_csv(fpath=fpath_bedrock_data)
+            # stably order the names by country code, keeping the file order of the names within each country
+            bedrock_country_codes = bedrock_data["ISO numeric"].to_numpy()
+            country_order = np.argsort(bedrock_country_codes, kind="stable")
+            country_codes, country_counts = np.unique(bedrock_country_codes, return_counts=True)
+            offsets = np.concatenate([[0], np.cumsum(country_counts, dtype=np.int64)])
+            names = bedrock_data[sample_column_name].to_numpy()[country_order]
+            return (country_codes, offsets, names)
+        return self.get(name="country_names_index", fpaths=(fpath_bedrock_data,), loader=loader, args=(sample_column_name,))
+
+    @lean_beartype
+    def country_code_reject_rates(
+        self,
+        fpath_countries_europe:str=cons.fpath_countries_europe,
+        fpath_countrycrimeindex:str=cons.fpath_countrycrimeindex,
+        ) -> Dict[str, float]:
+        """
+        Gets the transaction rejection rates of the european countries, derived from their crime indices.
+
+        Parameters
+        ----------
+        fpath_countries_europe : str
+            The file path to the europe countries reference data, default is cons.fpath_countries_europe.
+        fpath_countrycrimeindex : str
+            The file path to the country crime index reference data, default is cons.fpath_countrycrimeindex.
+
+        Returns
+        -------
+        Dict[str, float]
+            A copy of the cached dictionary of ISO alpha country codes mapping to transaction rejection rates.
+        """
+        def loader():
+            countrieseurope = self.read_csv(fpath=fpath_countries_europe, usecols=("ISO alpha 2",))
+            countrycrimeindex = self.read_csv(fpath=fpath_countrycrimeindex, usecols=("country_code", "crime_index"))
+            europecountrycrimeindex = pd.merge(left=countrieseurope, right=countrycrimeindex, left_on="ISO alpha 2", right_on="country_code", how="left",)
+            europecountrycrimeindex["trans_reject_rate"] = europecountrycrimeindex["crime_index"].divide(europecountrycrimeindex["crime_index"].sum())
+            return europecountrycrimeindex.set_index("ISO alpha 2")["trans_reject_rate"].to_dict()
+        return dict(self.get(name="country_code_reject_rates", fpaths=(fpath_countries_europe, fpath_countrycrimeindex), loader=loader))
+
+    @lean_beartype
+    def email_domain_reject_rates(
+        self,
+        fpath_email_domain:str=cons.fpath_email_domain,
+        ) -> Dict[str, float]:
+        """
+        Gets the transaction rejection rates of the email domains, derived from their proportions.
+
+        Parameters
+        ----------
+        fpath_email_domain : str
+            The file path to the email domains reference data, default is cons.fpath_email_domain.
+
+        Returns
+        -------
+        Dict[str, float]
+            A copy of the cached dictionary of email domains mapping to transaction rejection rates.
+        """
+        def loader():
+            domain_email = self.read_csv(fpath=fpath_email_domain, usecols=("domain", "proportion"))
+            trans_reject_rate = (1 - domain_email["proportion"]) / (1 - domain_email["proportion"]).sum()
+            return dict(zip(domain_email["domain"].tolist(), trans_reject_rate.tolist()))
+        return dict(self.get(name="email_domain_reject_rates", fpaths=(fpath_email_domain,), loader=loader))
+
+    @lean_beartype
+    def preload(
+        self,
+        fpath_countries_europe:str=cons.fpath_countries_europe,
+        fpath_countrycrimeindex:str=cons.fpath_countrycrimeindex,
+        fpath_email_domain:str=cons.fpath_email_domain,
+        fpath_smartphones:str=cons.fpath_smartphones,
+        fpath_first_names:str=cons.fpath_llama_first_names,
+        fpath_last_names:str=cons.fpath_llama_last_names,
+        ):
+        """
+        Loads all of the reference data into the registry, e.g. before forking worker processes.
+
+        Parameters
+        ----------
+        fpath_countries_europe : str
+            The file path to the europe countries reference data, default is cons.fpath_countries_europe.
+        fpath_countrycrimeindex : str
+            The file path to the country crime index reference data, default is cons.fpath_countrycrimeindex.
+        fpath_email_domain : str
+            The file path to the email domains reference data, default is cons.fpath_email_domain.
+        fpath_smartphones : str
+            The file path to the smart phones reference data, default is cons.fpath_smartphones.
+        fpath_first_names : str
+            The file path to the first names reference data, default is cons.fpath_llama_first_names.
+        fpath_last_names : str
+            The file path to the last names reference data, default is cons.fpath_llama_last_names.
+        """
+        self.country_population_sampler(fpath_countries_europe=fpath_countries_europe)
+        self.country_codes_map(fpath_countries_europe=fpath_countries_europe)
+        self.country_code_reject_rates(fpath_countries_europe=fpath_countries_europe, fpath_countrycrimeindex=fpath_countrycrimeindex)
+        self.email_domain_sampler(fpath_email_domain=fpath_email_domain)
+        self.email_domain_reject_rates(fpath_email_domain=fpath_email_domain)
+        self.smartphone_sampler(fpath_smartphones=fpath_smartphones)
+        self.country_names_index(fpath_bedrock_data=fpath_first_names, sample_column_name="first_names")
+        self.country_names_index(fpath_bedrock_data=fpath_last_names, sample_column_name="last_names")
+
+    @lean_beartype
+    def gen_source_key(
+        self,
+        fpath:str,
+        ) -> str:
+        """
+        Generates the bundle key of a source file, its normalised path relative to the reference data directory, so that files with the same name in different directories have different keys.
+
+        Parameters
+        ----------
+        fpath : str
+            The file path of the reference file.
+
+        Returns
+        -------
+        str
+            The bundle key of the source file.
+        """
+        source_key = os.path.relpath(os.path.realpath(fpath), os.path.realpath(self.fdir_ref_data))
+        return source_key.replace(os.sep, "/")
+
+    @lean_beartype
+    def gen_entry_id(
+        self,
+        name:str,
+        fpaths:Tuple[str, ...],
+        args:tuple=(),
+        ) -> str:
+        """
+        Generates the bundle id of an entry, from the source keys of its reference files.
+
+        Parameters
+        ----------
+        name : str
+            The name of the entry.
+        fpaths : Tuple[str, ...]
+            The file paths of the reference files the entry is derived from.
+        args : tuple
+            Any further arguments the entry depends on, default is ().
+
+        Returns
+        -------
+        str
+            The bundle id of the entry.
+        """
+        return f"{name}|{','.join(self.gen_source_key(fpath) for fpath in fpaths)}|{args!r}"
+
+    @lean_beartype
+    def read_bundle_entry(
+        self,
+        name:str,
+        fpaths:Tuple[str, ...],
+        args:tuple=(),
+        ) -> object:
+        """
+        Reads an entry from the loaded bundle, if the bundle holds the entry and the content hashes of its source files are unchanged.
+
+        Parameters
+        ----------
+        name : str
+            The name of the entry.
+        fpaths : Tuple[str, ...]
+            The file paths of the reference files the entry is derived from.
+        args : tuple
+            Any further arguments the entry depends on, default is ().
+
+        Returns
+        -------
+        object
+            The decoded entry, or None if the entry cannot be read from the bundle.
+        """
+        entry_id = self.gen_entry_id(name=name, fpaths=fpaths, args=args)
+        if entry_id not in self.bundle_entries:
+            return None
+        # invalidate the entry if any of its source files have changed since the bundle was compiled
+        for fpath in fpaths:
+            if self.bundle_hashes.get(self.gen_source_key(fpath)) != self.file_content_hash(fpath):
+                return None
+        # decode the entry, converting fixed width unicode arrays back to object arrays of strings
+        entry_type, fields = self.bundle_entries[entry_id]
+        fields = {field: array.astype(object) if array.dtype.kind == "U" else array for field, array in fields.items()}
+        if entry_type == "sampler":
+            entry = CategoricalSampler(categories=fields["categories"], probs=fields["probs"])
+        elif entry_type == "tuple":
+            entry = tuple(fields[str(idx)] for idx in range(len(fields)))
+        elif entry_type == "dict":
+            entry = dict(zip(fields["keys"].tolist(), fields["values"].tolist()))
+        else:
+            entry = pd.DataFrame(fields)
+        return entry
+
+    @lean_beartype
+    def load_bundle(
+        self,
+        fpath_bundle:str=cons.fpath_ref_data_bundle,
+        ) -> bool:
+        """
+        Loads a compiled reference data bundle, whose entries are then used in place of parsing the source files.
+
+        Parameters
+        ----------
+        fpath_bundle : str
+            The file path of the bundle, default is cons.fpath_ref_data_bundle.
+
+        Returns
+        -------
+        bool
+            Whether the bundle was loaded, False if the bundle file does not exist.
+        """
+        if not os.path.exists(fpath_bundle):
+            return False
+        # the same version of the bundle only needs to be loaded once
+        bundle_signature = self.file_signature(fpath_bundle)
+        if bundle_signature != self.bundle_signature:
+            bundle_hashes, bundle_entries = {}, {}
+            with np.load(fpath_bundle, allow_pickle=False) as bundle:
+                for array_name in bundle.files:
+                    entry_id, entry_type, field = array_name.rsplit("|", 2)
+                    if entry_type == "hash":
+                        bundle_hashes[field] = str(bundle[array_name])
+                    else:
+                        bundle_entries.setdefault(entry_id, (entry_type, {}))[1][field] = bundle[array_name]
+            self.bundle_signature, self.bundle_hashes, self.bundle_entries = bundle_signature, bundle_hashes, bundle_entries
+        return True
+
+    @lean_beartype
+    def build_bundle(
+        self,
+        fpath_bundle:str=cons.fpath_ref_data_bundle,
+        ) -> int:
+        """
+        Compiles all of the cached reference data entries, and the content hashes of their source files, into a single binary numpy bundle; the registry is typically preloaded first.
+
+        Parameters
+        ----------
+        fpath_bundle : str
+            The file path to write the bundle to, default is cons.fpath_ref_data_bundle.
+
+        Returns
+        -------
+        int
+            The number of entries written to the bundle.
+        """
+        bundle_arrays, n_entries = {}, 0
+        for (name, signatures, args), entry in self.cache.items():
+            entry_id = self.gen_entry_id(name=name, fpaths=tuple(signature[0] for signature in signatures), args=args)
+            # encode the entry as named arrays, strings are stored as fixed width unicode so the bundle needs no pickling
+            if isinstance(entry, CategoricalSampler):
+                entry_type, fields = "sampler", {"categories": entry.categories, "probs": entry.probs}
+            elif isinstance(entry, tuple):
+                entry_type, fields = "tuple", {str(idx): array for idx, array in enumerate(entry)}
+            elif isinstance(entry, dict):
+                entry_type, fields = "dict", {"keys": np.array(list(entry.keys())), "values": np.array(list(entry.values()))}
+            elif isinstance(entry, pd.DataFrame) and isinstance(entry.index, pd.RangeIndex) and entry.notnull().all().all():
+                entry_type, fields = "frame", {col: entry[col].to_numpy() for col in entry.columns}
+            else:
+                continue
+            for field, array in fields.items():
+                bundle_arrays[f"{entry_id}|{entry_type}|{field}"] = array.astype(str) if array.dtype == object else array
+            for signature in signatures:
+                bundle_arrays[f"source|hash|{self.gen_source_key(signature[0])}"] = np.array(self.file_content_hash(signature[0]))
+            n_entries += 1
+        np.savez(fpath_bundle, **bundle_arrays)
+        return n_entries
+
+# the process wide reference data registry, inherited by forked worker processes
+ref_data_registry = RefDataRegistry()
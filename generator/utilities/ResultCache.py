@@ -0,0 +1,244 @@
+import os
+import json
+import hashlib
+import threading
+import pandas as pd
+from collections import OrderedDict
+from typing import Dict, List, Union
+
+import cons
+from utilities.lean_beartype import lean_beartype
+
+class ResultCache():
+    """
+    A content addressed cache of generated transaction data, keyed by a hash of the input parameters which determine the data and a version hash of the generator code and reference data.
+    Entries are held in an in memory least recently used tier, backed by an on disk tier of parquet files, and each tier evicts its least recently used entries once its total size exceeds its limit.
+
+    Parameters
+    ----------
+    fdir : str
+        The directory of the on disk tier.
+    version_hash : str
+        The version hash of the generator code and reference data, so that entries generated by other versions are never returned.
+    max_memory_bytes : int
+        The maximum total size of the in memory tier in bytes, default is cons.api_cache_max_memory_bytes.
+    max_disk_bytes : int
+        The maximum total size of the on disk tier in bytes, default is cons.api_cache_max_disk_bytes.
+    key_params : List[str]
+        The input parameters which determine the generated data, default is cons.api_cache_key_params.
+
+    Attributes
+    ----------
+    fdir : str
+        The directory of the on disk tier.
+    version_hash : str
+        The version hash of the generator code and reference data.
+    max_memory_bytes : int
+        The maximum total size of the in memory tier in bytes.
+    max_disk_bytes : int
+        The maximum total size of the on disk tier in bytes.
+    key_params : List[str]
+        The input parameters which determine the generated data.
+    memory_entries : collections.OrderedDict
+        The entries of the in memory tier and their sizes, from least to most recently used.
+    memory_bytes : int
+        The total size of the in memory tier in bytes.
+    counts : Dict[str, int]
+        The number of memory hits, disk hits, misses and evictions so far.
+
+    Examples
+    --------
+    ```
+    result_cache = ResultCache(fdir='data/cache', version_hash='abc')
+    cache_key = result_cache.gen_key(input_params_dict=input_params_dict)
+    if result_cache.get(cache_key=cache_key) is None:
+        result_cache.put(cache_key=cache_key, trans_data=trans_data)
+    ```
+    """
+
+    @lean_beartype
+    def __init__(
+        self,
+        fdir:str,
+        version_hash:str,
+        max_memory_bytes:int=cons.api_cache_max_memory_bytes,
+        max_disk_bytes:int=cons.api_cache_max_disk_bytes,
+        key_params:List[str]=cons.api_cache_key_params,
+        ):
+        self.fdir = fdir
+        self.version_hash = version_hash
+        self.max_memory_bytes = max_memory_bytes
+        self.max_disk_bytes = max_disk_bytes
+        self.key_params = key_params
+        self.memory_entries = OrderedDict()
+        self.memory_bytes = 0
+        self.counts = {"memory_hits":0, "disk_hits":0, "misses":0, "memory_evictions":0, "disk_evictions":0}
+        # the cache is read and written from worker threads
+        self.lock = threading.RLock()
+
+    @lean_beartype
+    def gen_key(
+        self,
+        input_params_dict:Dict[str, object],
+        ) -> str:
+        """
+        Generates the cache key of a request, from its normalised input parameters and the version hash.
+
+        Parameters
+        ----------
+        input_params_dict : Dict[str, object]
+            The input parameters of the request.
+
+        Returns
+        -------
+        str
+            The hexadecimal sha256 cache key.
+        """
+        # keep only the parameters which determine the generated data, serialised in a fixed key order
+        key_params_dict = {key_param:input_params_dict[key_param] for key_param in sorted(self.key_params)}
+        key_json = json.dumps({"params":key_params_dict, "version_hash":self.version_hash}, sort_keys=True, default=str)
+        return hashlib.sha256(key_json.encode()).hexdigest()
+
+    @lean_beartype
+    def fpath(
+        self,
+        cache_key:str,
+        ) -> str:
+        """
+        Gets the file path of an entry of the on disk tier.
+
+        Parameters
+        ----------
+        cache_key : str
+            The cache key of the entry.
+
+        Returns
+        -------
+        str
+            The parquet file path of the entry.
+        """
+        return os.path.join(self.fdir, f"{cache_key}.parquet")
+
+    @lean_beartype
+    def get(
+        self,
+        cache_key:str,
+        ) -> Union[pd.DataFrame, None]:
+        """
+        Gets the transaction data of an entry, from the in memory tier or otherwise the on disk tier, which is then promoted to the in memory tier.
+
+        Parameters
+        ----------
+        cache_key : str
+            The cache key of the entry.
+
+        Returns
+        -------
+        pandas.DataFrame
+            The cached transaction data, or None if the entry is not cached.
+        """
+        with self.lock:
+            if cache_key in self.memory_entries:
+                self.memory_entries.move_to_end(cache_key)
+                self.counts["memory_hits"] += 1
+                return self.memory_entries[cache_key][0]
+            fpath_entry = self.fpath(cache_key=cache_key)
+            if not os.path.exists(fpath_entry):
+                self.counts["misses"] += 1
+                return None
+            # mark the file as recently used, and promote the entry to the in memory tier
+            os.utime(fpath_entry)
+            trans_data = pd.read_parquet(fpath_entry, engine="pyarrow")
+            self.counts["disk_hits"] += 1
+            self.put_memory(cache_key=cache_key, trans_data=trans_data)
+            return trans_data
+
+    @lean_beartype
+    def put(
+        self,
+        cache_key:str,
+        trans_data:pd.DataFrame,
+        ):
+        """
+        Puts the transaction data of an entry into both the in memory and on disk tiers, evicting the least recently used entries of each tier beyond its size limit.
+
+        Parameters
+        ----------
+        cache_key : str
+            The cache key of the entry.
+        trans_data : pandas.DataFrame
+            The transaction data to cache.
+        """
+        with self.lock:
+            # write the entry to a temporary file which is then atomically renamed, so that a partially written entry is never read
+            os.makedirs(self.fdir, exist_ok=True)
+            fpath_entry = self.fpath(cache_key=cache_key)
+            trans_data.to_parquet(f"{fpath_entry}.tmp", engine="pyarrow", index=False)
+            os.replace(f"{fpath_entry}.tmp", fpath_entry)
+            self.evict_disk()
+            self.put_memory(cache_key=cache_key, trans_data=trans_data)
+
+    @lean_beartype
+    def put_memory(
+        self,
+        cache_key:str,
+        trans_data:pd.DataFrame,
+        ):
+        """
+        Puts the transaction data of an entry into the in memory tier, unless it alone exceeds the tier's size limit, evicting the least recently used entries beyond the limit.
+
+        Parameters
+        ----------
+        cache_key : str
+            The cache key of the entry.
+        trans_data : pandas.DataFrame
+            The transaction data to cache.
+        """
+        nbytes = int(trans_data.memory_usage(index=False, deep=True).sum())
+        if nbytes > self.max_memory_bytes:
+            return
+        if cache_key in self.memory_entries:
+            self.memory_bytes -= self.memory_entries.pop(cache_key)[1]
+        self.memory_entries[cache_key] = (trans_data, nbytes)
+        self.memory_bytes += nbytes
+        while self.memory_bytes > self.max_memory_bytes:
+            _, (_, evicted_nbytes) = self.memory_entries.popitem(last=False)
+            self.memory_bytes -= evicted_nbytes
+            self.counts["memory_evictions"] += 1
+
+    @lean_beartype
+    def evict_disk(self):
+        """
+        Removes the least recently used files of the on disk tier, by modification time, until its total size is within its limit.
+        """
+        fpath_entries = [os.path.join(self.fdir, fname) for fname in os.listdir(self.fdir) if fname.endswith(".parquet")]
+        fpath_entries = sorted(fpath_entries, key=os.path.getmtime)
+        disk_bytes = sum([os.path.getsize(fpath_entry) for fpath_entry in fpath_entries])
+        for fpath_entry in fpath_entries:
+            if disk_bytes <= self.max_disk_bytes:
+                break
+            disk_bytes -= os.path.getsize(fpath_entry)
+            os.remove(fpath_entry)
+            self.counts["disk_evictions"] += 1
+
+    @lean_beartype
+    def metrics(self) -> Dict[str, Union[int, float]]:
+        """
+        Reports the hit, miss and eviction counts, hit rate and size of each tier of the cache.
+
+        Returns
+        -------
+        Dict[str, Union[int, float]]
+            The metrics of the cache.
+        """
+        with self.lock:
+            fpath_entries = [os.path.join(self.fdir, fname) for fname in os.listdir(self.fdir) if fname.endswith(".parquet")] if os.path.exists(self.fdir) else []
+            n_requests = self.counts["memory_hits"] + self.counts["disk_hits"] + self.counts["misses"]
+            return {
+                **self.counts,
+                "hit_rate":(self.counts["memory_hits"] + self.counts["disk_hits"]) / n_requests if n_requests > 0 else 0.0,
+                "memory_entries":len(self.memory_entries),
+                "memory_bytes":self.memory_bytes,
+                "disk_entries":len(fpath_entries),
+                "disk_bytes":sum([os.path.getsize(fpath_entry) for fpath_entry in fpath_entries]),
+            }
@@ -0,0 +1,160 @@
+import pandas as pd
+import pyarrow as pa
+import pyarrow.parquet as pq
+from typing import Tuple
+
+import cons
+from utilities.lean_beartype import lean_beartype
+
+class TransDataWriter():
+    """
+    A writer which writes the transaction level data to either a csv file or a columnar parquet file, in one or more chunks.
+    The parquet output has a fixed arrow schema, with dictionary encoded categorical columns, date typed date columns and configurable compression and row group sizing, so every chunk is appended as row groups of the same file.
+
+    Parameters
+    ----------
+    fpath : str
+        The file path to write the transaction level data to.
+    output_format : str
+        The output file format, either "csv" or "parquet", default is "csv".
+    compression : str
+        The parquet compression codec, e.g. "snappy", "zstd", "gzip" or "none", default is "snappy".
+    row_group_size : int
+        The maximum number of rows in each parquet row group, default is 1000000.
+
+    Attributes
+    ----------
+    fpath : str
+        The file path the transaction level data is written to.
+    output_format : str
+        The output file format.
+    compression : str
+        The parquet compression codec.
+    row_group_size : int
+        The maximum number of rows in each parquet row group.
+    schema : pyarrow.Schema
+        The arrow schema of the parquet output.
+    n_rows : int
+        The number of rows written so far.
+    n_cols : int
+        The number of columns written.
+
+    Examples
+    --------
+    ```
+    trans_data_writer = TransDataWriter(fpath='data/RandomTelecomPayments.parquet', output_format='parquet', compression='zstd')
+    trans_data_writer.write(trans_data=trans_data)
+    trans_data_writer.close()
+    ```
+    """
+
+    @lean_beartype
+    def __init__(
+        self,
+        fpath:str,
+        output_format:str="csv",
+        compression:str="snappy",
+        row_group_size:int=1000000,
+        ):
+        if output_format not in ("csv", "parquet"):
+            raise ValueError(f"Invalid output_format value {output_format}; must be either 'csv' or 'parquet'.")
+        self.fpath = fpath
+        self.output_format = output_format
+        self.compression = compression
+        self.row_group_size = row_group_size
+        self.schema = self.gen_trans_schema()
+        self.n_rows = 0
+        self.n_cols = len(self.schema)
+        self.parquet_writer = None
+        self.parquet_buffer = []
+        self.n_buffered_rows = 0
+
+    @staticmethod
+    @lean_beartype
+    def gen_trans_schema() -> pa.Schema:
+        """
+        Generates the arrow schema of the transaction level data, which is shared by the parquet output and the arrow stream api responses.
+
+        Returns
+        -------
+        pyarrow.Schema
+            The arrow schema, with dictionary encoded categorical columns, date32 date columns, a float64 transaction amount and string typed remaining columns.
+        """
+        trans_cols = cons.user_cols + cons.device_cols + cons.card_cols + cons.ip_cols + cons.app_cols + cons.trans_cols + cons.itr_cols
+        trans_fields = []
+        for trans_col in trans_cols:
+            if trans_col in cons.trans_date_cols:
+                trans_fields.append(pa.field(trans_col, pa.date32()))
+            elif trans_col in cons.trans_dictionary_cols:
+                trans_fields.append(pa.field(trans_col, pa.dictionary(pa.int32(), pa.string())))
+            elif trans_col == "transaction_amount":
+                trans_fields.append(pa.field(trans_col, pa.float64()))
+            else:
+                trans_fields.append(pa.field(trans_col, pa.string()))
+        return pa.schema(trans_fields)
+
+    @lean_beartype
+    def write(
+        self,
+        trans_data:pd.DataFrame,
+        ):
+        """
+        Appends a chunk of transaction level data to the output file.
+
+        Parameters
+        ----------
+        trans_data : pandas.DataFrame
+            The chunk of transaction level data, with idhashes rendered as strings.
+        """
+        if self.output_format == "csv":
+            trans_data.to_csv(self.fpath, mode="w" if self.n_rows == 0 else "a", header=(self.n_rows == 0), index=False)
+        else:
+            # open the parquet file on the first chunk, each chunk is then appended as further row groups
+            if self.parquet_writer is None:
+                self.parquet_writer = pq.ParquetWriter(self.fpath, schema=self.schema, compression=self.compression)
+            # buffer small chunks, such as daily partitions, so that row groups are filled up to the row group size
+            self.parquet_buffer.append(pa.Table.from_pandas(trans_data, schema=self.schema, preserve_index=False))
+            self.n_buffered_rows += trans_data.shape[0]
+            if self.n_buffered_rows >= self.row_group_size:
+                self.flush()
+        self.n_rows += trans_data.shape[0]
+
+    @lean_beartype
+    def flush(
+        self,
+        final:bool=False,
+        ):
+        """
+        Writes the buffered parquet chunks to the output file as whole row groups of the row group size, keeping any remaining rows buffered until further chunks fill them up to a whole row group.
+
+        Parameters
+        ----------
+        final : bool
+            Whether to also write the remaining rows as a final smaller row group, default is False.
+        """
+        n_flush_rows = self.n_buffered_rows if final else self.n_buffered_rows - self.n_buffered_rows % self.row_group_size
+        if n_flush_rows > 0:
+            buffered_table = pa.concat_tables(self.parquet_buffer)
+            self.parquet_writer.write_table(buffered_table.slice(0, n_flush_rows), row_group_size=self.row_group_size)
+            # keep the remaining rows buffered for the next row group
+            remaining_table = buffered_table.slice(n_flush_rows)
+            self.parquet_buffer = [remaining_table] if remaining_table.num_rows > 0 else []
+            self.n_buffered_rows = remaining_table.num_rows
+
+    @lean_beartype
+    def close(self) -> Tuple[int, int]:
+        """
+        Closes the output file, writing any remaining buffered rows as a final row group.
+
+        Returns
+        -------
+        Tuple[int, int]
+            The number of rows and columns written.
+        """
+        if self.parquet_writer is not None:
+            self.flush(final=True)
+            self.parquet_writer.close()
+            self.parquet_writer = None
+        self.parquet_buffer = []
+        self.n_buffered_rows = 0
+        return (self.n_rows, self.n_cols)
@@ -0,0 +1,221 @@
+import queue
+import asyncio
+import multiprocessing
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, AsyncIterator, Callable
+
+from utilities.lean_beartype import lean_beartype
+
+def stream_to_queue(
+    chunk_queue:Any,
+    cancel_event:Any,
+    func:Callable[..., Any],
+    args:tuple,
+    ):
+    """
+    Puts each chunk yielded by a generator function onto a queue, followed by a None end of stream marker, stopping early if the stream is cancelled.
+    Any exception raised by the generator function is put onto the queue in place of the remaining chunks.
+
+    Parameters
+    ----------
+    chunk_queue : multiprocessing.managers.BaseProxy
+        The bounded managed queue to put the chunks onto.
+    cancel_event : multiprocessing.managers.BaseProxy
+        The managed event which is set when the consumer of the stream stops reading.
+    func : Callable[..., Any]
+        The generator function yielding the chunks.
+    args : tuple
+        The positional arguments to call the generator function with.
+    """
+    def put(item:Any) -> bool:
+        # wait for space on the bounded queue, checking whether the stream has been cancelled in the meantime
+        while not cancel_event.is_set():
+            try:
+                chunk_queue.put(item, timeout=1)
+                return True
+            except queue.Full:
+                continue
+        return False
+    try:
+        for chunk in func(*args):
+            if not put(chunk):
+                return
+    except Exception as exception:
+        put(exception)
+    put(None)
+
+class WorkerPool():
+    """
+    A bounded pool of worker processes for running cpu bound calls from an asyncio event loop without blocking it.
+    At most max_workers calls run at once, up to max_queued further calls wait for a free worker, and calls beyond that are rejected, so a burst of requests cannot build an unbounded backlog.
+    The worker processes are started on the first call, so that they inherit any data preloaded by the parent process beforehand.
+
+    Parameters
+    ----------
+    max_workers : int
+        The maximum number of calls to run at once, default is 2.
+    max_queued : int
+        The maximum number of calls waiting for a free worker, default is 8.
+    max_queued_chunks : int
+        The maximum number of streamed chunks buffered between a worker and its consumer, default is 2.
+
+    Attributes
+    ----------
+    max_workers : int
+        The maximum number of calls to run at once.
+    max_queued : int
+        The maximum number of calls waiting for a free worker.
+    max_queued_chunks : int
+        The maximum number of streamed chunks buffered between a worker and its consumer.
+    n_pending : int
+        The number of calls either running or waiting for a free worker.
+
+    Examples
+    --------
+    ```
+    worker_pool = WorkerPool(max_workers=2, max_queued=8)
+    output = await worker_pool.run(pow, 2, 3)
+    async for chunk in worker_pool.stream(range, 3):
+        print(chunk)
+    worker_pool.shutdown()
+    ```
+    """
+
+    @lean_beartype
+    def __init__(
+        self,
+        max_workers:int=2,
+        max_queued:int=8,
+        max_queued_chunks:int=2,
+        ):
+        if (max_workers < 1) or (max_queued < 0) or (max_queued_chunks < 1):
+            raise ValueError("max_workers and max_queued_chunks must be >= 1 and max_queued must be >= 0")
+        self.max_workers = max_workers
+        self.max_queued = max_queued
+        self.max_queued_chunks = max_queued_chunks
+        self.n_pending = 0
+        self.executor = None
+        self.manager = None
+        self.semaphore = None
+
+    @lean_beartype
+    def is_full(self) -> bool:
+        """
+        Checks whether every worker is busy and the queue of waiting calls is full, in which case further calls are rejected.
+
+        Returns
+        -------
+        bool
+            Whether further calls are rejected.
+        """
+        return self.n_pending >= self.max_workers + self.max_queued
+
+    @lean_beartype
+    def start(self):
+        """
+        Starts the worker processes and the concurrency limit, if not already started.
+        """
+        if self.executor is None:
+            self.executor = ProcessPoolExecutor(max_workers=self.max_workers)
+            self.semaphore = asyncio.Semaphore(self.max_workers)
+
+    @lean_beartype
+    async def run(
+        self,
+        func:Callable[..., Any],
+        *args:Any,
+        ) -> Any:
+        """
+        Runs a function call in a worker process once a worker is free.
+
+        Parameters
+        ----------
+        func : Callable[..., Any]
+            The picklable function to call.
+        *args : Any
+            The picklable positional arguments to call the function with.
+
+        Returns
+        -------
+        Any
+            The output of the function call.
+        """
+        if self.is_full():
+            raise RuntimeError(f"WorkerPool is full with {self.n_pending} pending calls")
+        self.start()
+        self.n_pending += 1
+        try:
+            # wait for a free worker, so that waiting calls never occupy the worker processes
+            async with self.semaphore:
+                return await asyncio.get_running_loop().run_in_executor(self.executor, func, *args)
+        finally:
+            self.n_pending -= 1
+
+    @lean_beartype
+    async def stream(
+        self,
+        func:Callable[..., Any],
+        *args:Any,
+        ) -> AsyncIterator[Any]:
+        """
+        Runs a generator function call in a worker process once a worker is free, yielding each chunk as soon as the worker produces it.
+        The chunks are passed through a bounded queue, so a slow consumer holds back the worker rather than the chunks building up in memory, and the worker stops early if the consumer stops reading.
+
+        Parameters
+        ----------
+        func : Callable[..., Any]
+            The picklable generator function to call, which yields picklable chunks.
+        *args : Any
+            The picklable positional arguments to call the generator function with.
+
+        Returns
+        -------
+        AsyncIterator[Any]
+            The chunks yielded by the generator function.
+        """
+        if self.is_full():
+            raise RuntimeError(f"WorkerPool is full with {self.n_pending} pending calls")
+        self.start()
+        if self.manager is None:
+            self.manager = multiprocessing.Manager()
+        loop = asyncio.get_running_loop()
+        self.n_pending += 1
+        try:
+            async with self.semaphore:
+                chunk_queue, cancel_event = self.manager.Queue(maxsize=self.max_queued_chunks), self.manager.Event()
+                future = loop.run_in_executor(self.executor, stream_to_queue, chunk_queue, cancel_event, func, args)
+                def get() -> Any:
+                    # wait for the next chunk, checking whether the stream has been cancelled in the meantime, so that the reading thread is never left waiting on a worker which has stopped
+                    while not cancel_event.is_set():
+                        try:
+                            return chunk_queue.get(timeout=1)
+                        except queue.Empty:
+                            continue
+                    return None
+                try:
+                    # read the chunks from the queue in a thread until the end of stream marker
+                    while (chunk := await loop.run_in_executor(None, get)) is not None:
+                        if isinstance(chunk, Exception):
+                            raise chunk
+                        yield chunk
+                    await future
+                finally:
+                    # stop the worker if the consumer stopped reading before the end of the stream
+                    if not future.done():
+                        cancel_event.set()
+                        await future
+        finally:
+            self.n_pending -= 1
+
+    @lean_beartype
+    def shutdown(self):
+        """
+        Shuts down the worker processes, waiting for any running calls to finish.
+        """
+        if self.executor is not None:
+            self.executor.shutdown(wait=True, cancel_futures=True)
+            self.executor = None
+            self.semaphore = None
+        if self.manager is not None:
+            self.manager.shutdown()
+            self.manager = None
@@ -1,65 +1,56 @@
-import random
 import numpy as np
 import pandas as pd
-from beartype import beartype
 
-@beartype
+from utilities.lean_beartype import lean_beartype
+
+@lean_beartype
 def align_country_codes(
-    series:pd.Series,
+    data:pd.DataFrame,
+    rng:np.random.Generator,
     proba_comm_ip:float=0.05,
     proba_comm_card:float=0.01,
-    ) -> pd.Series:
+    ) -> pd.DataFrame:
     """
     Aligns inconsistent registration, ip and card country codes to have mostly common values; with a random chance of inconsistencies.
-    
+
     Parameters
     ----------
-    series : pandas.Series
-        A series from the random transaction dataframe with inconsistent country codes to align.
+    data : pandas.DataFrame
+        The random transaction data with inconsistent registration, ip and card country codes to align.
+    rng : numpy.random.Generator
+        The random number generator to draw from.
     proba_comm_ip : float
         The probability of a common / shared registration country code and ip country code, default is 0.05.
     proba_comm_card : float
         The probability of a common / shared registration country code and card country code, default is 0.01.
-    
+
     Returns
     -------
-    pandas.Series
-        A pandas series containing only the aligned country codes; registration, ip and card.
-    
+    pandas.DataFrame
+        A pandas dataframe containing only the aligned country codes; registration, ip and card.
+
     Examples
     --------
     ```
-    series = pd.Series({'registration_country_code_alpha': 353.0, 'ip_country_code_alpha': 42.0, 'card_country_code_alpha': 42.0})
-    align_country_codes(series=series, proba_comm_ip=0.05, proba_comm_card=0.01,)
+    data = pd.DataFrame({'registration_country_code_alpha': [353, 42], 'ip_country_code_alpha': [42.0, np.nan], 'card_country_code_alpha': [42.0, 42.0]})
+    align_country_codes(data=data, rng=np.random.default_rng(seed=42), proba_comm_ip=0.05, proba_comm_card=0.01,)
     ```
     """
-    # generate random value between 0 and 1
-    random_unif = random.uniform(0, 1)
-    # extract country codes from input series
-    registration_country_code = series["registration_country_code_alpha"]
-    ip_country_code = series["ip_country_code_alpha"]
-    card_country_code = series["card_country_code_alpha"]
+    # generate random values between 0 and 1 for each transaction
+    random_unif = rng.uniform(size=data.shape[0])
+    # extract country codes from input data
+    registration_country_code = data["registration_country_code_alpha"].to_numpy()
+    ip_country_code = data["ip_country_code_alpha"].to_numpy()
+    card_country_code = data["card_country_code_alpha"].to_numpy()
     # determine shared or new ip country code
-    if pd.notna(ip_country_code):
-        if random_unif <= proba_comm_ip:
-            new_ip_country_code = ip_country_code
-        else:
-            new_ip_country_code = registration_country_code
-    else:
-        new_ip_country_code = np.nan
+    new_ip_country_code = np.where(pd.notna(ip_country_code), np.where(random_unif <= proba_comm_ip, ip_country_code, registration_country_code), np.nan)
     # determine shared or new card country code
-    if pd.notna(card_country_code):
-        if random_unif <= proba_comm_card:
-            new_card_country_code = card_country_code
-        else:
-            new_card_country_code = registration_country_code
-    else:
-        new_card_country_code = np.nan
+    new_card_country_code = np.where(pd.notna(card_country_code), np.where(random_unif <= proba_comm_card, card_country_code, registration_country_code), np.nan)
     # return aligned codes
     align_code_dict = {
         "registration_country_code_alpha": registration_country_code,
         "ip_country_code_alpha": new_ip_country_code,
         "card_country_code_alpha": new_card_country_code,
     }
-    aligned_code_series = pd.Series(align_code_dict)
-    return aligned_code_series
+    aligned_code_data = pd.DataFrame(align_code_dict, index=data.index)
+    return aligned_code_data
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+
+from utilities.lean_beartype import lean_beartype
+
+@lean_beartype
+def align_idhash_country_codes(
+    data:pd.DataFrame,
+    idhash_col:str,
+    country_code_col:str,
+    ) -> np.ndarray:
+    """
+    Re-aligns the country codes of an entity idhash to the majority country code observed for that idhash; ties are resolved in favour of the highest country code.
+
+    Parameters
+    ----------
+    data : pandas.DataFrame
+        The random transaction data containing the idhash and country code columns.
+    idhash_col : str
+        The entity idhash column, e.g. ip_hash or card_hash.
+    country_code_col : str
+        The numeric country code column of the entity, e.g. ip_country_code_alpha or card_country_code_alpha.
+
+    Returns
+    -------
+    numpy.ndarray
+        The majority country code for the idhash of each transaction, or nan where either the idhash or all of its country codes are missing.
+
+    Examples
+    --------
+    ```
+    data = pd.DataFrame({'ip_hash': ['a', 'a', 'a', 'b'], 'ip_country_code_alpha': [42.0, 42.0, 353.0, np.nan]})
+    align_idhash_country_codes(data=data, idhash_col='ip_hash', country_code_col='ip_country_code_alpha')
+    ```
+    """
+    # factorize the idhashes and the non-null country codes
+    idhash_codes, idhash_uniques = pd.factorize(data[idhash_col])
+    country_codes = data[country_code_col].to_numpy(dtype=float)
+    valid_mask = (idhash_codes >= 0) & pd.notna(country_codes)
+    # count the occurrences of each idhash country code pair with a single groupby
+    idhash_country_code_cnts = pd.DataFrame({"idhash":idhash_codes[valid_mask], "country_code":country_codes[valid_mask]}).groupby(by=["idhash", "country_code"], sort=False).size().reset_index(name="size")
+    # keep the most common country code per idhash, breaking ties with the highest country code
+    idhash_majority = idhash_country_code_cnts.sort_values(by=["idhash", "size", "country_code"], ascending=[True, False, False]).drop_duplicates(subset=["idhash"], keep="first")
+    # map the majority country codes back onto every transaction, the trailing nan is taken by missing idhashes with code -1
+    idhash_majority_country_codes = np.full(shape=len(idhash_uniques) + 1, fill_value=np.nan)
+    idhash_majority_country_codes[idhash_majority["idhash"].to_numpy()] = idhash_majority["country_code"].to_numpy()
+    aligned_country_codes = idhash_majority_country_codes.take(idhash_codes)
+    return aligned_country_codes
@@ -0,0 +1,50 @@
+import numpy as np
+
+from utilities.lean_beartype import lean_beartype
+
+@lean_beartype
+def align_trans_dates(
+    registration_dates:np.ndarray,
+    transaction_dates:np.ndarray,
+    end_date:str,
+    rng:np.random.Generator,
+    ) -> np.ndarray:
+    """
+    Aligns transaction dates to be on or after their registration dates, redrawing each transaction date uniformly between the later of its registration and transaction date and the end date.
+
+    Parameters
+    ----------
+    registration_dates : numpy.ndarray
+        The datetime64 registration dates of each transaction.
+    transaction_dates : numpy.ndarray
+        The datetime64 transaction dates to align.
+    end_date : str
+        The end date ("%Y-%m-%d") of the transaction dates, exclusive of the redrawn dates unless a transaction already falls on the end date.
+    rng : numpy.random.Generator
+        The random number generator to draw from.
+
+    Returns
+    -------
+    numpy.ndarray
+        The aligned datetime64 transaction dates, with the same unit as the input transaction dates.
+
+    Examples
+    --------
+    ```
+    registration_dates = np.array(['2021-03-01', '2021-01-01'], dtype='datetime64[D]')
+    transaction_dates = np.array(['2021-01-15', '2021-02-01'], dtype='datetime64[D]')
+    align_trans_dates(registration_dates=registration_dates, transaction_dates=transaction_dates, end_date='2021-12-31', rng=np.random.default_rng(seed=42))
+    ```
+    """
+    # convert the dates to integer day offsets
+    registration_days = registration_dates.astype("datetime64[D]").astype(np.int64)
+    transaction_days = transaction_dates.astype("datetime64[D]").astype(np.int64)
+    end_days = np.datetime64(end_date, "D").astype(np.int64)
+    # the lower bound of each redrawn date is the later of the registration and transaction dates
+    lower_days = np.maximum(registration_days, transaction_days)
+    # draw a day offset uniformly from the lower bound until the end date, keeping transactions already on the end date
+    upper_days = np.maximum(end_days, lower_days + 1)
+    aligned_days = rng.integers(low=lower_days, high=upper_days)
+    # convert the day offsets back to dates of the input unit
+    aligned_dates = aligned_days.astype("datetime64[D]").astype(transaction_dates.dtype)
+    return aligned_dates
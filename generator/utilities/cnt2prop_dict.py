@@ -1,8 +1,9 @@
-from beartype import beartype
 import numpy as np
 from typing import Dict, Union
 
-@beartype
+from utilities.lean_beartype import lean_beartype
+
+@lean_beartype
 def cnt2prop_dict(
     idhashes_cnts_dict:Dict[Union[str, int], Union[int,np.int64]],
     ) -> Dict[Union[str, int], float]:
@@ -21,6 +21,20 @@ def commandline_interface() -> Dict[str, object]:
         Use a set random seed for reproducible results; must be either 0 or 1.
     n_itr : int
         Number of iterations to run.
+    n_shards : int
+        Number of shards to split a single dataset of n_users across.
+    stream_output : int
+        Stream the transaction data to date partitions on disk as each iteration or shard set completes; must be either 0 or 1.
+    trans_output_format : str
+        The file format of the transaction data output; must be either csv or parquet.
+    parquet_compression : str
+        The compression codec of the parquet transaction data output.
+    parquet_row_group_size : int
+        The maximum number of rows in each row group of the parquet transaction data output.
+    write_output : int
+        Write the user and transaction data output files to disk; must be either 0 or 1.
+    output_fdir : str
+        The directory to write the user and transaction data output files to.
     n_applications : int
         The number of applications to generate random telecom payments data for.
     registration_start_date : str
@@ -43,6 +57,13 @@ def commandline_interface() -> Dict[str, object]:
     parser.add_argument("--n_users", action="store", dest="n_users", type=int, default=cons.default_n_users, help="Integer, the number of users to generate random telecom payments data for",)
     parser.add_argument("--use_random_seed", action="store", dest="use_random_seed", type=int, default=cons.default_use_random_seed, choices=[0, 1], help="Integer, use a set random seed for reproducible results; must be either 0 or 1",)
     parser.add_argument("--n_itr", action="store", dest="n_itr", type=int, default=cons.default_n_itr, help="Integer, number of iterations to run",)
+    parser.add_argument("--n_shards", action="store", dest="n_shards", type=int, default=cons.default_n_shards, help="Integer, number of shards to split a single dataset of n_users across",)
+    parser.add_argument("--stream_output", action="store", dest="stream_output", type=int, default=cons.default_stream_output, choices=[0, 1], help="Integer, stream the transaction data to date partitions on disk as each iteration or shard set completes; must be either 0 or 1",)
+    parser.add_argument("--trans_output_format", action="store", dest="trans_output_format", type=str, default=cons.default_trans_output_format, choices=["csv", "parquet"], help="String, the file format of the transaction data output; must be either csv or parquet",)
+    parser.add_argument("--parquet_compression", action="store", dest="parquet_compression", type=str, default=cons.default_parquet_compression, choices=["none", "snappy", "gzip", "brotli", "lz4", "zstd"], help="String, the compression codec of the parquet transaction data output",)
+    parser.add_argument("--parquet_row_group_size", action="store", dest="parquet_row_group_size", type=int, default=cons.default_parquet_row_group_size, help="Integer, the maximum number of rows in each row group of the parquet transaction data output",)
+    parser.add_argument("--write_output", action="store", dest="write_output", type=int, default=cons.default_write_output, choices=[0, 1], help="Integer, write the user and transaction data output files to disk; must be either 0 or 1",)
+    parser.add_argument("--output_fdir", action="store", dest="output_fdir", type=str, default=cons.default_output_fdir, help="String, the directory to write the user and transaction data output files to",)
     parser.add_argument("--n_applications", action="store", dest="n_applications", type=int, default=cons.default_n_applications, help="Integer, the number of applications to generate random telecom payments data for",)
     parser.add_argument("--registration_start_date", action="store", dest="registration_start_date", type=str, default=cons.default_registration_start_date, help="String, the start date for registrations",)
     parser.add_argument("--registration_end_date", action="store", dest="registration_end_date", type=str, default=cons.default_registration_end_date, help="String, the end date for registrations",)
@@ -56,6 +77,13 @@ def commandline_interface() -> Dict[str, object]:
     input_params_dict["n_users"] = args.n_users
     input_params_dict["use_random_seed"] = args.use_random_seed
     input_params_dict["n_itr"] = args.n_itr
+    input_params_dict["n_shards"] = args.n_shards
+    input_params_dict["stream_output"] = args.stream_output
+    input_params_dict["trans_output_format"] = args.trans_output_format
+    input_params_dict["parquet_compression"] = args.parquet_compression
+    input_params_dict["parquet_row_group_size"] = args.parquet_row_group_size
+    input_params_dict["write_output"] = args.write_output
+    input_params_dict["output_fdir"] = args.output_fdir
     input_params_dict["n_applications"] = args.n_applications
     input_params_dict["registration_start_date"] = args.registration_start_date
     input_params_dict["registration_end_date"] = args.registration_end_date
@@ -0,0 +1,44 @@
+import cons
+from utilities.RefDataRegistry import ref_data_registry
+from utilities.lean_beartype import lean_beartype
+
+import numpy as np
+
+@lean_beartype
+def gen_country_codes(
+    size:int,
+    rng:np.random.Generator,
+    fpath_countries_europe:str=cons.fpath_countries_europe,
+    ) -> np.ndarray:
+    """
+    Generates an array of randomly sampled country codes, aligned by position with an array of idhashes of the given size.
+    
+    Parameters
+    ----------
+    size : int
+        The number of country codes to generate.
+    rng : numpy.random.Generator
+        The random number generator to draw from.
+    fpath_countries_europe : str
+        The file path to the european countries reference file, default is cons.fpath_countries_europe.
+    
+    Returns
+    -------
+    numpy.ndarray
+        An array of ISO numeric country codes.
+    
+    Examples
+    --------
+    ```
+    import cons
+    gen_country_codes(size=3,
+        rng=np.random.default_rng(seed=42),
+        fpath_countries_europe=cons.fpath_countries_europe,
+        )
+    ```
+    """
+    # get the cached sampler of european country codes by population proportions, the registry checks the file path exists
+    country_code_sampler = ref_data_registry.country_population_sampler(fpath_countries_europe=fpath_countries_europe)
+    # randomly generate country codes based on population proportions
+    country_codes = country_code_sampler.sample(rng=rng, size=size)
+    return country_codes
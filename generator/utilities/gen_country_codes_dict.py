@@ -1,63 +1,46 @@
 import cons
-from utilities.cnt2prop_dict import cnt2prop_dict
+from utilities.gen_country_codes import gen_country_codes
+from utilities.lean_beartype import lean_beartype
 
-import os
 import numpy as np
-import pandas as pd
-from beartype import beartype
-from typing import Dict, Union, List
+from typing import Dict, Union
 
-@beartype
+@lean_beartype
 def gen_country_codes_dict(
-    idhashes:List[str],
+    idhashes:np.ndarray,
+    rng:np.random.Generator,
     fpath_countries_europe:str=cons.fpath_countries_europe,
-    ) -> Dict[str, Union[int, np.int64]]:
+    ) -> Dict[int, Union[int, np.int64]]:
     """
     Generates a dictionary of randomLy sampled country codes for an input list of idhashes.
     
     Parameters
     ----------
-    idhashes : List[str]
-        A list of idhashes.
+    idhashes : numpy.ndarray
+        An array of idhash codes.
+    rng : numpy.random.Generator
+        The random number generator to draw from.
     fpath_countries_europe : str
         The file path to the european countries reference file, default is cons.fpath_countries_europe.
     
     Returns
     -------
-    Dict[str, Union[int, np.int64]]
+    Dict[int, Union[int, np.int64]]
         A dictionary of idhashes country codes.
     
     Examples
     --------
     ```
     import cons
-    idhashes_cnts_dict:{'abcd1234': 5, 'defg4567': 3, 'ghij7891': 7}
-    gen_country_codes_dict(idhashes_cnts_dict=idhashes_cnts_dict,
+    idhashes = np.array([3326615498294007818, 13295658390123716483, 12686328367587026978], dtype=np.uint64)
+    gen_country_codes_dict(idhashes=idhashes,
+        rng=np.random.default_rng(seed=42),
         fpath_countries_europe=cons.fpath_countries_europe,
         )
     ```
     """
-    # check file path exists
-    if os.path.exists(fpath_countries_europe) == False:
-        raise FileNotFoundError(f"File not found: {fpath_countries_europe}")
-    # load population data of european countries
-    european_populations_cnt_data = pd.read_csv(filepath_or_buffer=fpath_countries_europe, usecols=["ISO numeric", "population"],)
-    # convert to a dictionary of ISO country codes with population counts
-    european_populations_cnt_dict = european_populations_cnt_data.set_index("ISO numeric")["population"].to_dict()
-    # convert dictionary of population counts to dictionary of population proportions
-    european_populations_props_dict = cnt2prop_dict(european_populations_cnt_dict)
-    # check population proportions sum to 1.0
-    if np.isclose(sum(european_populations_props_dict.values()), 1.0) == False:
-        raise ValueError("Population proportions do not sum to 1.0")
     # randomly generate country codes for all idhashes based on population proportions
-    country_codes_list = list(
-        np.random.choice(
-            a=list(european_populations_props_dict.keys()),
-            p=list(european_populations_props_dict.values()),
-            replace=True,
-            size=len(idhashes),
-        )
-    )
+    country_codes_list = gen_country_codes(size=len(idhashes), rng=rng, fpath_countries_europe=fpath_countries_europe).tolist()
     # return a dictionary of idhashes and country codes
-    idhashes_country_codes = dict(zip(idhashes, country_codes_list))
+    idhashes_country_codes = dict(zip(idhashes.tolist(), country_codes_list))
     return idhashes_country_codes
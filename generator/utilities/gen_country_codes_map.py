@@ -1,11 +1,11 @@
 import cons
+from utilities.RefDataRegistry import ref_data_registry
+from utilities.lean_beartype import lean_beartype
 
 import numpy as np
-import pandas as pd
-from beartype import beartype
 from typing import Dict, Union
 
-@beartype
+@lean_beartype
 def gen_country_codes_map(
     fpath_countries_europe:str=cons.fpath_countries_europe,
     ) -> Dict[int, Union[str, np.int64]]:
@@ -29,8 +29,6 @@ def gen_country_codes_map(
     gen_country_codes_map(fpath_countries_europe=cons.fpath_countries_europe)
     ```
     """
-    # load european county codes data
-    country_codes_data = pd.read_csv(filepath_or_buffer=fpath_countries_europe, usecols=["ISO numeric", "ISO alpha 2"],)
-    # convert data to a dictionary of ISO numeric codes mapping to ISO alpha codes
-    country_codes_map = country_codes_data.set_index("ISO numeric")["ISO alpha 2"].to_dict()
+    # get the cached dictionary of ISO numeric codes mapping to ISO alpha codes
+    country_codes_map = ref_data_registry.country_codes_map(fpath_countries_europe=fpath_countries_europe)
     return country_codes_map
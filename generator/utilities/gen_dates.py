@@ -0,0 +1,42 @@
+import numpy as np
+
+from utilities.lean_beartype import lean_beartype
+
+@lean_beartype
+def gen_dates(
+    size:int,
+    start_date:str,
+    end_date:str,
+    rng:np.random.Generator,
+    ) -> np.ndarray:
+    """
+    Generates an array of random dates between a start and end date, inclusive of both.
+
+    Parameters
+    ----------
+    size : int
+        The number of random dates to generate.
+    start_date : str
+        The start date ("%Y-%m-%d") to generate random dates from.
+    end_date : str
+        The end date ("%Y-%m-%d") to generate random dates till.
+    rng : numpy.random.Generator
+        The random number generator to draw from.
+
+    Returns
+    -------
+    numpy.ndarray
+        An array of datetime64[D] random dates.
+    
+    Examples
+    --------
+    ```
+    gen_dates(size=3, start_date='2020-01-01', end_date='2023-01-01', rng=np.random.default_rng(seed=42))
+    ```
+    """
+    # convert the start and end dates to integer day offsets
+    start_days = np.datetime64(start_date, "D").astype(np.int64)
+    end_days = np.datetime64(end_date, "D").astype(np.int64)
+    # randomly sample a day offset for each date and convert back to dates
+    dates = (start_days + rng.integers(low=0, high=end_days - start_days + 1, size=size)).astype("datetime64[D]")
+    return dates
@@ -1,19 +1,22 @@
 from utilities.gen_random_hash import gen_random_hash
 from utilities.gen_random_id import gen_random_id
 from utilities.gen_random_poisson_power import gen_random_poisson_power
+from utilities.lean_beartype import lean_beartype
 
 import numpy as np
-from beartype import beartype
 from typing import Union, Dict
 
-@beartype
+@lean_beartype
 def gen_idhash_cnt_dict(
     idhash_type:str,
     n:Union[int,np.int64],
     lam:Union[int,float],
+    rng:np.random.Generator,
     nbytes:int=16,
     power:int=2,
-    ) -> Dict[str, Union[str, int, np.int64]]:
+    offset:Union[int,np.int64]=0,
+    key:Union[int,None]=None,
+    ) -> Dict[int, Union[int, np.int64]]:
     """
     Generates a dictionary of n random idhashes and associated counts.
     
@@ -25,15 +28,21 @@ def gen_idhash_cnt_dict(
         The total number of idhash values to generate.
     lam : float
         The lambda value to sample n poisson count values with.
+    rng : numpy.random.Generator
+        The random number generator to draw from.
     nbytes : int
         The number bytes to include in the idhash value, default is 16.
     power : int
         The power of the polynomial random poisson variable, default is 2.
+    offset : int
+        The start of the counter range the idhash codes are permuted from, default is 0.
+    key : int
+        The key of the idhash permutation, default is None which draws a random key.
     
     Returns
     -------
-    Dict[str, Union[str, int, np.int64]]
-        A dictionary of idhashes counts.
+    Dict[int, Union[int, np.int64]]
+        A dictionary of integer idhash codes and counts.
     
     Examples
     --------
@@ -43,6 +52,7 @@ def gen_idhash_cnt_dict(
         idhash_type="hash",
         n=10,
         lam=5.0,
+        rng=np.random.default_rng(seed=42),
         nbytes=16,
         power=2,
         )
@@ -50,16 +60,14 @@ def gen_idhash_cnt_dict(
     """
     # if generating a random hash value
     if idhash_type == "hash":
-        idhash_list = gen_random_hash(size=n, nbytes=nbytes)
+        idhash_codes = gen_random_hash(size=n, rng=rng, nbytes=nbytes, offset=offset, key=key)
     # else if generating a random id value
     elif idhash_type == "id":
-        idhash_list = gen_random_id(size=n, nbytes=nbytes)
+        idhash_codes = gen_random_id(size=n, rng=rng, nbytes=nbytes, offset=offset, key=key)
     else:
         raise ValueError("idhash_type must be either 'id' or 'hash'")
     # randomly sample n counts from a squared poisson distribution with given lam value
-    cnts_list = gen_random_poisson_power(lam=lam, size=n, power=power).tolist()
-    # return a dictionary of idhashes and counts
-    if len(idhash_list) != len(set(idhash_list)):
-        raise ValueError("Generated idhash values are not unique, please increase nbytes value")
-    idhash_dict = dict(zip(idhash_list, cnts_list))
+    cnts_list = gen_random_poisson_power(lam=lam, size=n, power=power, rng=rng).tolist()
+    # return a dictionary of idhashes and counts, the idhash codes are unique by construction
+    idhash_dict = dict(zip(idhash_codes.tolist(), cnts_list))
     return idhash_dict
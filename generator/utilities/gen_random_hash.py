@@ -1,36 +1,56 @@
-import string
 import numpy as np
-from beartype import beartype
-from typing import Union, List
+from typing import Union
 
-@beartype
+from utilities.permute_bits import permute_bits
+from utilities.lean_beartype import lean_beartype
+
+@lean_beartype
 def gen_random_hash(
     size:Union[int,np.int64],
+    rng:np.random.Generator,
     nbytes:int=16,
-    ) -> List[str]:
+    offset:Union[int,np.int64]=0,
+    key:Union[int,None]=None,
+    ) -> np.ndarray:
     """
-    Generates a list of random hashes.
+    Generates an array of unique random hash codes.
+    
+    The hash codes are integers rendered as nbytes hexadecimal characters at output time, see utilities.render_idhashes.
+    They are a keyed permutation of the counter range [offset, offset + size), and so are unique by construction for a given key.
     
     Parameters
     ----------
     size : int
         The total number of hashes to generate.
+    rng : numpy.random.Generator
+        The random number generator to draw from.
     nbytes : int
-        The number of alphanumeric values in each hash, default is 16.
+        The number of hexadecimal values in each hash, between 1 and 16, default is 16.
+    offset : int
+        The start of the counter range to permute, default is 0.
+    key : int
+        The key of the permutation, default is None which draws a random key.
     
     Returns
     -------
-    list
-        A list of random hashes.
+    numpy.ndarray
+        An array of random uint64 hash codes.
     
     Examples
     --------
     ```
-    gen_random_hash(size=5, nbytes=16)
+    gen_random_hash(size=5, rng=np.random.default_rng(seed=42), nbytes=16)
     ```
     """
-    # generate a list of digits and lower case letters from string library
-    alphanumeric = list(string.digits) + list(string.ascii_lowercase)[:6]
-    # randomly sample nbytes digits, string concatenate and convert to integers
-    random_hashes = [''.join(row) for row in np.random.choice(a=alphanumeric, size=(size, nbytes), replace=True).tolist()]
+    if not 1 <= nbytes <= 16:
+        raise ValueError(f"Invalid nbytes value {nbytes}; must be between 1 and 16.")
+    n_bits = 4 * nbytes
+    if offset + size > 2 ** n_bits:
+        raise ValueError(f"Cannot generate {size} unique hashes with {nbytes} hexadecimal values from offset {offset}.")
+    # randomly draw the permutation key
+    if key is None:
+        key = int(rng.integers(low=0, high=2 ** 64, dtype=np.uint64))
+    # permute the counter range to give unique random hash codes
+    counters = np.arange(offset, offset + size, dtype=np.uint64)
+    random_hashes = permute_bits(values=counters, n_bits=n_bits, key=key)
     return random_hashes
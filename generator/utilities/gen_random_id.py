@@ -1,36 +1,61 @@
-import string
 import numpy as np
-from beartype import beartype
-from typing import Union, List
+from typing import Union
 
-@beartype
+from utilities.permute_bits import permute_bits
+from utilities.lean_beartype import lean_beartype
+
+@lean_beartype
 def gen_random_id(
     size:Union[int,np.int64],
+    rng:np.random.Generator,
     nbytes:int=16,
-    ) -> List[str]:
+    offset:Union[int,np.int64]=0,
+    key:Union[int,None]=None,
+    ) -> np.ndarray:
     """
-    Generates a list of random ids.
+    Generates an array of unique random id codes.
+    
+    The id codes are integers below 10**nbytes rendered as nbytes decimal digits at output time, see utilities.render_idhashes.
+    They are a keyed permutation of the counter range [offset, offset + size) which cycle walks out of range values back into [0, 10**nbytes), and so are unique by construction for a given key.
     
     Parameters
     ----------
     size : int
         The total number of ids to generate.
+    rng : numpy.random.Generator
+        The random number generator to draw from.
     nbytes : int
-        The number of numeric values in each id, default is 16.
+        The number of numeric values in each id, between 2 and 19, default is 16.
+    offset : int
+        The start of the counter range to permute, default is 0.
+    key : int
+        The key of the permutation, default is None which draws a random key.
     
     Returns
     -------
-    list
-        A list of random ids.
+    numpy.ndarray
+        An array of random uint64 id codes.
     
     Examples
     --------
     ```
-    gen_random_id(size=5, nbytes=16)
+    gen_random_id(size=5, rng=np.random.default_rng(seed=42), nbytes=16)
     ```
     """
-    # generate a list of digits from string library
-    digits = list(string.digits)
-    # randomly sample nbytes digits, string concatenate
-    random_ids = ["".join(row) for row in np.random.choice(a=digits, size=(size, nbytes), replace=True).tolist()]
+    if not 2 <= nbytes <= 19:
+        raise ValueError(f"Invalid nbytes value {nbytes}; must be between 2 and 19.")
+    n_ids = 10 ** nbytes
+    if offset + size > n_ids:
+        raise ValueError(f"Cannot generate {size} unique ids with {nbytes} numeric values from offset {offset}.")
+    n_bits = (n_ids - 1).bit_length()
+    # randomly draw the permutation key
+    if key is None:
+        key = int(rng.integers(low=0, high=2 ** 64, dtype=np.uint64))
+    # permute the counter range and cycle walk any ids outside of the nbytes digit range
+    counters = np.arange(offset, offset + size, dtype=np.uint64)
+    random_ids = permute_bits(values=counters, n_bits=n_bits, key=key)
+    out_of_range_mask = random_ids >= np.uint64(n_ids)
+    while out_of_range_mask.any():
+        random_ids[out_of_range_mask] = permute_bits(values=random_ids[out_of_range_mask], n_bits=n_bits, key=key)
+        out_of_range_mask = random_ids >= np.uint64(n_ids)
     return random_ids
@@ -1,12 +1,14 @@
 import numpy as np
-from beartype import beartype
 from typing import Union
 
-@beartype
+from utilities.lean_beartype import lean_beartype
+
+@lean_beartype
 def gen_random_poisson_power(
     lam:Union[int,float],
     size:Union[int,np.int64],
     power:int,
+    rng:np.random.Generator,
     ) -> np.ndarray:
     """
     Generates data from a polynomial random poisson variable to a given power.
@@ -19,6 +21,8 @@ def gen_random_poisson_power(
         The number of values to generate.
     power : int
         The power of the polynomial sum.
+    rng : numpy.random.Generator
+        The random number generator to draw from.
     
     Returns
     -------
@@ -28,9 +32,9 @@ def gen_random_poisson_power(
     Examples
     --------
     ```
-    gen_random_poisson_power(lam=3.0, size=10, power=2)
+    gen_random_poisson_power(lam=3.0, size=10, power=2, rng=np.random.default_rng(seed=42))
     ```
     """
     # randomly generate a square poisson distribution
-    a = np.array([np.random.poisson(lam, size) ** p for p in range(1, power+1)]).sum(axis = 0) + 1
+    a = np.array([rng.poisson(lam, size) ** p for p in range(1, power+1)]).sum(axis = 0) + 1
     return a
@@ -1,55 +1,56 @@
 import numpy as np
-import pandas as pd
-from beartype import beartype
-from typing import Dict, Union, List
 
-@beartype
+from utilities.CategoricalSampler import CategoricalSampler
+from utilities.lean_beartype import lean_beartype
+
+@lean_beartype
 def gen_shared_idhashes(
-    idhashes:List[str],
+    idhashes:np.ndarray,
     prop_shared_idhashes:float,
-    ) -> Dict[str, str]:
+    rng:np.random.Generator,
+    ) -> np.ndarray:
     """
-    Generates a dictionary of shared idhashes proportions
+    Generates the shared idhash positions of an array of idhashes, by grouping a random proportion of the idhashes into networks and mapping each grouped idhash onto a random member of its network.
     
     Parameters
     ----------
-    idhashes : list of str
-        A list of idhashes.
+    idhashes : numpy.ndarray
+        An array of idhash codes.
     prop_shared_idhashes : float
         The total proportion of shared idhashes.
+    rng : numpy.random.Generator
+        The random number generator to draw from.
     
     Returns
     -------
-    Dict[str, str]
-        A dictionary  idhashes and their shared idhashes.
+    numpy.ndarray
+        The position of each idhash's shared idhash within the idhashes, aligned to the idhashes; unshared idhashes keep their own position, so idhashes[shared_idhash_positions] gives the shared idhash codes.
     
     Examples
     --------
     ```
-    idhashes=['2e23f63807f6170a', 'b8816ed926bf9f83', 'b010fdb44fa68822']
-    gen_shared_idhashes(idhashes=idhashes, prop_shared_idhashes=0.01)
+    idhashes = np.array([3326615498294007818, 13295658390123716483, 12686328367587026978], dtype=np.uint64)
+    gen_shared_idhashes(idhashes=idhashes, prop_shared_idhashes=0.01, rng=np.random.default_rng(seed=42))
     ```
     """
-    # calculate the total number of idhashes
+    # calculate the total number of idhashes, every idhash starts out mapped onto itself
     n_idhashes = len(idhashes)
-    # randomly sample the idhashes based on the total proportion of shared idhashes
-    shared_idhashes_list = np.random.choice(
-        a=idhashes,
-        size=int(np.round(n_idhashes * prop_shared_idhashes)),
-        replace=False
-    ).tolist()
-    shared_idhash_map_dict = {}
-    if (shared_idhashes_list != []):
-        # determine how many networks
-        n_groups = int(np.ceil(np.sqrt(len(shared_idhashes_list))))
-        group_uniform_dict = {g:np.random.uniform() for g in range(n_groups)}
-        group_prop_dict = {key:value/sum(group_uniform_dict.values()) for key, value in group_uniform_dict.items()}
-        # generate groups for all shared id hashes
-        shared_idhashes_groups_list = list(np.random.choice(a=list(group_prop_dict.keys()), size=len(shared_idhashes_list), replace=True, p=list(group_prop_dict.values())))
-        shared_idhashes_groups_dict = dict(zip(shared_idhashes_list, shared_idhashes_groups_list))
-        shared_idhashes_groups_df = pd.Series(shared_idhashes_groups_dict, name="shared_idhashes_group").to_frame().reset_index().rename(columns={'index':'idhash'})
-        shared_entity_groups_dict = shared_idhashes_groups_df.groupby('shared_idhashes_group').agg({'idhash':list}).to_dict()['idhash']
-        shared_idhashes_groups_df['shared_idhash'] = [np.random.choice(shared_entity_groups_dict[group]) for group in shared_idhashes_groups_df['shared_idhashes_group']]
-        # create the shared idhash map dictionary
-        shared_idhash_map_dict = shared_idhashes_groups_df.set_index('idhash')['shared_idhash'].to_dict()
-    return shared_idhash_map_dict
+    shared_idhash_positions = np.arange(n_idhashes, dtype=np.int64)
+    # randomly sample the positions of the idhashes to share based on the total proportion of shared idhashes
+    shared_positions = rng.choice(a=n_idhashes, size=int(np.round(n_idhashes * prop_shared_idhashes)), replace=False)
+    n_shared = shared_positions.shape[0]
+    if (n_shared > 0):
+        # determine how many networks and randomly weight each network
+        n_groups = int(np.ceil(np.sqrt(n_shared)))
+        group_uniforms = rng.uniform(size=n_groups)
+        group_sampler = CategoricalSampler(categories=np.arange(n_groups), probs=group_uniforms / group_uniforms.sum())
+        # generate groups for all shared idhashes
+        shared_groups = group_sampler.sample(rng=rng, size=n_shared)
+        # order the shared positions by group, keeping the sampled order within each group, and find the start and size of each group
+        group_members = shared_positions[np.argsort(shared_groups, kind="stable")]
+        group_sizes = np.bincount(shared_groups, minlength=n_groups)
+        group_starts = np.cumsum(group_sizes) - group_sizes
+        # map each shared idhash onto a random member of its group
+        member_offsets = rng.integers(low=0, high=group_sizes[shared_groups])
+        shared_idhash_positions[shared_positions] = group_members[group_starts[shared_groups] + member_offsets]
+    return shared_idhash_positions
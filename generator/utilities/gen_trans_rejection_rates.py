@@ -1,19 +1,24 @@
 import cons
+from utilities.RefDataRegistry import ref_data_registry
+from utilities.lean_beartype import lean_beartype
 
+import numpy as np
 import pandas as pd
-from beartype import beartype
-from typing import Dict
+from typing import Dict, Tuple
 
-@beartype
+@lean_beartype
 def gen_trans_rejection_rates(
     trans_data:pd.DataFrame,
     fpath_countries_europe:str=cons.fpath_countries_europe,
     fpath_countrycrimeindex:str=cons.fpath_countrycrimeindex,
     fpath_email_domain:str=cons.fpath_email_domain,
-    ) -> Dict[str, Dict[str, float]]:
+    ) -> Dict[str, Tuple[pd.Index, np.ndarray]]:
     """
     Generates the transaction rejection rates based on features within the transaction level telecom payments data.
     
+    Each set of rejection rates is returned as an index of the unique keys, e.g. the country codes, entity hashes or userids, together with a dense float array of their rates aligned to the index, so that the rates of each transaction can be gathered by position.
+    The shared entity and per user count rates are derived from a single set of unique user and entity pairs, computed from the factorized userids and entity hashes of the transactions.
+    
     Parameters
     ----------
     trans_data : pandas.DataFrame
@@ -27,46 +32,41 @@ def gen_trans_rejection_rates(
     
     Returns
     -------
-    dict
-        The rejection rates based on features within the transaction level telecom payments data.
+    Dict[str, Tuple[pandas.Index, numpy.ndarray]]
+        The unique keys and aligned rejection rates of each rejection rule based on features within the transaction level telecom payments data.
+    
+    Examples
+    --------
+    ```
+    rejection_rates = gen_trans_rejection_rates(trans_data=trans_data)
+    device_hashes, shared_devices_reject_rates = rejection_rates["shared_devices_reject_rates"]
+    ```
     """
     # initialize dictionary to store all computed rejection rates
-    rejection_rates_dict = {}
+    rejection_rates = {}
     
     # generate country code rejection based rates
-    countrieseurope = pd.read_csv(fpath_countries_europe, usecols=["ISO alpha 2"])
-    countrycrimeindex = pd.read_csv(fpath_countrycrimeindex, usecols=["country_code", "crime_index"])
-    europecountrycrimeindex = pd.merge(left=countrieseurope, right=countrycrimeindex, left_on="ISO alpha 2", right_on="country_code", how="left",)
-    europecountrycrimeindex["trans_reject_rate"] = europecountrycrimeindex["crime_index"].divide(europecountrycrimeindex["crime_index"].sum())
-    country_code_trans_reject_rate_dict = europecountrycrimeindex.set_index("ISO alpha 2")["trans_reject_rate"].to_dict()
-    rejection_rates_dict["country_code_trans_reject_rate_dict"] = country_code_trans_reject_rate_dict
+    country_code_trans_reject_rate_dict = ref_data_registry.country_code_reject_rates(fpath_countries_europe=fpath_countries_europe, fpath_countrycrimeindex=fpath_countrycrimeindex)
+    rejection_rates["country_code_trans_reject_rates"] = (pd.Index(list(country_code_trans_reject_rate_dict.keys())), np.array(list(country_code_trans_reject_rate_dict.values()), dtype=np.float64))
     
     # generate domain email rejection based rates
-    domain_email = pd.read_csv(fpath_email_domain, usecols=["domain", "proportion"])
-    domain_email["trans_reject_rate"] = (1 - domain_email["proportion"]) / (1 - domain_email["proportion"]).sum()
-    domain_email_trans_reject_rate_dict = domain_email.set_index("domain")["trans_reject_rate"].to_dict()
-    rejection_rates_dict["domain_email_trans_reject_rate_dict"] = domain_email_trans_reject_rate_dict
-    
-    # generate shared entities with rejection rates dictionary
-    shared_devices = (trans_data.groupby(by="device_hash").agg({"userid": "nunique"}).sort_values(by="userid"))
-    shared_ips = (trans_data.groupby(by="ip_hash").agg({"userid": "nunique"}).sort_values(by="userid"))
-    shared_cards = (trans_data.groupby(by="card_hash").agg({"userid": "nunique"}).sort_values(by="userid"))
-    shared_devices_reject_rate_dict = shared_devices.divide(shared_devices["userid"].sum())["userid"].to_dict()
-    shared_ips_reject_rate_dict = shared_ips.divide(shared_ips["userid"].sum()).to_dict()["userid"]
-    shared_cards_reject_rate_dict = shared_cards.divide(shared_cards["userid"].sum()).to_dict()["userid"]
-    rejection_rates_dict["shared_devices_reject_rate_dict"] = shared_devices_reject_rate_dict
-    rejection_rates_dict["shared_ips_reject_rate_dict"] = shared_ips_reject_rate_dict
-    rejection_rates_dict["shared_cards_reject_rate_dict"] = shared_cards_reject_rate_dict
+    domain_email_trans_reject_rate_dict = ref_data_registry.email_domain_reject_rates(fpath_email_domain=fpath_email_domain)
+    rejection_rates["domain_email_trans_reject_rates"] = (pd.Index(list(domain_email_trans_reject_rate_dict.keys())), np.array(list(domain_email_trans_reject_rate_dict.values()), dtype=np.float64))
     
-    # generate occurrence based rejection rates
-    count_devices = (trans_data.groupby(by="userid").agg({"device_hash": "nunique"}).sort_values(by="device_hash"))
-    count_ips = (trans_data.groupby(by="userid").agg({"ip_hash": "nunique"}).sort_values(by="ip_hash"))
-    count_cards = (trans_data.groupby(by="userid").agg({"card_hash": "nunique"}).sort_values(by="card_hash"))
-    count_devices_reject_rate_dict = count_devices.divide(count_devices["device_hash"].sum())["device_hash"].to_dict()
-    count_ips_reject_rate_dict = count_ips.divide(count_ips["ip_hash"].sum()).to_dict()["ip_hash"]
-    count_cards_reject_rate_dict = count_cards.divide(count_cards["card_hash"].sum()).to_dict()["card_hash"]
-    rejection_rates_dict["count_devices_reject_rate_dict"] = count_devices_reject_rate_dict
-    rejection_rates_dict["count_ips_reject_rate_dict"] = count_ips_reject_rate_dict
-    rejection_rates_dict["count_cards_reject_rate_dict"] = count_cards_reject_rate_dict
+    # factorize the userids once, every user is counted even if they have no non-null entities
+    user_codes, userids = pd.factorize(trans_data["userid"])
+    n_users = userids.shape[0]
+    for entity, idhash_col in [("devices", "device_hash"), ("ips", "ip_hash"), ("cards", "card_hash")]:
+        # factorize the entity hashes, null hashes are given -1 and are dropped
+        entity_codes, entity_hashes = pd.factorize(trans_data[idhash_col])
+        notnull_mask = entity_codes >= 0
+        # find the unique user and entity pairs as single integer keys
+        pair_keys = pd.unique(entity_codes[notnull_mask].astype(np.int64) * n_users + user_codes[notnull_mask])
+        # count the unique users of each entity and the unique entities of each user from the same pairs
+        shared_entity_cnts = np.bincount(pair_keys // n_users, minlength=entity_hashes.shape[0])
+        user_entity_cnts = np.bincount(pair_keys % n_users, minlength=n_users)
+        # generate shared entities and occurrence based rejection rates
+        rejection_rates[f"shared_{entity}_reject_rates"] = (entity_hashes, shared_entity_cnts / shared_entity_cnts.sum())
+        rejection_rates[f"count_{entity}_reject_rates"] = (userids, user_entity_cnts / user_entity_cnts.sum())
     
-    return rejection_rates_dict
+    return rejection_rates
@@ -1,69 +1,121 @@
 import cons
+from utilities.CategoricalSampler import CategoricalSampler
+from utilities.lean_beartype import lean_beartype
 
-import random
 import numpy as np
 import pandas as pd
-from beartype import beartype
-from typing import List, Dict, Union
+from typing import Dict, Tuple
 
-@beartype
+# the transaction status samplers of successful card and non-card transactions
+successful_status = {key:cons.data_model_transaction_status[key] for key in ["Successful", "Pending"]}
+successful_card_status_sampler = CategoricalSampler(categories=list(successful_status.keys()), probs=[value/sum(successful_status.values()) for value in successful_status.values()])
+non_card_status_sampler = CategoricalSampler(categories=["Successful", "Pending"], probs=[0.98, 0.02])
+# the error code samplers of each rejection family
+rejection_codes_samplers = {
+    "fraud":CategoricalSampler.from_dict(prop_dict=cons.data_model_rejection_codes_fraud),
+    "authentication":CategoricalSampler.from_dict(prop_dict=cons.data_model_rejection_codes_authentication),
+    "connection":CategoricalSampler.from_dict(prop_dict=cons.data_model_rejection_codes_connection),
+    "user":CategoricalSampler.from_dict(prop_dict=cons.data_model_rejection_codes_user),
+    "funds":CategoricalSampler.from_dict(prop_dict=cons.data_model_rejection_codes_funds),
+}
+
+@lean_beartype
 def gen_trans_status(
-    series:pd.Series,
-    rejection_rates_dict:Dict[str, Dict[str, float]],
+    trans_data:pd.DataFrame,
+    rejection_rates:Dict[str, Tuple[pd.Index, np.ndarray]],
+    rng:np.random.Generator,
     rejection_scaling_factor:int=2,
-    ) -> List[Union[str, float]]:
+    ) -> pd.DataFrame:
     """
-    Generates the transaction status for a pandas series from the transaction level telecom payments data given the rejection rates dictionary from the same data.
-    
+    Generates the transaction status and error codes for the transaction level telecom payments data given the rejection rates from the same data.
+
+    Each rejection rule is evaluated as a whole-array mask in the same order of precedence as the rules are listed below, where the first rule to trigger determines the rejection family.
+    The error codes are then drawn with one batched categorical sample per rejection family.
+
+    1. crime rates within a randomly chosen country code of the transaction (fraud)
+    2. email domain frequencies (authentication)
+    3. inconsistent country codes (connection)
+    4. shared devices, ips and cards (fraud)
+    5. per user counts of devices (user), ips (connection) and cards (funds)
+
     Parameters
     ----------
-    series : pandas.Series
-        A pandas series from the transaction level telecom payments data.
-    rejection_rates_dict : Dict[str, Dict[str, float]]
-        Rejection rates generated the transaction level telecom payments data.
+    trans_data : pandas.DataFrame
+        The transaction level telecom payments data.
+    rejection_rates : Dict[str, Tuple[pandas.Index, numpy.ndarray]]
+        The unique keys and aligned rejection rates generated from the transaction level telecom payments data, see gen_trans_rejection_rates.
+    rng : numpy.random.Generator
+        The random number generator to draw from.
     rejection_scaling_factor : int
         A multiplicative scaling factor for rejection rates, default is 2.
-    
+
     Returns
     -------
-    List[str]
-        The transaction status and error code.
+    pandas.DataFrame
+        The transaction status and error code for each transaction, aligned to the index of the transaction data.
+
+    Examples
+    --------
+    ```
+    from utilities.gen_trans_rejection_rates import gen_trans_rejection_rates
+    rejection_rates = gen_trans_rejection_rates(trans_data=trans_data)
+    gen_trans_status(trans_data=trans_data, rejection_rates=rejection_rates, rng=np.random.default_rng(seed=42))
+    ```
     """
+    n_trans = trans_data.shape[0]
     # set country code columns
     country_code_columns = ["registration_country_code","ip_country_code","card_country_code"]
-    # if card hash
-    if pd.notna(series['card_hash']):
-        status = "Rejected"
-        # add rejections based on crime rates within country codes
-        if rejection_rates_dict["country_code_trans_reject_rate_dict"][np.random.choice(a=series[country_code_columns].dropna().to_list(), size=1)[0]] >= random.uniform(0, 1)/rejection_scaling_factor:
-            error_code = np.random.choice(a=list(cons.data_model_rejection_codes_fraud.keys()),p=list(cons.data_model_rejection_codes_fraud.values()),size=1)[0]
-        # add rejections based on domain frequencies
-        elif rejection_rates_dict["domain_email_trans_reject_rate_dict"][series["email_domain"]] >= random.uniform(0, 1)/rejection_scaling_factor:
-            error_code = np.random.choice(a=list(cons.data_model_rejection_codes_authentication.keys()),p=list(cons.data_model_rejection_codes_authentication.values()),size=1)[0]
-        # add rejections based on inconsistent country codes
-        elif cons.data_model_inconsistent_country_codes_rejection_rate[series[country_code_columns].dropna().nunique()] >= random.uniform(0, 1)/rejection_scaling_factor:
-            error_code = np.random.choice(a=list(cons.data_model_rejection_codes_connection.keys()),p=list(cons.data_model_rejection_codes_connection.values()),size=1)[0]
-        # add rejections based on shared ips, cards and devices
-        elif pd.notna(series["device_hash"]) and rejection_rates_dict["shared_devices_reject_rate_dict"][series["device_hash"]] >= random.uniform(0, 1)/rejection_scaling_factor:
-            error_code = np.random.choice(a=list(cons.data_model_rejection_codes_fraud.keys()),p=list(cons.data_model_rejection_codes_fraud.values()),size=1)[0]
-        elif series["ip_hash"] == series["ip_hash"] and rejection_rates_dict["shared_ips_reject_rate_dict"][series["ip_hash"]] >= random.uniform(0, 1)/rejection_scaling_factor:
-            error_code = np.random.choice(a=list(cons.data_model_rejection_codes_fraud.keys()),p=list(cons.data_model_rejection_codes_fraud.values()),size=1)[0]
-        elif series["card_hash"] == series["card_hash"] and rejection_rates_dict["shared_cards_reject_rate_dict"][series["card_hash"]] >= random.uniform(0, 1)/rejection_scaling_factor:
-            error_code = np.random.choice(a=list(cons.data_model_rejection_codes_fraud.keys()),p=list(cons.data_model_rejection_codes_fraud.values()),size=1)[0]
-        # add rejections based on counts of devices, ips and cards
-        elif rejection_rates_dict["count_devices_reject_rate_dict"][series["userid"]] >= random.uniform(0, 1)/rejection_scaling_factor:
-            error_code = np.random.choice(a=list(cons.data_model_rejection_codes_user.keys()),p=list(cons.data_model_rejection_codes_user.values()),size=1)[0]
-        elif rejection_rates_dict["count_ips_reject_rate_dict"][series["userid"]] >= random.uniform(0, 1)/rejection_scaling_factor:
-            error_code = np.random.choice(a=list(cons.data_model_rejection_codes_connection.keys()),p=list(cons.data_model_rejection_codes_connection.values()),size=1)[0]
-        elif rejection_rates_dict["count_cards_reject_rate_dict"][series["userid"]] >= random.uniform(0, 1)/rejection_scaling_factor:
-            error_code = np.random.choice(a=list(cons.data_model_rejection_codes_funds.keys()),p=list(cons.data_model_rejection_codes_funds.values()),size=1)[0]
-        # otherwise return successful status
-        else:
-            successful_status = {key:cons.data_model_transaction_status[key] for key in ['Successful', 'Pending']}
-            successful_probs = [value/sum(successful_status.values()) for value in successful_status.values()]
-            status = np.random.choice(a=list(successful_status.keys()), size=1, p=successful_probs)[0]
-            error_code = np.nan
-    else:
-        status = np.random.choice(a=['Successful', 'Pending'], size=1, p=[0.98, 0.02])[0]
-        error_code = np.nan
-    return [status, error_code]
+    country_codes = trans_data[country_code_columns].to_numpy(dtype=object)
+    country_codes_notna = pd.notna(country_codes)
+    # randomly choose one of the non-null country codes for each transaction
+    n_country_codes = country_codes_notna.sum(axis=1)
+    country_code_rank = np.floor(rng.uniform(size=n_trans) * n_country_codes).astype(int)
+    country_code_column_idx = np.argmax((np.cumsum(country_codes_notna, axis=1) - 1 == country_code_rank[:, None]) & country_codes_notna, axis=1)
+    sampled_country_codes = pd.Series(country_codes[np.arange(n_trans), country_code_column_idx])
+    # count the number of unique non-null country codes for each transaction
+    n_unique_country_codes = np.zeros(shape=n_trans, dtype=int)
+    for col_idx in range(len(country_code_columns)):
+        unique_mask = country_codes_notna[:, col_idx].copy()
+        for prev_col_idx in range(col_idx):
+            unique_mask &= ~(country_codes_notna[:, prev_col_idx] & (country_codes[:, prev_col_idx] == country_codes[:, col_idx]))
+        n_unique_country_codes += unique_mask
+    # find the position of each transaction's keys within the unique keys of the rejection rates, the userid positions are shared by the per user count rates
+    key_positions = {}
+    for rates_name, key_values in [("country_code_trans_reject_rates", sampled_country_codes), ("domain_email_trans_reject_rates", trans_data["email_domain"]), ("shared_devices_reject_rates", trans_data["device_hash"]), ("shared_ips_reject_rates", trans_data["ip_hash"]), ("shared_cards_reject_rates", trans_data["card_hash"]), ("count_devices_reject_rates", trans_data["userid"])]:
+        key_positions[rates_name] = rejection_rates[rates_name][0].get_indexer(key_values)
+    for rates_name in ["count_ips_reject_rates", "count_cards_reject_rates"]:
+        key_positions[rates_name] = key_positions["count_devices_reject_rates"]
+    # gather the rejection rates of each rule by position, missing and unknown keys at position -1 gather the appended nan rate
+    gather_rates = lambda rates_name: np.append(rejection_rates[rates_name][1], np.nan)[key_positions[rates_name]]
+    # gather the rejection rates for each rule in order of precedence, along with the rejection family for each rule
+    inconsistent_country_codes_rates = np.array([cons.data_model_inconsistent_country_codes_rejection_rate.get(n_unique, np.nan) for n_unique in range(len(country_code_columns) + 1)], dtype=float)
+    rejection_rules = [
+        (gather_rates("country_code_trans_reject_rates"), "fraud"),
+        (gather_rates("domain_email_trans_reject_rates"), "authentication"),
+        (inconsistent_country_codes_rates[n_unique_country_codes], "connection"),
+        (gather_rates("shared_devices_reject_rates"), "fraud"),
+        (gather_rates("shared_ips_reject_rates"), "fraud"),
+        (gather_rates("shared_cards_reject_rates"), "fraud"),
+        (gather_rates("count_devices_reject_rates"), "user"),
+        (gather_rates("count_ips_reject_rates"), "connection"),
+        (gather_rates("count_cards_reject_rates"), "funds"),
+    ]
+    rule_rejection_rates = np.column_stack([rates for rates, _ in rejection_rules])
+    rejection_families = np.array([family for _, family in rejection_rules])
+    # evaluate every rule against an independent uniform draw, missing rates never trigger a rejection
+    rule_triggered = rule_rejection_rates >= rng.uniform(size=rule_rejection_rates.shape) / rejection_scaling_factor
+    card_mask = trans_data["card_hash"].notna().to_numpy()
+    rejected_mask = card_mask & rule_triggered.any(axis=1)
+    trans_rejection_families = rejection_families[np.argmax(rule_triggered, axis=1)]
+    # draw the transaction status for successful card and non-card transactions
+    trans_status = np.full(shape=n_trans, fill_value="Rejected", dtype=object)
+    trans_error_code = np.full(shape=n_trans, fill_value=np.nan, dtype=object)
+    successful_card_mask = card_mask & ~rejected_mask
+    trans_status[successful_card_mask] = successful_card_status_sampler.sample(rng=rng, size=successful_card_mask.sum())
+    trans_status[~card_mask] = non_card_status_sampler.sample(rng=rng, size=(~card_mask).sum())
+    # draw the error codes for rejected transactions with one batched sample per rejection family
+    for rejection_family, rejection_codes_sampler in rejection_codes_samplers.items():
+        family_mask = rejected_mask & (trans_rejection_families == rejection_family)
+        trans_error_code[family_mask] = rejection_codes_sampler.sample(rng=rng, size=family_mask.sum())
+    trans_status_data = pd.DataFrame({"transaction_status":trans_status, "transaction_error_code":trans_error_code}, index=trans_data.index)
+    return trans_status_data
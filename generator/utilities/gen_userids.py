@@ -0,0 +1,68 @@
+import numpy as np
+import pandas as pd
+import pyarrow as pa
+
+from utilities.lean_beartype import lean_beartype
+
+# the zero padded four digit strings of 0 to 9999, used to render four digits of a userid at a time
+four_digit_chars = np.array([f"{idx:04d}".encode() for idx in range(10000)], dtype="S4")
+# the 3 digit country codes 0 to 999 right padded with zeros, e.g. 8 becomes 800
+padded_country_codes = np.array([int(f"{idx:<03d}") for idx in range(1000)], dtype=np.int32)
+
+@lean_beartype
+def gen_userids(
+    registration_dates:np.ndarray,
+    country_codes:np.ndarray,
+    uids:np.ndarray,
+    ) -> pd.arrays.ArrowExtensionArray:
+    """
+    Generates the 16 digit userids of users, made up of the users' registration date as YYYYMMDD, the ISO numeric registration country code right padded with zeros to 3 digits, and the last 5 digits of the uid.
+
+    The userids are assembled from integer date digits, country codes and uid digits, and rendered as fixed width strings four digits at a time without formatting any python string objects.
+
+    Parameters
+    ----------
+    registration_dates : numpy.ndarray
+        The datetime64 registration dates of the users.
+    country_codes : numpy.ndarray
+        The ISO numeric registration country codes of the users, of at most 3 digits.
+    uids : numpy.ndarray
+        The integer uids of the users.
+
+    Returns
+    -------
+    pandas.arrays.ArrowExtensionArray
+        The arrow large string userids, aligned to the users.
+
+    Examples
+    --------
+    ```
+    registration_dates = np.array(['2020-01-01', '2021-12-31'], dtype='datetime64[D]')
+    gen_userids(registration_dates=registration_dates, country_codes=np.array([8, 826]), uids=np.array([1234567, 89], dtype=np.uint64))
+    ```
+    """
+    # convert the registration dates to days since the epoch, the year, month and day digits are then only derived once for each distinct day in the range of the dates
+    registration_days = registration_dates.astype("datetime64[D]").astype(np.int64)
+    first_day = registration_days.min() if registration_days.shape[0] > 0 else 0
+    range_days = np.arange(first_day, registration_days.max() + 1 if registration_days.shape[0] > 0 else 0, dtype=np.int64)
+    # split the days of the range into integer years, months and days by truncating the datetime64 days to years and months
+    range_dates = range_days.astype("datetime64[D]")
+    range_months = range_dates.astype("datetime64[M]")
+    years = range_dates.astype("datetime64[Y]").astype(np.int64) + 1970
+    months = (range_months - range_dates.astype("datetime64[Y]")).astype(np.int64) + 1
+    days = (range_dates - range_months).astype(np.int64) + 1
+    # right pad the country codes with zeros to 3 digits, e.g. 8 becomes 800, and take the last 5 digits of the uids
+    country_codes_padded = padded_country_codes[country_codes]
+    uid_digits = (uids.astype(np.uint64) % np.uint64(100000)).astype(np.int32)
+    # render the userids four digits at a time into a fixed width bytes buffer, gathering each group of four characters as a single 32 bit word
+    four_digit_words = four_digit_chars.view(np.uint32)
+    day_idx = registration_days - first_day
+    userid_words = np.empty(shape=(registration_days.shape[0], 4), dtype=np.uint32)
+    userid_words[:, 0] = four_digit_words[years][day_idx]
+    userid_words[:, 1] = four_digit_words[months * 100 + days][day_idx]
+    userid_words[:, 2] = four_digit_words[country_codes_padded * 10 + uid_digits // 10000]
+    userid_words[:, 3] = four_digit_words[uid_digits % 10000]
+    # wrap the fixed width bytes buffer as an arrow string array with evenly spaced offsets, without copying or validating each userid
+    userid_offsets = np.arange(0, 16 * (registration_days.shape[0] + 1), 16, dtype=np.int64)
+    userids = pa.LargeStringArray.from_buffers(registration_days.shape[0], pa.py_buffer(userid_offsets), pa.py_buffer(userid_words))
+    return pd.arrays.ArrowExtensionArray(userids)
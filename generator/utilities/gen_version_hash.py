@@ -0,0 +1,37 @@
+import os
+import hashlib
+from typing import List
+
+from utilities.lean_beartype import lean_beartype
+
+@lean_beartype
+def gen_version_hash(
+    fpaths:List[str],
+    ) -> str:
+    """
+    Generates a hash of the names and contents of a set of files, such as the generator code and reference data, which changes whenever any of the files change.
+    
+    Parameters
+    ----------
+    fpaths : List[str]
+        The file paths to hash, missing files are skipped.
+    
+    Returns
+    -------
+    str
+        The hexadecimal sha256 hash of the files.
+    
+    Examples
+    --------
+    ```
+    gen_version_hash(fpaths=['generator/cons.py', 'data/ref/smartphones.csv'])
+    ```
+    """
+    version_hash = hashlib.sha256()
+    # hash the files in a fixed order by file name, so the hash does not depend on the order or location of the file paths
+    for fpath in sorted(fpaths, key=lambda fpath: (os.path.basename(fpath), fpath)):
+        if os.path.isfile(fpath):
+            version_hash.update(os.path.basename(fpath).encode())
+            with open(fpath, "rb") as version_file:
+                version_hash.update(hashlib.sha256(version_file.read()).digest())
+    return version_hash.hexdigest()
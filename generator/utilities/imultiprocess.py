@@ -0,0 +1,66 @@
+import os
+from multiprocessing import Pool
+from typing import Any, Iterator, List, Tuple, Union
+
+from utilities.lean_beartype import lean_beartype
+
+def starcall(
+    func_args:Tuple[Any, tuple],
+    ) -> Any:
+    """
+    Calls a function with a tuple of positional arguments, the picklable equivalent of starmap for a single call.
+
+    Parameters
+    ----------
+    func_args : Tuple[Callable[..., Any], tuple]
+        The function and the tuple of positional arguments to call it with.
+
+    Returns
+    -------
+    Any
+        The output of the function call.
+    """
+    func, args = func_args
+    return func(*args)
+
+@lean_beartype
+def imultiprocess(
+    func,
+    args:List[tuple],
+    ncpu:Union[int, None]=None,
+    ordered:bool=False,
+    ) -> Iterator[Any]:
+    """
+    Lazily executes a function in parallel, yielding each output as soon as its call completes rather than waiting for all calls to finish.
+
+    Parameters
+    ----------
+    func : Callable[..., Any]
+        The function to be executed in parallel
+    args : List[tuple]
+        The input parameters as a list of tuples to be passed with the function in parallel.
+    ncpu : int
+        The number of cpus to execute across, default is None.
+    ordered : bool
+        Whether to yield the outputs in the order of the input parameters, each output then waits for the outputs of all earlier calls, default is False.
+
+    Returns
+    -------
+    Iterator[Any]
+        An iterator of the outputs of the func calls, in order of completion or in the order of the input parameters.
+
+    Examples
+    --------
+    ```
+    for result in imultiprocess(func=pow, args=[(2, 3), (3, 2)], ncpu=2):
+        print(result)
+    ```
+    """
+    # set number of cpus
+    if ncpu is None:
+        ncpu = os.cpu_count()
+    # initialize a pool of ncpus and yield outputs as they complete
+    with Pool(ncpu) as pool:
+        imap = pool.imap if ordered else pool.imap_unordered
+        for result in imap(starcall, [(func, func_args) for func_args in args]):
+            yield result
@@ -16,7 +16,7 @@ def input_error_handling(
     Examples
     --------
     ```
-    input_params_dict = {'n_users': 1000, 'use_random_seed': 1, 'n_itr': 10}
+    input_params_dict = {'n_users': 1000, 'use_random_seed': 1, 'n_itr': 10, 'n_shards': 1, 'stream_output': 0, 'trans_output_format': 'csv', 'parquet_compression': 'snappy', 'parquet_row_group_size': 1000000, 'write_output': 1, 'output_fdir': 'data'}
     input_error_handling(input_params_dict=input_params_dict)
     ```
     """
@@ -29,6 +29,33 @@ def input_error_handling(
     # check if the number of iterations is greater than or equal to 1
     if not ((input_params_dict["n_itr"] >= 1) and (isinstance(input_params_dict["n_itr"], int))):
         raise ValueError(f"Invalid n_itr parameter value {input_params_dict['n_itr']}; must be an integer >= 1.")
+    # check if the number of shards is between 1 and the number of users
+    if not ((1 <= input_params_dict["n_shards"] <= input_params_dict["n_users"]) and (isinstance(input_params_dict["n_shards"], int))):
+        raise ValueError(f"Invalid n_shards parameter value {input_params_dict['n_shards']}; must be an integer between 1 and n_users.")
+    # check that iterations and shards are not both requested
+    if (input_params_dict["n_itr"] > 1) and (input_params_dict["n_shards"] > 1):
+        raise ValueError(f"Invalid n_itr and n_shards parameter values {input_params_dict['n_itr']} and {input_params_dict['n_shards']}; only one of n_itr and n_shards can be greater than 1.")
+    # check if the stream output flag is either 0 or 1
+    if not ((input_params_dict["stream_output"] in (0, 1)) and (isinstance(input_params_dict["stream_output"], int))):
+        raise ValueError(f"Invalid stream_output value {input_params_dict['stream_output']}; must be either 0 or 1.")
+    # check if the transaction output format is either csv or parquet
+    if not (input_params_dict["trans_output_format"] in ("csv", "parquet")):
+        raise ValueError(f"Invalid trans_output_format value {input_params_dict['trans_output_format']}; must be either 'csv' or 'parquet'.")
+    # check if the parquet compression codec is supported
+    if not (input_params_dict["parquet_compression"] in ("none", "snappy", "gzip", "brotli", "lz4", "zstd")):
+        raise ValueError(f"Invalid parquet_compression value {input_params_dict['parquet_compression']}; must be one of 'none', 'snappy', 'gzip', 'brotli', 'lz4' or 'zstd'.")
+    # check if the parquet row group size is positive
+    if not ((input_params_dict["parquet_row_group_size"] >= 1) and (isinstance(input_params_dict["parquet_row_group_size"], int))):
+        raise ValueError(f"Invalid parquet_row_group_size parameter value {input_params_dict['parquet_row_group_size']}; must be an integer >= 1.")
+    # check if the write output flag is either 0 or 1
+    if not ((input_params_dict["write_output"] in (0, 1)) and (isinstance(input_params_dict["write_output"], int))):
+        raise ValueError(f"Invalid write_output value {input_params_dict['write_output']}; must be either 0 or 1.")
+    # check that streamed output is written to disk
+    if (input_params_dict["stream_output"] == 1) and (input_params_dict["write_output"] == 0):
+        raise ValueError(f"Invalid stream_output and write_output values {input_params_dict['stream_output']} and {input_params_dict['write_output']}; stream_output requires write_output to be 1.")
+    # check if the output directory is a non-empty string
+    if not ((isinstance(input_params_dict["output_fdir"], str)) and (len(input_params_dict["output_fdir"]) > 0)):
+        raise ValueError(f"Invalid output_fdir value {input_params_dict['output_fdir']}; must be a non-empty string.")
     # check if the number of applications is positive
     if not ((input_params_dict["n_applications"] >= 1) and (isinstance(input_params_dict["n_applications"], int))):
         raise ValueError(f"Invalid n_applications parameter value {input_params_dict['n_applications']}; must be a integer >= 1.")
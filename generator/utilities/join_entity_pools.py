@@ -0,0 +1,44 @@
+import pandas as pd
+from typing import Dict
+
+import cons
+from utilities.EntityPool import EntityPool
+from utilities.render_idhashes import render_idhashes
+from utilities.lean_beartype import lean_beartype
+
+@lean_beartype
+def join_entity_pools(
+    user_data:pd.DataFrame,
+    user_entity_pools:Dict[str, EntityPool],
+    ) -> pd.DataFrame:
+    """
+    Joins the per user entity pools to the user data as columns of rendered idhash lists, e.g. for writing the user level data to disk.
+    
+    Parameters
+    ----------
+    user_data : pd.DataFrame
+        The user level data, with rows aligned to the user positions of the entity pools.
+    user_entity_pools : Dict[str, EntityPool]
+        The entity pools keyed by the idhash column name to materialise them as.
+    
+    Returns
+    -------
+    pd.DataFrame
+        The user level data with a column of rendered idhash lists for each entity pool.
+    
+    Examples
+    --------
+    ```
+    user_data, user_entity_pools = gen_user_data(...)
+    join_entity_pools(user_data=user_data, user_entity_pools=user_entity_pools)
+    ```
+    """
+    idhash_lists_dict = {}
+    for idhash_col, entity_pool in user_entity_pools.items():
+        if len(entity_pool) != user_data.shape[0]:
+            raise ValueError(f"Entity pool {idhash_col} has {len(entity_pool)} users but the user data has {user_data.shape[0]} rows.")
+        # render the integer idhash codes of the pool before splitting into per user lists
+        rendered_pool = EntityPool(values=render_idhashes(idhashes=entity_pool.values, idhash_type=cons.idhash_col_types[idhash_col]), counts=entity_pool.counts)
+        idhash_lists_dict[idhash_col] = pd.Series(rendered_pool.to_lists(), index=user_data.index)
+    user_pools_data = user_data.assign(**idhash_lists_dict)
+    return user_pools_data
@@ -0,0 +1,48 @@
+import numpy as np
+import pandas as pd
+from typing import Dict
+
+from utilities.lean_beartype import lean_beartype
+
+@lean_beartype
+def join_idhash_attrs(
+    data:pd.DataFrame,
+    idhash_col:str,
+    idhashes:np.ndarray,
+    idhash_attrs:Dict[str, np.ndarray],
+    ) -> pd.DataFrame:
+    """
+    Joins entity attribute arrays to either the user or transaction data.
+    
+    The position of each row's idhash within the entity idhashes is computed once, and every attribute column is then added with a single take on those positions; no merge is performed and the unrelated columns of the data are not copied.
+    
+    Parameters
+    ----------
+    data : pd.DataFrame
+        The user or transaction data, the attribute columns are added in place.
+    idhash_col : str
+        The name of the idhash column for joining the attributes to the user or transaction data.
+    idhashes : numpy.ndarray
+        The unique entity idhashes, e.g. the card hash codes of a Card object.
+    idhash_attrs : Dict[str, numpy.ndarray]
+        The entity attribute arrays aligned to the idhashes, keyed by the column name to set for each attribute.
+    
+    Returns
+    -------
+    pd.DataFrame
+        The user or transaction data with the joined idhash attribute columns, rows with a missing or unknown idhash are given null attributes.
+    
+    Examples
+    --------
+    ```
+    data = pd.DataFrame({'card_hash': pd.array([3326615498294007818, None], dtype='UInt64')})
+    idhashes = np.array([13295658390123716483, 3326615498294007818], dtype=np.uint64)
+    join_idhash_attrs(data=data, idhash_col='card_hash', idhashes=idhashes, idhash_attrs={'card_type': np.array(['Visa', 'Mastercard'])})
+    ```
+    """
+    # find the position of each row's idhash within the entity idhashes, missing and unknown idhashes are given -1
+    idhash_positions = pd.Index(idhashes).get_indexer(data[idhash_col])
+    # take each attribute at the idhash positions, filling -1 positions with nulls
+    for attr_col, attr_values in idhash_attrs.items():
+        data[attr_col] = pd.api.extensions.take(attr_values, idhash_positions, allow_fill=True)
+    return data
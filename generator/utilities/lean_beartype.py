@@ -0,0 +1,33 @@
+from beartype import beartype
+from typing import Callable
+
+import cons
+
+def lean_beartype(func:Callable) -> Callable:
+    """
+    Decorates an internal helper with beartype runtime type checks, unless the generator runs in lean mode.
+    
+    In lean mode, i.e. when the cons.lean_mode_env_var environment variable is set to 1 before the generator is imported, the helper is returned undecorated so its calls carry no type checking overhead.
+    The public boundaries, i.e. the programme parameters and the input error handling, keep using beartype directly and are always checked.
+    
+    Parameters
+    ----------
+    func : Callable
+        The internal helper function or method to decorate.
+    
+    Returns
+    -------
+    Callable
+        The beartype decorated helper, or the helper itself in lean mode.
+    
+    Examples
+    --------
+    ```
+    @lean_beartype
+    def gen_dates(size:int, start_date:str, end_date:str, rng:np.random.Generator) -> np.ndarray:
+        ...
+    ```
+    """
+    if cons.lean_mode:
+        return func
+    return beartype(func)
@@ -1,13 +1,14 @@
 import os
 from multiprocessing import Pool
-from beartype import beartype
-from typing import List, Any
+from typing import List, Any, Union
 
-@beartype
+from utilities.lean_beartype import lean_beartype
+
+@lean_beartype
 def multiprocess(
     func,
     args:List[tuple],
-    ncpu:int=None,
+    ncpu:Union[int, None]=None,
     ) -> List[Any]:
     """
     Generates a dictionary of random dates for an input dictionary of idhashes counts by utilizing multiprocessing.
@@ -0,0 +1,51 @@
+from typing import Union
+
+import cons
+from utilities.lean_beartype import lean_beartype
+
+@lean_beartype
+def negotiate_media_type(
+    accept:Union[str, None],
+    media_types:dict=cons.api_media_types,
+    default_format:str="json",
+    ) -> str:
+    """
+    Negotiates the response format of an api request from its Accept header, choosing the supported media type of the highest quality value.
+    
+    Parameters
+    ----------
+    accept : str
+        The Accept header of the request, a missing header or wildcard media type negotiates the default format.
+    media_types : dict
+        The supported response formats and their media types, default is cons.api_media_types.
+    default_format : str
+        The response format of a missing header or a wildcard media type, default is "json".
+    
+    Returns
+    -------
+    str
+        The negotiated response format, or the default format when no supported media type is accepted.
+    
+    Examples
+    --------
+    ```
+    negotiate_media_type(accept="application/vnd.apache.arrow.stream, application/x-ndjson;q=0.5")
+    ```
+    """
+    formats = {media_type:response_format for response_format, media_type in media_types.items()}
+    formats.update({"*/*":default_format, "application/*":default_format})
+    negotiated_format, negotiated_quality = default_format, 0.0
+    for media_range in (accept or "").split(","):
+        # split each media range into its media type and quality value parameter
+        media_type, *params = [param.strip() for param in media_range.split(";")]
+        quality = 1.0
+        for param in params:
+            if param.startswith("q="):
+                try:
+                    quality = float(param[2:])
+                except ValueError:
+                    quality = 0.0
+        # keep the first supported media type of the highest quality value
+        if (media_type.lower() in formats) and (quality > negotiated_quality):
+            negotiated_format, negotiated_quality = formats[media_type.lower()], quality
+    return negotiated_format
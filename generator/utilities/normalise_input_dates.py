@@ -0,0 +1,42 @@
+import datetime
+from typing import Dict, List
+
+import cons
+from utilities.lean_beartype import lean_beartype
+
+@lean_beartype
+def normalise_input_dates(
+    input_params_dict:Dict[str, object],
+    date_params:List[str]=cons.input_date_params,
+    ) -> Dict[str, object]:
+    """
+    Normalises the date input parameters to the canonical YYYY-MM-DD format, so that equivalent dates such as 2020-1-1 and 2020-01-01 generate and cache the same dataset.
+    
+    Parameters
+    ----------
+    input_params_dict : Dict[str, object]
+        A dictionary of input parameters.
+    date_params : List[str]
+        The date input parameters to normalise, default is cons.input_date_params.
+    
+    Returns
+    -------
+    Dict[str, object]
+        A copy of the input parameters with the date input parameters in YYYY-MM-DD format.
+    
+    Examples
+    --------
+    ```
+    input_params_dict = {'registration_start_date': '2020-1-1', 'registration_end_date': '2020-12-31', 'transaction_start_date': '2021-1-1', 'transaction_end_date': '2021-12-31'}
+    normalise_input_dates(input_params_dict=input_params_dict)
+    ```
+    """
+    normalised_input_params_dict = input_params_dict.copy()
+    for date_param in date_params:
+        # parse each date and render it with zero padded months and days
+        try:
+            date = datetime.datetime.strptime(input_params_dict[date_param], cons.date_date_strftime)
+        except (ValueError, TypeError):
+            raise ValueError(f"Invalid {date_param} value {input_params_dict[date_param]}; must be a date in YYYY-MM-DD format.")
+        normalised_input_params_dict[date_param] = date.strftime(cons.date_date_strftime)
+    return normalised_input_params_dict
@@ -0,0 +1,51 @@
+import numpy as np
+
+from utilities.lean_beartype import lean_beartype
+
+@lean_beartype
+def permute_bits(
+    values:np.ndarray,
+    n_bits:int,
+    key:int,
+    ) -> np.ndarray:
+    """
+    Applies a keyed bijective permutation to an array of unsigned integers with n_bits bits.
+    
+    The permutation is a splitmix64 style finaliser (xor-shifts and odd multiplications modulo 2**n_bits) with the key mixed in twice, and so distinct input values always map to distinct output values.
+    
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The unsigned integers to permute, each must be less than 2**n_bits.
+    n_bits : int
+        The number of bits of the integer domain to permute, between 4 and 64.
+    key : int
+        The key of the permutation.
+    
+    Returns
+    -------
+    numpy.ndarray
+        The permuted values as uint64.
+    
+    Examples
+    --------
+    ```
+    permute_bits(values=np.arange(5, dtype=np.uint64), n_bits=64, key=42)
+    ```
+    """
+    if not 4 <= n_bits <= 64:
+        raise ValueError(f"Invalid n_bits value {n_bits}; must be between 4 and 64.")
+    mask = np.uint64((1 << n_bits) - 1)
+    key = np.uint64(key & ((1 << n_bits) - 1))
+    shifts = [np.uint64(max(1, n_bits * shift // 64)) for shift in (30, 27, 31)]
+    multipliers = [np.uint64((multiplier & ((1 << n_bits) - 1)) | 1) for multiplier in (0xbf58476d1ce4e5b9, 0x94d049bb133111eb)]
+    # uint64 arithmetic wraps modulo 2**64, masking reduces it modulo 2**n_bits
+    with np.errstate(over="ignore"):
+        permuted = (values.astype(np.uint64) + key) & mask
+        permuted ^= permuted >> shifts[0]
+        permuted = (permuted * multipliers[0]) & mask
+        permuted ^= (key * multipliers[1]) & mask
+        permuted ^= permuted >> shifts[1]
+        permuted = (permuted * multipliers[1]) & mask
+        permuted ^= permuted >> shifts[2]
+    return permuted
@@ -0,0 +1,46 @@
+import numpy as np
+import pandas as pd
+
+from utilities.lean_beartype import lean_beartype
+
+@lean_beartype
+def remap_idhashes(
+    idhashes:pd.Series,
+    source_codes:np.ndarray,
+    target_codes:np.ndarray,
+    ) -> pd.Series:
+    """
+    Remaps integer idhash codes to their shared idhash codes, leaving unmapped and null idhashes unchanged.
+    
+    The codes are looked up with a single index lookup and a single take of the aligned target codes rather than a dictionary map, so that unsigned 64 bit codes are never cast to float.
+    
+    Parameters
+    ----------
+    idhashes : pandas.Series
+        The integer idhash codes to remap, e.g. the ip_hash column of the transaction data.
+    source_codes : numpy.ndarray
+        The unique idhash codes to remap from.
+    target_codes : numpy.ndarray
+        The shared idhash codes to remap to, aligned to the source codes.
+    
+    Returns
+    -------
+    pandas.Series
+        The remapped idhash codes, with the same index and dtype as the input idhashes.
+    
+    Examples
+    --------
+    ```
+    idhashes = pd.Series(pd.array([3326615498294007818, None, 13295658390123716483], dtype='UInt64'))
+    source_codes = np.array([3326615498294007818, 13295658390123716483], dtype=np.uint64)
+    target_codes = np.array([3326615498294007818, 3326615498294007818], dtype=np.uint64)
+    remap_idhashes(idhashes=idhashes, source_codes=source_codes, target_codes=target_codes)
+    ```
+    """
+    # find the position of each idhash within the source codes, unmapped and null idhashes are given -1
+    map_positions = pd.Index(source_codes).get_indexer(idhashes)
+    mapped_mask = map_positions >= 0
+    # overwrite the mapped idhashes with their shared idhash codes
+    remapped_idhashes = idhashes.copy()
+    remapped_idhashes[mapped_mask] = np.take(target_codes, map_positions[mapped_mask])
+    return remapped_idhashes
@@ -1,8 +1,9 @@
 import numpy as np
 import pandas as pd
-from beartype import beartype
 
-@beartype
+from utilities.lean_beartype import lean_beartype
+
+@lean_beartype
 def remove_duplicate_idhashes(
     user_data:pd.DataFrame,
     idhash_col:str,
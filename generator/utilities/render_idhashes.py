@@ -0,0 +1,53 @@
+import numpy as np
+import pandas as pd
+from typing import Union
+
+from utilities.lean_beartype import lean_beartype
+
+@lean_beartype
+def render_idhashes(
+    idhashes:Union[np.ndarray, pd.Series, pd.api.extensions.ExtensionArray],
+    idhash_type:str,
+    nbytes:int=16,
+    ) -> np.ndarray:
+    """
+    Renders integer idhash codes as fixed width strings, either as hexadecimal hashes or zero padded decimal ids.
+    
+    Parameters
+    ----------
+    idhashes : numpy.ndarray, pandas.Series
+        The integer idhash codes to render, missing values are rendered as nan.
+    idhash_type : str
+        Whether to render "id" or "hash" values.
+    nbytes : int
+        The number of characters in each rendered idhash, default is 16.
+    
+    Returns
+    -------
+    numpy.ndarray
+        An object array of the rendered idhash strings.
+    
+    Examples
+    --------
+    ```
+    render_idhashes(idhashes=np.array([255, 4096], dtype=np.uint64), idhash_type="hash", nbytes=16)
+    ```
+    """
+    # set the base and character set of the rendered idhashes
+    if idhash_type == "hash":
+        base, charset = 16, b"0123456789abcdef"
+    elif idhash_type == "id":
+        base, charset = 10, b"0123456789"
+    else:
+        raise ValueError("idhash_type must be either 'id' or 'hash'")
+    idhashes = pd.Series(idhashes)
+    null_mask = idhashes.isna().to_numpy()
+    codes = idhashes.where(~null_mask, 0).to_numpy(dtype=np.uint64)
+    # extract the digits of every code in one vectorised pass, most significant digit first
+    place_values = np.array([base ** power for power in range(nbytes - 1, -1, -1)], dtype=np.uint64)
+    digits = (codes[:, None] // place_values[None, :]) % np.uint64(base)
+    chars = np.frombuffer(charset, dtype=np.uint8)[digits.astype(np.intp)]
+    # view each row of characters as a fixed width string
+    rendered = np.ascontiguousarray(chars).view(f"S{nbytes}").ravel().astype(f"U{nbytes}").astype(object)
+    rendered[null_mask] = np.nan
+    return rendered
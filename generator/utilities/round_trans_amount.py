@@ -1,8 +1,16 @@
 import numpy as np
-from beartype import beartype
 
-@beartype
-def round_trans_amount(amounts:np.ndarray) -> np.ndarray:
+from utilities.CategoricalSampler import CategoricalSampler
+from utilities.lean_beartype import lean_beartype
+
+# a probability distribution for remainders
+round_sampler = CategoricalSampler.from_dict(prop_dict={0.01:0.4, 0.5:0.1, 0.45:0.1, 0.51:0.1, 0.41:0.1, 0.71:0.1, 1:0.1})
+
+@lean_beartype
+def round_trans_amount(
+    amounts:np.ndarray,
+    rng:np.random.Generator,
+    ) -> np.ndarray:
     """
     Rounds transaction amounts to have store price like remainders such as 1.99, 3.45, and 2.5.
     
@@ -10,6 +18,8 @@ def round_trans_amount(amounts:np.ndarray) -> np.ndarray:
     ----------
     amounts : np.ndarray
         The transaction amounts to round.
+    rng : numpy.random.Generator
+        The random number generator to draw from.
     
     Returns
     -------
@@ -21,11 +31,10 @@ def round_trans_amount(amounts:np.ndarray) -> np.ndarray:
     ```
     import numpy as np
     amounts = np.array([2.34, 5.67, 3.21])
-    round_trans_amount(amounts=amounts)
+    round_trans_amount(amounts=amounts, rng=np.random.default_rng(seed=42))
     ```
     """
-    # a probability distribution for remainders
-    round_dict = {0.01:0.4, 0.5:0.1, 0.45:0.1, 0.51:0.1, 0.41:0.1, 0.71:0.1, 1:0.1}
-    remainder = np.random.choice(a=list(round_dict.keys()), size=amounts.shape[0], replace=True, p=list(round_dict.values()))
+    # draw a remainder for each amount
+    remainder = round_sampler.sample(rng=rng, size=amounts.shape[0])
     rounded_amounts =np.maximum(0, np.round(np.ceil(amounts) - remainder, 2))
     return rounded_amounts
\ No newline at end of file
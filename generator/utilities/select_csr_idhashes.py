@@ -0,0 +1,58 @@
+import numpy as np
+import pandas as pd
+from typing import Union
+
+from utilities.lean_beartype import lean_beartype
+
+@lean_beartype
+def select_csr_idhashes(
+    values:np.ndarray,
+    offsets:np.ndarray,
+    owners:np.ndarray,
+    rng:np.random.Generator,
+    ) -> Union[np.ndarray, pd.arrays.IntegerArray]:
+    """
+    Randomly selects one idhash per row from compressed sparse row (CSR) entity pools.
+
+    The idhashes of owner i are stored in values[offsets[i]:offsets[i+1]], and one index within each owner's pool is drawn for every row with a single vectorised call.
+
+    Parameters
+    ----------
+    values : numpy.ndarray
+        The flat array of idhashes for all owners.
+    offsets : numpy.ndarray
+        The offsets of each owner's idhashes within the values array, of length n_owners + 1.
+    owners : numpy.ndarray
+        The owner position of each row to select an idhash for.
+    rng : numpy.random.Generator
+        The random number generator to draw from.
+
+    Returns
+    -------
+    numpy.ndarray or pandas.arrays.IntegerArray
+        The randomly selected idhash for each row, or null where the owner has no idhashes; integer idhash codes are returned as a nullable integer array.
+
+    Examples
+    --------
+    ```
+    values = np.array(['2e23f63807f6170a', 'b8816ed926bf9f83', 'b010fdb44fa68822'])
+    offsets = np.array([0, 2, 3])
+    owners = np.array([0, 0, 1, 1, 0])
+    select_csr_idhashes(values=values, offsets=offsets, owners=owners, rng=np.random.default_rng(seed=42))
+    ```
+    """
+    # determine the pool size and start position for each row
+    counts = np.diff(offsets)[owners]
+    starts = offsets[:-1][owners]
+    # draw one index within each row's pool in a single call
+    picks = rng.integers(low=0, high=np.maximum(counts, 1), size=owners.shape[0])
+    nonempty_mask = counts > 0
+    # gather integer idhash codes into a nullable integer array, rows with empty pools are masked
+    if np.issubdtype(values.dtype, np.integer):
+        selected_codes = np.zeros(shape=owners.shape[0], dtype=values.dtype)
+        selected_codes[nonempty_mask] = values[starts[nonempty_mask] + picks[nonempty_mask]]
+        return pd.arrays.IntegerArray(selected_codes, ~nonempty_mask)
+    # gather the selected idhashes, rows with empty pools are set to nan
+    selected = np.full(shape=owners.shape[0], fill_value=np.nan, dtype=object)
+    selected[nonempty_mask] = values[starts[nonempty_mask] + picks[nonempty_mask]]
+    return selected
@@ -0,0 +1,54 @@
+import pandas as pd
+from typing import Iterable, Iterator, List, Union
+
+from utilities.lean_beartype import lean_beartype
+
+@lean_beartype
+def select_trans_data(
+    trans_data_chunks:Iterable[pd.DataFrame],
+    columns:Union[List[str], None]=None,
+    offset:int=0,
+    limit:Union[int, None]=None,
+    ) -> Iterator[pd.DataFrame]:
+    """
+    Lazily projects chunks of transaction level data onto a subset of columns, and selects a page of rows from the offset up to the limit counted across all of the chunks.
+    Once the limit is reached no further chunks are read, so any chunks generated lazily beyond the page are never generated.
+    
+    Parameters
+    ----------
+    trans_data_chunks : Iterable[pandas.DataFrame]
+        The chunks of transaction level data.
+    columns : List[str]
+        The columns to select, in order, default is None for all columns.
+    offset : int
+        The number of rows to skip, default is 0.
+    limit : int
+        The maximum number of rows to select, default is None for all rows after the offset.
+    
+    Returns
+    -------
+    Iterator[pandas.DataFrame]
+        The selected rows and columns of each chunk up to the end of the page, chunks before the offset yield no rows.
+    
+    Examples
+    --------
+    ```
+    trans_data_page = next(select_trans_data(trans_data_chunks=[trans_data], columns=['userid', 'transaction_date'], offset=100, limit=50))
+    ```
+    """
+    n_skip, n_take = offset, limit
+    for trans_data in trans_data_chunks:
+        # select the rows of the chunk after the rows still to skip, and up to the rows still to take
+        n_rows = trans_data.shape[0]
+        start = min(n_skip, n_rows)
+        stop = n_rows if n_take is None else min(n_rows, start + n_take)
+        trans_data_page = trans_data.iloc[start:stop]
+        if columns is not None:
+            trans_data_page = trans_data_page[columns]
+        n_skip -= start
+        if n_take is not None:
+            n_take -= stop - start
+        yield trans_data_page
+        # stop reading chunks once the page is complete
+        if (n_take is not None) and (n_take <= 0):
+            return
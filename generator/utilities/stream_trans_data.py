@@ -0,0 +1,68 @@
+import io
+import pandas as pd
+import pyarrow as pa
+from typing import Iterable, Iterator, List, Union
+
+import cons
+from utilities.lean_beartype import lean_beartype
+from utilities.TransDataWriter import TransDataWriter
+
+@lean_beartype
+def stream_trans_data(
+    trans_data_chunks:Iterable[pd.DataFrame],
+    response_format:str,
+    chunk_size:int=cons.api_stream_chunk_size,
+    columns:Union[List[str], None]=None,
+    ) -> Iterator[bytes]:
+    """
+    Lazily serialises chunks of transaction level data as either newline delimited json lines or an arrow ipc stream of record batches, yielding the bytes of each chunk as soon as it is serialised.
+    Each chunk is serialised in slices of at most the chunk size rows, so that the serialised bytes held in memory do not grow with the size of the dataset.
+    
+    Parameters
+    ----------
+    trans_data_chunks : Iterable[pandas.DataFrame]
+        The chunks of transaction level data, with idhashes rendered as strings.
+    response_format : str
+        The serialisation format, either "ndjson" or "arrow".
+    chunk_size : int
+        The maximum number of rows serialised at a time, default is cons.api_stream_chunk_size.
+    columns : List[str]
+        The columns of the chunks, in order, which the arrow schema is restricted to, default is None for all columns.
+    
+    Returns
+    -------
+    Iterator[bytes]
+        The serialised bytes of each slice of the chunks, the arrow ipc stream starts with its schema and ends with an end of stream marker.
+    
+    Examples
+    --------
+    ```
+    for trans_data_bytes in stream_trans_data(trans_data_chunks=[trans_data], response_format="ndjson"):
+        print(trans_data_bytes)
+    ```
+    """
+    if response_format not in ("ndjson", "arrow"):
+        raise ValueError(f"Invalid response_format value {response_format}; must be either 'ndjson' or 'arrow'.")
+    # the arrow ipc stream is written to an in memory sink, which is drained after every record batch
+    sink = io.BytesIO()
+    trans_schema = TransDataWriter.gen_trans_schema()
+    if columns is not None:
+        trans_schema = pa.schema([trans_schema.field(column) for column in columns])
+    arrow_writer = pa.ipc.new_stream(pa.PythonFile(sink, mode="w"), schema=trans_schema) if response_format == "arrow" else None
+    for trans_data in trans_data_chunks:
+        for start in range(0, trans_data.shape[0], chunk_size):
+            trans_data_slice = trans_data.iloc[start:start + chunk_size]
+            if arrow_writer is not None:
+                arrow_writer.write_table(pa.Table.from_pandas(trans_data_slice, schema=trans_schema, preserve_index=False))
+            else:
+                # render the date columns as YYYY-MM-DD strings, matching the date typed columns of the arrow schema
+                trans_date_strs = {date_col:trans_data_slice[date_col].to_numpy(dtype="datetime64[D]").astype(str) for date_col in trans_data_slice.columns.intersection(cons.trans_date_cols)}
+                sink.write(trans_data_slice.assign(**trans_date_strs).to_json(orient="records", lines=True).rstrip("\n").encode() + b"\n")
+            # yield and drain the serialised bytes of the slice
+            yield sink.getvalue()
+            sink.seek(0)
+            sink.truncate(0)
+    # close the arrow ipc stream, writing its schema if no chunks were written and its end of stream marker
+    if arrow_writer is not None:
+        arrow_writer.close()
+        yield sink.getvalue()